@@ -0,0 +1,134 @@
+"""
+Benchmark loading quarterly estimates a year at a time from a multi-year,
+multi-thousand-sid estimates frame.
+
+Each chunk corresponds to a single call to ``load_adjusted_array``, as made by
+the pipeline engine when a long pipeline is run one year at a time.  For each
+chunk, the number of raw estimates passed on to the quarter selection is
+printed, as a count and as a share of all of the estimates, along with the
+time taken to load them.
+
+Only the rows passed to the quarter selection are cut down by the loader: the
+selection itself still works on those rows with pandas, so the time of each
+load grows with the share of estimates known by the end of the chunk.
+
+Usage::
+
+    $ python benchmarks/estimates_loader.py [--years N] [--assets N]
+"""
+from __future__ import print_function
+
+import argparse
+from timeit import default_timer
+
+import numpy as np
+from numpy.random import RandomState
+import pandas as pd
+
+from zipline.pipeline.common import (
+    EVENT_DATE_FIELD_NAME,
+    FISCAL_QUARTER_FIELD_NAME,
+    FISCAL_YEAR_FIELD_NAME,
+    SID_FIELD_NAME,
+    TS_FIELD_NAME,
+)
+from zipline.pipeline.data import Column, DataSet
+from zipline.pipeline.loaders.earnings_estimates import (
+    NextEarningsEstimatesLoader,
+    PreviousEarningsEstimatesLoader,
+)
+from zipline.utils.calendars import get_calendar
+from zipline.utils.numpy_utils import datetime64ns_dtype, float64_dtype
+
+LOADERS = (
+    ('next', NextEarningsEstimatesLoader),
+    ('previous', PreviousEarningsEstimatesLoader),
+)
+
+
+class Estimates(DataSet):
+    event_date = Column(dtype=datetime64ns_dtype)
+    fiscal_quarter = Column(dtype=float64_dtype)
+    fiscal_year = Column(dtype=float64_dtype)
+    estimate = Column(dtype=float64_dtype)
+    num_announcements = 1
+
+
+def make_estimates(first_year, years, nassets, revisions):
+    """
+    Make ``revisions`` estimates for each quarter of each asset, learned about
+    in the 60 days before the quarter's announcement.
+    """
+    rand = RandomState(0)
+    quarters = np.arange(4 * years)
+    nrows = nassets * len(quarters) * revisions
+
+    sids = np.repeat(np.arange(nassets), len(quarters) * revisions)
+    normalized = np.tile(np.repeat(quarters, revisions), nassets)
+    # Announce each quarter about 45 days after it ends.
+    event_dates = (
+        pd.Timestamp('%d-01-01' % first_year) +
+        pd.to_timedelta(
+            (normalized + 1) * 91 + 45 + rand.randint(-10, 10, nrows),
+            unit='D',
+        )
+    )
+    timestamps = event_dates - pd.to_timedelta(
+        rand.randint(1, 60, nrows),
+        unit='D',
+    )
+    return pd.DataFrame({
+        SID_FIELD_NAME: sids,
+        TS_FIELD_NAME: timestamps,
+        EVENT_DATE_FIELD_NAME: event_dates,
+        FISCAL_YEAR_FIELD_NAME: first_year + normalized // 4,
+        FISCAL_QUARTER_FIELD_NAME: normalized % 4 + 1,
+        'estimate': rand.randn(nrows),
+    }).sort_values(TS_FIELD_NAME)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--years', type=int, default=5)
+    parser.add_argument('--assets', type=int, default=2000)
+    parser.add_argument('--revisions', type=int, default=3)
+    args = parser.parse_args()
+
+    sessions = get_calendar('NYSE').all_sessions
+    first_year = sessions[-1].year - args.years
+    estimates = make_estimates(
+        first_year,
+        args.years,
+        args.assets,
+        args.revisions,
+    )
+    assets = pd.Int64Index(np.arange(args.assets))
+    columns = list(Estimates.columns)
+    name_map = {c.name: c.name for c in columns}
+
+    print('%d years, %d assets, %d estimates' % (
+        args.years, args.assets, len(estimates),
+    ))
+    print('%-9s %-6s %12s %7s %10s' % (
+        'loader', 'year', 'estimates', 'share', 'time (s)',
+    ))
+    for name, loader_type in LOADERS:
+        loader = loader_type(estimates, name_map)
+        for year in range(first_year + 1, first_year + args.years):
+            dates = sessions[
+                (sessions >= pd.Timestamp('%d-01-01' % year, tz='utc')) &
+                (sessions < pd.Timestamp('%d-01-01' % (year + 1), tz='utc'))
+            ]
+            mask = np.ones((len(dates), len(assets)), dtype=bool)
+            nrows = len(loader.estimates_for_dates(assets.values, dates))
+
+            start = default_timer()
+            loader.load_adjusted_array(columns, dates, assets, mask)
+            elapsed = default_timer() - start
+            print('%-9s %-6d %12d %6.0f%% %10.2f' % (
+                name, year, nrows, 100.0 * nrows / len(estimates), elapsed,
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+"""
+Benchmark a pricing pipeline in float64 and float32 modes.
+
+Each mode is run in a fresh subprocess so that peak memory usage can be
+compared.  Pricing data is synthetic, and is stored and scaled the same way as
+in a bcolz daily bar table: prices are uint32 thousandths of a dollar.
+
+Usage::
+
+    $ python benchmarks/float32_pipeline.py [--years N] [--assets N]
+"""
+from __future__ import print_function
+
+import argparse
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+from timeit import default_timer
+
+from numpy import abs as np_abs, float32, float64, uint32
+from numpy.random import RandomState
+import pandas as pd
+
+from zipline.assets.synthetic import make_simple_equity_info
+from zipline.pipeline import Pipeline
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.factors import (
+    AverageDollarVolume,
+    Returns,
+    SimpleMovingAverage,
+    VWAP,
+)
+from zipline.pipeline.loaders.equity_pricing_loader import (
+    USEquityPricingLoader,
+)
+from zipline.pipeline.loaders.synthetic import NullAdjustmentReader
+from zipline.testing.core import tmp_asset_finder
+from zipline.utils.calendars import get_calendar
+
+MODES = ('float64', 'float32')
+
+
+class SyntheticDailyBarReader(object):
+    """
+    Daily bar reader serving random walks stored as uint32 thousandths.
+    """
+    def __init__(self, calendar, sessions, nassets, float32_prices):
+        self.trading_calendar = calendar
+        self.sessions = sessions
+        self._float32_prices = float32_prices
+
+        rand = RandomState(0)
+        shape = len(sessions), nassets
+        close = 50.0 * (1 + rand.randn(*shape).cumsum(axis=0) * 0.001)
+        close = close.clip(1.0, None)
+        self._columns = {
+            'open': close * (1 + rand.uniform(-0.01, 0.01, shape)),
+            'high': close * (1 + rand.uniform(0, 0.02, shape)),
+            'low': close * (1 - rand.uniform(0, 0.02, shape)),
+            'close': close,
+        }
+        for name, values in self._columns.items():
+            self._columns[name] = (values * 1000).astype(uint32)
+        self._columns['volume'] = rand.randint(
+            1000, 5000000, size=shape,
+        ).astype(uint32)
+
+    def load_raw_arrays(self, columns, start_date, end_date, assets):
+        start = self.sessions.get_loc(start_date)
+        stop = self.sessions.get_loc(end_date) + 1
+        out = []
+        for name in columns:
+            raw = self._columns[name][start:stop, :len(assets)]
+            if name == 'volume':
+                out.append(raw.copy())
+                continue
+            values = raw.astype(float32 if self._float32_prices else float64)
+            values *= .001
+            out.append(values)
+        return out
+
+
+def run_mode(args):
+    calendar = get_calendar('NYSE')
+    all_sessions = calendar.all_sessions
+    first = all_sessions[-1] - pd.DateOffset(years=args.years)
+    sessions = all_sessions[all_sessions.searchsorted(first):]
+    float32 = args.mode == 'float32'
+
+    loader = USEquityPricingLoader(
+        SyntheticDailyBarReader(calendar, sessions, args.assets, float32),
+        NullAdjustmentReader(),
+        float32=float32,
+    )
+    pipeline = Pipeline({
+        'sma': SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=50,
+        ),
+        'adv': AverageDollarVolume(window_length=20),
+        'vwap': VWAP(window_length=20),
+        'returns': Returns(window_length=20),
+    })
+
+    equities = make_simple_equity_info(
+        range(args.assets),
+        sessions[0],
+        sessions[-1],
+    )
+    with tmp_asset_finder(equities=equities) as finder:
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            sessions,
+            finder,
+        )
+        start = default_timer()
+        result = engine.run_pipeline(pipeline, sessions[60], sessions[-1])
+        elapsed = default_timer() - start
+
+    result.to_pickle(args.output)
+    # ru_maxrss is in kilobytes on Linux.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    print('%f %f' % (elapsed, peak))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--assets', type=int, default=8000)
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--output', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        return run_mode(args)
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        stats, results = {}, {}
+        for mode in MODES:
+            output = os.path.join(tmpdir, mode)
+            stdout = subprocess.check_output([
+                sys.executable, __file__,
+                '--years', str(args.years),
+                '--assets', str(args.assets),
+                '--mode', mode,
+                '--output', output,
+            ])
+            stats[mode] = tuple(map(float, stdout.split()[-2:]))
+            results[mode] = pd.read_pickle(output)
+    finally:
+        shutil.rmtree(tmpdir)
+
+    print('%d years, %d assets' % (args.years, args.assets))
+    print('%-8s %12s %14s' % ('mode', 'time (s)', 'peak RSS (MB)'))
+    for mode in MODES:
+        print('%-8s %12.2f %14.1f' % ((mode,) + stats[mode]))
+
+    print()
+    print('%-8s %16s %16s' % ('column', 'max abs diff', 'max rel diff'))
+    expected, actual = results['float64'], results['float32']
+    for column in expected.columns:
+        diff = np_abs(actual[column] - expected[column])
+        print('%-8s %16.3g %16.3g' % (
+            column,
+            diff.max(),
+            (diff / np_abs(expected[column])).max(),
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Measure the memory used by the blotter's orders when rebalancing daily.
+
+Every day, an order is placed for each asset and then filled and pruned, as
+a strategy that rebalances a large universe would.  The ``memory`` mode
+keeps every order in ``Blotter.orders``; the ``archive`` mode passes an
+``OrderArchive``, which moves orders to disk once they are closed.  Every
+mode is run in a fresh subprocess so that peak RSS can be compared, and the
+growth in peak RSS is reported per million orders.
+
+Usage::
+
+    $ python benchmarks/order_memory.py [--days N] [--assets N]
+"""
+from __future__ import print_function
+
+import argparse
+import resource
+import subprocess
+import sys
+from timeit import default_timer
+
+import pandas as pd
+
+from zipline.assets import Equity
+from zipline.finance.blotter import Blotter
+from zipline.finance.execution import MarketOrder
+from zipline.finance.order_archive import OrderArchive
+
+MODES = ('memory', 'archive')
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def run_mode(args):
+    assets = [Equity(sid, exchange='TEST') for sid in range(args.assets)]
+    sessions = pd.date_range('2000-01-03', periods=args.days, tz='UTC')
+    style = MarketOrder()
+
+    orders = OrderArchive() if args.mode == 'archive' else None
+    blotter = Blotter('daily', None, orders=orders)
+
+    start_rss = peak_rss_mb()
+    start = default_timer()
+    for session in sessions:
+        blotter.set_date(session)
+        for asset in assets:
+            blotter.order(asset, 100, style)
+
+        closed_orders = [
+            order
+            for asset_orders in blotter.open_orders.values()
+            for order in asset_orders
+        ]
+        for order in closed_orders:
+            order.filled = order.amount
+        blotter.prune_orders(closed_orders)
+        blotter.new_orders = []
+    elapsed = default_timer() - start
+
+    norders = args.days * args.assets
+    growth = peak_rss_mb() - start_rss
+    print(growth, growth * 1e6 / norders, elapsed)
+
+    if orders is not None:
+        orders.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--days', type=int, default=250)
+    parser.add_argument('--assets', type=int, default=4000)
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        return run_mode(args)
+
+    print('%d days, %d assets (%d orders)' % (
+        args.days, args.assets, args.days * args.assets,
+    ))
+    print('%-8s %14s %20s %10s' % (
+        'mode', 'growth (MB)', 'MB per 1M orders', 'time (s)',
+    ))
+    for mode in MODES:
+        stdout = subprocess.check_output([
+            sys.executable, __file__,
+            '--days', str(args.days),
+            '--assets', str(args.assets),
+            '--mode', mode,
+        ])
+        growth, per_million, elapsed = map(float, stdout.split()[-3:])
+        print('%-8s %14.1f %20.1f %10.2f' % (
+            mode, growth, per_million, elapsed,
+        ))
+
+
+if __name__ == '__main__':
+    main()
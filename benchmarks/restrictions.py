@@ -0,0 +1,112 @@
+"""
+Benchmark querying the restrictions of a whole universe of assets once per
+bar, as ``BarData.can_trade`` does for a list of assets.
+
+Restrictions are generated at random effective dates over the simulation, and
+``is_restricted`` is called for every asset at each bar.  The ``scan`` mode
+looks up each asset by walking its sorted restriction history, which is what
+``HistoricalRestrictions`` used to do; the ``indexed`` mode uses
+``HistoricalRestrictions``, which applies the state changes since the last
+query to an array of states and gathers from it.  The time taken by each mode
+is printed, after checking that both modes agree.
+
+Usage::
+
+    $ python benchmarks/restrictions.py [--days N] [--assets N] [--events N]
+"""
+from __future__ import print_function
+
+import argparse
+from timeit import default_timer
+
+import pandas as pd
+from numpy.random import RandomState
+from six import iteritems
+from toolz import groupby
+
+from zipline.assets import Equity
+from zipline.finance.asset_restrictions import (
+    HistoricalRestrictions,
+    Restriction,
+    RESTRICTION_STATES,
+)
+
+
+def make_restrictions(assets, sessions, nevents):
+    rand = RandomState(0)
+    states = (RESTRICTION_STATES.ALLOWED, RESTRICTION_STATES.FROZEN)
+    asset_ix = rand.randint(0, len(assets), nevents)
+    session_ix = rand.randint(0, len(sessions), nevents)
+    state_ix = rand.randint(0, 2, nevents)
+    return [
+        Restriction(assets[a], sessions[s], states[f])
+        for a, s, f in zip(asset_ix, session_ix, state_ix)
+    ]
+
+
+def scan_is_restricted(restrictions):
+    """Look up restrictions by walking each asset's history.
+    """
+    by_asset = {
+        asset: sorted(rs, key=lambda r: r.effective_date)
+        for asset, rs in iteritems(groupby(lambda r: r.asset, restrictions))
+    }
+
+    def is_restricted_for_asset(asset, dt):
+        state = RESTRICTION_STATES.ALLOWED
+        for r in by_asset.get(asset, ()):
+            if r.effective_date > dt:
+                break
+            state = r.state
+        return state == RESTRICTION_STATES.FROZEN
+
+    def is_restricted(assets, dt):
+        return pd.Series(
+            index=pd.Index(assets),
+            data=[is_restricted_for_asset(asset, dt) for asset in assets],
+        )
+
+    return is_restricted
+
+
+def run(name, is_restricted, assets, sessions):
+    start = default_timer()
+    results = [is_restricted(assets, dt) for dt in sessions]
+    elapsed = default_timer() - start
+    print('%-8s %10.3f %14.1f' % (
+        name, elapsed, 1e6 * elapsed / len(sessions),
+    ))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--days', type=int, default=252)
+    parser.add_argument('--assets', type=int, default=8000)
+    parser.add_argument('--events', type=int, default=50000)
+    args = parser.parse_args()
+
+    assets = [Equity(sid, exchange='TEST') for sid in range(args.assets)]
+    sessions = pd.date_range(
+        '2015-01-02', periods=args.days, freq='B', tz='UTC',
+    )
+    restrictions = make_restrictions(assets, sessions, args.events)
+
+    print('%d days, %d assets, %d restriction events' % (
+        args.days, args.assets, args.events,
+    ))
+    print('%-8s %10s %14s' % ('mode', 'time (s)', 'us per query'))
+    scanned = run(
+        'scan', scan_is_restricted(restrictions), assets, sessions,
+    )
+    indexed = run(
+        'indexed', HistoricalRestrictions(restrictions).is_restricted,
+        assets, sessions,
+    )
+
+    for expected, actual in zip(scanned, indexed):
+        pd.util.testing.assert_series_equal(actual, expected)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark the whole-matrix implementations of the rolling statistical factors
+against the per-column scipy calls they replaced.
+
+Each iteration corresponds to a single call to ``compute`` for one day of a
+``RollingPearson``, ``RollingSpearman`` or ``RollingLinearRegression`` factor.
+
+Usage::
+
+    $ python benchmarks/statistical.py [--assets N] [--window-length N]
+"""
+from __future__ import print_function
+
+import argparse
+from timeit import default_timer
+import warnings
+
+from numpy import broadcast_arrays
+from numpy.random import RandomState
+from scipy.stats import linregress, pearsonr, spearmanr
+
+from zipline.pipeline.factors.statistical import (
+    vectorized_linear_regression,
+    vectorized_pearson_r,
+    vectorized_spearman_r,
+)
+
+
+def per_column(func):
+    def apply(a, b):
+        b = broadcast_arrays(b, a)[0]
+        return [func(a[:, i], b[:, i]) for i in range(a.shape[1])]
+    return apply
+
+
+def best_of(func, args, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = default_timer()
+        func(*args)
+        timings.append(default_timer() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--assets', type=int, default=3000)
+    parser.add_argument('--window-length', type=int, default=63)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rand = RandomState(0)
+    shape = args.window_length, args.assets
+    base = rand.randn(*shape)
+    cases = [
+        ('pearson', pearsonr, vectorized_pearson_r),
+        ('spearman', spearmanr, vectorized_spearman_r),
+        ('regression', linregress, vectorized_linear_regression),
+    ]
+
+    print('%d assets, window length %d' % (args.assets, args.window_length))
+    print('%-12s %-8s %12s %12s %9s' % (
+        'factor', 'target', 'scipy (s)', 'vector (s)', 'speedup',
+    ))
+    for target_name, target in (('slice', rand.randn(shape[0], 1)),
+                                ('factor', rand.randn(*shape))):
+        for name, scipy_func, vectorized in cases:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                old = best_of(
+                    per_column(scipy_func),
+                    (base, target),
+                    args.repeat,
+                )
+                new = best_of(vectorized, (base, target), args.repeat)
+            print('%-12s %-8s %12.5f %12.5f %8.1fx' % (
+                name, target_name, old, new, old / new,
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Measure peak memory used by concurrent traversals of an AdjustedArray.
+
+Each traversal is advanced to the end of the array in lockstep with the
+others, as the pipeline engine does when computing one row at a time.  The
+``eager`` mode copies the array for every traversal up front, which is what
+``AdjustedArray.traverse`` used to do; the ``lazy`` mode calls ``traverse``,
+which only copies once a window has an adjustment to apply, and then only the
+rows from that window on.  Every mode is run in a fresh subprocess so that
+peak RSS can be compared.
+
+Usage::
+
+    $ python benchmarks/window_memory.py [--days N] [--assets N]
+"""
+from __future__ import print_function
+
+import argparse
+import resource
+import subprocess
+import sys
+
+from numpy.random import RandomState
+
+from zipline.lib.adjusted_array import AdjustedArray, NOMASK
+from zipline.lib.adjustment import Float64Multiply
+
+MODES = ('eager', 'lazy')
+ADJUSTMENTS = ('none', 'adjusted')
+
+
+def make_adjustments(kind, ndays, nassets):
+    if kind == 'none':
+        return {}
+    row = ndays // 2
+    return {
+        row: [Float64Multiply(0, row - 1, 0, nassets - 1, 0.5)],
+    }
+
+
+def run_mode(args):
+    data = RandomState(0).randn(args.days, args.assets)
+    array = AdjustedArray(
+        data,
+        NOMASK,
+        make_adjustments(args.adjustments, args.days, args.assets),
+        float('nan'),
+    )
+    del data
+
+    if args.mode == 'eager':
+        windows = [
+            array._iterator_type(
+                array._data.copy(),
+                array._view_kwargs,
+                array.adjustments,
+                0,
+                args.window_length,
+                0,
+            )
+            for _ in range(args.consumers)
+        ]
+    else:
+        windows = [
+            array.traverse(args.window_length)
+            for _ in range(args.consumers)
+        ]
+
+    for _ in range(args.days - args.window_length + 1):
+        for window in windows:
+            next(window)
+
+    # ru_maxrss is in kilobytes on Linux.
+    print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--days', type=int, default=2520)
+    parser.add_argument('--assets', type=int, default=8000)
+    parser.add_argument('--window-length', type=int, default=20)
+    parser.add_argument('--consumers', type=int, default=8)
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument(
+        '--adjustments',
+        choices=ADJUSTMENTS,
+        help=argparse.SUPPRESS,
+    )
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        return run_mode(args)
+
+    nbytes = args.days * args.assets * 8 / float(1 << 20)
+    print('%d days, %d assets (%.1f MB), %d traversals' % (
+        args.days, args.assets, nbytes, args.consumers,
+    ))
+    print('%-12s %14s %14s' % ('adjustments', 'eager (MB)', 'lazy (MB)'))
+    for adjustments in ADJUSTMENTS:
+        peaks = []
+        for mode in MODES:
+            stdout = subprocess.check_output([
+                sys.executable, __file__,
+                '--days', str(args.days),
+                '--assets', str(args.assets),
+                '--window-length', str(args.window_length),
+                '--consumers', str(args.consumers),
+                '--mode', mode,
+                '--adjustments', adjustments,
+            ])
+            peaks.append(float(stdout.split()[-1]))
+        print('%-12s %14.1f %14.1f' % ((adjustments,) + tuple(peaks)))
+
+
+if __name__ == '__main__':
+    main()
@@ -93,6 +93,7 @@ ext_modules = [
               ['zipline/assets/continuous_futures.pyx']),
     Extension('zipline.lib.adjustment', ['zipline/lib/adjustment.pyx']),
     Extension('zipline.lib._factorize', ['zipline/lib/_factorize.pyx']),
+    window_specialization('float32'),
     window_specialization('float64'),
     window_specialization('int64'),
     window_specialization('int64'),
@@ -18,9 +18,11 @@ from nose_parameterized import parameterized
 from numpy import (
     arange,
     datetime64,
+    float32,
     nan,
 )
 from numpy.testing import (
+    assert_allclose,
     assert_array_equal,
 )
 from pandas import (
@@ -231,6 +233,29 @@ class BcolzDailyBarTestCase(WithBcolzEquityDailyBarReader, ZiplineTestCase):
             TEST_QUERY_STOP,
         )
 
+    def test_read_float32_prices(self):
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        reader = BcolzDailyBarReader(
+            self.bcolz_daily_bar_ctable,
+            self.bcolz_equity_daily_bar_reader._read_all_threshold,
+            float32_prices=True,
+        )
+        results = reader.load_raw_arrays(
+            columns,
+            TEST_QUERY_START,
+            TEST_QUERY_STOP,
+            self.assets,
+        )
+        dates = self.trading_days_between(TEST_QUERY_START, TEST_QUERY_STOP)
+        for column, result in zip(columns, results):
+            expected = expected_bar_values_2d(dates, EQUITY_INFO, column)
+            if column == 'volume':
+                # Volumes are always returned as stored.
+                assert_array_equal(result, expected)
+            else:
+                self.assertEqual(result.dtype, float32)
+                assert_allclose(result, expected, rtol=1e-6)
+
     def test_start_on_asset_start(self):
         """
         Test loading with queries that starts on the first day of each asset's
@@ -12,6 +12,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+
 from nose_parameterized import parameterized
 
 import pandas as pd
@@ -27,6 +29,7 @@ from zipline.finance.execution import (
     StopOrder,
 )
 from zipline.finance.order import ORDER_STATUS, Order
+from zipline.finance.order_archive import OrderArchive
 from zipline.finance.slippage import (
     DEFAULT_VOLUME_SLIPPAGE_BAR_LIMIT,
     FixedSlippage,
@@ -419,3 +422,100 @@ class BlotterTestCase(WithCreateBarData,
             bar_data.current(future_txn.sid, 'price') + 1.0,
         )
         self.assertEqual(commissions[1]['cost'], 2.0)
+
+    def test_prune_many_orders(self):
+        blotter = Blotter('daily', self.asset_finder)
+
+        order_ids_24 = [
+            blotter.order(self.asset_24, amount, MarketOrder())
+            for amount in (100, 200, 300, 400, 500)
+        ]
+        order_ids_25 = [
+            blotter.order(self.asset_25, amount, MarketOrder())
+            for amount in (150, 250)
+        ]
+
+        closed_orders = []
+        for order_id in order_ids_24[1::2] + order_ids_25:
+            order = blotter.orders[order_id]
+            order.filled = order.amount
+            closed_orders.append(order)
+
+        blotter.prune_orders(closed_orders)
+
+        # The remaining orders keep their order, and assets without open
+        # orders are removed.
+        self.assertEqual(list(blotter.open_orders), [self.asset_24])
+        self.assertEqual(
+            [o.id for o in blotter.open_orders[self.asset_24]],
+            order_ids_24[::2],
+        )
+
+        # Pruning orders that were already removed is a no-op.
+        blotter.prune_orders(closed_orders)
+        self.assertEqual(list(blotter.open_orders), [self.asset_24])
+        self.assertEqual(len(blotter.open_orders[self.asset_24]), 3)
+
+    def test_order_archive(self):
+        with OrderArchive() as archive:
+            blotter = Blotter(
+                self.sim_params.data_frequency,
+                self.asset_finder,
+                equity_slippage=FixedSlippage(),
+                orders=archive,
+            )
+            filled_id = blotter.order(self.asset_24, 100, MarketOrder())
+            cancelled_id = blotter.order(self.asset_25, 100, MarketOrder())
+            open_id = blotter.order(
+                self.asset_24, 100, LimitOrder(0.01),
+            )
+
+            blotter.cancel(cancelled_id)
+            cancelled_order = blotter.new_orders[-1]
+
+            blotter.current_dt = self.sim_params.sessions[-1]
+            bar_data = self.create_bardata(
+                simulation_dt_func=lambda: self.sim_params.sessions[-1],
+            )
+            txns, _, closed_orders = blotter.get_transactions(bar_data)
+            self.assertEqual([txn.order_id for txn in txns], [filled_id])
+            blotter.prune_orders(closed_orders)
+
+            self.assertEqual(
+                sorted(blotter.orders),
+                sorted([filled_id, cancelled_id, open_id]),
+            )
+            self.assertEqual(len(blotter.orders), 3)
+
+            # Open orders stay in memory, closed orders are loaded from disk.
+            self.assertIs(
+                blotter.orders[open_id],
+                blotter.open_orders[self.asset_24][0],
+            )
+
+            filled_order = blotter.orders[filled_id]
+            self.assertIsNot(filled_order, closed_orders[0])
+            self.assertEqual(
+                filled_order.to_dict(),
+                closed_orders[0].to_dict(),
+            )
+            self.assertEqual(filled_order.status, ORDER_STATUS.FILLED)
+
+            self.assertIsNot(blotter.orders[cancelled_id], cancelled_order)
+            self.assertEqual(
+                blotter.orders[cancelled_id].status,
+                ORDER_STATUS.CANCELLED,
+            )
+
+            # Archived orders are copies; storing one again moves it back
+            # into memory.
+            filled_order.reason = 'changed'
+            self.assertIsNone(blotter.orders[filled_id].reason)
+            blotter.orders[filled_id] = filled_order
+            self.assertIs(blotter.orders[filled_id], filled_order)
+            self.assertEqual(len(blotter.orders), 3)
+
+            blotter.close()
+            self.assertTrue(archive.closed)
+
+        self.assertFalse(os.path.exists(archive.path))
@@ -1,6 +1,9 @@
 from datetime import timedelta
 from textwrap import dedent
 
+from nose_parameterized import parameterized
+import numpy as np
+
 from zipline import TradingAlgorithm
 from zipline.finance.commission import PerTrade, PerShare, PerDollar
 from zipline.finance.order import Order
@@ -100,6 +103,59 @@ class CommissionUnitTests(WithAssetFinder, ZiplineTestCase):
         self.assertAlmostEqual(25.755, model.calculate(order, txns[1]))
         self.assertAlmostEqual(15.3, model.calculate(order, txns[2]))
 
+    @parameterized.expand([
+        ('per_trade', PerTrade, {'cost': 10}),
+        ('per_share_no_minimum',
+         PerShare, {'cost': 0.0075, 'min_trade_cost': None}),
+        ('per_share_with_minimum',
+         PerShare, {'cost': 0.05, 'min_trade_cost': 3}),
+        ('per_dollar', PerDollar, {'cost': 0.0015}),
+    ])
+    def test_calculate_batch(self, name, model_type, kwargs):
+        model = model_type(**kwargs)
+        asset1 = self.asset_finder.retrieve_asset(1)
+        rand = np.random.RandomState(0)
+
+        orders = []
+        txns = []
+        for _ in range(100):
+            direction = rand.choice([-1, 1])
+            order = Order(dt=None, sid=asset1, amount=direction * 500)
+            # Some orders have already been partially filled and charged.
+            if rand.rand() < 0.5:
+                order.filled = direction * rand.randint(1, 400)
+                order.commission = rand.choice([0.0, 1.0, 4.0])
+            orders.append(order)
+            txns.append(Transaction(
+                sid=asset1,
+                amount=direction * rand.randint(1, 100),
+                dt=None,
+                price=rand.uniform(10, 200),
+                order_id=order.id,
+            ))
+
+        expected = [
+            model.calculate(order, txn) for order, txn in zip(orders, txns)
+        ]
+        np.testing.assert_allclose(
+            model.calculate_batch(orders, txns),
+            expected,
+            rtol=1e-12,
+        )
+
+        # Models that override ``calculate`` fall back to calling it for each
+        # order.
+        class Doubled(model_type):
+            def calculate(self, order, transaction):
+                return 2 * super(Doubled, self).calculate(order, transaction)
+
+        doubled = Doubled(**kwargs)
+        np.testing.assert_allclose(
+            doubled.calculate_batch(orders, txns),
+            np.multiply(expected, 2),
+            rtol=1e-12,
+        )
+
 
 class CommissionAlgorithmTests(WithDataPortal, WithSimParams, ZiplineTestCase):
     # make sure order commissions are properly incremented
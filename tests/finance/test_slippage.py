@@ -18,6 +18,7 @@ Unit tests for finance.slippage
 '''
 import datetime
 from collections import namedtuple
+from copy import deepcopy
 
 import pytz
 
@@ -26,8 +27,9 @@ from nose_parameterized import parameterized
 import pandas as pd
 from pandas.tslib import normalize_date
 
-from zipline.finance.slippage import VolumeShareSlippage, \
-    fill_price_worse_than_limit_price
+from zipline.finance.slippage import FixedSlippage, SlippageModel, \
+    VolumeShareSlippage, fill_price_worse_than_limit_price
+from zipline.finance.transaction import create_transaction
 
 from zipline.protocol import DATASOURCE_TYPE, BarData
 from zipline.finance.blotter import Order
@@ -839,3 +841,140 @@ class OrdersStopTestCase(WithSimParams,
 
                 for key, value in expected['transaction'].items():
                     self.assertEquals(value, txn[key])
+
+
+class SimulateBatchTestCase(WithCreateBarData,
+                            WithSimParams,
+                            WithDataPortal,
+                            ZiplineTestCase):
+    START_DATE = pd.Timestamp('2006-01-05 14:31', tz='utc')
+    END_DATE = pd.Timestamp('2006-01-05 14:36', tz='utc')
+    SIM_PARAMS_CAPITAL_BASE = 1.0e5
+    SIM_PARAMS_DATA_FREQUENCY = 'minute'
+    SIM_PARAMS_EMISSION_RATE = 'daily'
+
+    ASSET_FINDER_EQUITY_SIDS = (133, 134, 135)
+    ASSET_FINDER_EQUITY_START_DATE = pd.Timestamp('2006-01-05', tz='utc')
+    ASSET_FINDER_EQUITY_END_DATE = pd.Timestamp('2006-01-07', tz='utc')
+    minutes = pd.DatetimeIndex(
+        start=START_DATE,
+        end=END_DATE - pd.Timedelta('1 minute'),
+        freq='1min'
+    )
+
+    @classproperty
+    def CREATE_BARDATA_DATA_FREQUENCY(cls):
+        return cls.sim_params.data_frequency
+
+    @classmethod
+    def make_equity_minute_bar_data(cls):
+        for sid, volume in ((133, 20000), (134, 300), (135, 0)):
+            yield sid, pd.DataFrame(
+                {
+                    'open': [3.0, 3.0, 3.5, 4.0, 3.5],
+                    'high': [3.15, 3.15, 3.15, 3.15, 3.15],
+                    'low': [2.85, 2.85, 2.85, 2.85, 2.85],
+                    'close': [3.0, 3.5, 4.0, 3.5, 3.0],
+                    'volume': [volume] * 5,
+                },
+                index=cls.minutes,
+            )
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(SimulateBatchTestCase, cls).init_class_fixtures()
+        cls.assets = cls.env.asset_finder.retrieve_all(
+            cls.ASSET_FINDER_EQUITY_SIDS,
+        )
+
+    def make_orders(self):
+        dt = datetime.datetime(2006, 1, 5, 14, 30, tzinfo=pytz.utc)
+        order_kwargs = [
+            {'amount': 100},
+            {'amount': -300},
+            {'amount': 50, 'limit': 3.6},
+            {'amount': -50, 'limit': 3.4},
+            {'amount': 200, 'stop': 3.6},
+            {'amount': -200, 'stop': 3.6, 'limit': 3.55},
+            {'amount': 500},
+        ]
+        return [
+            [Order(dt=dt, sid=asset, **kwargs) for kwargs in order_kwargs]
+            for asset in self.assets
+        ]
+
+    @parameterized.expand([
+        ('volume_share', VolumeShareSlippage()),
+        ('volume_share_no_limit', VolumeShareSlippage(volume_limit=1.0)),
+        ('fixed', FixedSlippage(spread=0.1)),
+    ])
+    def test_simulate_batch(self, name, slippage_model):
+        orders = self.make_orders()
+        batch_orders = deepcopy(orders)
+
+        for minute in self.minutes:
+            bar_data = self.create_bardata(
+                simulation_dt_func=lambda: minute,
+            )
+
+            expected = [
+                list(slippage_model.simulate(bar_data, asset, asset_orders))
+                for asset, asset_orders in zip(self.assets, orders)
+            ]
+            result = slippage_model.simulate_batch(
+                bar_data,
+                self.assets,
+                batch_orders,
+            )
+
+            self.assertEqual(len(result), len(expected))
+            for asset_result, asset_expected in zip(result, expected):
+                self.assertEqual(
+                    [(o.id, txn.__dict__) for o, txn in asset_result],
+                    [(o.id, txn.__dict__) for o, txn in asset_expected],
+                )
+                for order, txn in asset_expected:
+                    order.filled += txn.amount
+                for order, txn in asset_result:
+                    order.filled += txn.amount
+
+            for asset_orders, asset_batch_orders in zip(orders,
+                                                        batch_orders):
+                self.assertEqual(
+                    [o.to_dict() for o in asset_batch_orders],
+                    [o.to_dict() for o in asset_orders],
+                )
+
+    @parameterized.expand([
+        ('slippage_model', SlippageModel),
+        ('volume_share', VolumeShareSlippage),
+        ('fixed', FixedSlippage),
+    ])
+    def test_simulate_batch_overridden_simulate(self, name, base):
+
+        # Fills the first order of every asset, even without volume.
+        def simulate(self, data, asset, orders_for_asset):
+            order = orders_for_asset[0]
+            yield order, create_transaction(
+                order, data.current_dt, 1.0, order.amount,
+            )
+
+        methods = {'simulate': simulate}
+        if base is SlippageModel:
+            methods['process_order'] = lambda self, data, order: None
+        FillFirstOrder = type('FillFirstOrder', (base,), methods)
+
+        orders = self.make_orders()
+        bar_data = self.create_bardata(
+            simulation_dt_func=lambda: self.minutes[0],
+        )
+        result = FillFirstOrder().simulate_batch(
+            bar_data,
+            self.assets,
+            orders,
+        )
+
+        self.assertEqual(
+            [[(o.id, txn.amount) for o, txn in fills] for fills in result],
+            [[(o[0].id, o[0].amount)] for o in orders],
+        )
@@ -13,6 +13,7 @@ from numpy import (
     asarray,
     dtype,
     full,
+    may_share_memory,
     where,
 )
 from six.moves import zip_longest
@@ -28,7 +29,7 @@ from zipline.lib.adjustment import (
     Int64Overwrite,
     ObjectOverwrite,
 )
-from zipline.lib.adjusted_array import AdjustedArray, NOMASK
+from zipline.lib.adjusted_array import AdjustedArray, NOMASK, window_blocks
 from zipline.lib.labelarray import LabelArray
 from zipline.testing import check_arrays, parameter_space
 from zipline.utils.compat import unicode
@@ -36,6 +37,7 @@ from zipline.utils.numpy_utils import (
     coerce_to_dtype,
     datetime64ns_dtype,
     default_missing_value_for_dtype,
+    float32_dtype,
     float64_dtype,
     int64_dtype,
     object_dtype,
@@ -585,6 +587,81 @@ class AdjustedArrayTestCase(TestCase):
             for yielded, expected_yield in zip_longest(window_iter, expected):
                 check_arrays(yielded, expected_yield)
 
+    @parameterized.expand(
+        chain(
+            _gen_multiplicative_adjustment_cases(float64_dtype),
+            _gen_overwrite_adjustment_cases(float64_dtype),
+            _gen_overwrite_1d_array_adjustment_case(float64_dtype),
+        )
+    )
+    def test_float32_adjustments(self,
+                                 name,
+                                 data,
+                                 lookback,
+                                 adjustments,
+                                 missing_value,
+                                 perspective_offset,
+                                 expected):
+
+        array = AdjustedArray(
+            data,
+            NOMASK,
+            adjustments,
+            missing_value,
+            float32=True,
+        )
+        self.assertEqual(array.dtype, float32_dtype)
+        window_iter = array.traverse(
+            lookback,
+            perspective_offset=perspective_offset,
+        )
+        # All of the values in these cases are exactly representable as
+        # float32, so rounding doesn't introduce any error.
+        for yielded, expected_yield in zip_longest(window_iter, expected):
+            check_arrays(yielded, expected_yield.astype(float32_dtype))
+
+    @parameterized.expand(
+        chain(
+            _gen_multiplicative_adjustment_cases(float64_dtype),
+            _gen_overwrite_adjustment_cases(float64_dtype),
+        )
+    )
+    def test_window_blocks(self,
+                           name,
+                           data,
+                           lookback,
+                           adjustments,
+                           missing_value,
+                           perspective_offset,
+                           expected):
+
+        array = AdjustedArray(data, NOMASK, adjustments, missing_value)
+        window_iter = array.traverse(
+            lookback,
+            perspective_offset=perspective_offset,
+        )
+        blocks = list(window_blocks([window_iter], len(expected)))
+
+        # Blocks should tile the output rows.
+        starts = [start for start, _, _ in blocks]
+        stops = [stop for _, stop, _ in blocks]
+        self.assertEqual(starts, [0] + stops[:-1])
+        self.assertEqual(stops[-1], len(expected))
+
+        yielded = []
+        for start, stop, (block,) in blocks:
+            self.assertEqual(len(block), stop - start + lookback - 1)
+            self.assertFalse(block.flags.writeable)
+            yielded.extend(
+                block[i:i + lookback] for i in range(stop - start)
+            )
+        for window, expected_window in zip_longest(yielded, expected):
+            check_arrays(window, expected_window)
+
+        # The window should be left exhausted, as if we had iterated over it.
+        with self.assertRaises(StopIteration):
+            next(window_iter)
+
     @parameterized.expand(
         chain(
             _gen_overwrite_adjustment_cases(int64_dtype),
@@ -742,6 +819,44 @@ class AdjustedArrayTestCase(TestCase):
             with self.assertRaises(ValueError):
                 frame[0, 0] = 5.0
 
+    def test_traverse_shares_unadjusted_data(self):
+        data = arange(30, dtype=float).reshape(6, 5)
+        adj_array = AdjustedArray(data, NOMASK, {}, float('nan'))
+
+        for frame in adj_array.traverse(3):
+            self.assertTrue(may_share_memory(frame, adj_array.data))
+
+    def test_traverse_copies_on_first_adjustment(self):
+        data = arange(30, dtype=float).reshape(6, 5)
+        adjustments = {
+            3: [Float64Multiply(first_row=0,
+                                last_row=2,
+                                first_col=0,
+                                last_col=4,
+                                value=2.0)],
+        }
+        adj_array = AdjustedArray(data, NOMASK, adjustments, float('nan'))
+
+        first = adj_array.traverse(2)
+        second = adj_array.traverse(2)
+
+        # Windows ending before the adjustment is known are views over the
+        # array's own data.
+        for _ in range(2):
+            self.assertTrue(may_share_memory(next(first), adj_array.data))
+        check_arrays(next(first), data[2:4] * [[2.0], [1.0]])
+
+        # Only the rows from the window being produced on are copied.
+        self.assertEqual(first.data_offset, 2)
+        check_arrays(first.data, data[2:] * [[2.0], [1.0], [1.0], [1.0]])
+        check_arrays(next(first), data[3:5])
+
+        # Applying the adjustment in one traversal doesn't affect the
+        # array's data or any other traversal over it.
+        check_arrays(adj_array.data, data)
+        check_arrays(next(second), data[0:2])
+        check_arrays(next(second), data[1:3])
+
     def test_bad_input(self):
         msg = "Mask shape \(2L?, 3L?\) != data shape \(5L?, 5L?\)"
         data = arange(25).reshape(5, 5)
@@ -3,6 +3,7 @@ Tests for zipline.lib.adjustment
 """
 from unittest import TestCase
 from nose_parameterized import parameterized
+import numpy as np
 
 from zipline.lib import adjustment as adj
 from zipline.utils.numpy_utils import make_datetime64ns
@@ -83,6 +84,33 @@ class AdjustmentTestCase(TestCase):
         )
         self.assertEqual(result, expected)
 
+    @parameterized.expand([
+        ('multiply', adj.Float64Multiply(1, 3, 0, 1, 2.0), [2.0, 2.0]),
+        ('add', adj.Float64Add(1, 3, 0, 1, 2.0), [3.0, 3.0]),
+        ('overwrite', adj.Float64Overwrite(1, 3, 0, 1, 2.0), [2.0, 2.0]),
+        (
+            'array_overwrite',
+            adj.Float641DArrayOverwrite(1, 3, 0, 1, np.array([4., 5., 6.])),
+            [5.0, 6.0],
+        ),
+    ])
+    def test_mutate_with_row_offset(self, name, adjustment, values):
+        data = np.ones((4, 3))
+        expected = np.ones((4, 3))
+        adjustment.mutate(expected)
+
+        # ``data`` holds rows 2 through 5 of the adjusted array, so only
+        # the last two rows of the adjustment land in it.
+        adjustment.mutate(data, 2)
+        np.testing.assert_array_equal(data[:2], expected[2:4])
+        np.testing.assert_array_equal(data[2:], np.ones((2, 3)))
+        np.testing.assert_array_equal(data[:2, 0], values)
+
+        # Adjustments that end before ``data`` starts do nothing.
+        data = np.ones((4, 3))
+        adjustment.mutate(data, 4)
+        np.testing.assert_array_equal(data, np.ones((4, 3)))
+
     def test_unsupported_type(self):
         class SomeClass(object):
             pass
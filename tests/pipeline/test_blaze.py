@@ -28,6 +28,7 @@ from zipline.pipeline.loaders.blaze import (
     from_blaze,
     BlazeLoader,
     NoMetaDataWarning,
+    QueryCache,
 )
 from zipline.pipeline.loaders.blaze.core import (
     ExprData,
@@ -37,6 +38,7 @@ from zipline.testing import (
     ZiplineTestCase,
     parameter_space,
     tmp_asset_finder,
+    tmp_dir,
 )
 from zipline.testing.fixtures import WithAssetFinder
 from zipline.testing.predicates import assert_equal, assert_isidentical
@@ -1249,8 +1251,9 @@ class BlazeToPipelineTestCase(WithAssetFinder, ZiplineTestCase):
                       end,
                       window_length,
                       compute_fn,
-                      apply_deltas_adjustments=True):
-        loader = BlazeLoader()
+                      apply_deltas_adjustments=True,
+                      cache=None):
+        loader = BlazeLoader(cache=cache)
         ds = from_blaze(
             expr,
             deltas,
@@ -1771,7 +1774,10 @@ class BlazeToPipelineTestCase(WithAssetFinder, ZiplineTestCase):
 
         self._test_checkpoints_macro(checkpoints)
 
-    def _test_checkpoints(self, checkpoints, ffilled_values=None):
+    def _test_checkpoints(self,
+                          checkpoints,
+                          ffilled_values=None,
+                          cache=None):
         """Simple checkpoints test that accepts a checkpoints dataframe and
         the expected value for 2014-01-03.
 
@@ -1784,6 +1790,8 @@ class BlazeToPipelineTestCase(WithAssetFinder, ZiplineTestCase):
         ffilled_value : float, optional
             The value to be read on the third, if not provided, it will be the
             value in the base data that will be naturally ffilled there.
+        cache : QueryCache, optional
+            The cache to load the data through.
         """
         nassets = len(simple_asset_info)
 
@@ -1834,6 +1842,7 @@ class BlazeToPipelineTestCase(WithAssetFinder, ZiplineTestCase):
                 end=dates[-1],
                 window_length=1,
                 compute_fn=op.itemgetter(-1),
+                cache=cache,
             )
 
     def test_checkpoints(self):
@@ -1849,6 +1858,22 @@ class BlazeToPipelineTestCase(WithAssetFinder, ZiplineTestCase):
 
         self._test_checkpoints(checkpoints, ffilled_values)
 
+    def test_checkpoints_cached(self):
+        nassets = len(simple_asset_info)
+        ffilled_values = (np.arange(nassets, dtype=np.float64) + 1) * 10
+        dates = [pd.Timestamp('2014-01-02')] * nassets
+        checkpoints = pd.DataFrame({
+            'sid': simple_asset_info.index,
+            'value': ffilled_values,
+            'asof_date': dates,
+            'timestamp': dates,
+        })
+        cache = QueryCache(self.enter_instance_context(tmp_dir()).path)
+
+        # Run twice so that the second run is served from the cache.
+        for _ in range(2):
+            self._test_checkpoints(checkpoints, ffilled_values, cache=cache)
+
     def test_empty_checkpoints(self):
         checkpoints = pd.DataFrame({
             'sid': [],
@@ -1956,6 +1981,64 @@ class MiscTestCase(ZiplineTestCase):
             "apply_deltas_adjustments=True)",
         )
 
+    def test_query_cache(self):
+        ts = pd.to_datetime([
+            '2014-01-03', '2014-01-01', '2014-01-02', '2014-01-02',
+            '2014-01-04',
+        ])
+        df = pd.DataFrame({
+            'sid': [1, 2, 3, 4, 5],
+            'value': [3.0, 1.0, 2.0, 2.5, 4.0],
+            'asof_date': ts,
+            'timestamp': ts,
+        })
+        expr = bz.data(
+            df,
+            name='expr',
+            dshape="""var * {
+                sid: int64,
+                value: float64,
+                asof_date: datetime,
+                timestamp: datetime,
+            }""",
+        )
+        colnames = ['sid', 'timestamp', 'value']
+        cache = QueryCache(self.enter_instance_context(tmp_dir()).path)
+
+        T = pd.Timestamp
+        for lower, upper in ((None, T('2014-01-02')),
+                             (T('2014-01-02'), T('2014-01-03')),
+                             (T('2014-01-02', tz='utc'), T('2014-01-10')),
+                             (T('2014-01-05'), T('2014-01-10'))):
+            pred = expr.timestamp <= upper
+            if lower is not None:
+                pred &= expr.timestamp >= lower
+            expected = odo(
+                expr[pred][colnames],
+                pd.DataFrame,
+            ).sort_values(['timestamp', 'sid']).reset_index(drop=True)
+            assert_frame_equal(
+                cache.query(expr, colnames, lower, upper),
+                expected,
+                check_dtype=False,
+            )
+
+        checkpoint_ts, checkpoint = cache.checkpoint(
+            expr,
+            colnames,
+            T('2014-01-02 12:00'),
+        )
+        assert_equal(checkpoint_ts, T('2014-01-02'))
+        assert_equal(list(checkpoint.sid), [3, 4])
+
+        checkpoint_ts, checkpoint = cache.checkpoint(
+            expr,
+            colnames,
+            T('2013-12-31'),
+        )
+        self.assertIsNone(checkpoint_ts)
+        self.assertTrue(checkpoint.empty)
+
     def test_blaze_loader_repr(self):
         assert_equal(repr(BlazeLoader()), '<BlazeLoader: {}>')
 
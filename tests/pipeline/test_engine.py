@@ -5,6 +5,7 @@ from __future__ import division
 from collections import OrderedDict
 from itertools import product
 from operator import add, sub
+import os
 
 from nose_parameterized import parameterized
 from numpy import (
@@ -17,6 +18,7 @@ from numpy import (
     full_like,
     log,
     nan,
+    nanmean,
     tile,
     where,
     zeros,
@@ -41,6 +43,7 @@ from zipline.errors import NoFurtherDataError
 from zipline.lib.adjustment import MULTIPLY
 from zipline.lib.labelarray import LabelArray
 from zipline.pipeline import CustomFactor, Pipeline
+from zipline.pipeline.cache import TermCache, UncacheableTerm, term_key
 from zipline.pipeline.data import Column, DataSet, USEquityPricing
 from zipline.pipeline.data.testing import TestingDataSet
 from zipline.pipeline.engine import SimplePipelineEngine
@@ -51,6 +54,7 @@ from zipline.pipeline.factors import (
     ExponentialWeightedMovingAverage,
     ExponentialWeightedMovingStdDev,
     MaxDrawdown,
+    Returns,
     SimpleMovingAverage,
 )
 from zipline.pipeline.loaders.equity_pricing_loader import (
@@ -63,7 +67,7 @@ from zipline.pipeline.loaders.synthetic import (
     expected_bar_values_2d,
 )
 from zipline.pipeline.sentinels import NotSpecified
-from zipline.pipeline.term import InputDates
+from zipline.pipeline.term import AssetExists, InputDates
 from zipline.testing import (
     AssetID,
     AssetIDPlusDay,
@@ -75,8 +79,10 @@ from zipline.testing import (
     parameter_space,
     product_upper_triangle,
 )
+from zipline.testing.core import UnexpectedAttributeAccess
 from zipline.testing.fixtures import (
     WithAdjustmentReader,
+    WithInstanceTmpDir,
     WithSeededRandomPipelineEngine,
     WithTradingEnvironment,
     ZiplineTestCase,
@@ -161,6 +167,20 @@ class RecordingPrecomputedLoader(PrecomputedLoader):
         )
 
 
+class RecordingDataFrameLoader(DataFrameLoader):
+    def __init__(self, *args, **kwargs):
+        super(RecordingDataFrameLoader, self).__init__(*args, **kwargs)
+
+        self.load_calls = []
+
+    def load_adjusted_array(self, columns, dates, assets, mask):
+        self.load_calls.append(assets)
+
+        return super(RecordingDataFrameLoader, self).load_adjusted_array(
+            columns, dates, assets, mask,
+        )
+
+
 class RollingSumSum(CustomFactor):
     def compute(self, today, assets, out, *inputs):
         assert len(self.inputs) == len(inputs)
@@ -813,6 +833,54 @@ class ConstantInputTestCase(WithConstantInputs, ZiplineTestCase):
                          {ColumnArgs.sorted_by_ds(Loader2DataSet.col1,
                                                   Loader2DataSet.col2)})
 
+    def test_run_pipelines_shares_terms(self):
+        loader = RecordingPrecomputedLoader(
+            constants=self.constants,
+            dates=self.dates,
+            sids=self.asset_ids,
+        )
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        )
+
+        compute_calls = []
+
+        class CountingFactor(CustomFactor):
+            inputs = [USEquityPricing.close]
+            window_length = 3
+
+            def compute(self, today, assets, out, closes):
+                compute_calls.append(today)
+                out[:] = closes.sum(axis=0)
+
+        shared = CountingFactor()
+        pipelines = {
+            'first': Pipeline({'shared': shared}),
+            'second': Pipeline(
+                {'shared': shared, 'low': USEquityPricing.low.latest},
+                screen=AssetID() <= self.asset_ids[1],
+            ),
+        }
+        dates = self.dates[5:10]
+        results = engine.run_pipelines(pipelines, dates[0], dates[-1])
+
+        # Each day of the shared factor should only have been computed once.
+        self.assertEqual(len(compute_calls), len(dates))
+        # Each column should only have been loaded once.
+        self.assertEqual(len(loader.load_calls), 2)
+        self.assertEqual(
+            set(loader.load_calls),
+            {ColumnArgs(USEquityPricing.close),
+             ColumnArgs(USEquityPricing.low)},
+        )
+
+        self.assertEqual(set(results), {'first', 'second'})
+        for name, pipeline in iteritems(pipelines):
+            assert_frame_equal(
+                results[name],
+                engine.run_pipeline(pipeline, dates[0], dates[-1]),
+            )
+
 
 class FrameInputTestCase(WithTradingEnvironment, ZiplineTestCase):
     asset_ids = ASSET_FINDER_EQUITY_SIDS = 1, 2, 3
@@ -917,6 +985,387 @@ class FrameInputTestCase(WithTradingEnvironment, ZiplineTestCase):
                 high_results = results.unstack()['high']
                 assert_frame_equal(high_results, high_base.iloc[iloc_bounds])
 
+    def test_incremental_matches_chunked(self):
+        dates, asset_ids = self.dates, self.asset_ids
+        high = USEquityPricing.high
+        adjustments = DataFrame.from_records(
+            [
+                dict(
+                    kind=MULTIPLY,
+                    sid=asset_ids[1],
+                    value=2.0,
+                    start_date=None,
+                    end_date=dates[apply_idx - 1],
+                    apply_date=dates[apply_idx],
+                )
+                for apply_idx in (3, 10, 16)
+            ]
+        )
+        baseline = self.make_frame(
+            arange(len(dates) * len(asset_ids), dtype=float).reshape(
+                len(dates), len(asset_ids),
+            ) + 1,
+        )
+        loader = DataFrameLoader(high, baseline, adjustments)
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+        )
+
+        sma = SimpleMovingAverage(inputs=[high], window_length=3)
+        returns = Returns(inputs=[high], window_length=2)
+        pipeline = Pipeline(
+            columns={
+                'sma': sma,
+                'sma_of_returns': SimpleMovingAverage(
+                    inputs=[returns],
+                    window_length=3,
+                ),
+                'masked_sma': SimpleMovingAverage(
+                    inputs=[high],
+                    window_length=2,
+                    mask=sma > 20,
+                ),
+                'weekly_sma': sma.downsample('week_start'),
+                'rank': sma.rank(),
+            },
+            screen=high.latest > 10,
+        )
+
+        start, end = dates[5], dates[-1]
+        expected = engine.run_pipeline(pipeline, start, end)
+
+        incremental = list(
+            engine.run_pipeline_incrementally(pipeline, start, end)
+        )
+        self.assertEqual(
+            [date for date, _ in incremental],
+            list(dates[5:]),
+        )
+        for date, result in incremental:
+            assert_frame_equal(result, expected.loc[[date]])
+
+        # Computed terms only keep the trailing rows their dependents read.
+        plan = pipeline.to_execution_plan(
+            'screen',
+            AssetExists(),
+            dates,
+            start,
+            end,
+        )
+        columns = pipeline.columns
+        depths = SimplePipelineEngine._row_depths(
+            plan,
+            [returns] + list(columns.values()),
+        )
+        self.assertEqual(depths[returns], 3)
+        self.assertEqual(depths[sma], 1)
+        self.assertEqual(depths[columns['weekly_sma']], 2)
+
+    def test_screen_first(self):
+        dates, asset_ids = self.dates, self.asset_ids
+        high = USEquityPricing.high
+        adjustments = DataFrame.from_records(
+            [
+                dict(
+                    kind=MULTIPLY,
+                    sid=asset_ids[1],
+                    value=2.0,
+                    start_date=None,
+                    end_date=dates[apply_idx - 1],
+                    apply_date=dates[apply_idx],
+                )
+                for apply_idx in (3, 10, 16)
+            ]
+        )
+        baseline = self.make_frame(
+            arange(len(dates) * len(asset_ids), dtype=float).reshape(
+                len(dates), len(asset_ids),
+            ) + 1,
+        )
+        loader = RecordingDataFrameLoader(high, baseline, adjustments)
+        get_loader = lambda column: loader  # noqa
+
+        sma = SimpleMovingAverage(inputs=[high], window_length=3)
+        pipeline = Pipeline(
+            columns={
+                'sma': sma,
+                'sma_of_returns': SimpleMovingAverage(
+                    inputs=[Returns(inputs=[high], window_length=2)],
+                    window_length=3,
+                ),
+                'rank': sma.rank(),
+                'demeaned': sma.demean(),
+            },
+            screen=sma.top(1),
+        )
+        start, end = dates[5], dates[-1]
+
+        expected = SimplePipelineEngine(
+            get_loader,
+            self.dates,
+            self.asset_finder,
+        ).run_pipeline(pipeline, start, end)
+        # Only the second and third assets ever have the highest average.
+        self.assertEqual(
+            set(expected.index.get_level_values(1)),
+            set(self.asset_finder.retrieve_all(asset_ids[1:])),
+        )
+
+        del loader.load_calls[:]
+        result = SimplePipelineEngine(
+            get_loader,
+            self.dates,
+            self.asset_finder,
+            screen_first=True,
+        ).run_pipeline(pipeline, start, end)
+        assert_frame_equal(result, expected)
+
+        # The screen and the cross-sectional columns are computed over every
+        # asset; everything else is computed over the survivors only.
+        self.assertEqual(
+            [list(assets) for assets in loader.load_calls],
+            [list(asset_ids), list(asset_ids[1:])],
+        )
+
+    def _screen_first_inputs(self):
+        dates, asset_ids = self.dates, self.asset_ids
+        high = USEquityPricing.high
+        adjustments = DataFrame.from_records(
+            [
+                dict(
+                    kind=MULTIPLY,
+                    sid=asset_ids[1],
+                    value=2.0,
+                    start_date=None,
+                    end_date=dates[apply_idx - 1],
+                    apply_date=dates[apply_idx],
+                )
+                for apply_idx in (3, 10, 16)
+            ]
+        )
+        baseline = self.make_frame(
+            arange(len(dates) * len(asset_ids), dtype=float).reshape(
+                len(dates), len(asset_ids),
+            ) + 1,
+        )
+        return RecordingDataFrameLoader(high, baseline, adjustments)
+
+    def test_screen_first_reuses_shared_terms(self):
+        loader = self._screen_first_inputs()
+        get_loader = lambda column: loader  # noqa
+        high = USEquityPricing.high
+
+        sma = SimpleMovingAverage(inputs=[high], window_length=3)
+        pipeline = Pipeline(
+            columns={
+                'sma': sma,
+                'short_sma': SimpleMovingAverage(
+                    inputs=[high],
+                    window_length=2,
+                ),
+            },
+            screen=sma.top(1),
+        )
+        start, end = self.dates[5], self.dates[-1]
+
+        expected = SimplePipelineEngine(
+            get_loader,
+            self.dates,
+            self.asset_finder,
+        ).run_pipeline(pipeline, start, end)
+
+        del loader.load_calls[:]
+        result = SimplePipelineEngine(
+            get_loader,
+            self.dates,
+            self.asset_finder,
+            screen_first=True,
+        ).run_pipeline(pipeline, start, end)
+        assert_frame_equal(result, expected)
+
+        # ``high`` is loaded with enough rows for both passes, so the
+        # survivors' columns are cut out of the first load.
+        self.assertEqual(
+            [list(assets) for assets in loader.load_calls],
+            [list(self.asset_ids)],
+        )
+
+    def test_screen_first_overridden_compute(self):
+        loader = self._screen_first_inputs()
+        get_loader = lambda column: loader  # noqa
+        high = USEquityPricing.high
+
+        class DemeanedReturns(Returns):
+            # Inherits asset_independent from Returns, but compares assets
+            # with one another.
+            def compute(self, today, assets, out, close):
+                super(DemeanedReturns, self).compute(
+                    today, assets, out, close,
+                )
+                out -= nanmean(out)
+
+        sma = SimpleMovingAverage(inputs=[high], window_length=3)
+        pipeline = Pipeline(
+            columns={
+                'demeaned': DemeanedReturns(inputs=[high], window_length=2),
+            },
+            screen=sma.top(1),
+        )
+        start, end = self.dates[5], self.dates[-1]
+
+        expected = SimplePipelineEngine(
+            get_loader,
+            self.dates,
+            self.asset_finder,
+        ).run_pipeline(pipeline, start, end)
+
+        del loader.load_calls[:]
+        result = SimplePipelineEngine(
+            get_loader,
+            self.dates,
+            self.asset_finder,
+            screen_first=True,
+        ).run_pipeline(pipeline, start, end)
+        assert_frame_equal(result, expected)
+
+        # The column is computed over every asset in the first pass.
+        self.assertEqual(
+            [list(assets) for assets in loader.load_calls],
+            [list(self.asset_ids)],
+        )
+
+    def test_screen_first_latest(self):
+        loader = self._screen_first_inputs()
+        high, low = USEquityPricing.high, USEquityPricing.low
+        low_loader = RecordingDataFrameLoader(
+            low,
+            self.make_frame(
+                arange(len(self.dates) * len(self.asset_ids), dtype=float)
+                .reshape(len(self.dates), len(self.asset_ids)),
+            ),
+        )
+        get_loader = {high: loader, low: low_loader}.__getitem__
+
+        sma = SimpleMovingAverage(inputs=[high], window_length=3)
+        pipeline = Pipeline(
+            columns={'low': low.latest},
+            screen=sma.top(1),
+        )
+        start, end = self.dates[5], self.dates[-1]
+
+        expected = SimplePipelineEngine(
+            get_loader,
+            self.dates,
+            self.asset_finder,
+        ).run_pipeline(pipeline, start, end)
+
+        del low_loader.load_calls[:]
+        result = SimplePipelineEngine(
+            get_loader,
+            self.dates,
+            self.asset_finder,
+            screen_first=True,
+        ).run_pipeline(pipeline, start, end)
+        assert_frame_equal(result, expected)
+
+        # ``low`` isn't needed by the screen, so it's only loaded for the
+        # survivors.
+        self.assertEqual(
+            [list(assets) for assets in low_loader.load_calls],
+            [list(self.asset_ids[1:])],
+        )
+
+        # Filters and classifiers built by ``.latest`` are asset-independent
+        # too.
+        for term in (TestingDataSet.bool_col.latest,
+                     TestingDataSet.categorical_col.latest):
+            self.assertTrue(
+                SimplePipelineEngine._is_asset_independent(term, {}),
+            )
+
+    def test_screen_first_nothing_passes(self):
+        high = USEquityPricing.high
+        loader = DataFrameLoader(high, self.make_frame(1.0))
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+            screen_first=True,
+        )
+        pipeline = Pipeline(
+            columns={'latest': high.latest},
+            screen=high.latest > 1.0,
+        )
+
+        result = engine.run_pipeline(pipeline, self.dates[0], self.dates[-1])
+        self.assertTrue(result.empty)
+        self.assertEqual(list(result.columns), ['latest'])
+
+    def test_fuse_expressions(self):
+        dates = self.dates
+        high = USEquityPricing.high
+        baseline = self.make_frame(
+            arange(len(dates) * len(self.asset_ids), dtype=float).reshape(
+                len(dates), len(self.asset_ids),
+            ) + 1,
+        )
+        baseline.iloc[7:9, 1] = nan
+        loader = DataFrameLoader(high, baseline)
+
+        latest = high.latest
+        sma = SimpleMovingAverage(inputs=[high], window_length=3)
+        # The alias and the null check each break the chain of expressions.
+        gap = (latest - sma).alias('gap')
+        spread = gap / sma
+        pipeline = Pipeline(
+            columns={
+                'spread': spread,
+                'rank': spread.rank(),
+                'valid_sma': (sma * 10).notnull() & (latest < 50),
+            },
+            screen=~spread.isnull() & (latest > 10),
+        )
+        start, end = dates[5], dates[-1]
+
+        plan = pipeline.to_execution_plan(
+            'screen',
+            AssetExists(),
+            dates,
+            start,
+            end,
+            fuse_expressions=True,
+        )
+        # ``gap`` and the expression it names are folded into ``spread``, and
+        # the null checks are folded into the filters that use them.  ``sma *
+        # 10`` would be evaluated twice by ``notnull()``, so it's kept.
+        self.assertEqual(plan.fused_count, 4)
+        self.assertEqual(
+            set(plan.fused),
+            {spread, pipeline.columns['valid_sma'], pipeline.screen},
+        )
+        self.assertNotIn(gap, plan.graph)
+
+        expected = SimplePipelineEngine(
+            lambda column: loader,
+            dates,
+            self.asset_finder,
+        ).run_pipeline(pipeline, start, end)
+        self.assertFalse(expected.empty)
+
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            dates,
+            self.asset_finder,
+            fuse_expressions=True,
+        )
+        assert_frame_equal(engine.run_pipeline(pipeline, start, end), expected)
+
+        incremental = engine.run_pipeline_incrementally(pipeline, start, end)
+        for date, result in incremental:
+            assert_frame_equal(result, expected.loc[[date]])
+
 
 class SyntheticBcolzTestCase(WithAdjustmentReader,
                              ZiplineTestCase):
@@ -1323,6 +1772,66 @@ class StringColumnTestCase(WithSeededRandomPipelineEngine,
         assert_frame_equal(result.c.unstack(), expected_final_result)
 
 
+class RawPipelineResultTestCase(WithSeededRandomPipelineEngine,
+                                ZiplineTestCase):
+
+    def test_raw_result_matches_frame(self):
+        pipe = Pipeline(
+            columns={
+                'c': TestingDataSet.categorical_col.latest,
+                'f': TestingDataSet.float_col.latest,
+            },
+            screen=TestingDataSet.bool_col.latest,
+        )
+        start_date, end_date = self.trading_days[[-10, -1]]
+
+        expected = self.run_pipeline(pipe, start_date, end_date)
+        raw = self.seeded_random_engine.run_pipeline_raw(
+            pipe,
+            start_date,
+            end_date,
+        )
+
+        self.assertEqual(len(raw), len(expected))
+        assert_equal(
+            raw.dates,
+            expected.index.get_level_values(0).tz_localize(None).values,
+        )
+        assert_equal(
+            raw.sids,
+            array([asset.sid for asset in expected.index.get_level_values(1)]),
+        )
+        assert_equal(raw.assets, expected.index.get_level_values(1).values)
+        for name in 'c', 'f':
+            assert_equal(raw.columns[name], expected[name].values)
+
+        assert_frame_equal(raw.to_frame(), expected)
+
+        by_sid = raw.to_frame(resolve_assets=False)
+        assert_equal(by_sid.index.get_level_values(1).values, raw.sids)
+        assert_equal(by_sid.values, expected.values)
+
+    def test_empty_raw_result(self):
+        pipe = Pipeline(
+            columns={'f': TestingDataSet.float_col.latest},
+            # Seeded random floats are drawn from [0, 100).
+            screen=TestingDataSet.float_col.latest < 0,
+        )
+        start_date, end_date = self.trading_days[[-10, -1]]
+
+        raw = self.seeded_random_engine.run_pipeline_raw(
+            pipe,
+            start_date,
+            end_date,
+        )
+        self.assertEqual(len(raw), 0)
+        self.assertEqual(raw.columns['f'].dtype, float)
+        assert_frame_equal(
+            raw.to_frame(),
+            self.run_pipeline(pipe, start_date, end_date),
+        )
+
+
 class WindowSafetyPropagationTestCase(WithSeededRandomPipelineEngine,
                                       ZiplineTestCase):
 
@@ -1497,3 +2006,216 @@ class PopulateInitialWorkspaceTestCase(WithConstantInputs, ZiplineTestCase):
                 precomputed_term_value,
             ),
         )
+
+
+class TermCacheTestCase(WithConstantInputs,
+                        WithInstanceTmpDir,
+                        ZiplineTestCase):
+
+    def test_cached_terms_skip_their_dependencies(self):
+        sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        pipeline = Pipeline({'sma': sma, 'sma_plus_one': sma + 1})
+        cache = TermCache(self.instance_tmpdir.path, data_version='v1')
+
+        loader = self.loader
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+            term_cache=cache,
+        )
+        expected = engine.run_pipeline(
+            pipeline,
+            self.dates[-10],
+            self.dates[-1],
+        )
+
+        # Every computed term should be served from the cache, so we should
+        # never touch the loader when running a subset of the same range.
+        engine = SimplePipelineEngine(
+            lambda column: ExplodingObject(),
+            self.dates,
+            self.asset_finder,
+            term_cache=cache,
+        )
+        result = engine.run_pipeline(
+            pipeline,
+            self.dates[-8],
+            self.dates[-2],
+        )
+        assert_frame_equal(
+            result,
+            expected.loc[self.dates[-8]:self.dates[-2]],
+        )
+
+    def test_data_version_invalidates_cache(self):
+        sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        pipeline = Pipeline({'sma': sma})
+        path = self.instance_tmpdir.path
+
+        loader = self.loader
+        SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+            term_cache=TermCache(path, data_version='v1'),
+        ).run_pipeline(pipeline, self.dates[-10], self.dates[-1])
+
+        engine = SimplePipelineEngine(
+            lambda column: ExplodingObject(),
+            self.dates,
+            self.asset_finder,
+            term_cache=TermCache(path, data_version='v2'),
+        )
+        with self.assertRaises(UnexpectedAttributeAccess):
+            engine.run_pipeline(pipeline, self.dates[-10], self.dates[-1])
+
+    def test_term_key_is_structural(self):
+        close_sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        self.assertEqual(
+            term_key(close_sma),
+            term_key(SimpleMovingAverage(
+                inputs=[USEquityPricing.close],
+                window_length=5,
+            )),
+        )
+        self.assertNotEqual(
+            term_key(close_sma),
+            term_key(SimpleMovingAverage(
+                inputs=[USEquityPricing.close],
+                window_length=6,
+            )),
+        )
+        self.assertNotEqual(
+            term_key(close_sma),
+            term_key(SimpleMovingAverage(
+                inputs=[USEquityPricing.open],
+                window_length=5,
+            )),
+        )
+
+    def test_term_key_tracks_compute_code(self):
+
+        class Scaled(CustomFactor):
+            inputs = [USEquityPricing.close]
+            window_length = 1
+
+            def compute(self, today, assets, out, close):
+                out[:] = close[-1] * 2
+
+        doubled = Scaled()
+
+        class Scaled(CustomFactor):
+            inputs = [USEquityPricing.close]
+            window_length = 1
+
+            def compute(self, today, assets, out, close):
+                out[:] = close[-1] * 3
+
+        # The bytecode is the same, only the constants differ.
+        self.assertNotEqual(term_key(doubled), term_key(Scaled()))
+
+        def make_factor(scale, offset):
+
+            def shift(data):
+                return data + offset
+
+            class Scaled(CustomFactor):
+                inputs = [USEquityPricing.close]
+                window_length = 1
+
+                def compute(self, today, assets, out, close):
+                    out[:] = self.scale(shift(close[-1]))
+
+                def scale(self, data):
+                    return data * scale
+
+            return Scaled()
+
+        key = term_key(make_factor(2, 1))
+        self.assertEqual(key, term_key(make_factor(2, 1)))
+        # Changes to closures and to helper methods invalidate the key.
+        self.assertNotEqual(key, term_key(make_factor(3, 1)))
+        self.assertNotEqual(key, term_key(make_factor(2, 2)))
+
+    def test_unhashable_dependency_is_uncacheable(self):
+        state = object()
+
+        class Stateful(CustomFactor):
+            inputs = [USEquityPricing.close]
+            window_length = 1
+
+            def compute(self, today, assets, out, close):
+                out[:] = id(state)
+
+        factor = Stateful()
+        with self.assertRaises(UncacheableTerm):
+            term_key(factor)
+
+        cache = TermCache(self.instance_tmpdir.path)
+        cache.store(
+            factor,
+            self.dates[:2],
+            self.assets,
+            full((2, len(self.assets)), 1.0),
+        )
+        self.assertEqual(os.listdir(self.instance_tmpdir.path), [])
+
+    def test_max_size_evicts_least_recently_used(self):
+        sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        path = self.instance_tmpdir.path
+        ranges = [self.dates[i * 10:(i + 1) * 10] for i in range(4)]
+        values = full((10, len(self.assets)), 1.0)
+
+        def entry_sizes():
+            return sorted(
+                os.path.getsize(os.path.join(root, name))
+                for root, _, names in os.walk(path)
+                for name in names
+            )
+
+        def backdate(seconds):
+            # Don't rely on the resolution of the filesystem's timestamps.
+            for root, _, names in os.walk(path):
+                for name in names:
+                    entry_path = os.path.join(root, name)
+                    mtime = os.path.getmtime(entry_path) - seconds
+                    os.utime(entry_path, (mtime, mtime))
+
+        # Size the cache to fit exactly two entries.
+        TermCache(path).store(sma, ranges[0], self.assets, values)
+        max_size = 2 * sum(entry_sizes())
+        cache = TermCache(path, max_size=max_size)
+
+        backdate(100)
+        cache.store(sma, ranges[1], self.assets, values)
+        backdate(10)
+        # Reading the first entry makes the second one the oldest.
+        self.assertIsNotNone(cache.load(sma, ranges[0], self.assets))
+        cache.store(sma, ranges[2], self.assets, values)
+
+        self.assertLessEqual(sum(entry_sizes()), max_size)
+        self.assertIsNotNone(cache.load(sma, ranges[0], self.assets))
+        self.assertIsNone(cache.load(sma, ranges[1], self.assets))
+        self.assertIsNotNone(cache.load(sma, ranges[2], self.assets))
+
+        # Results that could never fit aren't written.
+        cache.store(
+            sma,
+            self.dates,
+            self.assets,
+            full((len(self.dates), len(self.assets)), 1.0),
+        )
+        self.assertIsNone(cache.load(sma, self.dates, self.assets))
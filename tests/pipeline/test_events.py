@@ -20,6 +20,7 @@ from zipline.pipeline.data import DataSet, Column
 from zipline.pipeline.loaders.events import EventsLoader
 from zipline.pipeline.loaders.blaze.events import BlazeEventsLoader
 from zipline.pipeline.loaders.utils import (
+    EventIndex,
     next_event_indexer,
     normalize_timestamp_to_query_time,
     previous_event_indexer,
@@ -266,6 +267,71 @@ class EventIndexerTestCase(ZiplineTestCase):
                 # Neither event is eligible.  Return -1 as a sentinel.
                 self.assertEqual(computed_index, -1)
 
+    def test_event_index_many_events(self):
+        rand = np.random.RandomState(0)
+        nevents = 200
+        event_dates = (
+            pd.Timestamp('2013-12-15') +
+            pd.to_timedelta(rand.randint(0, 60, nevents), unit='D')
+        ).sort_values().values
+        # Some timestamps come after their event dates, and some events are
+        # for sids that we don't ask about.
+        event_timestamps = event_dates - pd.to_timedelta(
+            rand.randint(-5, 20, nevents),
+            unit='D',
+        ).values
+        event_sids = rand.randint(0, 12, nevents)
+
+        all_dates = pd.date_range('2014', '2014-01-31')
+        all_sids = np.array([0, 1, 3, 4, 7, 8, 10])
+
+        expected_next = np.full(
+            (len(all_dates), len(all_sids)),
+            -1,
+            dtype=np.int64,
+        )
+        expected_previous = expected_next.copy()
+        for i, (date, sid) in enumerate(product(all_dates.values, all_sids)):
+            relevant = event_sids == sid
+            # The earliest event that we know about whose date hasn't passed.
+            next_ = np.flatnonzero(
+                relevant &
+                (event_timestamps <= date) &
+                (date <= event_dates)
+            )
+            if len(next_):
+                expected_next.flat[i] = next_[0]
+            # The latest event whose date and timestamp have both passed.
+            previous = np.flatnonzero(
+                relevant &
+                (event_timestamps <= date) &
+                (event_dates <= date)
+            )
+            if len(previous):
+                expected_previous.flat[i] = previous[-1]
+
+        index = EventIndex(event_dates, event_timestamps, event_sids)
+        check_arrays(
+            index.next_event_indexer(all_dates, all_sids),
+            expected_next,
+        )
+        check_arrays(
+            index.previous_event_indexer(all_dates, all_sids),
+            expected_previous,
+        )
+
+        # The same index can be reused for any block of dates, such as the
+        # chunks of a pipeline run.
+        for start, stop in (0, 10), (10, 11), (11, len(all_dates)):
+            check_arrays(
+                index.next_event_indexer(all_dates[start:stop], all_sids),
+                expected_next[start:stop],
+            )
+            check_arrays(
+                index.previous_event_indexer(all_dates[start:stop], all_sids),
+                expected_previous[start:stop],
+            )
+
 
 class EventsLoaderEmptyTestCase(WithAssetFinder,
                                 WithTradingSessions,
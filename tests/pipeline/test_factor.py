@@ -20,19 +20,30 @@ from numpy import (
     rot90,
     where,
 )
-from numpy.random import randn, seed
+from numpy.random import RandomState, randn, seed
 import pandas as pd
+from scipy.stats import rankdata
 from scipy.stats.mstats import winsorize as scipy_winsorize
 
 from zipline.errors import BadPercentileBounds, UnknownRankMethod
 from zipline.lib.labelarray import LabelArray
-from zipline.lib.rank import masked_rankdata_2d
-from zipline.lib.normalize import naive_grouped_rowwise_apply as grouped_apply
+from zipline.lib.rank import (
+    grouped_rankdata_2d,
+    masked_rankdata_2d,
+    rankdata_1d_descending,
+)
+from zipline.lib.normalize import (
+    grouped_rowwise_apply,
+    grouped_rowwise_demean,
+    grouped_rowwise_zscore,
+    naive_grouped_rowwise_apply as grouped_apply,
+)
 from zipline.pipeline import Classifier, Factor, Filter
 from zipline.pipeline.factors import (
     Returns,
     RSI,
 )
+from zipline.pipeline.factors.factor import demean, winsorize, zscore
 from zipline.testing import (
     check_allclose,
     check_arrays,
@@ -965,6 +976,62 @@ class FactorTestCase(BasePipelineTestCase):
             mask=self.build_mask(nomask),
         )
 
+    @parameter_space(
+        seed_value=[1, 2],
+        ngroups=[1, 3, 50],
+        __fail_fast=True,
+    )
+    def test_grouped_kernels_match_naive_apply(self, seed_value, ngroups):
+        shape = (20, 100)
+        rand = RandomState(seed_value)
+        data = rand.randn(*shape)
+        data[rand.uniform(size=shape) < 0.2] = nan
+        labels = rand.randint(-1, ngroups, size=shape) * 7
+
+        for kernel, func in ((grouped_rowwise_demean, demean),
+                             (grouped_rowwise_zscore, zscore)):
+            check_arrays(
+                kernel(data, labels),
+                grouped_apply(data, labels, func),
+            )
+
+        # The generic implementation should pass each group to ``func`` in
+        # column order, so that order-dependent functions agree as well.
+        for func, args in ((rankdata, ('ordinal',)),
+                           (winsorize, (0.25, 0.75))):
+            check_arrays(
+                grouped_rowwise_apply(data, labels, func, args),
+                grouped_apply(data, labels, func, args),
+            )
+
+    @parameter_space(
+        method=['average', 'dense', 'max', 'min', 'ordinal'],
+        ascending=[True, False],
+        __fail_fast=True,
+    )
+    def test_grouped_rankdata_2d(self, method, ascending):
+        shape = (20, 100)
+        rand = RandomState(5)
+        # Use a small set of values so that there are many ties.
+        data = rand.randint(0, 5, size=shape).astype(float64_dtype)
+        labels = rand.randint(-1, 10, size=shape)
+
+        expected = grouped_apply(
+            data,
+            labels,
+            rankdata if ascending else rankdata_1d_descending,
+            (method,),
+        )
+        check_arrays(
+            grouped_rankdata_2d(data, labels, method, ascending),
+            expected,
+        )
+
+        out = empty(shape)
+        result = grouped_rankdata_2d(data, labels, method, ascending, out)
+        self.assertIs(result, out)
+        check_arrays(out, expected)
+
     @parameter_space(method_name=['demean', 'zscore'])
     def test_cant_normalize_non_float(self, method_name):
         class DateFactor(Factor):
@@ -23,17 +23,18 @@ from numpy import (
     rot90,
     sum as np_sum
 )
-from numpy.random import randn, seed as random_seed
+from numpy.random import RandomState, randn, seed as random_seed
 import pandas as pd
 
 from zipline.errors import BadPercentileBounds
-from zipline.pipeline import Filter, Factor, Pipeline
+from zipline.pipeline import ExecutionPlan, Filter, Factor, Pipeline
 from zipline.pipeline.classifiers import Classifier
 from zipline.pipeline.factors import CustomFactor
 from zipline.pipeline.filters import (
     All,
     Any,
     AtLeastN,
+    PartialSortFilter,
     StaticAssets,
     StaticSids,
 )
@@ -173,6 +174,50 @@ class FilterTestCase(BasePipelineTestCase):
             mask=self.build_mask(self.ones_mask()),
         )
 
+    @parameter_space(
+        seed=[1, 2],
+        missing_value=[nan, -1.0],
+        __fail_fast=True,
+    )
+    def test_top_and_bottom_match_rank(self, seed, missing_value):
+        f = SomeFactor(missing_value=missing_value)
+        mask = Mask()
+
+        # Draw from a small set of values so that there are plenty of ties.
+        rand = RandomState(seed)
+        shape = self.default_shape
+        data = rand.choice([-inf, -1.0, 0.0, 1.0, 2.0, inf], size=shape)
+        data[rand.uniform(size=shape) < 0.3] = nan
+        data[rand.uniform(size=shape) < 0.1] = -1.0
+        mask_data = rand.uniform(size=shape) < 0.8
+
+        terms = {}
+        expected_terms = {}
+        for N in (0, 1, 3, shape[1] - 1, shape[1], shape[1] + 5):
+            for ascending, method in ((False, 'top'), (True, 'bottom')):
+                for masked in (False, True):
+                    kwargs = {'mask': mask} if masked else {}
+                    name = '%s_%d_%s' % (method, N, masked)
+                    terms[name] = getattr(f, method)(N, **kwargs)
+                    expected_terms[name] = (
+                        f.rank(ascending=ascending, **kwargs) <= N
+                    )
+                    self.assertIsInstance(terms[name], PartialSortFilter)
+
+        initial_workspace = {f: data, mask: mask_data}
+        mask = self.build_mask(self.ones_mask())
+        expected = self.run_graph(
+            ExecutionPlan(
+                expected_terms,
+                all_dates=self.nyse_sessions,
+                start_date=mask.index[0],
+                end_date=mask.index[-1],
+            ),
+            initial_workspace.copy(),
+            mask,
+        )
+        self.check_terms(terms, expected, initial_workspace, mask)
+
     def test_percentile_between(self):
 
         quintiles = range(5)
@@ -28,6 +28,7 @@ from pandas import (
     Timestamp,
 )
 from pandas.tseries.tools import normalize_date
+from pandas.util.testing import assert_frame_equal
 from six import iteritems, itervalues
 
 from zipline.algorithm import TradingAlgorithm
@@ -43,7 +44,7 @@ from zipline.errors import (
 )
 from zipline.lib.adjustment import MULTIPLY
 from zipline.pipeline import Pipeline
-from zipline.pipeline.factors import VWAP
+from zipline.pipeline.factors import Returns, SimpleMovingAverage, VWAP
 from zipline.pipeline.data import USEquityPricing
 from zipline.pipeline.loaders.frame import DataFrameLoader
 from zipline.pipeline.loaders.equity_pricing_loader import (
@@ -344,6 +345,110 @@ class ClosesOnly(WithDataPortal, ZiplineTestCase):
         # Run for a week in the middle of our data.
         algo.run(self.data_portal)
 
+    @parameterized.expand([('separate', False), ('combined', True)])
+    def test_multiple_pipelines(self, test_name, combine_pipelines):
+        """
+        Assert that several attached pipelines each produce their own results,
+        whether or not they are computed together.
+        """
+        def initialize(context):
+            attach_pipeline(
+                Pipeline({'close': USEquityPricing.close.latest}),
+                'closes',
+            )
+            attach_pipeline(
+                Pipeline({
+                    'close': USEquityPricing.close.latest,
+                    'double_close': USEquityPricing.close.latest * 2,
+                }),
+                'double_closes',
+                chunks=3,
+            )
+
+        def handle_data(context, data):
+            closes = pipeline_output('closes')
+            double_closes = pipeline_output('double_closes')
+            self.assertEqual(list(closes.columns), ['close'])
+            self.assertEqual(
+                sorted(double_closes.columns),
+                ['close', 'double_close'],
+            )
+
+            date = get_datetime().normalize()
+            for asset in self.assets:
+                exists_today = self.exists(date, asset)
+                existed_yesterday = self.exists(date - self.trading_day, asset)
+                if exists_today and existed_yesterday:
+                    expected = self.expected_close(date, asset)
+                    self.assertEqual(closes.loc[asset, 'close'], expected)
+                    self.assertEqual(
+                        double_closes.loc[asset, 'double_close'],
+                        expected * 2,
+                    )
+                else:
+                    self.assertNotIn(asset, closes.index)
+                    self.assertNotIn(asset, double_closes.index)
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            data_frequency='daily',
+            get_pipeline_loader=lambda column: self.pipeline_loader,
+            start=self.first_asset_start,
+            end=self.last_asset_end,
+            env=self.env,
+            combine_pipelines=combine_pipelines,
+        )
+        algo.run(self.data_portal)
+
+    def test_incremental_pipeline_matches_chunked(self):
+        """
+        Assert that a pipeline attached with ``incremental=True`` produces the
+        same output as one computed a chunk at a time, across several chunk
+        boundaries and the split of 'A'.
+        """
+        close = USEquityPricing.close
+        sma = SimpleMovingAverage(inputs=[close], window_length=3)
+
+        def make_pipeline():
+            return Pipeline(
+                columns={
+                    'close': close.latest,
+                    'sma': sma,
+                    'returns': Returns(inputs=[close], window_length=2),
+                    'sma_rank': sma.rank(),
+                },
+            )
+
+        def initialize(context):
+            attach_pipeline(make_pipeline(), 'chunked', chunks=3)
+            attach_pipeline(
+                make_pipeline(),
+                'incremental',
+                chunks=3,
+                incremental=True,
+            )
+            context.days_with_results = 0
+
+        def handle_data(context, data):
+            chunked = pipeline_output('chunked')
+            incremental = pipeline_output('incremental')
+            assert_frame_equal(incremental, chunked)
+            if len(chunked):
+                context.days_with_results += 1
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            data_frequency='daily',
+            get_pipeline_loader=lambda column: self.pipeline_loader,
+            start=self.dates[5],
+            end=self.last_asset_end,
+            env=self.env,
+        )
+        algo.run(self.data_portal)
+        self.assertGreater(algo.days_with_results, 3)
+
 
 class MockDailyBarSpotReader(object):
     """
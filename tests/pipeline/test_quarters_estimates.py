@@ -245,6 +245,38 @@ class WithOneDayPipeline(WithEstimates):
         )
         assert_frame_equal(results, self.expected_out)
 
+    def test_load_one_day_with_later_estimates(self):
+        # Estimates that we only learn about after the requested dates can't
+        # affect the results.
+        later_events = pd.DataFrame({
+            SID_FIELD_NAME: [0, 0],
+            TS_FIELD_NAME: [pd.Timestamp('2015-01-16'),
+                            pd.Timestamp('2015-01-21')],
+            EVENT_DATE_FIELD_NAME: [pd.Timestamp('2015-01-15'),
+                                    pd.Timestamp('2015-01-25')],
+            'estimate1': [5., 7.],
+            'estimate2': [6., 8.],
+            FISCAL_QUARTER_FIELD_NAME: [2, 3],
+            FISCAL_YEAR_FIELD_NAME: [2015, 2015]
+        })
+        loader = self.make_loader(
+            pd.concat([self.events, later_events], ignore_index=True),
+            {column.name: val for column, val in self.columns.items()},
+        )
+        dataset = MultipleColumnsQuartersEstimates(1)
+        engine = SimplePipelineEngine(
+            lambda x: loader,
+            self.trading_days,
+            self.asset_finder,
+        )
+
+        results = engine.run_pipeline(
+            Pipeline({c.name: c.latest for c in dataset.columns}),
+            start_date=pd.Timestamp('2015-01-15', tz='utc'),
+            end_date=pd.Timestamp('2015-01-15', tz='utc'),
+        )
+        assert_frame_equal(results, self.expected_out)
+
 
 class PreviousWithOneDayPipeline(WithOneDayPipeline, ZiplineTestCase):
     """
@@ -1,13 +1,18 @@
 """
 Tests for statistical pipeline terms.
 """
+from warnings import catch_warnings, simplefilter
+
 from numpy import (
     arange,
+    array,
+    broadcast_arrays,
     full,
     full_like,
     nan,
     where,
 )
+from numpy.random import RandomState
 from pandas import (
     DataFrame,
     date_range,
@@ -29,11 +34,17 @@ from zipline.pipeline.factors import (
     RollingPearsonOfReturns,
     RollingSpearmanOfReturns,
 )
+from zipline.pipeline.factors.statistical import (
+    vectorized_linear_regression,
+    vectorized_pearson_r,
+    vectorized_spearman_r,
+)
 from zipline.pipeline.loaders.frame import DataFrameLoader
 from zipline.pipeline.sentinels import NotSpecified
 from zipline.testing import (
     AssetID,
     AssetIDPlusDay,
+    check_allclose,
     check_arrays,
     make_alternating_boolean_array,
     make_cascading_boolean_array,
@@ -802,3 +813,67 @@ class StatisticalMethodsTestCase(WithSeededRandomPipelineEngine,
                 columns=assets,
             )
             assert_frame_equal(output_result, expected_output_result)
+
+
+class VectorizedStatisticsTestCase(ZiplineTestCase):
+    """
+    Tests for the whole-matrix helpers used by the statistical factors.
+    """
+
+    def make_data(self, seed):
+        rand = RandomState(seed)
+        # Use a small range of integers so that we get plenty of ties.
+        a = rand.randint(0, 5, size=(20, 6)).astype(float64_dtype)
+        b = rand.randn(20, 6)
+        a[3, 2] = nan
+        b[7, 3] = nan
+        a[:, 4] = 1.0
+        return a, b
+
+    @parameter_space(seed=[1, 2, 3], broadcast=[True, False])
+    def test_correlations_match_scipy(self, seed, broadcast):
+        a, b = self.make_data(seed)
+        if broadcast:
+            b = b[:, :1]
+        b_full = broadcast_arrays(b, a)[0]
+
+        with catch_warnings():
+            # scipy complains about the column with no variance.
+            simplefilter('ignore')
+            expected_pearson = array([
+                pearsonr(a[:, i], b_full[:, i])[0] for i in range(a.shape[1])
+            ])
+            expected_spearman = array([
+                spearmanr(a[:, i], b_full[:, i])[0]
+                for i in range(a.shape[1])
+            ])
+
+        check_allclose(vectorized_pearson_r(a, b), expected_pearson)
+        check_allclose(vectorized_spearman_r(a, b), expected_spearman)
+
+    @parameter_space(seed=[1, 2, 3], broadcast=[True, False])
+    def test_regression_matches_scipy(self, seed, broadcast):
+        y, x = self.make_data(seed)
+        # linregress's handling of zero-variance inputs has changed across
+        # scipy versions, so don't test it here.
+        y[:, 4] = arange(len(y))
+        if broadcast:
+            x = x[:, :1]
+        x_full = broadcast_arrays(x, y)[0]
+
+        with catch_warnings():
+            simplefilter('ignore')
+            # `linregress` returns its results in the following order:
+            # slope, intercept, r-value, p-value, stderr
+            expected = [
+                linregress(y=y[:, i], x=x_full[:, i])
+                for i in range(y.shape[1])
+            ]
+            result = vectorized_linear_regression(y=y, x=x)
+
+        alpha, beta, r_value, p_value, stderr = result
+        check_allclose(alpha, array([e[1] for e in expected]))
+        check_allclose(beta, array([e[0] for e in expected]))
+        check_allclose(r_value, array([e[2] for e in expected]))
+        check_allclose(p_value, array([e[3] for e in expected]))
+        check_allclose(stderr, array([e[4] for e in expected]))
@@ -8,19 +8,25 @@ import talib
 from numpy.random import RandomState
 
 from zipline.lib.adjusted_array import AdjustedArray
+from zipline.lib.adjustment import Float64Multiply
+from zipline.pipeline import ExecutionPlan
 from zipline.pipeline.data import USEquityPricing
 from zipline.pipeline.factors import (
+    AverageDollarVolume,
     BollingerBands,
     Aroon,
+    ExponentialWeightedMovingAverage,
     FastStochasticOscillator,
     IchimokuKinkoHyo,
     LinearWeightedMovingAverage,
     RateOfChangePercentage,
+    SimpleMovingAverage,
     TrueRange,
     MovingAverageConvergenceDivergenceSignal,
     AnnualizedVolatility,
+    VWAP,
 )
-from zipline.testing import parameter_space
+from zipline.testing import check_allclose, parameter_space
 from zipline.testing.fixtures import ZiplineTestCase
 from zipline.testing.predicates import assert_equal
 from .base import BasePipelineTestCase
@@ -582,3 +588,123 @@ class AnnualizedVolatilityTestCase(ZiplineTestCase):
             expected_vol,
             decimal=8
         )
+
+
+class ComputeRangeTestCase(BasePipelineTestCase):
+    """
+    Check that factors implementing ``compute_range`` agree with their
+    row-by-row ``compute``.
+    """
+    @staticmethod
+    def per_row(factor):
+        cls = type(factor)
+        per_row_cls = type(
+            'PerRow' + cls.__name__,
+            (cls,),
+            {'compute_range': None},
+        )
+        return per_row_cls(
+            inputs=factor.inputs,
+            window_length=factor.window_length,
+            **factor.params
+        )
+
+    @parameter_space(window_length=[2, 5, 10], __fail_fast=True)
+    def test_compute_range_matches_compute(self, window_length):
+        rand = RandomState(5)
+        closes = 100 + rand.randn(*self.default_shape).cumsum(axis=0)
+        closes[rand.uniform(size=closes.shape) < 0.1] = np.nan
+        closes[:, -1] = np.nan
+        volumes = rand.uniform(1e5, 1e6, size=closes.shape)
+        volumes[rand.uniform(size=volumes.shape) < 0.1] = np.nan
+        mask = self.eye_mask()
+
+        # Adjustments split the computation into multiple blocks.
+        adjustments = {
+            7: [Float64Multiply(0, 6, 0, 4, 0.5)],
+            15: [
+                Float64Multiply(0, 14, 3, 3, 2.0),
+                Float64Multiply(0, 14, 8, 12, 0.25),
+            ],
+        }
+        initial_workspace = {
+            USEquityPricing.close: AdjustedArray(
+                data=closes,
+                mask=mask,
+                adjustments=adjustments,
+                missing_value=np.nan,
+            ),
+            USEquityPricing.volume: AdjustedArray(
+                data=volumes,
+                mask=mask,
+                adjustments={},
+                missing_value=np.nan,
+            ),
+        }
+
+        close = USEquityPricing.close
+        factors = {
+            'sma': SimpleMovingAverage(
+                inputs=[close], window_length=window_length,
+            ),
+            'vwap': VWAP(window_length=window_length),
+            'adv': AverageDollarVolume(window_length=window_length),
+            'ewma': ExponentialWeightedMovingAverage(
+                inputs=[close], window_length=window_length, decay_rate=0.7,
+            ),
+            'volatility': AnnualizedVolatility(window_length=window_length),
+        }
+        terms = factors.copy()
+        for name, factor in factors.items():
+            terms[name + '_per_row'] = self.per_row(factor)
+
+        mask = self.build_mask(mask)
+        start_date, end_date = mask.index[[0, -1]]
+        graph = ExecutionPlan(
+            terms,
+            all_dates=self.nyse_sessions,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        results = self.run_graph(graph, initial_workspace, mask)
+
+        for name in factors:
+            check_allclose(
+                results[name],
+                results[name + '_per_row'],
+                err_msg=name,
+            )
+
+    def test_overridden_compute(self):
+
+        class WindowMax(SimpleMovingAverage):
+            # Inherits compute_range from SimpleMovingAverage.
+            def compute(self, today, assets, out, data):
+                out[:] = np.nanmax(data, axis=0)
+
+        rand = RandomState(5)
+        closes = 100 + rand.randn(*self.default_shape).cumsum(axis=0)
+        mask = self.eye_mask()
+        initial_workspace = {
+            USEquityPricing.close: AdjustedArray(
+                data=closes,
+                mask=mask,
+                adjustments={},
+                missing_value=np.nan,
+            ),
+        }
+
+        factor = WindowMax(inputs=[USEquityPricing.close], window_length=3)
+        mask = self.build_mask(mask)
+        start_date, end_date = mask.index[[0, -1]]
+        graph = ExecutionPlan(
+            {'max': factor, 'max_per_row': self.per_row(factor)},
+            all_dates=self.nyse_sessions,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        results = self.run_graph(graph, initial_workspace, mask)
+
+        # The subclass's compute is used instead of the inherited
+        # compute_range.
+        check_allclose(results['max'], results['max_per_row'])
@@ -19,6 +19,7 @@ from nose_parameterized import parameterized
 from numpy import (
     arange,
     datetime64,
+    float32,
     float64,
     ones,
     uint32,
@@ -34,6 +35,7 @@ from pandas import (
     Timestamp,
 )
 from pandas.util.testing import assert_frame_equal
+from six.moves import zip_longest
 from toolz.curried.operator import getitem
 
 from zipline.lib.adjustment import Float64Multiply
@@ -611,3 +613,42 @@ class USEquityPricingLoaderTestCase(WithAdjustmentReader,
             highs.traverse(windowlen + 1)
         with self.assertRaises(WindowLengthTooLong):
             volumes.traverse(windowlen + 1)
+
+    def test_read_float32(self):
+        columns = [USEquityPricing.high, USEquityPricing.volume]
+        query_days = self.calendar_days_between(
+            TEST_QUERY_START,
+            TEST_QUERY_STOP
+        )
+        assets = Int64Index(arange(1, 7))
+        mask = ones((len(query_days), len(assets)), dtype=bool)
+
+        def load(float32):
+            loader = USEquityPricingLoader(
+                self.bcolz_equity_daily_bar_reader,
+                self.adjustment_reader,
+                float32=float32,
+            )
+            return map(
+                getitem(loader.load_adjusted_array(
+                    columns,
+                    dates=query_days,
+                    assets=assets,
+                    mask=mask,
+                )),
+                columns,
+            )
+
+        expected_highs, expected_volumes = load(float32=False)
+        highs, volumes = load(float32=True)
+
+        for windowlen in range(1, len(query_days) + 1):
+            for array, expected_array in ((highs, expected_highs),
+                                          (volumes, expected_volumes)):
+                windows = zip_longest(
+                    array.traverse(windowlen),
+                    expected_array.traverse(windowlen),
+                )
+                for window, expected in windows:
+                    self.assertEqual(window.dtype, float32)
+                    assert_allclose(window, expected, rtol=1e-6)
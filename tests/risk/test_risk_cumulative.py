@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from nose_parameterized import parameterized
 import numpy as np
 import pandas as pd
 import zipline.finance.risk as risk
@@ -144,3 +145,63 @@ class TestRisk(WithTradingEnvironment, ZiplineTestCase):
     def test_representation(self):
         assert all([metric in self.cumulative_metrics.__repr__() for metric in
                    self.cumulative_metrics.METRIC_NAMES])
+
+    @parameterized.expand([
+        ('daily', False, 1),
+        ('minute', True, 3),
+    ])
+    def test_incremental_matches_empyrical(self,
+                                           name,
+                                           create_first_day_stats,
+                                           updates_per_session):
+        rand = np.random.RandomState(0)
+        sessions = self.algo_returns.index
+        algo_returns = rand.normal(0.001, 0.01, len(sessions))
+        benchmark_returns = rand.normal(0.0005, 0.01, len(sessions))
+
+        metrics = {
+            incremental: risk.RiskMetricsCumulative(
+                self.sim_params,
+                treasury_curves=self.env.treasury_curves,
+                trading_calendar=self.trading_calendar,
+                create_first_day_stats=create_first_day_stats,
+                incremental=incremental,
+            )
+            for incremental in (True, False)
+        }
+        for i, dt in enumerate(sessions):
+            # In minute emission, the returns for the current session are
+            # updated many times before the session is over.
+            for j in range(updates_per_session, 0, -1):
+                for m in metrics.values():
+                    m.update(
+                        dt,
+                        algo_returns[i] / j,
+                        benchmark_returns[i] / j,
+                        0.0,
+                    )
+
+            expected = metrics[False].to_dict()
+            actual = metrics[True].to_dict()
+            self.assertEqual(sorted(actual), sorted(expected))
+            for key, value in expected.items():
+                if isinstance(value, float):
+                    np.testing.assert_allclose(
+                        actual[key],
+                        value,
+                        rtol=1e-9,
+                        err_msg='%s on %s' % (key, dt),
+                    )
+                else:
+                    self.assertEqual(actual[key], value)
+
+        for metric in risk.RiskMetricsCumulative.METRIC_NAMES + (
+                'algorithm_cumulative_returns',
+                'benchmark_cumulative_returns',
+                'max_drawdowns'):
+            np.testing.assert_allclose(
+                getattr(metrics[True], metric),
+                getattr(metrics[False], metric),
+                rtol=1e-9,
+                err_msg=metric,
+            )
@@ -16,6 +16,7 @@ import warnings
 from collections import namedtuple
 import datetime
 from datetime import timedelta
+import os
 from textwrap import dedent
 from unittest import skip
 from copy import deepcopy
@@ -73,9 +74,26 @@ from zipline.api import (
     order_target_percent
 )
 
+from zipline.finance.blotter import Blotter
 from zipline.finance.commission import PerShare
+from zipline.finance.controls import (
+    AssetDateBounds,
+    LongOnly,
+    MaxOrderCount,
+    MaxOrderSize,
+    MaxPositionSize,
+    RestrictedListOrder,
+    TradingControl,
+)
 from zipline.finance.execution import LimitOrder
 from zipline.finance.order import ORDER_STATUS
+from zipline.finance.order_archive import OrderArchive
+from zipline.finance.performance.sinks import (
+    CallbackSink,
+    PickleSink,
+    read_daily_stats,
+    read_risk_report,
+)
 from zipline.finance.trading import SimulationParameters
 from zipline.finance.asset_restrictions import (
     Restriction,
@@ -203,6 +221,112 @@ class TestRecordAlgorithm(WithSimParams, WithDataPortal, ZiplineTestCase):
         np.testing.assert_array_equal(output['name3'].values,
                                       range(1, len(output) + 1))
 
+    def test_record_to_sinks(self):
+        algo = RecordAlgorithm(sim_params=self.sim_params, env=self.env)
+        expected = algo.run(self.data_portal)
+        expected_risk_report = algo.risk_report
+
+        packets = []
+        algo = RecordAlgorithm(sim_params=self.sim_params, env=self.env)
+        sink = CallbackSink(packets.append)
+        self.assertIs(algo.run(self.data_portal, sink=sink), sink)
+        self.assertEqual(
+            len([p for p in packets if 'daily_perf' in p]),
+            len(expected),
+        )
+        self.assertIs(algo.risk_report, packets[-1])
+        assert_equal(algo.risk_report, expected_risk_report)
+
+        with TempDirectory() as tempdir:
+            path = tempdir.getpath('results.pickle')
+            algo = RecordAlgorithm(sim_params=self.sim_params, env=self.env)
+            sink = algo.run(self.data_portal, sink=PickleSink(path))
+
+            assert_equal(sink.daily_stats(), expected)
+            assert_equal(read_daily_stats(path), expected)
+            assert_equal(
+                read_daily_stats(path, columns=['incr', 'returns']),
+                expected[['incr', 'returns']],
+            )
+            assert_equal(read_risk_report(path), expected_risk_report)
+
+    def test_analyze_with_callback_sink(self):
+        analyzed = []
+        algo = RecordAlgorithm(
+            sim_params=self.sim_params,
+            env=self.env,
+            analyze=lambda context, perf: analyzed.append(perf),
+        )
+        packets = []
+        sink = CallbackSink(packets.append)
+
+        # The callback sink doesn't keep the daily stats to analyze, so
+        # analyze is skipped instead of failing after the simulation.
+        self.assertIs(algo.run(self.data_portal, sink=sink), sink)
+        self.assertTrue(packets)
+        self.assertEqual(analyzed, [])
+
+    def test_sink_closed_when_simulation_fails(self):
+        def initialize(context):
+            context.bars = 0
+
+        def handle_data(context, data):
+            context.bars += 1
+            if context.bars > 1:
+                raise ValueError('simulation failed')
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            sim_params=self.sim_params,
+            env=self.env,
+        )
+        with TempDirectory() as tempdir:
+            path = tempdir.getpath('results.pickle')
+            sink = PickleSink(path)
+            with self.assertRaises(ValueError):
+                algo.run(self.data_portal, sink=sink)
+
+            self.assertTrue(sink._file.closed)
+            # The packet for the first session was flushed to disk.
+            self.assertEqual(len(read_daily_stats(path)), 1)
+
+    def test_order_archive_closed_after_run(self):
+        archive = OrderArchive()
+        blotter = Blotter(
+            self.sim_params.data_frequency,
+            self.asset_finder,
+            orders=archive,
+        )
+        archived = []
+
+        def initialize(context):
+            pass
+
+        def handle_data(context, data):
+            context.order(context.sid(133), 10)
+
+        def analyze(context, perf):
+            # Archived orders can still be looked up until the simulation
+            # is over.
+            archived.extend(
+                archive[order_id].status for order_id in archive
+            )
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            analyze=analyze,
+            sim_params=self.sim_params,
+            env=self.env,
+            blotter=blotter,
+        )
+        output = algo.run(self.data_portal)
+
+        self.assertEqual(len(archived), len(output))
+        self.assertTrue(archive.closed)
+        self.assertFalse(os.path.exists(archive.path))
+
 
 class TestMiscellaneousAPI(WithLogger,
                            WithSimParams,
@@ -2792,6 +2916,151 @@ def order_stuff(context, data):
                  pd.Timestamp('2006-01-04 18:00', tz='UTC'): 500.0}
             )
 
+    def test_lean_minute_emission(self):
+        sim_params = factory.create_simulation_parameters(
+            start=pd.Timestamp('2006-01-03', tz='UTC'),
+            end=pd.Timestamp('2006-01-05', tz='UTC'),
+            data_frequency='minute',
+            emission_rate='minute',
+            capital_base=1000.0
+        )
+
+        algocode = """
+from zipline.api import set_slippage, set_commission, slippage, commission, \
+    schedule_function, time_rules, order, sid
+
+def initialize(context):
+    set_slippage(slippage.FixedSlippage(spread=0))
+    set_commission(commission.PerShare(0, 0))
+    schedule_function(order_stuff, time_rule=time_rules.market_open())
+
+def order_stuff(context, data):
+    order(sid(1), 1)
+"""
+
+        def run(**kwargs):
+            algo = TradingAlgorithm(
+                script=algocode,
+                sim_params=sim_params,
+                env=self.env,
+                data_portal=self.data_portal,
+                **kwargs
+            )
+            return list(algo.get_generator())
+
+        full = run()
+        lean = run(lean_emission=True, snapshot_interval=100)
+
+        full_minutes = [r for r in full if 'minute_perf' in r]
+        lean_minutes = [r for r in lean if 'minute_perf' in r]
+        lean_daily = [r for r in lean if 'daily_perf' in r]
+
+        self.assertEqual(len(full_minutes), 1170)
+        self.assertEqual(len(lean_daily), 3)
+
+        # Snapshots are full minute packets, emitted on the 100th, 200th and
+        # 300th minutes of each session.
+        self.assertEqual(len(lean_minutes), 9)
+        snapshots = [
+            full_minutes[session * 390 + minute - 1]
+            for session in range(3)
+            for minute in (100, 200, 300)
+        ]
+        for actual, expected in zip(lean_minutes, snapshots):
+            self.assertEqual(
+                actual['minute_perf']['period_close'],
+                expected['minute_perf']['period_close'],
+            )
+            self.assertEqual(
+                actual['minute_perf']['positions'],
+                expected['minute_perf']['positions'],
+            )
+
+        minute_metrics = pd.concat([r['minute_metrics'] for r in lean_daily])
+        self.assertEqual(len(minute_metrics), 1170)
+        self.assertEqual(
+            list(minute_metrics.index),
+            [r['minute_perf']['period_close'] for r in full_minutes],
+        )
+        for field in ('portfolio_value', 'ending_cash', 'ending_value',
+                      'capital_used', 'pnl', 'returns'):
+            np.testing.assert_array_almost_equal(
+                minute_metrics[field].values,
+                [r['minute_perf'][field] for r in full_minutes],
+                err_msg=field,
+            )
+        np.testing.assert_array_almost_equal(
+            minute_metrics['algorithm_period_return'].values,
+            [r['cumulative_risk_metrics']['algorithm_period_return']
+             for r in full_minutes],
+        )
+
+    def test_lean_minute_emission_run(self):
+        sim_params = factory.create_simulation_parameters(
+            start=pd.Timestamp('2006-01-03', tz='UTC'),
+            end=pd.Timestamp('2006-01-05', tz='UTC'),
+            data_frequency='minute',
+            emission_rate='minute',
+            capital_base=1000.0
+        )
+
+        algocode = """
+from zipline.api import set_slippage, set_commission, slippage, commission, \
+    schedule_function, time_rules, order, sid
+
+def initialize(context):
+    set_slippage(slippage.FixedSlippage(spread=0))
+    set_commission(commission.PerShare(0, 0))
+    schedule_function(order_stuff, time_rule=time_rules.market_open())
+
+def order_stuff(context, data):
+    order(sid(1), 1)
+"""
+
+        def make_algo(**kwargs):
+            return TradingAlgorithm(
+                script=algocode,
+                sim_params=sim_params,
+                env=self.env,
+                **kwargs
+            )
+
+        full_minutes = [
+            r for r in make_algo(data_portal=self.data_portal).get_generator()
+            if 'minute_perf' in r
+        ]
+
+        algo = make_algo(lean_emission=True, snapshot_interval=100)
+        daily_stats = algo.run(self.data_portal)
+        self.assertEqual(len(daily_stats), 3)
+
+        # The minute metrics and snapshots of every session are kept by run.
+        self.assertEqual(len(algo.minute_metrics), 1170)
+        self.assertEqual(
+            list(algo.minute_metrics.index),
+            [r['minute_perf']['period_close'] for r in full_minutes],
+        )
+        np.testing.assert_array_almost_equal(
+            algo.minute_metrics['portfolio_value'].values,
+            [r['minute_perf']['portfolio_value'] for r in full_minutes],
+        )
+        self.assertEqual(
+            [r['minute_perf']['period_close'] for r in algo.minute_snapshots],
+            [
+                full_minutes[session * 390 + minute - 1]['minute_perf'][
+                    'period_close'
+                ]
+                for session in range(3)
+                for minute in (100, 200, 300)
+            ],
+        )
+
+        # Without lean emission, run keeps neither.
+        algo = make_algo()
+        algo.run(self.data_portal)
+        self.assertIsNone(algo.minute_metrics)
+        self.assertEqual(algo.minute_snapshots, [])
+
 
 class TestGetDatetime(WithLogger,
                       WithSimParams,
@@ -3313,6 +3582,65 @@ class TestTradingControls(WithSimParams, WithDataPortal, ZiplineTestCase):
             with self.assertRaises(TradingControlViolation):
                 algo.run(data_portal)
 
+    def test_validate_orders(self):
+        assets = [self.asset, self.another_asset] * 4
+        amounts = [5, -5, 50, 1, -50, 0, 15, -25]
+
+        def make_controls(on_error):
+            return [
+                MaxOrderSize(on_error, max_shares=20),
+                MaxOrderSize(on_error,
+                             asset=self.another_asset,
+                             max_notional=100.0),
+                MaxPositionSize(on_error, max_shares=30, max_notional=300.0),
+                LongOnly(on_error),
+                RestrictedListOrder(
+                    on_error, StaticRestrictions([self.another_asset]),
+                ),
+                AssetDateBounds(on_error),
+                MaxOrderCount(on_error, max_count=5),
+            ]
+
+        def initialize(algo):
+            for control in make_controls('log'):
+                algo.register_trading_control(control)
+            algo.masks = []
+
+        def handle_data(algo, data):
+            if algo.masks:
+                return
+
+            actual = algo.validate_orders(assets, amounts)
+
+            # Check the batch against the controls one order at a time.
+            expected = np.zeros(len(assets), dtype=bool)
+            for control in make_controls('log'):
+                expected |= TradingControl.validate_batch(
+                    control,
+                    assets,
+                    np.array(amounts),
+                    np.asarray(data.current(assets, 'price')),
+                    algo.updated_portfolio(),
+                    algo.get_datetime(),
+                    data,
+                )
+            algo.masks.extend([actual, expected])
+
+            algo.trading_controls = make_controls('fail')
+            with self.assertRaises(TradingControlViolation):
+                algo.validate_orders(assets, amounts)
+
+        algo = TradingAlgorithm(initialize=initialize,
+                                handle_data=handle_data,
+                                sim_params=self.sim_params,
+                                env=self.env)
+        algo.run(self.data_portal)
+
+        actual, expected = algo.masks
+        self.assertTrue(expected.any())
+        self.assertFalse(expected.all())
+        np.testing.assert_array_equal(actual, expected)
+
 
 class TestAccountControls(WithDataPortal, WithSimParams, ZiplineTestCase):
     START_DATE = pd.Timestamp('2006-01-03', tz='utc')
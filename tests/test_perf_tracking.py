@@ -41,7 +41,7 @@ from zipline.finance.transaction import create_transaction
 import zipline.utils.math_utils as zp_math
 
 from zipline.finance.blotter import Order
-from zipline.finance.performance.position import Position
+from zipline.finance.performance.position import Position, PositionStore
 from zipline.utils.factory import create_simulation_parameters
 from zipline.utils.serialization_utils import (
     loads_with_persistent_ids, dumps_with_persistent_ids
@@ -2014,6 +2014,88 @@ class TestPositionTracker(WithTradingEnvironment,
             self.assertEquals(val, 0)
             self.assertNotIsInstance(val, (bool, np.bool_))
 
+    def test_earn_dividends_batch(self):
+        ex_date = pd.Timestamp('2006-01-04', tz='UTC')
+        pay_date = pd.Timestamp('2006-01-06', tz='UTC')
+        other_date = pd.Timestamp('2006-01-09', tz='UTC')
+
+        dbpath = self.instance_tmpdir.getpath('adjustments.sqlite')
+        writer = SQLiteAdjustmentWriter(
+            dbpath,
+            MockDailyBarReader(),
+            self.trading_calendar.all_sessions,
+        )
+        splits = mergers = create_empty_splits_mergers_frame()
+        # Sid 3 is not held, so its dividends are never earned.
+        dividends = pd.DataFrame({
+            'sid': np.array([1, 2, 3], dtype=np.uint32),
+            'amount': np.array([0.5, 0.25, 10.0], dtype=np.float64),
+            'declared_date': np.array([ex_date] * 3, dtype='datetime64[ns]'),
+            'ex_date': np.array([ex_date] * 3, dtype='datetime64[ns]'),
+            'record_date': np.array([ex_date] * 3, dtype='datetime64[ns]'),
+            'pay_date': np.array(
+                [pay_date, other_date, pay_date], dtype='datetime64[ns]',
+            ),
+        })
+        stock_dividends = pd.DataFrame({
+            'sid': np.array([1, 2], dtype=np.uint32),
+            'payment_sid': np.array([2, 1], dtype=np.uint32),
+            'ratio': np.array([0.33, 1.5], dtype=np.float64),
+            'declared_date': np.array([ex_date] * 2, dtype='datetime64[ns]'),
+            'ex_date': np.array([ex_date] * 2, dtype='datetime64[ns]'),
+            'record_date': np.array([ex_date] * 2, dtype='datetime64[ns]'),
+            'pay_date': np.array([pay_date] * 2, dtype='datetime64[ns]'),
+        })
+        writer.write(splits, mergers, dividends, stock_dividends)
+        adjustment_reader = SQLiteAdjustmentReader(dbpath)
+
+        def make_tracker():
+            pt = perf.PositionTracker(self.env.asset_finder, 'daily')
+            pt.update_positions({
+                1: perf.Position(self.env.asset_finder.retrieve_asset(1),
+                                 amount=100),
+                2: perf.Position(self.env.asset_finder.retrieve_asset(2),
+                                 amount=-30),
+            })
+            return pt
+
+        expected = make_tracker()
+        held_sids = set(expected.positions)
+        expected.earn_dividends(
+            adjustment_reader.get_dividends_with_ex_date(
+                held_sids, ex_date, self.env.asset_finder,
+            ),
+            adjustment_reader.get_stock_dividends_with_ex_date(
+                held_sids, ex_date, self.env.asset_finder,
+            ),
+        )
+
+        schedule = adjustment_reader.get_dividend_schedule(ex_date, pay_date)
+        self.assertIn(ex_date, schedule)
+        self.assertNotIn(other_date, schedule)
+        self.assertEqual(len(schedule.cash_dividends(ex_date)), 3)
+        self.assertEqual(len(schedule.cash_dividends(pay_date)), 0)
+
+        actual = make_tracker()
+        actual.earn_dividends_batch(
+            schedule.cash_dividends(ex_date),
+            schedule.stock_dividends(ex_date),
+        )
+
+        for date, cash in (pay_date, 50.0), (other_date, -7.5):
+            self.assertEqual(actual.pay_dividends(date), cash)
+            self.assertEqual(expected.pay_dividends(date), cash)
+
+        self.assertEqual(
+            {sid: p.amount for sid, p in actual.positions.items()},
+            {sid: p.amount for sid, p in expected.positions.items()},
+        )
+        # 100 + floor(-30 * 1.5) and -30 + floor(100 * .33)
+        self.assertEqual(
+            {sid: p.amount for sid, p in actual.positions.items()},
+            {1: 55, 2: 3},
+        )
+
     def test_position_values_and_exposures(self):
         pt = perf.PositionTracker(self.env.asset_finder, None)
         dt = pd.Timestamp("1984/03/06 3:00PM")
@@ -2135,3 +2217,119 @@ class TestPositionTracker(WithTradingEnvironment,
         # Test gross and net exposures.
         self.assertEqual(100, pos_stats.gross_exposure)
         self.assertEqual(100, pos_stats.net_exposure)
+
+    def test_position_store_tracks_positions(self):
+        pt = perf.PositionTracker(self.env.asset_finder, None)
+        dt = pd.Timestamp('2017/01/04 3:00PM')
+        assets = self.env.asset_finder.retrieve_all([1, 2, 3, 1032201401])
+        for amount, asset in enumerate(assets, 1):
+            pt.execute_transaction(
+                create_txn(asset, dt, 10.0 * amount, amount),
+            )
+
+        # Close a position in the middle of the store.
+        pt.execute_transaction(create_txn(assets[1], dt, 25.0, -2))
+        self.assertNotIn(assets[1], pt.positions)
+
+        store = pt.positions
+        held = [assets[0], assets[2], assets[3]]
+        self.assertEqual(list(store), held)
+        np.testing.assert_array_equal(store.column('sid'), [1, 3, 1032201401])
+        np.testing.assert_array_equal(store.column('amount'), [1, 3, 4])
+        np.testing.assert_array_equal(
+            store.column('last_sale_price'),
+            [10.0, 30.0, 40.0],
+        )
+        np.testing.assert_array_equal(
+            store.column('exposure_multiplier'),
+            [1, 1000, 50],
+        )
+
+        # Positions read and write their fields through the store.
+        pt.positions[assets[2]].last_sale_price = 35.0
+        self.assertEqual(store.column('last_sale_price')[1], 35.0)
+
+        pos_stats = pt.stats()
+        self.assertEqual(10, pos_stats.long_value)
+        self.assertEqual(10 + 3 * 35.0 * 1000 + 4 * 40.0 * 50,
+                         pos_stats.long_exposure)
+        self.assertEqual(3, pos_stats.longs_count)
+
+        # Removed positions keep their last fields.
+        closed = pt.positions[assets[0]]
+        pt.execute_transaction(create_txn(assets[0], dt, 12.0, -1))
+        self.assertEqual(closed.amount, 0)
+        self.assertEqual(closed.cost_basis, 0.0)
+        self.assertEqual(closed.last_sale_price, 10.0)
+        self.assertEqual(len(store), 2)
+
+        restored = copy.deepcopy(store)
+        self.assertEqual(list(restored), list(store))
+        for name in store.arrays:
+            np.testing.assert_array_equal(
+                restored.column(name),
+                store.column(name),
+            )
+        self.assertIs(store[assets[2]]._store, store)
+
+    def test_position_store_removals(self):
+        store = PositionStore(
+            (sid, Position(sid, amount=sid, last_sale_price=10.0 * sid))
+            for sid in range(1, 7)
+        )
+        for sid in 2, 5, 1:
+            del store[sid]
+
+        # Removing positions leaves the other slots alone until the arrays
+        # are read.
+        self.assertEqual([store[sid]._slot for sid in store], [2, 3, 5])
+        np.testing.assert_array_equal(store.column('sid'), [3, 4, 6])
+        np.testing.assert_array_equal(store.column('amount'), [3, 4, 6])
+        self.assertEqual([store[sid]._slot for sid in store], [0, 1, 2])
+
+        store[7] = Position(7, amount=7)
+        store.column('last_sale_price')[:] = [1.0, 2.0, 3.0, 4.0]
+        self.assertEqual(
+            [store[sid].last_sale_price for sid in store],
+            [1.0, 2.0, 3.0, 4.0],
+        )
+
+    def test_position_store_takes_over_position(self):
+        first = PositionStore()
+        second = PositionStore()
+        position = Position(1, amount=5, cost_basis=10.0)
+        first[1] = position
+        first[2] = Position(2, amount=3)
+
+        second[1] = position
+        self.assertNotIn(1, first)
+        self.assertIs(position._store, second)
+        np.testing.assert_array_equal(first.column('amount'), [3])
+        np.testing.assert_array_equal(second.column('amount'), [5])
+
+        position.amount = 9
+        np.testing.assert_array_equal(first.column('amount'), [3])
+        np.testing.assert_array_equal(second.column('amount'), [9])
+
+    def test_sync_last_sale_prices_batched(self):
+        pt = perf.PositionTracker(self.env.asset_finder, 'minute')
+        dt = pd.Timestamp('2017/01/04 3:00PM', tz='UTC')
+        assets = self.env.asset_finder.retrieve_all([1, 2, 3])
+        for asset in assets:
+            pt.execute_transaction(create_txn(asset, dt, 10.0, 100))
+
+        calls = []
+
+        class SpotValuePortal(object):
+            def get_spot_value(self, assets, field, dt, data_frequency):
+                calls.append((list(assets), field, dt, data_frequency))
+                return [11.0, np.nan, 13.0]
+
+        pt.sync_last_sale_prices(dt, False, SpotValuePortal())
+
+        self.assertEqual(calls, [(assets, 'price', dt, 'minute')])
+        # Missing prices leave the last sale price alone.
+        self.assertEqual(
+            [pt.positions[asset].last_sale_price for asset in assets],
+            [11.0, 10.0, 13.0],
+        )
@@ -1,3 +1,4 @@
+from numpy.random import RandomState
 import pandas as pd
 from pandas.util.testing import assert_series_equal
 from six import iteritems
@@ -193,6 +194,49 @@ class RestrictionsTestCase(WithDataPortal, ZiplineTestCase):
         assert_is_restricted(self.ASSET1, str_to_ts('2011-01-07'))
         assert_is_restricted(self.ASSET1, str_to_ts('2011-01-07') + MINUTE)
 
+    def test_historical_restrictions_out_of_order_queries(self):
+        """
+        Test that queries at earlier dts than previous queries see the
+        restrictions as of the earlier dt.
+        """
+        rand = RandomState(0)
+        dates = pd.date_range('2011-01-03', periods=10, tz='UTC')
+        states = (ALLOWED, FROZEN)
+        restrictions = [
+            Restriction(
+                self.ALL_ASSETS[rand.randint(0, 2)],
+                dates[rand.randint(0, len(dates))],
+                states[rand.randint(0, 2)],
+            )
+            for _ in range(20)
+        ]
+        restrictions_by_asset = groupby(lambda r: r.asset, restrictions)
+
+        def expected_restricted(asset, dt):
+            # The last state to take effect for the asset, where restrictions
+            # with the same date take effect in the order they were given.
+            state = ALLOWED
+            for r in sorted(restrictions_by_asset.get(asset, ()),
+                            key=lambda r: r.effective_date):
+                if r.effective_date <= dt:
+                    state = r.state
+            return state == FROZEN
+
+        rl = HistoricalRestrictions(restrictions)
+        query_dates = dates[rand.randint(0, len(dates), 30)] + \
+            pd.to_timedelta(rand.randint(-1, 2, 30), unit='m')
+        for dt in query_dates:
+            self.assert_all_restrictions(
+                rl,
+                [expected_restricted(asset, dt) for asset in self.ALL_ASSETS],
+                dt,
+            )
+            for asset in self.ALL_ASSETS:
+                self.assertEqual(
+                    rl.is_restricted(asset, dt),
+                    expected_restricted(asset, dt),
+                )
+
     def test_static_restrictions(self):
         """
         Test single- and multi-asset queries on static restrictions
@@ -373,15 +373,16 @@ cdef class BarData:
                 # assume assets is iterable
                 # return a Series indexed by asset
                 if not self._adjust_minutes:
-                    return pd.Series(data={
-                        asset: self.data_portal.get_spot_value(
-                                    asset,
-                                    field,
-                                    self._get_current_minute(),
-                                    self.data_frequency
-                               )
-                        for asset in assets
-                        }, index=assets, name=fields)
+                    return pd.Series(
+                        data=self.data_portal.get_spot_value(
+                            assets,
+                            field,
+                            self._get_current_minute(),
+                            self.data_frequency
+                        ),
+                        index=assets,
+                        name=fields,
+                    )
                 else:
                     return pd.Series(data={
                         asset: self.data_portal.get_adjusted_value(
@@ -400,15 +401,16 @@ cdef class BarData:
 
                 if not self._adjust_minutes:
                     for field in fields:
-                        series = pd.Series(data={
-                            asset: self.data_portal.get_spot_value(
-                                        asset,
-                                        field,
-                                        self._get_current_minute(),
-                                        self.data_frequency
-                                   )
-                            for asset in assets
-                            }, index=assets, name=field)
+                        series = pd.Series(
+                            data=self.data_portal.get_spot_value(
+                                assets,
+                                field,
+                                self._get_current_minute(),
+                                self.data_frequency
+                            ),
+                            index=assets,
+                            name=field,
+                        )
                         data[field] = series
                 else:
                     for field in fields:
@@ -476,25 +478,33 @@ cdef class BarData:
         data_portal = self.data_portal
 
         if isinstance(assets, Asset):
+            if self._is_restricted(assets, adjusted_dt):
+                return False
             return self._can_trade_for_asset(
                 assets, dt, adjusted_dt, data_portal
             )
         else:
+            assets = list(assets)
+            # Look up the restrictions of all of the assets at once.
+            restricted = np.asarray(
+                self._is_restricted(assets, adjusted_dt), dtype=bool,
+            )
             tradeable = [
-                self._can_trade_for_asset(
+                not is_restricted and self._can_trade_for_asset(
                     asset, dt, adjusted_dt, data_portal
                 )
-                for asset in assets
+                for asset, is_restricted in zip(assets, restricted)
             ]
             return pd.Series(data=tradeable, index=assets, dtype=bool)
 
     cdef bool _can_trade_for_asset(self, asset, dt, adjusted_dt, data_portal):
+        """
+        Whether an unrestricted asset can be traded. Restrictions are checked
+        by ``can_trade``.
+        """
         cdef object session_label
         cdef object dt_to_use_for_exchange_check,
 
-        if self._is_restricted(asset, adjusted_dt):
-            return False
-
         session_label = self._trading_calendar.minute_to_session_label(dt)
 
         if not asset.is_alive_for_session(session_label):
@@ -82,7 +82,7 @@ from zipline.finance.execution import (
     StopLimitOrder,
     StopOrder,
 )
-from zipline.finance.performance import PerformanceTracker
+from zipline.finance.performance import MemorySink, PerformanceTracker
 from zipline.finance.asset_restrictions import Restrictions
 from zipline.finance.slippage import SlippageModel
 from zipline.finance.cancel_policy import NeverCancel, CancelPolicy
@@ -199,6 +199,23 @@ class TradingAlgorithm(object):
         equities_metadata, but will be traded by this TradingAlgorithm.
     get_pipeline_loader : callable[BoundColumn -> PipelineLoader], optional
         The function that maps pipeline columns to their loaders.
+    combine_pipelines : bool, optional
+        Whether to compute all attached pipelines together.  When True,
+        whenever the results of one pipeline need to be recomputed, every
+        attached pipeline is computed over the same chunk of days in a single
+        pass, so that terms shared between pipelines are only loaded and
+        computed once.  The size of the chunk is taken from the pipeline whose
+        output was requested.  default: False
+    lean_emission : bool, optional
+        In minute emission, record only scalar performance metrics each
+        minute instead of emitting a full minute packet.  The metrics for
+        each session are emitted under the ``'minute_metrics'`` key of the
+        daily packet.  After ``run``, the metrics of every session are
+        available as the ``minute_metrics`` DataFrame.  default: False
+    snapshot_interval : int, optional
+        In lean emission, also emit a full minute packet every
+        ``snapshot_interval`` minutes of each session.  After ``run``, these
+        packets are available as ``minute_snapshots``.
     create_event_context : callable[BarData -> context manager], optional
         A function used to create a context mananger that wraps the
         execution of all events that are scheduled for a bar.
@@ -311,9 +328,18 @@ class TradingAlgorithm(object):
         # Initialize Pipeline API data.
         self.init_engine(kwargs.pop('get_pipeline_loader', None))
         self._pipelines = {}
-        # Create an always-expired cache so that we compute the first time data
-        # is requested.
-        self._pipeline_cache = CachedObject(None, pd.Timestamp(0, tz='UTC'))
+        # Map from pipeline name to the cached results for that pipeline.
+        self._pipeline_cache = {}
+        # Map from pipeline name to the in-progress incremental computation of
+        # that pipeline, for pipelines attached with ``incremental=True``.
+        self._incremental_pipelines = {}
+        self._combine_pipelines = kwargs.pop('combine_pipelines', False)
+
+        self._lean_emission = kwargs.pop('lean_emission', False)
+        self._snapshot_interval = kwargs.pop('snapshot_interval', None)
+        # The results of lean emission, set by ``run``.
+        self.minute_metrics = None
+        self.minute_snapshots = []
 
         self.blotter = kwargs.pop('blotter', None)
         self.cancel_policy = kwargs.pop('cancel_policy', NeverCancel())
@@ -566,6 +592,8 @@ class TradingAlgorithm(object):
                 sim_params=self.sim_params,
                 trading_calendar=self.trading_calendar,
                 env=self.trading_environment,
+                lean_emission=self._lean_emission,
+                snapshot_interval=self._snapshot_interval,
             )
 
             # Set the dt initially to the period start by forcing it to change.
@@ -603,12 +631,21 @@ class TradingAlgorithm(object):
         """
         return self._create_generator(self.sim_params)
 
-    def run(self, data=None, overwrite_sim_params=True):
+    def run(self, data=None, overwrite_sim_params=True, sink=None):
         """Run the algorithm.
 
         :Arguments:
             source : DataPortal
 
+        :Optional:
+            sink : zipline.finance.performance.sinks.ResultsSink
+              The sink to write each performance packet to as it is
+              emitted. If passed, the sink is returned instead of the daily
+              stats, and ``analyze`` is only called with the sink's
+              ``daily_stats()`` if the algorithm defines it and the sink
+              keeps daily stats. The sink is closed when the simulation
+              ends, even if it fails.
+
         :Returns:
             daily_stats : pandas.DataFrame
               Daily performance metrics such as returns, alpha etc.
@@ -700,17 +737,40 @@ class TradingAlgorithm(object):
 
         # Create zipline and loop through simulated_trading.
         # Each iteration returns a perf dictionary
+        if sink is None:
+            results = MemorySink(keep_minute_packets=self._lean_emission)
+        else:
+            results = sink
         try:
-            perfs = []
-            for perf in self.get_generator():
-                perfs.append(perf)
-
-            # convert perf dict to pandas dataframe
-            daily_stats = self._create_daily_stats(perfs)
-
-            self.analyze(daily_stats)
+            try:
+                for perf in self.get_generator():
+                    results.write(perf)
+            finally:
+                # Flush the packets written so far, even if the simulation
+                # failed.
+                results.close()
+            self.risk_report = results.risk_report
+
+            if sink is None:
+                self.minute_metrics = results.minute_metrics()
+                self.minute_snapshots = results.minute_packets
+                # convert perf dict to pandas dataframe
+                daily_stats = results.daily_stats()
+                self.analyze(daily_stats)
+            else:
+                daily_stats = sink
+                if self._analyze is not None:
+                    if sink.keeps_daily_stats:
+                        self.analyze(sink.daily_stats())
+                    else:
+                        log.warn(
+                            'Not calling analyze: {} does not keep daily'
+                            ' stats.'.format(type(sink).__name__),
+                        )
         finally:
             self.data_portal = None
+            # Archived orders are only kept for the simulation.
+            self.blotter.close()
 
         return daily_stats
 
@@ -821,27 +881,14 @@ class TradingAlgorithm(object):
 
     def _create_daily_stats(self, perfs):
         # create daily and cumulative stats dataframe
-        daily_perfs = []
-        # TODO: the loop here could overwrite expected properties
-        # of daily_perf. Could potentially raise or log a
-        # warning.
+        results = MemorySink(keep_minute_packets=self._lean_emission)
         for perf in perfs:
-            if 'daily_perf' in perf:
+            results.write(perf)
+        self.risk_report = results.risk_report
+        self.minute_metrics = results.minute_metrics()
+        self.minute_snapshots = results.minute_packets
 
-                perf['daily_perf'].update(
-                    perf['daily_perf'].pop('recorded_vars')
-                )
-                perf['daily_perf'].update(perf['cumulative_risk_metrics'])
-                daily_perfs.append(perf['daily_perf'])
-            else:
-                self.risk_report = perf
-
-        daily_dts = pd.DatetimeIndex(
-            [p['period_close'] for p in daily_perfs], tz='UTC'
-        )
-        daily_stats = pd.DataFrame(daily_perfs, index=daily_dts)
-
-        return daily_stats
+        return results.daily_stats()
 
     def calculate_capital_changes(self, dt, emission_rate, is_interday,
                                   portfolio_value_adjustment=0.0):
@@ -1489,6 +1536,61 @@ class TradingAlgorithm(object):
                              self.get_datetime(),
                              self.trading_client.current_data)
 
+    def validate_orders(self, assets, amounts):
+        """
+        Check a batch of market orders against every registered trading
+        control at once.
+
+        Each control handles its violations as it would for a single order,
+        raising for controls with ``on_error='fail'`` and logging for controls
+        with ``on_error='log'``.
+
+        Parameters
+        ----------
+        assets : list[Asset]
+            The asset of each order.
+        amounts : list[int]
+            The amount of each order.
+
+        Returns
+        -------
+        violations : np.ndarray[bool]
+            Whether each order violates any of the trading controls.
+
+        Notes
+        -----
+        The controls are checked one at a time over the whole batch, so when
+        several orders violate controls that fail, the error is raised for the
+        first violating order of the first registered control that is
+        violated.
+        """
+        if not self.initialized:
+            raise OrderDuringInitialize(
+                msg="order() can only be called from within handle_data()"
+            )
+
+        violations = np.zeros(len(assets), dtype=bool)
+        if not self.trading_controls or not assets:
+            return violations
+
+        amounts = np.asarray(amounts, dtype=np.int64)
+        current_data = self.trading_client.current_data
+        prices = np.asarray(
+            current_data.current(assets, 'price'),
+            dtype=np.float64,
+        )
+        portfolio = self.updated_portfolio()
+        dt = self.get_datetime()
+
+        for control in self.trading_controls:
+            violations |= control.validate_batch(assets,
+                                                 amounts,
+                                                 prices,
+                                                 portfolio,
+                                                 dt,
+                                                 current_data)
+        return violations
+
     @staticmethod
     def __convert_order_params_for_blotter(limit_price, stop_price, style):
         """
@@ -2021,8 +2123,14 @@ class TradingAlgorithm(object):
                 amount = self._calculate_order_target_percent_amount(
                     asset, target,
                 )
-                amount, style = self._calculate_order(asset, amount)
-                order_args[asset] = (asset, amount, style)
+                order_args[asset] = (asset, self.round_order(amount),
+                                     MarketOrder())
+
+        # Check the whole rebalance against the trading controls at once.
+        self.validate_orders(
+            [asset for asset, _, _ in viewvalues(order_args)],
+            [amount for _, amount, _ in viewvalues(order_args)],
+        )
 
         order_ids = self.blotter.batch_order(viewvalues(order_args))
         order_ids = pd.Series(data=order_ids, index=order_args)
@@ -2338,8 +2446,9 @@ class TradingAlgorithm(object):
         pipeline=Pipeline,
         name=string_types,
         chunks=(int, Iterable, type(None)),
+        incremental=bool,
     )
-    def attach_pipeline(self, pipeline, name, chunks=None):
+    def attach_pipeline(self, pipeline, name, chunks=None, incremental=False):
         """Register a pipeline to be computed at the start of each day.
 
         Parameters
@@ -2353,6 +2462,12 @@ class TradingAlgorithm(object):
             this number will make it longer to get the first results but
             may improve the total runtime of the simulation. If an iterator
             is passed, we will run in chunks based on values of the itereator.
+        incremental : bool, optional
+            Whether to compute the pipeline one day at a time.  Raw data is
+            still loaded in chunks, but terms are only computed for a day when
+            its results are requested, by sliding the previous day's windows
+            forward.  This trades a small amount of total runtime for a
+            roughly constant cost each day.  default: False
 
         Returns
         -------
@@ -2363,8 +2478,6 @@ class TradingAlgorithm(object):
         --------
         :func:`zipline.api.pipeline_output`
         """
-        if self._pipelines:
-            raise NotImplementedError("Multiple pipelines are not supported.")
         if chunks is None:
             # Make the first chunk smaller to get more immediate results:
             # (one week, then every half year)
@@ -2372,6 +2485,16 @@ class TradingAlgorithm(object):
         elif isinstance(chunks, int):
             chunks = repeat(chunks)
         self._pipelines[name] = pipeline, iter(chunks)
+        # Create an always-expired cache so that we compute the first time data
+        # is requested.
+        self._pipeline_cache[name] = CachedObject(
+            None,
+            pd.Timestamp(0, tz='UTC'),
+        )
+        if incremental:
+            # We create the incremental computation lazily because we don't
+            # know the first session on which results will be requested.
+            self._incremental_pipelines[name] = None
 
         # Return the pipeline to allow expressions like
         # p = attach_pipeline(Pipeline(), 'name')
@@ -2404,8 +2527,6 @@ class TradingAlgorithm(object):
         :func:`zipline.api.attach_pipeline`
         :meth:`zipline.pipeline.engine.PipelineEngine.run_pipeline`
         """
-        # NOTE: We don't currently support multiple pipelines, but we plan to
-        # in the future.
         try:
             p, chunks = self._pipelines[name]
         except KeyError:
@@ -2413,16 +2534,16 @@ class TradingAlgorithm(object):
                 name=name,
                 valid=list(self._pipelines.keys()),
             )
-        return self._pipeline_output(p, chunks)
+        return self._pipeline_output(p, chunks, name)
 
-    def _pipeline_output(self, pipeline, chunks):
+    def _pipeline_output(self, pipeline, chunks, name):
         """
         Internal implementation of `pipeline_output`.
         """
         today = normalize_date(self.get_datetime())
         data = NO_DATA = object()
         try:
-            data = self._pipeline_cache.unwrap(today)
+            data = self._pipeline_cache[name].unwrap(today)
         except Expired:
             # We can't handle the exception in this block because in Python 3
             # sys.exc_info isn't cleared until we leave the block.  See note
@@ -2445,19 +2566,50 @@ class TradingAlgorithm(object):
             # 3. Clear the traceback.  This is no-op in Python 3.
             exc_clear()
 
-            # 2. Clear the .loc/.iloc caches.
-            clear_dataframe_indexer_caches(
-                self._pipeline_cache._unsafe_get_value()
-            )
+            incremental = name in self._incremental_pipelines
+            if self._combine_pipelines and not incremental:
+                # Every attached pipeline is computed over the same chunks, so
+                # they all expire together.
+                names = [
+                    n for n in self._pipelines
+                    if n not in self._incremental_pipelines
+                ]
+            else:
+                names = [name]
 
-            # 1. Clear the reference to self._pipeline_cache.
-            self._pipeline_cache = None
+            for expired_name in names:
+                # 2. Clear the .loc/.iloc caches.
+                clear_dataframe_indexer_caches(
+                    self._pipeline_cache[expired_name]._unsafe_get_value()
+                )
+
+                # 1. Clear the reference to self._pipeline_cache.
+                self._pipeline_cache[expired_name] = None
 
             # Calculate the next block.
-            data, valid_until = self._run_pipeline(
-                pipeline, today, next(chunks),
-            )
-            self._pipeline_cache = CachedObject(data, valid_until)
+            if incremental:
+                data = self._advance_incremental_pipeline(
+                    name, pipeline, chunks, today,
+                )
+                self._pipeline_cache[name] = CachedObject(data, today)
+            elif self._combine_pipelines:
+                results, valid_until = self._run_pipelines(
+                    {n: self._pipelines[n][0] for n in names},
+                    today,
+                    next(chunks),
+                )
+                for result_name, result in iteritems(results):
+                    self._pipeline_cache[result_name] = CachedObject(
+                        result,
+                        valid_until,
+                    )
+                data = results[name]
+                del results
+            else:
+                data, valid_until = self._run_pipeline(
+                    pipeline, today, next(chunks),
+                )
+                self._pipeline_cache[name] = CachedObject(data, valid_until)
 
         # Now that we have a cached result, try to return the data for today.
         try:
@@ -2467,6 +2619,34 @@ class TradingAlgorithm(object):
             # day.
             return pd.DataFrame(index=[], columns=data.columns)
 
+    def _advance_incremental_pipeline(self, name, pipeline, chunks, today):
+        """
+        Advance the incremental computation of the pipeline named `name` to
+        `today`, starting a new chunk if the current one has been exhausted.
+
+        Returns
+        -------
+        data : pd.DataFrame
+            The results of the pipeline for `today`.
+
+        See Also
+        --------
+        SimplePipelineEngine.run_pipeline_incrementally
+        """
+        while True:
+            rows = self._incremental_pipelines[name]
+            if rows is not None:
+                for date, data in rows:
+                    if date == today:
+                        return data
+
+            self._incremental_pipelines[name] = \
+                self.engine.run_pipeline_incrementally(
+                    pipeline,
+                    today,
+                    self._pipeline_chunk_end(today, next(chunks)),
+                )
+
     def _run_pipeline(self, pipeline, start_session, chunksize):
         """
         Compute `pipeline`, providing values for at least `start_date`.
@@ -2485,6 +2665,34 @@ class TradingAlgorithm(object):
         --------
         PipelineEngine.run_pipeline
         """
+        end_session = self._pipeline_chunk_end(start_session, chunksize)
+        return \
+            self.engine.run_pipeline(pipeline, start_session, end_session), \
+            end_session
+
+    def _run_pipelines(self, pipelines, start_session, chunksize):
+        """
+        Compute several pipelines in a single pass, providing values for at
+        least `start_date`.
+
+        Returns
+        -------
+        (results, valid_until) : tuple (dict[str, pd.DataFrame], pd.Timestamp)
+
+        See Also
+        --------
+        TradingAlgorithm._run_pipeline
+        PipelineEngine.run_pipelines
+        """
+        end_session = self._pipeline_chunk_end(start_session, chunksize)
+        return \
+            self.engine.run_pipelines(pipelines, start_session, end_session), \
+            end_session
+
+    def _pipeline_chunk_end(self, start_session, chunksize):
+        """
+        Get the last session of a pipeline chunk starting at `start_session`.
+        """
         sessions = self.trading_calendar.all_sessions
 
         # Load data starting from the previous trading day...
@@ -2499,11 +2707,7 @@ class TradingAlgorithm(object):
             sessions.get_loc(sim_end_session)
         )
 
-        end_session = sessions[end_loc]
-
-        return \
-            self.engine.run_pipeline(pipeline, start_session, end_session), \
-            end_session
+        return sessions[end_loc]
 
     ##################
     # End Pipeline API
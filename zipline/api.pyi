@@ -9,7 +9,7 @@ from zipline.utils.events import EventRule
 from zipline.utils.security_list import SecurityList
 
 
-def attach_pipeline(pipeline, name, chunks=None):
+def attach_pipeline(pipeline, name, chunks=None, incremental=False):
     """Register a pipeline to be computed at the start of each day.
 
     Parameters
@@ -23,6 +23,12 @@ def attach_pipeline(pipeline, name, chunks=None):
         this number will make it longer to get the first results but
         may improve the total runtime of the simulation. If an iterator
         is passed, we will run in chunks based on values of the itereator.
+    incremental : bool, optional
+        Whether to compute the pipeline one day at a time.  Raw data is
+        still loaded in chunks, but terms are only computed for a day when
+        its results are requested, by sliding the previous day's windows
+        forward.  This trades a small amount of total runtime for a
+        roughly constant cost each day.  default: False
 
     Returns
     -------
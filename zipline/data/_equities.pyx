@@ -18,13 +18,13 @@ from cpython cimport bool
 
 from numpy import (
     array,
+    float32,
     float64,
     intp,
     uint32,
     zeros,
 )
 from numpy cimport (
-    float64_t,
     intp_t,
     ndarray,
     uint32_t,
@@ -137,7 +137,8 @@ cpdef _read_bcolz_data(ctable_t table,
                        intp_t[:] first_rows,
                        intp_t[:] last_rows,
                        intp_t[:] offsets,
-                       bool read_all):
+                       bool read_all,
+                       bool float32_prices=False):
     """
     Load raw bcolz data for the given columns and indices.
 
@@ -157,6 +158,8 @@ cpdef _read_bcolz_data(ctable_t table,
     read_all : bool
         Whether to read_all sid data at once, or to read a silce from the
         carray for each sid.
+    float32_prices : bool, optional
+        Whether to return price columns as float32 rather than float64.
 
     Returns
     -------
@@ -170,7 +173,7 @@ cpdef _read_bcolz_data(ctable_t table,
         ndarray[dtype=uint32_t, ndim=1] raw_data
         ndarray[dtype=uint32_t, ndim=2] outbuf
         ndarray[dtype=uint8_t, ndim=2, cast=True] where_nan
-        ndarray[dtype=float64_t, ndim=2] outbuf_as_float
+        ndarray outbuf_as_float
         intp_t asset
         intp_t out_idx
         intp_t raw_idx
@@ -215,7 +218,10 @@ cpdef _read_bcolz_data(ctable_t table,
 
         if column_name in {'open', 'high', 'low', 'close'}:
             where_nan = (outbuf == 0)
-            outbuf_as_float = outbuf.astype(float64) * .001
+            outbuf_as_float = outbuf.astype(
+                float32 if float32_prices else float64,
+            )
+            outbuf_as_float *= .001
             outbuf_as_float[where_nan] = NAN
             results.append(outbuf_as_float)
         else:
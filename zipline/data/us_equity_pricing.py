@@ -405,6 +405,11 @@ class BcolzDailyBarReader(SessionBarReader):
         all of the data for all assets into memory and then indexing into that
         array for each day and asset pair.  Used to tune performance of reads
         when using a small or large number of equities.
+    float32_prices : bool, optional
+        If True, ``load_raw_arrays`` returns price columns as float32 rather
+        than float64, halving the memory needed for large reads.  Prices are
+        scaled in single precision, so each carries a relative error on the
+        order of 1e-7.  Default is False.
 
     Attributes
     ----------
@@ -461,7 +466,7 @@ class BcolzDailyBarReader(SessionBarReader):
     --------
     zipline.data.us_equity_pricing.BcolzDailyBarWriter
     """
-    def __init__(self, table, read_all_threshold=3000):
+    def __init__(self, table, read_all_threshold=3000, float32_prices=False):
         self._maybe_table_rootdir = table
         # Cache of fully read np.array for the carrays in the daily bar table.
         # raw_array does not use the same cache, but it could.
@@ -470,6 +475,7 @@ class BcolzDailyBarReader(SessionBarReader):
         self._spot_cols = {}
         self.PRICE_ADJUSTMENT_FACTOR = 0.001
         self._read_all_threshold = read_all_threshold
+        self._float32_prices = float32_prices
 
     @lazyval
     def _table(self):
@@ -604,6 +610,7 @@ class BcolzDailyBarReader(SessionBarReader):
             last_rows,
             offsets,
             read_all,
+            self._float32_prices,
         )
 
     def _spot_col(self, colname):
@@ -1230,6 +1237,109 @@ StockDividend = namedtuple(
     'StockDividend',
     ['asset', 'payment_asset', 'ratio', 'pay_date'])
 
+DIVIDEND_SCHEDULE_QUERY = """
+SELECT ex_date, sid, amount, pay_date from dividend_payouts
+WHERE ex_date BETWEEN ? AND ?
+ORDER BY ex_date
+"""
+
+STOCK_DIVIDEND_SCHEDULE_QUERY = """
+SELECT ex_date, sid, payment_sid, ratio, pay_date from stock_dividend_payouts
+WHERE ex_date BETWEEN ? AND ?
+ORDER BY ex_date
+"""
+
+# Dates are stored in second resolution as ints in adj.db tables.
+CASH_DIVIDEND_SCHEDULE_DTYPE = np.dtype([
+    ('ex_date', np.int64),
+    ('sid', np.int64),
+    ('amount', np.float64),
+    ('pay_date', np.int64),
+])
+
+STOCK_DIVIDEND_SCHEDULE_DTYPE = np.dtype([
+    ('ex_date', np.int64),
+    ('sid', np.int64),
+    ('payment_sid', np.int64),
+    ('ratio', np.float64),
+    ('pay_date', np.int64),
+])
+
+
+class DividendSchedule(object):
+    """
+    The cash and stock dividends of every asset with ex dates in a range of
+    sessions, held in record arrays sorted by ex date.
+
+    Parameters
+    ----------
+    cash_dividends : np.recarray[CASH_DIVIDEND_SCHEDULE_DTYPE]
+        The cash dividends, sorted by ex date.
+    stock_dividends : np.recarray[STOCK_DIVIDEND_SCHEDULE_DTYPE]
+        The stock dividends, sorted by ex date.
+    start_date : pd.Timestamp
+        The first ex date that was loaded.
+    end_date : pd.Timestamp
+        The last ex date that was loaded.
+
+    Notes
+    -----
+    The ``ex_date`` and ``pay_date`` fields are in seconds since the epoch.
+
+    See Also
+    --------
+    :meth:`SQLiteAdjustmentReader.get_dividend_schedule`
+    """
+    def __init__(self, cash_dividends, stock_dividends, start_date, end_date):
+        self._cash_dividends = cash_dividends
+        self._stock_dividends = stock_dividends
+        self.start_date = start_date
+        self.end_date = end_date
+
+    def __contains__(self, date):
+        return self.start_date <= date <= self.end_date
+
+    @staticmethod
+    def _with_ex_date(dividends, date):
+        seconds = date.value // int(1e9)
+        ex_dates = dividends['ex_date']
+        return dividends[
+            ex_dates.searchsorted(seconds, 'left'):
+            ex_dates.searchsorted(seconds, 'right')
+        ]
+
+    def cash_dividends(self, date):
+        """
+        Get the cash dividends with an ex date of ``date``.
+
+        Parameters
+        ----------
+        date : pd.Timestamp
+            The ex date.
+
+        Returns
+        -------
+        dividends : np.recarray[CASH_DIVIDEND_SCHEDULE_DTYPE]
+            The cash dividends of every asset with an ex date of ``date``.
+        """
+        return self._with_ex_date(self._cash_dividends, date)
+
+    def stock_dividends(self, date):
+        """
+        Get the stock dividends with an ex date of ``date``.
+
+        Parameters
+        ----------
+        date : pd.Timestamp
+            The ex date.
+
+        Returns
+        -------
+        dividends : np.recarray[STOCK_DIVIDEND_SCHEDULE_DTYPE]
+            The stock dividends of every asset with an ex date of ``date``.
+        """
+        return self._with_ex_date(self._stock_dividends, date)
+
 
 class SQLiteAdjustmentReader(object):
     """
@@ -1330,6 +1440,42 @@ class SQLiteAdjustmentReader(object):
 
         return stock_divs
 
+    def get_dividend_schedule(self, start_date, end_date):
+        """
+        Load the cash and stock dividends of every asset with ex dates between
+        ``start_date`` and ``end_date``, inclusive.
+
+        Parameters
+        ----------
+        start_date : pd.Timestamp
+            The first ex date to load.
+        end_date : pd.Timestamp
+            The last ex date to load.
+
+        Returns
+        -------
+        schedule : DividendSchedule
+            The dividends, sorted by ex date.
+        """
+        bounds = (start_date.value // int(1e9), end_date.value // int(1e9))
+        c = self.conn.cursor()
+        cash_dividends = c.execute(DIVIDEND_SCHEDULE_QUERY, bounds).fetchall()
+        stock_dividends = c.execute(
+            STOCK_DIVIDEND_SCHEDULE_QUERY, bounds,
+        ).fetchall()
+        c.close()
+
+        return DividendSchedule(
+            np.array(
+                cash_dividends, dtype=CASH_DIVIDEND_SCHEDULE_DTYPE,
+            ).view(np.recarray),
+            np.array(
+                stock_dividends, dtype=STOCK_DIVIDEND_SCHEDULE_DTYPE,
+            ).view(np.recarray),
+            start_date,
+            end_date,
+        )
+
     def unpack_db_to_component_dfs(self, convert_dates=False):
         """Returns the set of known tables in the adjustments file in DataFrame
         form.
@@ -1,7 +1,7 @@
 import abc
-from numpy import vectorize
-from functools import partial, reduce
+from functools import reduce
 import operator
+import numpy as np
 import pandas as pd
 from six import with_metaclass, iteritems
 from collections import namedtuple
@@ -161,6 +161,15 @@ class HistoricalRestrictions(Restrictions):
     ----------
     restrictions : iterable of namedtuple Restriction
         The restrictions, each defined by an asset, effective date and state
+
+    Notes
+    -----
+    The restrictions are compiled into one array of state changes sorted by
+    effective date, along with the state of every asset as of the last dt
+    that was queried. Querying a later dt applies only the state changes
+    since the last query, so a simulation, which moves forward in time,
+    applies each state change once. Querying an earlier dt replays the state
+    changes from the start.
     """
 
     def __init__(self, restrictions):
@@ -174,28 +183,75 @@ class HistoricalRestrictions(Restrictions):
             in iteritems(groupby(lambda x: x.asset, restrictions))
         }
 
+        # A dict mapping each asset to its column in the state arrays.
+        self._columns = {}
+        columns = []
+        effective_dates = []
+        frozen = []
+        for asset, restrictions_for_asset in iteritems(
+                self._restrictions_by_asset):
+            column = self._columns[asset] = len(self._columns)
+            for r in restrictions_for_asset:
+                columns.append(column)
+                effective_dates.append(pd.Timestamp(r.effective_date).value)
+                frozen.append(r.state == RESTRICTION_STATES.FROZEN)
+
+        # A stable sort keeps the state changes of each asset that share an
+        # effective date in the order of _restrictions_by_asset.
+        order = np.argsort(
+            np.array(effective_dates, dtype=np.int64), kind='mergesort',
+        )
+        self._effective_dates = \
+            np.array(effective_dates, dtype=np.int64)[order]
+        self._change_columns = np.array(columns, dtype=np.intp)[order]
+        self._change_frozen = np.array(frozen, dtype=bool)[order]
+
+        # Whether each asset is frozen as of _dt, after the first
+        # _changes_applied state changes. The extra last column is for assets
+        # without restrictions, which are never frozen.
+        self._frozen = np.zeros(len(self._columns) + 1, dtype=bool)
+        self._changes_applied = 0
+        self._dt = None
+
+    def _frozen_as_of(self, dt):
+        dt = pd.Timestamp(dt).value
+        if self._dt is not None and dt < self._dt:
+            self._frozen[:] = False
+            self._changes_applied = 0
+        self._dt = dt
+
+        start = self._changes_applied
+        stop = self._effective_dates.searchsorted(dt, side='right')
+        if stop > start:
+            # Apply only the last state change of each asset.
+            columns = self._change_columns[start:stop][::-1]
+            frozen = self._change_frozen[start:stop][::-1]
+            columns, last = np.unique(columns, return_index=True)
+            self._frozen[columns] = frozen[last]
+            self._changes_applied = stop
+
+        return self._frozen
+
     def is_restricted(self, assets, dt):
         """
         Returns whether or not an asset or iterable of assets is restricted
         on a dt.
         """
+        frozen = self._frozen_as_of(dt)
+        columns = self._columns
         if isinstance(assets, Asset):
-            return self._is_restricted_for_asset(assets, dt)
+            return bool(frozen[columns.get(assets, -1)])
 
-        is_restricted = partial(self._is_restricted_for_asset, dt=dt)
         return pd.Series(
             index=pd.Index(assets),
-            data=vectorize(is_restricted, otypes=[bool])(assets)
+            data=frozen[
+                np.array(
+                    [columns.get(asset, -1) for asset in assets],
+                    dtype=np.intp,
+                )
+            ],
         )
 
-    def _is_restricted_for_asset(self, asset, dt):
-        state = RESTRICTION_STATES.ALLOWED
-        for r in self._restrictions_by_asset.get(asset, ()):
-            if r.effective_date > dt:
-                break
-            state = r.state
-        return state == RESTRICTION_STATES.FROZEN
-
 
 class SecurityListRestrictions(Restrictions):
     """
@@ -209,9 +265,16 @@ class SecurityListRestrictions(Restrictions):
 
     def __init__(self, security_list_by_dt):
         self.current_securities = security_list_by_dt.current_securities
+        self._dt = None
+        self._securities_in_list = None
 
     def is_restricted(self, assets, dt):
-        securities_in_list = self.current_securities(dt)
+        # The security list is only looked up once per dt, since every
+        # asset that can be traded is checked at the same dt.
+        if dt != self._dt:
+            self._securities_in_list = self.current_securities(dt)
+            self._dt = dt
+        securities_in_list = self._securities_in_list
         if isinstance(assets, Asset):
             return assets in securities_in_list
         return pd.Series(
@@ -20,6 +20,7 @@ from six import iteritems
 
 from zipline.assets import Equity, Future
 from zipline.finance.order import Order
+from zipline.finance.order_archive import OrderArchive
 from zipline.finance.slippage import VolumeShareSlippage
 from zipline.finance.commission import (
     DEFAULT_FUTURE_COST_PER_TRADE,
@@ -35,12 +36,13 @@ warning_logger = Logger('AlgoWarning')
 class Blotter(object):
     def __init__(self, data_frequency, asset_finder, equity_slippage=None,
                  future_slippage=None, equity_commission=None,
-                 future_commission=None, cancel_policy=None):
+                 future_commission=None, cancel_policy=None, orders=None):
         # these orders are aggregated by sid
         self.open_orders = defaultdict(list)
 
-        # keep a dict of orders by their own id
-        self.orders = {}
+        # keep a dict of orders by their own id. if this is an OrderArchive,
+        # orders are moved to disk once they are closed.
+        self.orders = orders if orders is not None else {}
 
         # all our legacy order management code works with integer sids.
         # this lets us convert those to assets when needed.  ideally, we'd just
@@ -177,9 +179,7 @@ class Blotter(object):
         cur_order = self.orders[order_id]
 
         if cur_order.open:
-            order_list = self.open_orders[cur_order.sid]
-            if cur_order in order_list:
-                order_list.remove(cur_order)
+            self._remove_open_order(cur_order)
 
             if cur_order in self.new_orders:
                 self.new_orders.remove(cur_order)
@@ -191,19 +191,18 @@ class Blotter(object):
                 # along with newly placed orders.
                 self.new_orders.append(cur_order)
 
+            self._archive_orders([cur_order])
+
     def cancel_all_orders_for_asset(self, asset, warn=False,
                                     relay_status=True):
         """
         Cancel all open orders for a given asset.
         """
-        # (sadly) open_orders is a defaultdict, so this will always succeed.
-        orders = self.open_orders[asset]
-
-        # We're making a copy here because `cancel` mutates the list of open
-        # orders in place.  The right thing to do here would be to make
-        # self.open_orders no longer a defaultdict.  If we do that, then we
-        # should just remove the orders once here and be done with the matter.
-        for order in orders[:]:
+        # Remove all of the asset's orders at once, so that `cancel` doesn't
+        # have to remove them from the list of open orders one at a time.
+        orders = self.open_orders.pop(asset, [])
+
+        for order in orders:
             self.cancel(order.id, relay_status)
             if warn:
                 # Message appropriately depending on whether there's
@@ -246,9 +245,6 @@ class Blotter(object):
                         )
                     )
 
-        assert not orders
-        del self.open_orders[asset]
-
     def execute_cancel_policy(self, event):
         if self.cancel_policy.should_cancel(event):
             warn = self.cancel_policy.warn_on_cancel
@@ -268,9 +264,7 @@ class Blotter(object):
 
         cur_order = self.orders[order_id]
 
-        order_list = self.open_orders[cur_order.sid]
-        if cur_order in order_list:
-            order_list.remove(cur_order)
+        self._remove_open_order(cur_order)
 
         if cur_order in self.new_orders:
             self.new_orders.remove(cur_order)
@@ -280,6 +274,8 @@ class Blotter(object):
         # along with newly placed orders.
         self.new_orders.append(cur_order)
 
+        self._archive_orders([cur_order])
+
     def hold(self, order_id, reason=''):
         """
         Mark the order with order_id as 'held'. Held is functionally similar
@@ -356,18 +352,41 @@ class Blotter(object):
         commissions = []
 
         if self.open_orders:
-            assets = self.asset_finder.retrieve_all(self.open_orders)
-            asset_dict = {asset.sid: asset for asset in assets}
-
-            for sid, asset_orders in iteritems(self.open_orders):
-                asset = asset_dict[sid]
-                slippage = self.slippage_models[type(asset)]
-
-                for order, txn in \
-                        slippage.simulate(bar_data, asset, asset_orders):
-                    commission = self.commission_models[type(asset)]
-                    additional_commission = commission.calculate(order, txn)
-
+            sids = list(self.open_orders)
+            assets = self.asset_finder.retrieve_all(sids)
+
+            # Simulate the orders of all of the assets that share a slippage
+            # model at once.
+            batches = defaultdict(list)
+            for i, asset in enumerate(assets):
+                batches[type(asset)].append(i)
+
+            fills = [None] * len(assets)
+            costs = [None] * len(assets)
+            for asset_type, indices in iteritems(batches):
+                slippage = self.slippage_models[asset_type]
+                batch_fills = slippage.simulate_batch(
+                    bar_data,
+                    [assets[i] for i in indices],
+                    [self.open_orders[sids[i]] for i in indices],
+                )
+
+                # Calculate the commissions for all of the batch's fills at
+                # once. An order is filled at most once per bar, so none of
+                # the orders have been updated yet.
+                batch_costs = iter(
+                    self.commission_models[asset_type].calculate_batch(
+                        [order for f in batch_fills for order, _ in f],
+                        [txn for f in batch_fills for _, txn in f],
+                    ).tolist()
+                )
+                for i, asset_fills in zip(indices, batch_fills):
+                    fills[i] = asset_fills
+                    costs[i] = [next(batch_costs) for _ in asset_fills]
+
+            for asset_fills, asset_costs in zip(fills, costs):
+                for (order, txn), additional_commission in zip(asset_fills,
+                                                               asset_costs):
                     if additional_commission > 0:
                         commissions.append({
                             "sid": order.sid,
@@ -399,17 +418,54 @@ class Blotter(object):
         -------
         None
         """
-        # remove all closed orders from our open_orders dict
+        # group the closed orders by sid, so that each sid's open orders are
+        # filtered in a single pass instead of removing the orders one at a
+        # time.
+        closed_order_ids = defaultdict(set)
         for order in closed_orders:
-            sid = order.sid
-            sid_orders = self.open_orders[sid]
-            try:
-                sid_orders.remove(order)
-            except ValueError:
+            closed_order_ids[order.sid].add(order.id)
+
+        for sid, order_ids in iteritems(closed_order_ids):
+            sid_orders = self.open_orders.get(sid)
+            if sid_orders is None:
                 continue
 
-        # now clear out the sids from our open_orders dict that have
-        # zero open orders
-        for sid in list(self.open_orders.keys()):
-            if len(self.open_orders[sid]) == 0:
+            sid_orders[:] = [
+                order for order in sid_orders if order.id not in order_ids
+            ]
+
+            # clear out the sids from our open_orders dict that have zero
+            # open orders
+            if not sid_orders:
                 del self.open_orders[sid]
+
+        self._archive_orders(closed_orders)
+
+    def _remove_open_order(self, order):
+        sid_orders = self.open_orders.get(order.sid)
+        if sid_orders is None:
+            return
+
+        if order in sid_orders:
+            sid_orders.remove(order)
+        if not sid_orders:
+            del self.open_orders[order.sid]
+
+    def _archive_orders(self, orders):
+        if isinstance(self.orders, OrderArchive):
+            for order in orders:
+                self.orders.archive(order)
+
+    def close(self):
+        """
+        Release the resources held for the blotter's orders.
+
+        If the orders are kept in an OrderArchive, the archive is closed, and
+        a temporary archive is removed along with the orders in it.
+
+        Returns
+        -------
+        None
+        """
+        if isinstance(self.orders, OrderArchive):
+            self.orders.close()
@@ -15,8 +15,11 @@
 import abc
 
 from abc import abstractmethod
+import numpy as np
 from six import with_metaclass
 
+from zipline.utils.functional import overrides
+
 DEFAULT_PER_SHARE_COST = 0.0075         # 0.75 cents per share
 DEFAULT_MINIMUM_COST_PER_TRADE = 1.0    # $1 per trade
 DEFAULT_FUTURE_COST_PER_TRADE = 2.35
@@ -58,6 +61,63 @@ class CommissionModel(with_metaclass(abc.ABCMeta)):
         """
         raise NotImplementedError('calculate')
 
+    def calculate_batch(self, orders, transactions):
+        """
+        Calculate the commission to charge on many orders at once, one
+        transaction per order.
+
+        By default, this calls :meth:`calculate` for each pair. Models that
+        can calculate their commissions with array operations override this.
+
+        Parameters
+        ----------
+        orders : list[zipline.finance.order.Order]
+            The orders being processed. Each order may appear only once.
+        transactions : list[zipline.finance.transaction.Transaction]
+            The transaction being processed for each order.
+
+        Returns
+        -------
+        amounts_charged : np.ndarray[float64]
+            The additional commission, in dollars, that we should attribute to
+            each order.
+        """
+        return np.array(
+            [self.calculate(order, txn)
+             for order, txn in zip(orders, transactions)],
+            dtype=np.float64,
+        )
+
+
+def fill_arrays(orders, transactions):
+    """
+    Collect the state of a batch of orders and their transactions in arrays.
+
+    Parameters
+    ----------
+    orders : list[zipline.finance.order.Order]
+        The orders being processed.
+    transactions : list[zipline.finance.transaction.Transaction]
+        The transaction being processed for each order.
+
+    Returns
+    -------
+    commissions : np.ndarray[float64]
+        The commission already charged on each order.
+    filled : np.ndarray[float64]
+        The amount of each order filled before its transaction.
+    amounts : np.ndarray[float64]
+        The amount of each transaction.
+    prices : np.ndarray[float64]
+        The price of each transaction.
+    """
+    return (
+        np.array([order.commission for order in orders], dtype=np.float64),
+        np.array([order.filled for order in orders], dtype=np.float64),
+        np.array([txn.amount for txn in transactions], dtype=np.float64),
+        np.array([txn.price for txn in transactions], dtype=np.float64),
+    )
+
 
 class PerShare(CommissionModel):
     """
@@ -120,6 +180,29 @@ class PerShare(CommissionModel):
                 # we've exceeded the threshold, so pay more commission.
                 return per_share_total - order.commission
 
+    def calculate_batch(self, orders, transactions):
+        if overrides(self, PerShare, 'calculate'):
+            return super(PerShare, self).calculate_batch(orders, transactions)
+
+        commissions, filled, amounts, _ = fill_arrays(orders, transactions)
+        additional_commissions = np.abs(amounts * self.cost_per_share)
+
+        min_trade_cost = self.min_trade_cost
+        if min_trade_cost is None:
+            return additional_commissions
+
+        per_share_totals = \
+            (filled * self.cost_per_share) + additional_commissions
+        return np.where(
+            commissions == 0,
+            np.maximum(min_trade_cost, additional_commissions),
+            np.where(
+                per_share_totals < min_trade_cost,
+                0.0,
+                per_share_totals - commissions,
+            ),
+        )
+
 
 class PerTrade(CommissionModel):
     """
@@ -154,6 +237,16 @@ class PerTrade(CommissionModel):
             # commission.
             return 0.0
 
+    def calculate_batch(self, orders, transactions):
+        if overrides(self, PerTrade, 'calculate'):
+            return super(PerTrade, self).calculate_batch(orders, transactions)
+
+        commissions = np.array(
+            [order.commission for order in orders],
+            dtype=np.float64,
+        )
+        return np.where(commissions == 0, self.cost, 0.0)
+
 
 class PerDollar(CommissionModel):
     """
@@ -183,3 +276,12 @@ class PerDollar(CommissionModel):
         """
         cost_per_share = transaction.price * self.cost_per_dollar
         return abs(transaction.amount) * cost_per_share
+
+    def calculate_batch(self, orders, transactions):
+        if overrides(self, PerDollar, 'calculate'):
+            return super(PerDollar, self).calculate_batch(
+                orders, transactions,
+            )
+
+        _, _, amounts, prices = fill_arrays(orders, transactions)
+        return np.abs(amounts) * (prices * self.cost_per_dollar)
@@ -15,6 +15,7 @@
 import abc
 import logbook
 
+import numpy as np
 import pandas as pd
 
 from six import with_metaclass
@@ -27,11 +28,25 @@ from zipline.errors import (
 log = logbook.Logger('TradingControl')
 
 
+def position_amounts(portfolio, assets):
+    """
+    The number of shares held of each of ``assets`` in ``portfolio``.
+    """
+    positions = portfolio.positions
+    return np.array(
+        [positions[asset].amount if asset in positions else 0
+         for asset in assets],
+        dtype=np.int64,
+    )
+
+
 class TradingControl(with_metaclass(abc.ABCMeta)):
     """
     Abstract base class representing a fail-safe control on the behavior of any
     algorithm.
     """
+    # The number of violations of this control that have been handled.
+    violation_count = 0
 
     def __init__(self, on_error, **kwargs):
         """
@@ -61,6 +76,75 @@ class TradingControl(with_metaclass(abc.ABCMeta)):
         """
         raise NotImplementedError
 
+    def validate_batch(self,
+                       assets,
+                       amounts,
+                       prices,
+                       portfolio,
+                       algo_datetime,
+                       algo_current_data):
+        """
+        Validate a batch of orders at once, handling any violation as
+        :meth:`validate` would.
+
+        By default, this calls :meth:`validate` for each order. Controls that
+        can check all of the orders with array operations override this.
+
+        Parameters
+        ----------
+        assets : list[Asset]
+            The asset of each order.
+        amounts : np.ndarray[int64]
+            The amount of each order.
+        prices : np.ndarray[float64]
+            The current price of each asset.
+        portfolio : zipline.protocol.Portfolio
+            The current portfolio.
+        algo_datetime : pd.Timestamp
+            The current simulation time.
+        algo_current_data : BarData
+            The data for the current bar.
+
+        Returns
+        -------
+        violations : np.ndarray[bool]
+            Whether each order violates this control.
+        """
+        violations = np.zeros(len(assets), dtype=bool)
+        for i, (asset, amount) in enumerate(zip(assets, amounts)):
+            violation_count = self.violation_count
+            self.validate(asset,
+                          amount,
+                          portfolio,
+                          algo_datetime,
+                          algo_current_data)
+            violations[i] = self.violation_count != violation_count
+        return violations
+
+    def handle_violations(self, violations, assets, amounts, datetime):
+        """
+        Handle the violations of a batch of orders, in order.
+
+        Parameters
+        ----------
+        violations : np.ndarray[bool]
+            Whether each order violates this control.
+        assets : list[Asset]
+            The asset of each order.
+        amounts : np.ndarray[int64]
+            The amount of each order.
+        datetime : pd.Timestamp
+            The current simulation time.
+
+        Returns
+        -------
+        violations : np.ndarray[bool]
+            The ``violations`` that were passed.
+        """
+        for i in np.flatnonzero(violations):
+            self.handle_violation(assets[i], amounts[i], datetime)
+        return violations
+
     def _constraint_msg(self, metadata):
         constraint = repr(self)
         if metadata:
@@ -79,6 +163,7 @@ class TradingControl(with_metaclass(abc.ABCMeta)):
         `metadata`.
         """
         constraint = self._constraint_msg(metadata)
+        self.violation_count += 1
 
         if self.on_error == 'fail':
             raise TradingControlViolation(
@@ -130,6 +215,30 @@ class MaxOrderCount(TradingControl):
             self.handle_violation(asset, amount, algo_datetime)
         self.orders_placed += 1
 
+    def validate_batch(self,
+                       assets,
+                       amounts,
+                       prices,
+                       portfolio,
+                       algo_datetime,
+                       algo_current_data):
+        algo_date = algo_datetime.date()
+
+        # Reset order count if it's a new day.
+        if self.current_date and self.current_date != algo_date:
+            self.orders_placed = 0
+        self.current_date = algo_date
+
+        orders_placed = self.orders_placed
+        violations = orders_placed + np.arange(len(assets)) >= self.max_count
+        for i in np.flatnonzero(violations):
+            # Count the orders before the violation, as validate would have
+            # if it raises.
+            self.orders_placed = orders_placed + i
+            self.handle_violation(assets[i], amounts[i], algo_datetime)
+        self.orders_placed = orders_placed + len(assets)
+        return violations
+
 
 class RestrictedListOrder(TradingControl):
     """TradingControl representing a restricted list of assets that
@@ -157,6 +266,21 @@ class RestrictedListOrder(TradingControl):
         if self.restrictions.is_restricted(asset, algo_datetime):
             self.handle_violation(asset, amount, algo_datetime)
 
+    def validate_batch(self,
+                       assets,
+                       amounts,
+                       prices,
+                       portfolio,
+                       algo_datetime,
+                       algo_current_data):
+        violations = np.asarray(
+            self.restrictions.is_restricted(assets, algo_datetime),
+            dtype=bool,
+        )
+        return self.handle_violations(
+            violations, assets, amounts, algo_datetime,
+        )
+
 
 class MaxOrderSize(TradingControl):
     """
@@ -216,6 +340,20 @@ class MaxOrderSize(TradingControl):
         if too_much_value:
             self.handle_violation(asset, amount, algo_datetime)
 
+    def validate_batch(self,
+                       assets,
+                       amounts,
+                       prices,
+                       portfolio,
+                       algo_datetime,
+                       algo_current_data):
+        return self.handle_violations(
+            _size_violations(self, assets, amounts, prices),
+            assets,
+            amounts,
+            algo_datetime,
+        )
+
 
 class MaxPositionSize(TradingControl):
     """
@@ -280,6 +418,21 @@ class MaxPositionSize(TradingControl):
         if too_much_value:
             self.handle_violation(asset, amount, algo_datetime)
 
+    def validate_batch(self,
+                       assets,
+                       amounts,
+                       prices,
+                       portfolio,
+                       algo_datetime,
+                       algo_current_data):
+        shares_post_order = position_amounts(portfolio, assets) + amounts
+        return self.handle_violations(
+            _size_violations(self, assets, shares_post_order, prices),
+            assets,
+            amounts,
+            algo_datetime,
+        )
+
 
 class LongOnly(TradingControl):
     """
@@ -302,6 +455,20 @@ class LongOnly(TradingControl):
         if portfolio.positions[asset].amount + amount < 0:
             self.handle_violation(asset, amount, algo_datetime)
 
+    def validate_batch(self,
+                       assets,
+                       amounts,
+                       prices,
+                       portfolio,
+                       algo_datetime,
+                       algo_current_data):
+        return self.handle_violations(
+            position_amounts(portfolio, assets) + amounts < 0,
+            assets,
+            amounts,
+            algo_datetime,
+        )
+
 
 class AssetDateBounds(TradingControl):
     """
@@ -347,6 +514,67 @@ class AssetDateBounds(TradingControl):
                 self.handle_violation(
                     asset, amount, algo_datetime, metadata=metadata)
 
+    def validate_batch(self,
+                       assets,
+                       amounts,
+                       prices,
+                       portfolio,
+                       algo_datetime,
+                       algo_current_data):
+        normalized_algo_dt = pd.Timestamp(algo_datetime).normalize()
+        start_dates = pd.to_datetime(
+            [asset.start_date for asset in assets], utc=True,
+        ).normalize()
+        end_dates = pd.to_datetime(
+            [asset.end_date for asset in assets], utc=True,
+        ).normalize()
+
+        # Comparisons with missing dates are False, so assets without a start
+        # or end date are never in violation of it.
+        ordered = np.asarray(amounts) != 0
+        before_start = ordered & (normalized_algo_dt < start_dates)
+        after_end = ordered & (normalized_algo_dt > end_dates)
+
+        for i in np.flatnonzero(before_start | after_end):
+            if before_start[i]:
+                self.handle_violation(
+                    assets[i],
+                    amounts[i],
+                    algo_datetime,
+                    metadata={'asset_start_date': start_dates[i]},
+                )
+            if after_end[i]:
+                self.handle_violation(
+                    assets[i],
+                    amounts[i],
+                    algo_datetime,
+                    metadata={'asset_end_date': end_dates[i]},
+                )
+        return before_start | after_end
+
+
+def _size_violations(control, assets, amounts, prices):
+    """
+    Whether each of a batch of share amounts exceeds the ``max_shares`` or
+    ``max_notional`` of a :class:`MaxOrderSize` or :class:`MaxPositionSize`.
+    """
+    if control.asset is not None:
+        applies = np.array(
+            [asset == control.asset for asset in assets],
+            dtype=bool,
+        )
+    else:
+        applies = np.ones(len(assets), dtype=bool)
+
+    violations = np.zeros(len(assets), dtype=bool)
+    if control.max_shares is not None:
+        violations |= np.abs(amounts) > control.max_shares
+    if control.max_notional is not None:
+        # Comparisons with missing prices are False.
+        with np.errstate(invalid='ignore'):
+            violations |= np.abs(amounts * prices) > control.max_notional
+    return applies & violations
+
 
 class AccountControl(with_metaclass(abc.ABCMeta)):
     """
@@ -15,6 +15,7 @@
 import math
 import uuid
 
+import numpy as np
 from six import text_type
 
 import zipline.protocol as zp
@@ -253,3 +254,78 @@ class Order(object):
         Unicode representation for this object.
         """
         return text_type(repr(self))
+
+
+def check_triggers(orders, prices, dt):
+    """
+    Update the triggers of many orders at once, the same way that
+    :meth:`Order.check_triggers` updates the triggers of a single order.
+
+    Parameters
+    ----------
+    orders : list[Order]
+        The orders whose triggers to check.
+    prices : np.ndarray[float64]
+        The current price of each order's asset.
+    dt : pd.Timestamp
+        The current simulation time.
+
+    Returns
+    -------
+    triggered : np.ndarray[bool]
+        Whether each order is triggered, as :attr:`Order.triggered`.
+    """
+    amounts = np.array([o.amount for o in orders], dtype=np.float64)
+    stops = np.array(
+        [np.nan if o.stop is None else o.stop for o in orders],
+        dtype=np.float64,
+    )
+    limits = np.array(
+        [np.nan if o.limit is None else o.limit for o in orders],
+        dtype=np.float64,
+    )
+    stop_reached = np.array([o.stop_reached for o in orders], dtype=bool)
+    limit_reached = np.array([o.limit_reached for o in orders], dtype=bool)
+
+    has_stop = ~np.isnan(stops)
+    has_limit = ~np.isnan(limits)
+
+    # Orders that have been triggered already keep their current values.
+    pending = (has_stop & ~stop_reached) | (has_limit & ~limit_reached)
+
+    buy = amounts > 0
+    with np.errstate(invalid='ignore'):
+        stop_hit = np.where(buy, prices >= stops, prices <= stops)
+        limit_hit = np.where(buy, prices <= limits, prices >= limits)
+
+    # A stop limit order turns into a limit order once its stop is reached.
+    sl_stop_reached = pending & has_stop & has_limit & stop_hit
+    new_stop_reached = np.where(
+        pending,
+        has_stop & ~has_limit & stop_hit,
+        stop_reached,
+    )
+    new_limit_reached = np.where(
+        pending,
+        has_limit & limit_hit & (~has_stop | stop_hit),
+        limit_reached,
+    )
+
+    changed = (
+        (new_stop_reached != stop_reached) |
+        (new_limit_reached != limit_reached)
+    )
+    for i in np.flatnonzero(changed | sl_stop_reached):
+        order = orders[i]
+        if changed[i]:
+            order.dt = dt
+        order.stop_reached = bool(new_stop_reached[i])
+        order.limit_reached = bool(new_limit_reached[i])
+        if sl_stop_reached[i]:
+            order.stop = None
+
+    has_stop &= ~sl_stop_reached
+    return (
+        (~has_stop | new_stop_reached) &
+        (~has_limit | new_limit_reached)
+    )
@@ -0,0 +1,131 @@
+#
+# Copyright 2017 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    # Python 2
+    from collections import MutableMapping
+import os
+import pickle
+import shelve
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from six import iterkeys
+
+
+class OrderArchive(MutableMapping):
+    """A mapping from order id to order that keeps closed orders on disk.
+
+    Orders are held in memory until they are passed to :meth:`archive`,
+    after which they are pickled into a shelf on disk and dropped from
+    memory. Archived orders are keyed by the string form of their ids.
+
+    Looking up an archived order loads a new copy of it from the shelf each
+    time, so archived orders should be treated as read-only: changes made to
+    a copy are not written back to the archive. To change an archived order,
+    store it again with ``archive[order_id] = order``, which moves it back
+    into memory.
+
+    Pass an ``OrderArchive`` as the ``orders`` of a
+    :class:`~zipline.finance.blotter.Blotter` to archive orders once they
+    are closed, instead of keeping every order of a simulation in memory.
+    :class:`~zipline.algorithm.TradingAlgorithm` closes its blotter's
+    archive when the simulation ends.
+
+    Parameters
+    ----------
+    path : str, optional
+        The directory to write the shelf to. If not provided, a temporary
+        directory is used and removed when the archive is closed.
+    """
+    def __init__(self, path=None):
+        self.closed = False
+        self._remove_path = path is None
+        self.path = path if path is not None else mkdtemp()
+        self._orders = {}
+        self._shelf = shelve.open(
+            os.path.join(self.path, 'orders'),
+            flag='n',
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+    def archive(self, order):
+        """Move an order to disk.
+
+        Parameters
+        ----------
+        order : zipline.finance.order.Order
+            The order to archive.
+        """
+        self._shelf[str(order.id)] = order
+        self._orders.pop(order.id, None)
+
+    def close(self):
+        """Close the shelf, removing it if it was written to a temporary
+        directory. Closing an archive more than once has no effect.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self._shelf.close()
+        if self._remove_path:
+            rmtree(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getitem__(self, order_id):
+        try:
+            return self._orders[order_id]
+        except KeyError:
+            # A fresh copy of the archived order.
+            return self._shelf[str(order_id)]
+
+    def __setitem__(self, order_id, order):
+        self._orders[order_id] = order
+        # The order in memory replaces any archived copy.
+        key = str(order_id)
+        if key in self._shelf:
+            del self._shelf[key]
+
+    def __delitem__(self, order_id):
+        try:
+            del self._orders[order_id]
+        except KeyError:
+            del self._shelf[str(order_id)]
+
+    def __contains__(self, order_id):
+        return order_id in self._orders or str(order_id) in self._shelf
+
+    def __iter__(self):
+        for order_id in self._orders:
+            yield order_id
+        for order_id in iterkeys(self._shelf):
+            yield order_id
+
+    def __len__(self):
+        return len(self._orders) + len(self._shelf)
+
+    def __repr__(self):
+        return '<%s: %d in memory, %d archived at %r>' % (
+            type(self).__name__,
+            len(self._orders),
+            len(self._shelf),
+            self.path,
+        )
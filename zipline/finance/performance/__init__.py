@@ -17,10 +17,20 @@ from . tracker import PerformanceTracker
 from . period import PerformancePeriod
 from . position import Position
 from . position_tracker import PositionTracker
+from . sinks import (
+    CallbackSink,
+    MemorySink,
+    PickleSink,
+    ResultsSink,
+)
 
 __all__ = [
+    'CallbackSink',
+    'MemorySink',
     'PerformanceTracker',
     'PerformancePeriod',
     'Position',
+    'PickleSink',
     'PositionTracker',
+    'ResultsSink',
 ]
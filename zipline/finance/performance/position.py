@@ -40,17 +40,86 @@ import logbook
 log = logbook.Logger('Performance')
 
 
+class _StoredField(object):
+    """
+    A field of a Position that is kept in the arrays of a PositionStore while
+    the position is in the store, and on the position itself otherwise.
+    """
+    def __init__(self, name, convert):
+        self._name = name
+        self._attr = '_' + name
+        self._convert = convert
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        store = instance._store
+        if store is None:
+            return instance.__dict__[self._attr]
+        return self._convert(store.arrays[self._name][instance._slot])
+
+    def __set__(self, instance, value):
+        store = instance._store
+        if store is None:
+            instance.__dict__[self._attr] = value
+        else:
+            store.arrays[self._name][instance._slot] = value
+
+
 class Position(object):
 
+    amount = _StoredField('amount', int)
+    cost_basis = _StoredField('cost_basis', float)  # per share
+    last_sale_price = _StoredField('last_sale_price', float)
+
     def __init__(self, sid, amount=0, cost_basis=0.0,
                  last_sale_price=0.0, last_sale_date=None):
 
+        # The PositionStore holding this position, if any, and the position's
+        # slot in the store's arrays.
+        self._store = None
+        self._slot = None
+
         self.sid = sid
         self.amount = amount
-        self.cost_basis = cost_basis  # per share
+        self.cost_basis = cost_basis
         self.last_sale_price = last_sale_price
         self.last_sale_date = last_sale_date
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.update(
+            _store=None,
+            _slot=None,
+            _amount=self.amount,
+            _cost_basis=self.cost_basis,
+            _last_sale_price=self.last_sale_price,
+        )
+        return state
+
+    def __setstate__(self, state):
+        # Positions pickled before their fields could be stored in a
+        # PositionStore hold the fields directly.
+        for name in 'amount', 'cost_basis', 'last_sale_price':
+            if name in state:
+                state['_' + name] = state.pop(name)
+        state.setdefault('_store', None)
+        state.setdefault('_slot', None)
+        self.__dict__.update(state)
+
+    def _detach(self):
+        """
+        Copy this position's fields out of its store before it is removed from
+        the store.
+        """
+        amount = self.amount
+        cost_basis = self.cost_basis
+        last_sale_price = self.last_sale_price
+        self._store = self._slot = None
+        self.amount = amount
+        self.cost_basis = cost_basis
+        self.last_sale_price = last_sale_price
+
     def earn_dividend(self, dividend):
         """
         Register the number of shares we held at this dividend's ex date so
@@ -196,3 +265,191 @@ last_sale_price: {last_sale_price}"
 class positiondict(OrderedDict):
     def __missing__(self, key):
         return None
+
+
+class PositionStore(positiondict):
+    """
+    A mapping from sid to Position that keeps the fields of its positions in
+    parallel arrays.
+
+    While a position is in the store, its amount, cost basis and last sale
+    price live in the store's ``arrays``, along with its sid and the value
+    and exposure multipliers of its asset.  Positions removed from the store
+    take their fields with them, and a position added to the store is first
+    removed from any other store holding it.
+
+    Removing a position only leaves a hole in the arrays.  The holes are
+    squeezed out the next time the arrays are read through :meth:`column`,
+    after which slot ``i`` of every array belongs to the ``i``th position in
+    iteration order, so positions can be priced and summarized with a few
+    vectorized operations.
+
+    The arrays are allocated with spare capacity: read them through
+    :meth:`column` rather than through ``arrays`` directly.
+    """
+    _dtypes = (
+        ('sid', np.int64),
+        ('amount', np.int64),
+        ('cost_basis', np.float64),
+        ('last_sale_price', np.float64),
+        ('value_multiplier', np.float64),
+        ('exposure_multiplier', np.float64),
+    )
+
+    def __init__(self, *args, **kwargs):
+        self.arrays = {
+            name: np.zeros(16, dtype=dtype) for name, dtype in self._dtypes
+        }
+        # The number of slots handed out, including those of removed
+        # positions that have not been compacted away yet.
+        self._used = 0
+        super(PositionStore, self).__init__()
+        self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        return type(self), (), {
+            'positions': list(self.items()),
+            'value_multiplier': self.column('value_multiplier'),
+            'exposure_multiplier': self.column('exposure_multiplier'),
+        }
+
+    def __setstate__(self, state):
+        self.update(state['positions'])
+        size = len(self)
+        for name in 'value_multiplier', 'exposure_multiplier':
+            self.arrays[name][:size] = state[name]
+
+    def __setitem__(self, key, position):
+        old = self.get(key)
+        if old is position:
+            return
+
+        amount = position.amount
+        cost_basis = position.cost_basis
+        last_sale_price = position.last_sale_price
+
+        if position._store is not None:
+            position._store._remove(position)
+
+        if old is not None:
+            # Replacing a position keeps its slot, like the key keeps its
+            # place in the iteration order.
+            slot = old._slot
+            old._detach()
+        else:
+            slot = self._allocate()
+            self.arrays['value_multiplier'][slot] = 0
+            self.arrays['exposure_multiplier'][slot] = 0
+
+        position._store = self
+        position._slot = slot
+        self.arrays['sid'][slot] = int(position.sid)
+        position.amount = amount
+        position.cost_basis = cost_basis
+        position.last_sale_price = last_sale_price
+        super(PositionStore, self).__setitem__(key, position)
+
+    def __delitem__(self, key):
+        position = self.get(key)
+        if position is None:
+            raise KeyError(key)
+
+        # The position's slot becomes a hole until the next compaction.
+        position._detach()
+        super(PositionStore, self).__delitem__(key)
+
+    def _remove(self, position):
+        """
+        Remove ``position`` from the store, whatever its key.
+        """
+        if self.get(position.sid) is position:
+            del self[position.sid]
+            return
+        for key, held in self.items():
+            if held is position:
+                del self[key]
+                return
+
+    def _allocate(self):
+        """
+        Hand out a slot at the end of the arrays.
+        """
+        if self._used == len(self.arrays['sid']):
+            self._compact()
+            if self._used == len(self.arrays['sid']):
+                for name, array in self.arrays.items():
+                    self.arrays[name] = np.concatenate(
+                        (array, np.zeros_like(array)),
+                    )
+        slot = self._used
+        self._used += 1
+        return slot
+
+    def _compact(self):
+        """
+        Squeeze the holes left by removed positions out of the arrays.
+        """
+        size = len(self)
+        if self._used == size:
+            return
+        slots = np.fromiter(
+            (position._slot for position in self.values()),
+            dtype=np.intp,
+            count=size,
+        )
+        for array in self.arrays.values():
+            array[:size] = array[slots]
+        for slot, position in enumerate(self.values()):
+            position._slot = slot
+        self._used = size
+
+    def update(self, *args, **kwargs):
+        for other in args + (kwargs,):
+            items = other.items() if hasattr(other, 'keys') else other
+            for key, position in items:
+                self[key] = position
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self.get(key)
+
+    def pop(self, key, *default):
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        position = self.get(key)
+        del self[key]
+        return position
+
+    def popitem(self, last=True):
+        if not self:
+            raise KeyError('dictionary is empty')
+        key = next(reversed(self) if last else iter(self))
+        return key, self.pop(key)
+
+    def clear(self):
+        for position in self.values():
+            position._detach()
+        super(PositionStore, self).clear()
+        self._used = 0
+
+    def set_multipliers(self, key, value_multiplier, exposure_multiplier):
+        """
+        Set the value and exposure multipliers for the position held under
+        ``key``.
+        """
+        slot = self.get(key)._slot
+        self.arrays['value_multiplier'][slot] = value_multiplier
+        self.arrays['exposure_multiplier'][slot] = exposure_multiplier
+
+    def column(self, name):
+        """
+        Get the meaningful entries of one of the store's arrays, in the
+        iteration order of the store's positions.
+
+        This is a view on the array, so writing to it updates the positions.
+        """
+        self._compact()
+        return self.arrays[name][:len(self)]
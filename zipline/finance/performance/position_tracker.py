@@ -17,24 +17,21 @@ from __future__ import division
 
 import logbook
 import numpy as np
+import pandas as pd
 from collections import namedtuple
 from math import isnan
 from zipline.finance.performance.position import Position
 from zipline.finance.transaction import Transaction
 
-try:
-    # optional cython based OrderedDict
-    from cyordereddict import OrderedDict
-except ImportError:
-    from collections import OrderedDict
-from six import iteritems, itervalues
+from six import iteritems
+from six.moves import zip
 
 import zipline.protocol as zp
 from zipline.assets import (
     Equity, Future
 )
 from zipline.errors import PositionTrackerMissingAssetFinder
-from . position import positiondict
+from . position import PositionStore
 
 log = logbook.Logger('Performance')
 
@@ -55,58 +52,42 @@ PositionStats = namedtuple('PositionStats',
 def calc_position_values(amounts,
                          last_sale_prices,
                          value_multipliers):
-    iter_amount_price_multiplier = zip(
-        amounts,
-        last_sale_prices,
-        itervalues(value_multipliers),
-    )
-    return [
-        price * amount * multiplier for
-        price, amount, multiplier in iter_amount_price_multiplier
-    ]
+    return last_sale_prices * amounts * value_multipliers
 
 
 def calc_net(values):
     # Returns 0.0 if there are no values.
-    return sum(values, np.float64())
+    return values.sum()
 
 
 def calc_position_exposures(amounts,
                             last_sale_prices,
                             exposure_multipliers):
-    iter_amount_price_multiplier = zip(
-        amounts,
-        last_sale_prices,
-        itervalues(exposure_multipliers),
-    )
-    return [
-        price * amount * multiplier for
-        price, amount, multiplier in iter_amount_price_multiplier
-    ]
+    return last_sale_prices * amounts * exposure_multipliers
 
 
 def calc_long_value(position_values):
-    return sum(i for i in position_values if i > 0)
+    return position_values[position_values > 0].sum()
 
 
 def calc_short_value(position_values):
-    return sum(i for i in position_values if i < 0)
+    return position_values[position_values < 0].sum()
 
 
 def calc_long_exposure(position_exposures):
-    return sum(i for i in position_exposures if i > 0)
+    return position_exposures[position_exposures > 0].sum()
 
 
 def calc_short_exposure(position_exposures):
-    return sum(i for i in position_exposures if i < 0)
+    return position_exposures[position_exposures < 0].sum()
 
 
 def calc_longs_count(position_exposures):
-    return sum(1 for i in position_exposures if i > 0)
+    return int(np.count_nonzero(position_exposures > 0))
 
 
 def calc_shorts_count(position_exposures):
-    return sum(1 for i in position_exposures if i < 0)
+    return int(np.count_nonzero(position_exposures < 0))
 
 
 def calc_gross_exposure(long_exposure, short_exposure):
@@ -117,16 +98,40 @@ def calc_gross_value(long_value, short_value):
     return long_value + abs(short_value)
 
 
+def held_slots(held_sids, sids):
+    """
+    Find the slots of the positions in ``sids``.
+
+    Parameters
+    ----------
+    held_sids : np.ndarray[int64]
+        The sid of each slot of a PositionStore. Must not be empty.
+    sids : np.ndarray[int64]
+        The sids to look up.
+
+    Returns
+    -------
+    slots : np.ndarray[intp]
+        The slot of each of ``sids``. Only meaningful where ``held``.
+    held : np.ndarray[bool]
+        Whether each of ``sids`` has a position.
+    """
+    sorter = np.argsort(held_sids)
+    ix = np.searchsorted(held_sids, sids, sorter=sorter)
+    slots = sorter[ix.clip(max=len(held_sids) - 1)]
+    return slots, held_sids[slots] == sids
+
+
 class PositionTracker(object):
 
     def __init__(self, asset_finder, data_frequency):
         self.asset_finder = asset_finder
 
-        # sid => position object
-        self.positions = positiondict()
-        # Arrays for quick calculations of positions value
-        self._position_value_multipliers = OrderedDict()
-        self._position_exposure_multipliers = OrderedDict()
+        # sid => position object, with the positions' fields and multipliers
+        # kept in arrays for quick calculations of positions value
+        self.positions = PositionStore()
+        # sid => (value multiplier, exposure multiplier)
+        self._asset_multipliers = {}
         self._unpaid_dividends = {}
         self._unpaid_stock_dividends = {}
         self._positions_store = zp.Positions()
@@ -135,8 +140,7 @@ class PositionTracker(object):
 
     def _update_asset(self, sid):
         try:
-            self._position_value_multipliers[sid]
-            self._position_exposure_multipliers[sid]
+            multipliers = self._asset_multipliers[sid]
         except KeyError:
             # Check if there is an AssetFinder
             if self.asset_finder is None:
@@ -145,11 +149,14 @@ class PositionTracker(object):
             # Collect the value multipliers from applicable sids
             asset = self.asset_finder.retrieve_asset(sid)
             if isinstance(asset, Equity):
-                self._position_value_multipliers[sid] = 1
-                self._position_exposure_multipliers[sid] = 1
-            if isinstance(asset, Future):
-                self._position_value_multipliers[sid] = 0
-                self._position_exposure_multipliers[sid] = asset.multiplier
+                multipliers = 1, 1
+            elif isinstance(asset, Future):
+                multipliers = 0, asset.multiplier
+            else:
+                return
+            self._asset_multipliers[sid] = multipliers
+
+        self.positions.set_multipliers(sid, *multipliers)
 
     def update_positions(self, positions):
         # update positions in batch
@@ -192,8 +199,6 @@ class PositionTracker(object):
             # if this position now has 0 shares, remove it from our internal
             # bookkeeping.
             del self.positions[sid]
-            del self._position_value_multipliers[sid]
-            del self._position_exposure_multipliers[sid]
 
             try:
                 # if this position exists in our user-facing dictionary,
@@ -254,21 +259,72 @@ class PositionTracker(object):
             # Store the earned dividends so that they can be paid on the
             # dividends' pay_dates.
             div_owed = self.positions[dividend.asset].earn_dividend(dividend)
-            try:
-                self._unpaid_dividends[dividend.pay_date].append(div_owed)
-            except KeyError:
-                self._unpaid_dividends[dividend.pay_date] = [div_owed]
+            self._unpaid_dividends.setdefault(dividend.pay_date, []).append(
+                np.array([div_owed['amount']], dtype=np.float64),
+            )
 
         for stock_dividend in stock_dividends:
             div_owed = \
                 self.positions[stock_dividend.asset].earn_stock_dividend(
                     stock_dividend)
-            try:
-                self._unpaid_stock_dividends[stock_dividend.pay_date].\
-                    append(div_owed)
-            except KeyError:
-                self._unpaid_stock_dividends[stock_dividend.pay_date] = \
-                    [div_owed]
+            self._unpaid_stock_dividends.setdefault(
+                stock_dividend.pay_date, [],
+            ).append((
+                [div_owed['payment_asset']],
+                np.array([div_owed['share_count']], dtype=np.float64),
+            ))
+
+    def earn_dividends_batch(self, dividends, stock_dividends):
+        """
+        Given the dividends of every asset whose ex_dates are all the next
+        trading day, calculate and store the cash and/or stock payments to be
+        paid on each dividend's pay date for the positions we hold.
+
+        Parameters
+        ----------
+        dividends : np.recarray[CASH_DIVIDEND_SCHEDULE_DTYPE]
+            The cash dividends, as returned by
+            :meth:`DividendSchedule.cash_dividends
+            <zipline.data.us_equity_pricing.DividendSchedule.cash_dividends>`.
+        stock_dividends : np.recarray[STOCK_DIVIDEND_SCHEDULE_DTYPE]
+            The stock dividends, as returned by
+            :meth:`DividendSchedule.stock_dividends
+            <zipline.data.us_equity_pricing.DividendSchedule.stock_dividends>`.
+        """
+        positions = self.positions
+        if not positions:
+            return
+
+        held_sids = positions.column('sid')
+        held_amounts = positions.column('amount')
+
+        slots, held = held_slots(held_sids, dividends.sid)
+        if held.any():
+            dividends = dividends[held]
+            amounts_owed = held_amounts[slots[held]] * dividends.amount
+            for pay_date, owed in _group_by_pay_date(dividends.pay_date,
+                                                     amounts_owed):
+                self._unpaid_dividends.setdefault(pay_date, []).append(owed)
+
+        slots, held = held_slots(held_sids, stock_dividends.sid)
+        if held.any():
+            if self.asset_finder is None:
+                raise PositionTrackerMissingAssetFinder()
+
+            stock_dividends = stock_dividends[held]
+            share_counts = np.floor(
+                held_amounts[slots[held]] * stock_dividends.ratio
+            )
+            payment_assets = np.array(
+                self.asset_finder.retrieve_all(stock_dividends.payment_sid),
+                dtype=object,
+            )
+            for pay_date, ix in _group_by_pay_date(
+                    stock_dividends.pay_date,
+                    np.arange(len(stock_dividends))):
+                self._unpaid_stock_dividends.setdefault(pay_date, []).append(
+                    (payment_assets[ix].tolist(), share_counts[ix]),
+                )
 
     def pay_dividends(self, next_trading_day):
         """
@@ -278,38 +334,32 @@ class PositionTracker(object):
         """
         net_cash_payment = 0.0
 
-        try:
-            payments = self._unpaid_dividends[next_trading_day]
-            # Mark these dividends as paid by dropping them from our unpaid
-            del self._unpaid_dividends[next_trading_day]
-        except KeyError:
-            payments = []
+        # Mark these dividends as paid by dropping them from our unpaid
+        payments = self._unpaid_dividends.pop(next_trading_day, [])
 
-        # representing the fact that we're required to reimburse the owner of
-        # the stock for any dividends paid while borrowing.
-        for payment in payments:
-            net_cash_payment += payment['amount']
+        # The amounts owed may be negative for short positions, representing
+        # the fact that we're required to reimburse the owner of the stock
+        # for any dividends paid while borrowing.
+        for amounts_owed in payments:
+            net_cash_payment += float(amounts_owed.sum())
 
         # Add stock for any stock dividends paid.  Again, the values here may
         # be negative in the case of short positions.
-        try:
-            stock_payments = self._unpaid_stock_dividends[next_trading_day]
-        except:
-            stock_payments = []
-
-        for stock_payment in stock_payments:
-            payment_asset = stock_payment['payment_asset']
-            share_count = stock_payment['share_count']
-            # note we create a Position for stock dividend if we don't
-            # already own the asset
-            if payment_asset in self.positions:
-                position = self.positions[payment_asset]
-            else:
-                position = self.positions[payment_asset] = \
-                    Position(payment_asset)
-
-            position.amount += share_count
-            self._update_asset(payment_asset)
+        stock_payments = self._unpaid_stock_dividends.pop(next_trading_day, [])
+
+        for payment_assets, share_counts in stock_payments:
+            for payment_asset, share_count in zip(payment_assets,
+                                                  share_counts.tolist()):
+                # note we create a Position for stock dividend if we don't
+                # already own the asset
+                if payment_asset in self.positions:
+                    position = self.positions[payment_asset]
+                else:
+                    position = self.positions[payment_asset] = \
+                        Position(payment_asset)
+
+                position.amount += share_count
+                self._update_asset(payment_asset)
 
         return net_cash_payment
 
@@ -338,10 +388,16 @@ class PositionTracker(object):
     def get_positions(self):
 
         positions = self._positions_store
+        store = self.positions
 
-        for sid, pos in iteritems(self.positions):
+        # The store's arrays are in the same order as its positions.
+        for (sid, pos), amount, cost_basis, last_sale_price in zip(
+                iteritems(store),
+                store.column('amount').tolist(),
+                store.column('cost_basis').tolist(),
+                store.column('last_sale_price').tolist()):
 
-            if pos.amount == 0:
+            if amount == 0:
                 # Clear out the position if it has become empty since the last
                 # time get_positions was called.  Catching the KeyError is
                 # faster than checking `if sid in positions`, and this can be
@@ -353,9 +409,9 @@ class PositionTracker(object):
                 continue
 
             position = zp.Position(sid)
-            position.amount = pos.amount
-            position.cost_basis = pos.cost_basis
-            position.last_sale_price = pos.last_sale_price
+            position.amount = amount
+            position.cost_basis = cost_basis
+            position.last_sale_price = last_sale_price
             position.last_sale_date = pos.last_sale_date
 
             # Adds the new position if we didn't have one before, or overwrite
@@ -373,44 +429,50 @@ class PositionTracker(object):
 
     def sync_last_sale_prices(self, dt, handle_non_market_minutes,
                               data_portal):
-        if not handle_non_market_minutes:
-            for asset, position in iteritems(self.positions):
-                last_sale_price = data_portal.get_spot_value(
-                    asset, 'price', dt, self.data_frequency
-                )
+        if not self.positions:
+            return
 
-                if not np.isnan(last_sale_price):
-                    position.last_sale_price = last_sale_price
+        assets = list(self.positions)
+        if not handle_non_market_minutes:
+            # Fetch the prices of every asset that we hold at once.
+            last_sale_prices = data_portal.get_spot_value(
+                assets, 'price', dt, self.data_frequency
+            )
         else:
-            for asset, position in iteritems(self.positions):
-                last_sale_price = data_portal.get_adjusted_value(
+            previous_minute = data_portal.trading_calendar.previous_minute(dt)
+            last_sale_prices = [
+                data_portal.get_adjusted_value(
                     asset,
                     'price',
-                    data_portal.trading_calendar.previous_minute(dt),
+                    previous_minute,
                     dt,
                     self.data_frequency
                 )
+                for asset in assets
+            ]
 
-                if not np.isnan(last_sale_price):
-                    position.last_sale_price = last_sale_price
+        last_sale_prices = np.array(last_sale_prices, dtype=np.float64)
+        np.copyto(
+            self.positions.column('last_sale_price'),
+            last_sale_prices,
+            where=~np.isnan(last_sale_prices),
+        )
 
     def stats(self):
-        amounts = []
-        last_sale_prices = []
-        for pos in itervalues(self.positions):
-            amounts.append(pos.amount)
-            last_sale_prices.append(pos.last_sale_price)
+        store = self.positions
+        amounts = store.column('amount')
+        last_sale_prices = store.column('last_sale_price')
 
         position_values = calc_position_values(
             amounts,
             last_sale_prices,
-            self._position_value_multipliers
+            store.column('value_multiplier'),
         )
 
         position_exposures = calc_position_exposures(
             amounts,
             last_sale_prices,
-            self._position_exposure_multipliers
+            store.column('exposure_multiplier'),
         )
 
         long_value = calc_long_value(position_values)
@@ -436,3 +498,20 @@ class PositionTracker(object):
             shorts_count=shorts_count,
             net_value=net_value
         )
+
+
+def _group_by_pay_date(pay_dates, values):
+    """
+    Split ``values`` by the pay date, in seconds since the epoch, of each
+    value.
+
+    Yields
+    ------
+    (pay_date, values) : (pd.Timestamp, np.ndarray)
+        Each pay date and the values to be paid on it.
+    """
+    for pay_date in np.unique(pay_dates):
+        yield (
+            pd.Timestamp(pay_date, unit='s', tz='UTC'),
+            values[pay_dates == pay_date],
+        )
@@ -0,0 +1,329 @@
+#
+# Copyright 2017 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Sinks that receive the performance packets of a simulation as they are
+emitted, so that the packets don't have to be held in memory until the
+simulation ends.
+"""
+from abc import ABCMeta, abstractmethod
+import pickle
+
+import pandas as pd
+from six import with_metaclass
+
+
+def daily_stats_row(packet):
+    """Flatten a daily performance packet into a row of the daily stats.
+
+    The recorded variables and cumulative risk metrics are merged into the
+    packet's ``daily_perf``, which is updated in place.
+
+    Parameters
+    ----------
+    packet : dict
+        A performance packet with a ``daily_perf`` entry.
+
+    Returns
+    -------
+    row : dict
+        The daily stats for the packet's session.
+    """
+    # TODO: this could overwrite expected properties of the daily perf.
+    # Could potentially raise or log a warning.
+    row = packet['daily_perf']
+    row.update(row.pop('recorded_vars'))
+    row.update(packet['cumulative_risk_metrics'])
+    return row
+
+
+def daily_stats_frame(rows):
+    """Build the daily stats frame from rows made by :func:`daily_stats_row`.
+    """
+    index = pd.DatetimeIndex([row['period_close'] for row in rows], tz='UTC')
+    return pd.DataFrame(rows, index=index)
+
+
+class ResultsSink(with_metaclass(ABCMeta, object)):
+    """Abstract interface for receiving performance packets.
+
+    :meth:`TradingAlgorithm.run <zipline.algorithm.TradingAlgorithm.run>`
+    writes every packet to its sink as soon as the packet is emitted.
+
+    Attributes
+    ----------
+    risk_report : dict or None
+        The last packet that was neither a daily nor a minute packet. At the
+        end of a simulation, this is the risk report.
+    keeps_daily_stats : bool
+        Whether :meth:`daily_stats` can read back the daily stats. The
+        algorithm's ``analyze`` is only called for sinks that do.
+    """
+    risk_report = None
+    keeps_daily_stats = True
+
+    def write(self, packet):
+        """Receive a performance packet.
+
+        Parameters
+        ----------
+        packet : dict
+            The packet emitted by the simulation.
+        """
+        if 'daily_perf' in packet:
+            if 'minute_metrics' in packet:
+                self.write_minute_metrics(packet['minute_metrics'])
+            self.write_daily(daily_stats_row(packet))
+        elif 'minute_perf' in packet:
+            self.write_minute(packet)
+        else:
+            self.risk_report = packet
+
+    @abstractmethod
+    def write_daily(self, row):
+        """Receive the daily stats for a session.
+
+        Parameters
+        ----------
+        row : dict
+            The daily stats, as made by :func:`daily_stats_row`.
+        """
+        raise NotImplementedError('write_daily')
+
+    def write_minute(self, packet):
+        """Receive a minute performance packet. Minute packets are dropped
+        unless this is overridden.
+        """
+
+    def write_minute_metrics(self, frame):
+        """Receive the per-minute metrics of a session, recorded in lean
+        emission. The metrics are dropped unless this is overridden.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            The metrics recorded for each minute of the session, indexed by
+            minute.
+        """
+
+    def close(self):
+        """Called after the last packet of a simulation has been written.
+        """
+
+    @abstractmethod
+    def daily_stats(self):
+        """Read back the daily stats of the simulation.
+
+        Returns
+        -------
+        daily_stats : pd.DataFrame
+            The daily stats, indexed by the close of each session.
+        """
+        raise NotImplementedError('daily_stats')
+
+
+class MemorySink(ResultsSink):
+    """Keep the daily stats of a simulation in memory.
+
+    The per-minute metrics recorded in lean emission are kept as well.
+    Minute packets are dropped as they are received, unless
+    ``keep_minute_packets`` is True, so by default only one row per session
+    is ever held.
+
+    Parameters
+    ----------
+    keep_minute_packets : bool, optional
+        Whether to keep the minute packets, such as the snapshots emitted
+        every ``snapshot_interval`` minutes in lean emission, in
+        ``minute_packets``. default: False
+    """
+    def __init__(self, keep_minute_packets=False):
+        self._rows = []
+        self._minute_metrics = []
+        self.keep_minute_packets = keep_minute_packets
+        self.minute_packets = []
+
+    def write_daily(self, row):
+        self._rows.append(row)
+
+    def write_minute(self, packet):
+        if self.keep_minute_packets:
+            self.minute_packets.append(packet)
+
+    def write_minute_metrics(self, frame):
+        self._minute_metrics.append(frame)
+
+    def daily_stats(self):
+        return daily_stats_frame(self._rows)
+
+    def minute_metrics(self):
+        """The per-minute metrics of every session, or None if the simulation
+        wasn't run in lean emission.
+
+        Returns
+        -------
+        minute_metrics : pd.DataFrame or None
+            The metrics recorded for each minute, indexed by minute.
+        """
+        if not self._minute_metrics:
+            return None
+        return pd.concat(self._minute_metrics)
+
+
+class PickleSink(ResultsSink):
+    """Append the daily stats of a simulation to a file on disk.
+
+    Each row is pickled to the file as soon as it is received, so the memory
+    used by a simulation doesn't grow with its length. The results can be
+    read back with :func:`iter_daily_stats` or :func:`read_daily_stats`.
+
+    Parameters
+    ----------
+    path : str
+        The file to write to. An existing file is overwritten.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'wb')
+
+    def _dump(self, kind, payload):
+        pickle.dump((kind, payload), self._file, pickle.HIGHEST_PROTOCOL)
+
+    def write_daily(self, row):
+        self._dump('daily', row)
+
+    def write_minute_metrics(self, frame):
+        self._dump('minute_metrics', frame)
+
+    def write(self, packet):
+        super(PickleSink, self).write(packet)
+        if packet is self.risk_report:
+            self._dump('risk_report', packet)
+
+    def close(self):
+        self._file.close()
+
+    def daily_stats(self, columns=None):
+        if not self._file.closed:
+            self._file.flush()
+        return read_daily_stats(self.path, columns=columns)
+
+
+class CallbackSink(ResultsSink):
+    """Pass every performance packet to a callback.
+
+    The packets aren't kept, so the algorithm's ``analyze`` isn't called
+    when running with this sink.
+
+    Parameters
+    ----------
+    callback : callable[dict -> None]
+        The function to call with each packet.
+    """
+    keeps_daily_stats = False
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def write(self, packet):
+        self.callback(packet)
+        super(CallbackSink, self).write(packet)
+
+    def write_daily(self, row):
+        pass
+
+    def daily_stats(self):
+        raise ValueError('%s does not keep daily stats' % type(self).__name__)
+
+
+def _iter_records(path):
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+def iter_daily_stats(path, columns=None):
+    """Lazily read the daily stats written by a :class:`PickleSink`.
+
+    Parameters
+    ----------
+    path : str
+        The file written by the sink.
+    columns : list[str], optional
+        The columns to read. By default, every column is read.
+
+    Yields
+    ------
+    row : dict
+        The daily stats for each session, in order.
+    """
+    for kind, payload in _iter_records(path):
+        if kind != 'daily':
+            continue
+        if columns is not None:
+            payload = {
+                column: payload[column]
+                for column in set(columns) | {'period_close'}
+                if column in payload
+            }
+        yield payload
+
+
+def read_daily_stats(path, columns=None):
+    """Read the daily stats written by a :class:`PickleSink`.
+
+    Parameters
+    ----------
+    path : str
+        The file written by the sink.
+    columns : list[str], optional
+        The columns to read. Only these columns are held in memory while the
+        file is read. By default, every column is read.
+
+    Returns
+    -------
+    daily_stats : pd.DataFrame
+        The daily stats, indexed by the close of each session.
+    """
+    frame = daily_stats_frame(list(iter_daily_stats(path, columns)))
+    if columns is not None:
+        frame = frame.reindex(columns=columns)
+    return frame
+
+
+def read_minute_metrics(path):
+    """Read the per-minute metrics written by a :class:`PickleSink`, or None
+    if the simulation wasn't run in lean emission.
+    """
+    frames = [
+        payload for kind, payload in _iter_records(path)
+        if kind == 'minute_metrics'
+    ]
+    if not frames:
+        return None
+    return pd.concat(frames)
+
+
+def read_risk_report(path):
+    """Read the risk report written by a :class:`PickleSink`, or None if the
+    simulation didn't finish.
+    """
+    risk_report = None
+    for kind, payload in _iter_records(path):
+        if kind == 'risk_report':
+            risk_report = payload
+    return risk_report
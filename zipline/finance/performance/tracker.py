@@ -61,6 +61,7 @@ from __future__ import division
 
 import logbook
 
+import numpy as np
 import pandas as pd
 from pandas.tseries.tools import normalize_date
 
@@ -73,11 +74,114 @@ from . position_tracker import PositionTracker
 log = logbook.Logger('Performance')
 
 
+# The scalar metrics recorded for each minute in lean emission.
+MINUTE_METRICS = (
+    'portfolio_value',
+    'ending_cash',
+    'ending_value',
+    'ending_exposure',
+    'capital_used',
+    'pnl',
+    'returns',
+    'leverage',
+    'algorithm_period_return',
+    'benchmark_period_return',
+)
+
+
+class MinuteMetrics(object):
+    """
+    Scalar performance metrics for each minute of a session, kept in
+    preallocated arrays instead of one packet per minute.
+
+    Parameters
+    ----------
+    fields : tuple[str], optional
+        The names of the metrics to record.
+    size : int, optional
+        The number of minutes to allocate space for. The arrays are grown if
+        more minutes are recorded.
+    """
+    def __init__(self, fields=MINUTE_METRICS, size=390):
+        self.fields = fields
+        self._values = np.full((size, len(fields)), np.nan)
+        self._dts = np.empty(size, dtype='int64')
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def record(self, dt, values):
+        """
+        Record the metrics for a minute.
+
+        Parameters
+        ----------
+        dt : pd.Timestamp
+            The minute.
+        values : iterable[float]
+            The value of each of ``fields`` at ``dt``.
+        """
+        count = self._count
+        if count == len(self._dts):
+            self._values = np.vstack(
+                [self._values, np.full_like(self._values, np.nan)]
+            )
+            self._dts = np.concatenate([self._dts, self._dts])
+        self._values[count] = values
+        self._dts[count] = dt.value
+        self._count = count + 1
+
+    def reset(self):
+        """
+        Forget the recorded minutes, keeping the allocated arrays.
+        """
+        self._count = 0
+
+    def to_frame(self):
+        """
+        Returns
+        -------
+        frame : pd.DataFrame
+            The recorded metrics, indexed by minute.
+        """
+        count = self._count
+        return pd.DataFrame(
+            self._values[:count].copy(),
+            index=pd.to_datetime(self._dts[:count], utc=True),
+            columns=list(self.fields),
+        )
+
+
 class PerformanceTracker(object):
     """
     Tracks the performance of the algorithm.
+
+    Parameters
+    ----------
+    sim_params : SimulationParameters
+        The parameters of the simulation.
+    trading_calendar : TradingCalendar
+        The calendar of the simulation.
+    env : TradingEnvironment
+        The environment of the simulation.
+    lean_emission : bool, optional
+        In minute emission, record only the scalar metrics in
+        ``MINUTE_METRICS`` each minute instead of building a full minute
+        packet. The recorded metrics are emitted as a DataFrame under the
+        ``'minute_metrics'`` key of each daily packet, and a full minute
+        packet can be built on demand with :meth:`minute_snapshot`.
+        default: False
+    snapshot_interval : int, optional
+        In lean emission, also emit a full minute packet every
+        ``snapshot_interval`` minutes of each session.
     """
-    def __init__(self, sim_params, trading_calendar, env):
+    def __init__(self,
+                 sim_params,
+                 trading_calendar,
+                 env,
+                 lean_emission=False,
+                 snapshot_interval=None):
         self.sim_params = sim_params
         self.trading_calendar = trading_calendar
         self.asset_finder = env.asset_finder
@@ -170,6 +274,18 @@ class PerformanceTracker(object):
         self.account_needs_update = True
         self._account = None
 
+        # The dividends of every asset over the simulation, loaded from the
+        # first adjustment reader passed to check_upcoming_dividends.
+        self._dividend_schedule = None
+        self._dividend_schedule_reader = None
+
+        self.lean_emission = lean_emission
+        self.snapshot_interval = snapshot_interval
+        if lean_emission and self.emission_rate == 'minute':
+            self.minute_metrics = MinuteMetrics()
+        else:
+            self.minute_metrics = None
+
     def __repr__(self):
         return "%s(%r)" % (
             self.__class__.__name__,
@@ -238,6 +354,31 @@ class PerformanceTracker(object):
 
         return _dict
 
+    def minute_snapshot(self):
+        """
+        Creates a full minute packet as of the current minute, including the
+        positions, transactions and orders that are skipped in lean emission.
+        """
+        return self.to_dict(emission_type='minute')
+
+    def _record_minute_metrics(self, dt, account):
+        perf = self.todays_performance
+        risk_metrics = self.cumulative_risk_metrics
+        dt_loc = risk_metrics.latest_dt_loc
+
+        self.minute_metrics.record(dt, (
+            perf.ending_cash + perf.ending_value,
+            perf.ending_cash,
+            perf.ending_value,
+            perf.ending_exposure,
+            perf.cash_flow,
+            perf.pnl,
+            perf.returns,
+            account.leverage,
+            risk_metrics.algorithm_cumulative_returns[dt_loc],
+            risk_metrics.benchmark_cumulative_returns[dt_loc],
+        ))
+
     def prepare_capital_change(self, is_interday):
         self.cumulative_performance.initialize_subperiod_divider()
 
@@ -297,16 +438,26 @@ class PerformanceTracker(object):
         Then check if we are owed cash/stock for any dividends whose pay date
         is the next trading day.  Apply all such benefits, then recalculate
         performance.
+
+        If the adjustment reader can load a dividend schedule, the dividends
+        of the whole simulation are loaded once and joined against our
+        positions each session, instead of being queried for every session.
         """
         if adjustment_reader is None:
             return
         position_tracker = self.position_tracker
-        held_sids = set(position_tracker.positions)
+        schedule = self._get_dividend_schedule(adjustment_reader)
         # Dividends whose ex_date is the next trading day.  We need to check if
         # we own any of these stocks so we know to pay them out when the pay
         # date comes.
 
-        if held_sids:
+        if schedule is not None and next_session in schedule:
+            position_tracker.earn_dividends_batch(
+                schedule.cash_dividends(next_session),
+                schedule.stock_dividends(next_session),
+            )
+        elif position_tracker.positions:
+            held_sids = set(position_tracker.positions)
             cash_dividends = adjustment_reader.get_dividends_with_ex_date(
                 held_sids,
                 next_session,
@@ -331,6 +482,20 @@ class PerformanceTracker(object):
         self.cumulative_performance.handle_dividends_paid(net_cash_payment)
         self.todays_performance.handle_dividends_paid(net_cash_payment)
 
+    def _get_dividend_schedule(self, adjustment_reader):
+        if adjustment_reader is not self._dividend_schedule_reader:
+            self._dividend_schedule_reader = adjustment_reader
+            try:
+                get_dividend_schedule = adjustment_reader.get_dividend_schedule
+            except AttributeError:
+                self._dividend_schedule = None
+            else:
+                self._dividend_schedule = get_dividend_schedule(
+                    self.period_start,
+                    self.period_end,
+                )
+        return self._dividend_schedule
+
     def handle_minute_close(self, dt, data_portal):
         """
         Handles the close of the given minute in minute emission.
@@ -342,7 +507,8 @@ class PerformanceTracker(object):
 
         Returns
         _______
-        A minute perf packet.
+        A minute perf packet, or None in lean emission if no snapshot is due
+        for this minute.
         """
         self.position_tracker.sync_last_sale_prices(dt, False, data_portal)
         self.update_performance()
@@ -358,8 +524,14 @@ class PerformanceTracker(object):
                                             bench_since_open,
                                             account.leverage)
 
-        minute_packet = self.to_dict(emission_type='minute')
-        return minute_packet
+        if self.minute_metrics is None:
+            return self.to_dict(emission_type='minute')
+
+        self._record_minute_metrics(dt, account)
+        interval = self.snapshot_interval
+        if interval and len(self.minute_metrics) % interval == 0:
+            return self.minute_snapshot()
+        return None
 
     def handle_market_close(self, dt, data_portal):
         """
@@ -409,6 +581,9 @@ class PerformanceTracker(object):
         # Take a snapshot of our current performance to return to the
         # browser.
         daily_update = self.to_dict(emission_type='daily')
+        if self.minute_metrics is not None:
+            daily_update['minute_metrics'] = self.minute_metrics.to_frame()
+            self.minute_metrics.reset()
 
         # On the last day of the test, don't create tomorrow's performance
         # period.  We may not be able to find the next trading day if we're at
@@ -22,6 +22,7 @@ from pandas.tseries.tools import normalize_date
 
 from six import iteritems
 
+from . incremental import RunningRiskStats
 from . risk import (
     check_entry,
     choose_treasury
@@ -50,6 +51,11 @@ class RiskMetricsCumulative(object):
     :Usage:
         Instantiate RiskMetricsCumulative once.
         Call update() method on each dt to update the metrics.
+
+    By default, metrics are updated from running statistics of the returns,
+    which takes constant time per update.  Pass ``incremental=False`` to
+    recompute every metric from the full history of returns with
+    ``empyrical`` instead.
     """
 
     METRIC_NAMES = (
@@ -64,7 +70,7 @@ class RiskMetricsCumulative(object):
     )
 
     def __init__(self, sim_params, treasury_curves, trading_calendar,
-                 create_first_day_stats=False):
+                 create_first_day_stats=False, incremental=True):
         self.treasury_curves = treasury_curves
         self.trading_calendar = trading_calendar
         self.start_session = sim_params.start_session
@@ -142,6 +148,14 @@ class RiskMetricsCumulative(object):
 
         self.num_trading_days = 0
 
+        self.incremental = incremental
+        # Running statistics of the returns of every session before
+        # ``_committed_loc``. The returns of the latest session are
+        # overwritten on every update in minute emission, so they are only
+        # folded in once a later session is updated.
+        self._committed_stats = RunningRiskStats()
+        self._committed_loc = 0
+
     def update(self, dt, algorithm_returns, benchmark_returns, leverage):
         # Keep track of latest dt for use in to_dict and other methods
         # that report current state.
@@ -158,9 +172,15 @@ class RiskMetricsCumulative(object):
             if len(self.algorithm_returns) == 1:
                 self.algorithm_returns = np.append(0.0, self.algorithm_returns)
 
-        self.algorithm_cumulative_returns[dt_loc] = cum_returns(
-            self.algorithm_returns
-        )[-1]
+        self.benchmark_returns_cont[dt_loc] = benchmark_returns
+        if self.incremental:
+            stats = self._running_stats(dt_loc)
+            self.algorithm_cumulative_returns[dt_loc] = \
+                stats.algorithm_cumulative_return()
+        else:
+            self.algorithm_cumulative_returns[dt_loc] = cum_returns(
+                self.algorithm_returns
+            )[-1]
 
         algo_cumulative_returns_to_date = \
             self.algorithm_cumulative_returns[:dt_loc + 1]
@@ -182,16 +202,19 @@ class RiskMetricsCumulative(object):
                 self.annualized_mean_returns = np.append(
                     0.0, self.annualized_mean_returns)
 
-        self.benchmark_returns_cont[dt_loc] = benchmark_returns
         self.benchmark_returns = self.benchmark_returns_cont[:dt_loc + 1]
 
         if self.create_first_day_stats:
             if len(self.benchmark_returns) == 1:
                 self.benchmark_returns = np.append(0.0, self.benchmark_returns)
 
-        self.benchmark_cumulative_returns[dt_loc] = cum_returns(
-            self.benchmark_returns
-        )[-1]
+        if self.incremental:
+            self.benchmark_cumulative_returns[dt_loc] = \
+                stats.benchmark_cumulative_return()
+        else:
+            self.benchmark_cumulative_returns[dt_loc] = cum_returns(
+                self.benchmark_returns
+            )[-1]
 
         benchmark_cumulative_returns_to_date = \
             self.benchmark_cumulative_returns[:dt_loc + 1]
@@ -231,12 +254,16 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
             raise Exception(message)
 
         self.update_current_max()
-        self.benchmark_volatility[dt_loc] = annual_volatility(
-            self.benchmark_returns
-        )
-        self.algorithm_volatility[dt_loc] = annual_volatility(
-            self.algorithm_returns
-        )
+        if self.incremental:
+            self.benchmark_volatility[dt_loc] = stats.benchmark_volatility()
+            self.algorithm_volatility[dt_loc] = stats.algorithm_volatility()
+        else:
+            self.benchmark_volatility[dt_loc] = annual_volatility(
+                self.benchmark_returns
+            )
+            self.algorithm_volatility[dt_loc] = annual_volatility(
+                self.algorithm_returns
+            )
 
         # caching the treasury rates for the minutely case is a
         # big speedup, because it avoids searching the treasury
@@ -256,31 +283,63 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
             self.algorithm_cumulative_returns[dt_loc] -
             self.treasury_period_return)
 
-        self.alpha[dt_loc], self.beta[dt_loc] = alpha_beta_aligned(
-            self.algorithm_returns,
-            self.benchmark_returns,
-        )
-        self.sharpe[dt_loc] = sharpe_ratio(
-            self.algorithm_returns,
-        )
-        self.downside_risk[dt_loc] = downside_risk(
-            self.algorithm_returns
-        )
-        self.sortino[dt_loc] = sortino_ratio(
-            self.algorithm_returns,
-            _downside_risk=self.downside_risk[dt_loc]
-        )
-        self.information[dt_loc] = information_ratio(
-            self.algorithm_returns,
-            self.benchmark_returns,
-        )
-        self.max_drawdown = max_drawdown(
-            self.algorithm_returns
-        )
+        if self.incremental:
+            self.alpha[dt_loc], self.beta[dt_loc] = stats.alpha_beta()
+            self.sharpe[dt_loc] = stats.sharpe()
+            self.downside_risk[dt_loc] = stats.downside_risk()
+            self.sortino[dt_loc] = stats.sortino(self.downside_risk[dt_loc])
+            self.information[dt_loc] = stats.information()
+            self.max_drawdown = stats.max_drawdown
+        else:
+            self.alpha[dt_loc], self.beta[dt_loc] = alpha_beta_aligned(
+                self.algorithm_returns,
+                self.benchmark_returns,
+            )
+            self.sharpe[dt_loc] = sharpe_ratio(
+                self.algorithm_returns,
+            )
+            self.downside_risk[dt_loc] = downside_risk(
+                self.algorithm_returns
+            )
+            self.sortino[dt_loc] = sortino_ratio(
+                self.algorithm_returns,
+                _downside_risk=self.downside_risk[dt_loc]
+            )
+            self.information[dt_loc] = information_ratio(
+                self.algorithm_returns,
+                self.benchmark_returns,
+            )
+            self.max_drawdown = max_drawdown(
+                self.algorithm_returns
+            )
         self.max_drawdowns[dt_loc] = self.max_drawdown
         self.max_leverage = self.calculate_max_leverage()
         self.max_leverages[dt_loc] = self.max_leverage
 
+    def _running_stats(self, dt_loc):
+        """
+        Get the running statistics of the returns up to and including
+        ``dt_loc``.
+        """
+        algorithm_returns = self.algorithm_returns_cont
+        benchmark_returns = self.benchmark_returns_cont
+        committed = self._committed_stats
+        while self._committed_loc < dt_loc:
+            committed.add(
+                algorithm_returns[self._committed_loc],
+                benchmark_returns[self._committed_loc],
+            )
+            self._committed_loc += 1
+
+        if self.create_first_day_stats and dt_loc == 0:
+            # Match the zero return that is prepended to the first day.
+            stats = RunningRiskStats()
+            stats.add(0.0, 0.0)
+        else:
+            stats = committed.copy()
+        stats.add(algorithm_returns[dt_loc], benchmark_returns[dt_loc])
+        return stats
+
     def to_dict(self):
         """
         Creates a dictionary representing the state of the risk report.
@@ -0,0 +1,236 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Running statistics for computing cumulative risk metrics in constant time
+per observation.
+
+Each metric matches the corresponding function from ``empyrical`` applied to
+the full history of returns, with a daily period and no risk free rate.
+"""
+from math import isnan, sqrt
+
+import numpy as np
+
+APPROX_BDAYS_PER_YEAR = 252
+
+
+class _Moments(object):
+    """Running count, mean and sum of squared deviations of a series, updated
+    with Welford's algorithm.
+    """
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def copy(self):
+        new = _Moments()
+        new.count = self.count
+        new.mean = self.mean
+        new.m2 = self.m2
+        return new
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def std(self):
+        """The sample standard deviation (ddof=1), or nan with fewer than two
+        observations.
+        """
+        if self.count < 2:
+            return np.nan
+        return sqrt(self.m2 / (self.count - 1))
+
+
+class _CoMoments(object):
+    """Running means and co-moments of a pair of series, updated with
+    Welford's algorithm.
+    """
+    __slots__ = ('count', 'mean_x', 'mean_y', 'c_xy', 'm2_y')
+
+    def __init__(self):
+        self.count = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.c_xy = 0.0
+        self.m2_y = 0.0
+
+    def copy(self):
+        new = _CoMoments()
+        new.count = self.count
+        new.mean_x = self.mean_x
+        new.mean_y = self.mean_y
+        new.c_xy = self.c_xy
+        new.m2_y = self.m2_y
+        return new
+
+    def add(self, x, y):
+        self.count += 1
+        delta_x = x - self.mean_x
+        delta_y = y - self.mean_y
+        self.mean_x += delta_x / self.count
+        self.mean_y += delta_y / self.count
+        self.c_xy += delta_x * (y - self.mean_y)
+        self.m2_y += delta_y * (y - self.mean_y)
+
+
+class RunningRiskStats(object):
+    """Running statistics of algorithm and benchmark returns.
+
+    Observations are added one at a time with :meth:`add`, and every metric
+    is computed from the running statistics in constant time.  Missing
+    returns are skipped the same way that ``empyrical`` skips them.
+    """
+    __slots__ = (
+        'length',
+        'algorithm',
+        'benchmark',
+        'active',
+        'joint',
+        'downside_sum_squares',
+        'algorithm_growth',
+        'benchmark_growth',
+        'peak',
+        'max_drawdown',
+    )
+
+    def __init__(self):
+        # The number of observations, including missing ones.
+        self.length = 0
+        self.algorithm = _Moments()
+        self.benchmark = _Moments()
+        # The algorithm's returns in excess of the benchmark.
+        self.active = _Moments()
+        # The algorithm and benchmark returns, where both are present.
+        self.joint = _CoMoments()
+        self.downside_sum_squares = 0.0
+        # The cumulative products of one plus the returns.
+        self.algorithm_growth = 1.0
+        self.benchmark_growth = 1.0
+        self.peak = -np.inf
+        self.max_drawdown = np.nan
+
+    def copy(self):
+        new = RunningRiskStats()
+        new.length = self.length
+        new.algorithm = self.algorithm.copy()
+        new.benchmark = self.benchmark.copy()
+        new.active = self.active.copy()
+        new.joint = self.joint.copy()
+        new.downside_sum_squares = self.downside_sum_squares
+        new.algorithm_growth = self.algorithm_growth
+        new.benchmark_growth = self.benchmark_growth
+        new.peak = self.peak
+        new.max_drawdown = self.max_drawdown
+        return new
+
+    def add(self, algorithm_return, benchmark_return):
+        """Add the returns for a single period.
+        """
+        self.length += 1
+        algorithm_missing = isnan(algorithm_return)
+        benchmark_missing = isnan(benchmark_return)
+
+        if not algorithm_missing:
+            self.algorithm.add(algorithm_return)
+            self.algorithm_growth *= 1 + algorithm_return
+            if algorithm_return < 0:
+                self.downside_sum_squares += algorithm_return ** 2
+        if not benchmark_missing:
+            self.benchmark.add(benchmark_return)
+            self.benchmark_growth *= 1 + benchmark_return
+        if not (algorithm_missing or benchmark_missing):
+            self.active.add(algorithm_return - benchmark_return)
+            self.joint.add(algorithm_return, benchmark_return)
+
+        # ``cum_returns`` is computed with a starting value of 100 for the
+        # drawdown.
+        value = 100 * self.algorithm_growth
+        if value > self.peak:
+            self.peak = value
+        drawdown = (value - self.peak) / self.peak
+        if not drawdown >= self.max_drawdown:
+            self.max_drawdown = drawdown
+
+    def algorithm_cumulative_return(self):
+        return self.algorithm_growth - 1
+
+    def benchmark_cumulative_return(self):
+        return self.benchmark_growth - 1
+
+    def algorithm_volatility(self):
+        if self.length < 2:
+            return np.nan
+        return self.algorithm.std() * sqrt(APPROX_BDAYS_PER_YEAR)
+
+    def benchmark_volatility(self):
+        if self.length < 2:
+            return np.nan
+        return self.benchmark.std() * sqrt(APPROX_BDAYS_PER_YEAR)
+
+    def alpha_beta(self):
+        if self.length < 2:
+            return np.nan, np.nan
+
+        joint = self.joint
+        if joint.count < 2 or abs(joint.m2_y / joint.count) < 1.0e-30:
+            return np.nan, np.nan
+
+        beta = joint.c_xy / joint.m2_y
+        alpha = (joint.mean_x - beta * joint.mean_y) * APPROX_BDAYS_PER_YEAR
+        return alpha, beta
+
+    def sharpe(self):
+        if self.length < 2:
+            return np.nan
+
+        std = self.algorithm.std()
+        if std == 0:
+            return np.nan
+        return self.algorithm.mean / std * sqrt(APPROX_BDAYS_PER_YEAR)
+
+    def downside_risk(self):
+        if self.length < 1 or not self.algorithm.count:
+            return np.nan
+        return (
+            sqrt(self.downside_sum_squares / self.algorithm.count) *
+            sqrt(APPROX_BDAYS_PER_YEAR)
+        )
+
+    def sortino(self, downside_risk):
+        if self.length < 2:
+            return np.nan
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (
+                np.float64(self.algorithm.mean) / downside_risk *
+                APPROX_BDAYS_PER_YEAR
+            )
+
+    def information(self):
+        if self.length < 2:
+            return np.nan
+
+        tracking_error = self.active.std()
+        if isnan(tracking_error):
+            return 0.0
+        if tracking_error == 0:
+            return np.nan
+        return self.active.mean / tracking_error
@@ -16,11 +16,15 @@ from __future__ import division
 
 import abc
 import math
+
+import numpy as np
 from six import with_metaclass, iteritems
 
 from pandas import isnull
 
+from zipline.finance.order import check_triggers
 from zipline.finance.transaction import create_transaction
+from zipline.utils.functional import overrides
 
 SELL = 1 << 0
 BUY = 1 << 1
@@ -68,6 +72,29 @@ def fill_price_worse_than_limit_price(fill_price, order):
     return False
 
 
+def current_volumes_and_prices(data, assets):
+    """
+    Fetch the current volume and close price of many assets at once.
+
+    Parameters
+    ----------
+    data : BarData
+        The data for the given bar.
+    assets : list[Asset]
+        The assets whose volumes and prices to fetch.
+
+    Returns
+    -------
+    volumes, prices : np.ndarray[float64]
+        The volume and close price of each asset.
+    """
+    current = data.current(assets, ['volume', 'close'])
+    return (
+        np.asarray(current['volume'], dtype=np.float64),
+        np.asarray(current['close'], dtype=np.float64),
+    )
+
+
 class SlippageModel(with_metaclass(abc.ABCMeta)):
     """Abstract interface for defining a slippage model.
     """
@@ -118,6 +145,50 @@ class SlippageModel(with_metaclass(abc.ABCMeta)):
         if isnull(price):
             return
         # END
+
+        for order_txn in self._simulate_orders(data, orders_for_asset, price):
+            yield order_txn
+
+    def simulate_batch(self, data, assets, orders):
+        """Simulate the orders for many assets in the current bar.
+
+        The volume and close price of every asset are fetched at once, after
+        which each asset's orders are filled the same way as in
+        :meth:`simulate`. If a subclass overrides :meth:`simulate`, it is
+        called for each asset instead.
+
+        Parameters
+        ----------
+        data : BarData
+            The data for the given bar.
+        assets : list[Asset]
+            The assets with open orders.
+        orders : list[list[Order]]
+            The open orders for each asset.
+
+        Returns
+        -------
+        fills : list[list[(Order, Transaction)]]
+            The orders filled for each asset, and their transactions.
+        """
+        if overrides(self, SlippageModel, 'simulate'):
+            return [
+                list(self.simulate(data, asset, orders_for_asset))
+                for asset, orders_for_asset in zip(assets, orders)
+            ]
+
+        volumes, prices = current_volumes_and_prices(data, assets)
+        fills = [[] for _ in assets]
+
+        # Remove the check for a missing price after fixing data to ensure
+        # volume always has corresponding price.
+        for i in np.flatnonzero((volumes != 0) & ~np.isnan(prices)):
+            fills[i] = list(self._simulate_orders(data, orders[i], prices[i]))
+
+        return fills
+
+    def _simulate_orders(self, data, orders_for_asset, price):
+        self._volume_for_bar = 0
         dt = data.current_dt
 
         for order in orders_for_asset:
@@ -232,6 +303,94 @@ class VolumeShareSlippage(SlippageModel):
             math.copysign(cur_volume, order.direction)
         )
 
+    def simulate_batch(self, data, assets, orders):
+        if (overrides(self, VolumeShareSlippage, 'process_order') or
+                overrides(self, SlippageModel, 'simulate')):
+            return super(VolumeShareSlippage, self).simulate_batch(
+                data, assets, orders,
+            )
+
+        volumes, prices = current_volumes_and_prices(data, assets)
+        fills = [[] for _ in assets]
+        dt = data.current_dt
+
+        # The volume already filled against each asset's bar.
+        volumes_for_bar = np.zeros(len(assets))
+        # Whether each asset still has volume left to fill orders against.
+        available = (volumes != 0) & ~np.isnan(prices)
+
+        # Each asset's orders must be filled in sequence, because the price
+        # impact of an order depends on the volume filled before it. Fill the
+        # first open order of every asset at once, then the second, and so
+        # on.
+        for rank in range(max(len(o) for o in orders)):
+            idx = np.array([
+                i for i in np.flatnonzero(available)
+                if rank < len(orders[i]) and orders[i][rank].open_amount != 0
+            ], dtype=np.int64)
+            if not len(idx):
+                continue
+
+            rank_orders = [orders[i][rank] for i in idx]
+            triggered = check_triggers(rank_orders, prices[idx], dt)
+            rank_orders = [o for o, t in zip(rank_orders, triggered) if t]
+            idx = idx[triggered]
+
+            remaining_volumes = (
+                self.volume_limit * volumes[idx] - volumes_for_bar[idx]
+            )
+            # We can't fill any more transactions for these assets.
+            exceeded = remaining_volumes < 1
+            available[idx[exceeded]] = False
+
+            # The current order amount will be the min of the volume
+            # available in the bar or the open amount.
+            open_amounts = np.array(
+                [abs(o.open_amount) for o in rank_orders],
+                dtype=np.float64,
+            )
+            cur_volumes = np.trunc(np.minimum(remaining_volumes, open_amounts))
+            directions = np.array(
+                [o.direction for o in rank_orders],
+                dtype=np.float64,
+            )
+
+            # Price impact accounts for the total volume of transactions
+            # created against the current bar.
+            volume_shares = np.minimum(
+                (volumes_for_bar[idx] + cur_volumes) / volumes[idx],
+                self.volume_limit,
+            )
+            impacted_prices = prices[idx] + (
+                volume_shares ** 2 *
+                np.copysign(self.price_impact, directions) *
+                prices[idx]
+            )
+
+            limits = np.array(
+                [o.limit if o.limit else np.nan for o in rank_orders],
+                dtype=np.float64,
+            )
+            with np.errstate(invalid='ignore'):
+                worse_than_limit = (
+                    ((directions > 0) & (impacted_prices > limits)) |
+                    ((directions < 0) & (impacted_prices < limits))
+                )
+
+            filled = ~exceeded & (cur_volumes >= 1) & ~worse_than_limit
+            for j in np.flatnonzero(filled):
+                i = idx[j]
+                txn = create_transaction(
+                    rank_orders[j],
+                    dt,
+                    impacted_prices[j],
+                    math.copysign(cur_volumes[j], directions[j]),
+                )
+                volumes_for_bar[i] += abs(txn.amount)
+                fills[i].append((rank_orders[j], txn))
+
+        return fills
+
 
 class FixedSlippage(SlippageModel):
     """Model slippage as a fixed spread.
@@ -252,3 +411,42 @@ class FixedSlippage(SlippageModel):
             price + (self.spread / 2.0 * order.direction),
             order.amount
         )
+
+    def simulate_batch(self, data, assets, orders):
+        if (overrides(self, FixedSlippage, 'process_order') or
+                overrides(self, SlippageModel, 'simulate')):
+            return super(FixedSlippage, self).simulate_batch(
+                data, assets, orders,
+            )
+
+        volumes, prices = current_volumes_and_prices(data, assets)
+        fills = [[] for _ in assets]
+
+        # The fills for an asset don't depend on each other, so all of the
+        # open orders are filled at once.
+        idx = []
+        open_orders = []
+        for i in np.flatnonzero((volumes != 0) & ~np.isnan(prices)):
+            for order in orders[i]:
+                if order.open_amount != 0:
+                    idx.append(i)
+                    open_orders.append(order)
+        if not open_orders:
+            return fills
+
+        idx = np.array(idx, dtype=np.int64)
+        dt = data.current_dt
+        triggered = check_triggers(open_orders, prices[idx], dt)
+
+        directions = np.array(
+            [o.direction for o in open_orders],
+            dtype=np.float64,
+        )
+        fill_prices = prices[idx] + (self.spread / 2.0 * directions)
+
+        for j in np.flatnonzero(triggered):
+            order = open_orders[j]
+            txn = create_transaction(order, dt, fill_prices[j], order.amount)
+            fills[idx[j]].append((order, txn))
+
+        return fills
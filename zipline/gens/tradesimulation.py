@@ -119,8 +119,6 @@ class AlgorithmSimulator(object):
             new_transactions, new_commissions, closed_orders = \
                 blotter.get_transactions(current_data)
 
-            blotter.prune_orders(closed_orders)
-
             for transaction in new_transactions:
                 perf_tracker.process_transaction(transaction)
 
@@ -128,6 +126,10 @@ class AlgorithmSimulator(object):
                 order = blotter.orders[transaction.order_id]
                 perf_tracker.process_order(order)
 
+            # prune the closed orders after they have been recorded, because
+            # the blotter may archive them.
+            blotter.prune_orders(closed_orders)
+
             if new_commissions:
                 for commission in new_commissions:
                     perf_tracker.process_commission(commission)
@@ -240,7 +242,9 @@ class AlgorithmSimulator(object):
                     minute_msg = \
                         self._get_minute_message(dt, algo, algo.perf_tracker)
 
-                    yield minute_msg
+                    # In lean emission, most minutes don't have a packet.
+                    if minute_msg is not None:
+                        yield minute_msg
 
         risk_message = algo.perf_tracker.handle_simulation_end()
         yield risk_message
@@ -301,5 +305,6 @@ class AlgorithmSimulator(object):
             dt, self.data_portal,
         )
 
-        minute_message['minute_perf']['recorded_vars'] = rvars
+        if minute_message is not None:
+            minute_message['minute_perf']['recorded_vars'] = rvars
         return minute_message
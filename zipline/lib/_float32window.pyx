@@ -0,0 +1,7 @@
+"""
+float32 specialization of AdjustedArrayWindow
+"""
+from numpy cimport float32_t
+ctypedef float32_t[:, :] databuffer
+
+include "_windowtemplate.pxi"
@@ -26,9 +26,14 @@ cdef class AdjustedArrayWindow:
     Concrete subtypes should subclass this and provide a `data` attribute for
     specific types.
 
-    This object stores a copy of the data from the AdjustedArray over which
-    it's iterating.  At each step in the iteration, it mutates its copy to
-    allow us to show different data when looking back over the array.
+    This object starts out sharing the data of the AdjustedArray over which
+    it's iterating.  The first time an adjustment needs to be applied, it
+    takes a private copy of the data, which it then mutates at each step in
+    the iteration to allow us to show different data when looking back over
+    the array.  Windows over data with no adjustments never copy it, and the
+    rows before the first window that can still be produced are left out of
+    the copy.  ``data_offset`` is the row of the array held in the first row
+    of ``data``.
 
     The arrays yielded by this iterator are always views over the underlying
     data.
@@ -38,11 +43,13 @@ cdef class AdjustedArrayWindow:
         readonly databuffer data
         readonly dict view_kwargs
         readonly Py_ssize_t window_length
-        Py_ssize_t anchor, max_anchor, next_adj
-        Py_ssize_t perspective_offset
+        readonly Py_ssize_t anchor, max_anchor, next_adj
+        readonly Py_ssize_t perspective_offset
+        readonly Py_ssize_t data_offset
         dict adjustments
         list adjustment_indices
         ndarray output
+        bint owns_data
 
     def __cinit__(self,
                   databuffer data not None,
@@ -52,6 +59,8 @@ cdef class AdjustedArrayWindow:
                   Py_ssize_t window_length,
                   Py_ssize_t perspective_offset):
         self.data = data
+        self.data_offset = 0
+        self.owns_data = False
         self.view_kwargs = view_kwargs
         self.adjustments = adjustments
         self.adjustment_indices = sorted(adjustments, reverse=True)
@@ -122,8 +131,17 @@ cdef class AdjustedArrayWindow:
         # for which we're calculating a window.
         while self.next_adj < target + self.perspective_offset:
 
+            if not self.owns_data:
+                # Copy on first write so that the buffer we were constructed
+                # with is never mutated.  The anchor never moves backwards,
+                # so rows before the window ending at ``target`` are never
+                # read again and don't need to be copied.
+                self.data_offset = target - self.window_length
+                self.data = self.data[self.data_offset:].copy()
+                self.owns_data = True
+
             for adjustment in self.adjustments[self.next_adj]:
-                adjustment.mutate(self.data)
+                adjustment.mutate(self.data, self.data_offset)
 
             self.next_adj = self.pop_next_adj()
 
@@ -132,7 +150,7 @@ cdef class AdjustedArrayWindow:
     cdef inline _update_output(self):
         cdef:
             ndarray new_out
-            Py_ssize_t anchor = self.anchor
+            Py_ssize_t anchor = self.anchor - self.data_offset
             dict view_kwargs = self.view_kwargs
 
         new_out = asanyarray(self.data[anchor - self.window_length:anchor])
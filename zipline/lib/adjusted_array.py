@@ -1,7 +1,10 @@
 from textwrap import dedent
 
 from numpy import (
+    asanyarray,
+    asarray,
     bool_,
+    datetime64,
     dtype,
     float32,
     float64,
@@ -13,6 +16,8 @@ from numpy import (
     uint32,
     uint8,
 )
+from six import iteritems
+
 from zipline.errors import (
     WindowLengthNotPositive,
     WindowLengthTooLong,
@@ -20,6 +25,7 @@ from zipline.errors import (
 from zipline.lib.labelarray import LabelArray
 from zipline.utils.numpy_utils import (
     datetime64ns_dtype,
+    float32_dtype,
     float64_dtype,
     int64_dtype,
     uint8_dtype,
@@ -27,6 +33,7 @@ from zipline.utils.numpy_utils import (
 from zipline.utils.memoize import lazyval
 
 # These class names are all the same because of our bootleg templating system.
+from ._float32window import AdjustedArrayWindow as Float32Window
 from ._float64window import AdjustedArrayWindow as Float64Window
 from ._int64window import AdjustedArrayWindow as Int64Window
 from ._labelwindow import AdjustedArrayWindow as LabelWindow
@@ -74,19 +81,21 @@ def is_categorical(dtype):
 
 
 CONCRETE_WINDOW_TYPES = {
+    float32_dtype: Float32Window,
     float64_dtype: Float64Window,
     int64_dtype: Int64Window,
     uint8_dtype: UInt8Window,
 }
 
 
-def _normalize_array(data, missing_value):
+def _normalize_array(data, missing_value, float32=False):
     """
     Coerce buffer data for an AdjustedArray into a standard scalar
     representation, returning the coerced array and a dict of argument to pass
     to np.view to use when providing a user-facing view of the underlying data.
 
-    - float* data is coerced to float64 with viewtype float64.
+    - float* data is coerced to float64 with viewtype float64, or to float32
+      with viewtype float32 if ``float32`` is True.
     - int32, int64, and uint32 are converted to int64 with viewtype int64.
     - datetime[*] data is coerced to int64 with a viewtype of datetime64[ns].
     - bool_ data is coerced to uint8 with a viewtype of bool_.
@@ -94,6 +103,8 @@ def _normalize_array(data, missing_value):
     Parameters
     ----------
     data : np.ndarray
+    missing_value : object
+    float32 : bool, optional
 
     Returns
     -------
@@ -106,6 +117,8 @@ def _normalize_array(data, missing_value):
     if data_dtype == bool_:
         return data.astype(uint8), {'dtype': dtype(bool_)}
     elif data_dtype in FLOAT_DTYPES:
+        if float32:
+            return data.astype(float32), {'dtype': float32_dtype}
         return data.astype(float64), {'dtype': dtype(float64)}
     elif data_dtype in INT_DTYPES:
         return data.astype(int64), {'dtype': dtype(int64)}
@@ -152,6 +165,12 @@ class AdjustedArray(object):
     missing_value : object
         A value to use to fill missing data in yielded windows.
         Should be a value coercible to `data.dtype`.
+    float32 : bool, optional
+        If True, floating point data is stored, adjusted and yielded as
+        float32 rather than float64.  This halves the memory used by the array
+        and by each of its windows, at the cost of precision: every value is
+        rounded to the nearest float32, a relative error of at most 2 ** -24.
+        Default is False.
     """
     __slots__ = (
         '_data',
@@ -161,8 +180,12 @@ class AdjustedArray(object):
         '__weakref__',
     )
 
-    def __init__(self, data, mask, adjustments, missing_value):
-        self._data, self._view_kwargs = _normalize_array(data, missing_value)
+    def __init__(self, data, mask, adjustments, missing_value, float32=False):
+        self._data, self._view_kwargs = _normalize_array(
+            data,
+            missing_value,
+            float32,
+        )
 
         self.adjustments = adjustments
         self.missing_value = missing_value
@@ -218,7 +241,9 @@ class AdjustedArray(object):
             Number of rows past the end of the current window from which to
             "view" the underlying data.
         """
-        data = self._data.copy()
+        # Windows copy ``data`` before applying their first adjustment, so
+        # traversals that never reach an adjustment share our buffer.
+        data = self._data
         _check_window_params(data, window_length)
         return self._iterator_type(
             data,
@@ -229,6 +254,71 @@ class AdjustedArray(object):
             perspective_offset,
         )
 
+    def subset(self, columns, first_row=0):
+        """
+        Make an AdjustedArray holding some of our columns, starting at
+        ``first_row``.
+
+        Parameters
+        ----------
+        columns : np.ndarray[intp]
+            The indices of the columns to keep, in ascending order.
+        first_row : int, optional
+            The first row to keep.  Default is 0.
+
+        Returns
+        -------
+        subset : AdjustedArray
+            An array whose windows are the same as the windows of this array,
+            restricted to ``columns``.
+        """
+        is_datetime = self._view_kwargs.get('dtype') == datetime64ns_dtype
+        adjustments = {}
+        for row, row_adjustments in iteritems(self.adjustments):
+            for adjustment in row_adjustments:
+                last_row = adjustment.last_row - first_row
+                if last_row < 0:
+                    # The adjustment only touches rows we're dropping.
+                    continue
+                # The kept columns in the adjustment's range are contiguous
+                # because ``columns`` is sorted.
+                first_col = columns.searchsorted(adjustment.first_col)
+                last_col = columns.searchsorted(
+                    adjustment.last_col,
+                    'right',
+                ) - 1
+                if first_col > last_col:
+                    continue
+
+                dropped_rows = max(first_row - adjustment.first_row, 0)
+                if hasattr(adjustment, 'values'):
+                    # Array adjustments have a value for each row.
+                    value = asarray(adjustment.values)[dropped_rows:]
+                    if is_datetime:
+                        value = value.view(datetime64ns_dtype)
+                else:
+                    value = adjustment.value
+                    if is_datetime:
+                        value = datetime64(value, 'ns')
+
+                adjustments.setdefault(row - first_row, []).append(
+                    type(adjustment)(
+                        adjustment.first_row - first_row + dropped_rows,
+                        last_row,
+                        first_col,
+                        last_col,
+                        value,
+                    ),
+                )
+
+        return type(self)(
+            self.data[first_row:, columns],
+            NOMASK,
+            adjustments,
+            self.missing_value,
+            float32=self._data.dtype == float32_dtype,
+        )
+
     def inspect(self):
         """
         Return a string representation of the data stored in this array.
@@ -320,3 +410,75 @@ def _check_window_params(data, window_length):
             nrows=data.shape[0],
             window_length=window_length,
         )
+
+
+#: Types of the iterators returned by :meth:`AdjustedArray.traverse`.
+WINDOW_TYPES = (
+    Float32Window,
+    Float64Window,
+    Int64Window,
+    LabelWindow,
+    UInt8Window,
+)
+
+
+def window_blocks(windows, nrows):
+    """
+    Split the remaining rows of a set of AdjustedArray windows into blocks
+    over which no new adjustments are applied.
+
+    This is an alternative to calling ``next`` on each window ``nrows`` times:
+    rather than one array per row, each window produces one array covering a
+    contiguous run of rows, with ``window_length - 1`` leading rows of
+    history.  On return, ``windows`` are positioned exactly as if ``next``
+    had been called ``nrows`` times.
+
+    Parameters
+    ----------
+    windows : iterable[AdjustedArrayWindow]
+        Windows produced by :meth:`AdjustedArray.traverse` that have not yet
+        produced any output.
+    nrows : int
+        Number of rows to produce.
+
+    Yields
+    ------
+    start : int
+        Index of the first row covered by the block.
+    stop : int
+        Index one past the last row covered by the block.
+    arrays : list[np.ndarray]
+        One read-only array per window, each holding
+        ``stop - start + window_length - 1`` rows.  The trailing
+        ``window_length`` rows ending at offset ``i`` of an array are the
+        values ``next`` would have produced for row ``start + i``.
+    """
+    windows = list(windows)
+    origins = [w.anchor + 1 for w in windows]
+    row = 0
+    while row < nrows:
+        stop = nrows
+        for w, origin in zip(windows, origins):
+            w.seek(origin + row)
+            # The next adjustment is applied when ticking to the first anchor
+            # that is greater than ``next_adj - perspective_offset``.
+            stop = min(stop, w.next_adj - w.perspective_offset - origin + 1)
+
+        arrays = []
+        for w, origin in zip(windows, origins):
+            # Once a window has copied its data, the copy starts at row
+            # ``data_offset``.
+            base = origin - w.data_offset
+            block = asanyarray(
+                w.data[base + row - w.window_length:base + stop - 1],
+            )
+            if w.view_kwargs:
+                block = block.view(**w.view_kwargs)
+            block.setflags(write=False)
+            arrays.append(block)
+
+        yield row, stop, arrays
+
+        for w, origin in zip(windows, origins):
+            w.seek(origin + stop - 1)
+        row = stop
@@ -1,5 +1,6 @@
 # cython: embedsignature=True
 from cpython cimport Py_EQ
+from cython cimport floating
 
 from pandas import isnull, Timestamp
 from numpy cimport float64_t, uint8_t, int64_t
@@ -226,6 +227,10 @@ cdef class Adjustment:
     Base class for Adjustments.
 
     Subclasses should inherit and provide a `value` attribute and a `mutate` method.
+
+    ``mutate(data, row_offset=0)`` applies the adjustment in place to ``data``,
+    whose first row is row ``row_offset`` of the array being adjusted.  Rows of
+    the adjustment before ``row_offset`` are skipped.
     """
     cdef:
         readonly Py_ssize_t first_col, last_col, first_row, last_row
@@ -270,6 +275,9 @@ cdef class Adjustment:
 cdef class Float64Adjustment(Adjustment):
     """
     Base class for adjustments that operate on Float64 data.
+
+    Values are stored as float64, but ``mutate`` also accepts float32 buffers,
+    which are adjusted in double precision and rounded back to float32.
     """
     cdef:
         readonly float64_t value
@@ -333,15 +341,16 @@ cdef class Float64Multiply(Float64Adjustment):
            [  6.,  28.,  32.]])
     """
 
-    cpdef mutate(self, float64_t[:, :] data):
+    cpdef mutate(self, floating[:, :] data, Py_ssize_t row_offset=0):
         cdef Py_ssize_t row, col
         cdef float64_t value = self.value
 
         # last_col + 1 because last_col should also be affected.
         for col in range(self.first_col, self.last_col + 1):
             # last_row + 1 because last_row should also be affected.
-            for row in range(self.first_row, self.last_row + 1):
-                data[row, col] *= value
+            for row in range(max(self.first_row, row_offset),
+                             self.last_row + 1):
+                data[row - row_offset, col] *= value
 
 
 cdef class Float64Overwrite(Float64Adjustment):
@@ -372,15 +381,16 @@ cdef class Float64Overwrite(Float64Adjustment):
            [ 6.,  0.,  0.]])
     """
 
-    cpdef mutate(self, float64_t[:, :] data):
+    cpdef mutate(self, floating[:, :] data, Py_ssize_t row_offset=0):
         cdef Py_ssize_t row, col
         cdef float64_t value = self.value
 
         # last_col + 1 because last_col should also be affected.
         for col in range(self.first_col, self.last_col + 1):
             # last_row + 1 because last_row should also be affected.
-            for row in range(self.first_row, self.last_row + 1):
-                data[row, col] = value
+            for row in range(max(self.first_row, row_offset),
+                             self.last_row + 1):
+                data[row - row_offset, col] = value
 
 
 cdef class ArrayAdjustment(Adjustment):
@@ -455,12 +465,13 @@ cdef class Float641DArrayOverwrite(ArrayAdjustment):
             )
         self.values = values
 
-    cpdef mutate(self, float64_t[:, :] data):
-        cdef Py_ssize_t i, row, col
+    cpdef mutate(self, floating[:, :] data, Py_ssize_t row_offset=0):
+        cdef Py_ssize_t row, col
         cdef float64_t[:] values = self.values
         for col in range(self.first_col, self.last_col + 1):
-            for i, row in enumerate(range(self.first_row, self.last_row + 1)):
-                data[row, col] = values[i]
+            for row in range(max(self.first_row, row_offset),
+                             self.last_row + 1):
+                data[row - row_offset, col] = values[row - self.first_row]
 
 
 cdef class Datetime641DArrayOverwrite(ArrayAdjustment):
@@ -519,12 +530,13 @@ cdef class Datetime641DArrayOverwrite(ArrayAdjustment):
             )
         self.values = asarray([datetime_to_int(value) for value in values])
 
-    cpdef mutate(self, int64_t[:, :] data):
-        cdef Py_ssize_t i, row, col
+    cpdef mutate(self, int64_t[:, :] data, Py_ssize_t row_offset=0):
+        cdef Py_ssize_t row, col
         cdef int64_t[:] values = self.values
         for col in range(self.first_col, self.last_col + 1):
-            for i, row in enumerate(range(self.first_row, self.last_row + 1)):
-                data[row, col] = values[i]
+            for row in range(max(self.first_row, row_offset),
+                             self.last_row + 1):
+                data[row - row_offset, col] = values[row - self.first_row]
 
 
 cdef class Float64Add(Float64Adjustment):
@@ -555,15 +567,16 @@ cdef class Float64Add(Float64Adjustment):
            [ 6.,  8.,  9.]])
     """
 
-    cpdef mutate(self, float64_t[:, :] data):
+    cpdef mutate(self, floating[:, :] data, Py_ssize_t row_offset=0):
         cdef Py_ssize_t row, col
         cdef float64_t value = self.value
 
         # last_col + 1 because last_col should also be affected.
         for col in range(self.first_col, self.last_col + 1):
             # last_row + 1 because last_row should also be affected.
-            for row in range(self.first_row, self.last_row + 1):
-                data[row, col] += value
+            for row in range(max(self.first_row, row_offset),
+                             self.last_row + 1):
+                data[row - row_offset, col] += value
 
 
 cdef class _Int64Adjustment(Adjustment):
@@ -632,15 +645,16 @@ cdef class Int64Overwrite(_Int64Adjustment):
            [ 6,  0,  0]])
     """
 
-    cpdef mutate(self, int64_t[:, :] data):
+    cpdef mutate(self, int64_t[:, :] data, Py_ssize_t row_offset=0):
         cdef Py_ssize_t row, col
         cdef int64_t value = self.value
 
         # last_col + 1 because last_col should also be affected.
         for col in range(self.first_col, self.last_col + 1):
             # last_row + 1 because last_row should also be affected.
-            for row in range(self.first_row, self.last_row + 1):
-                data[row, col] = value
+            for row in range(max(self.first_row, row_offset),
+                             self.last_row + 1):
+                data[row - row_offset, col] = value
 
 
 cdef datetime_to_int(object datetimelike):
@@ -733,15 +747,16 @@ cdef class Datetime64Overwrite(Datetime64Adjustment):
            [False,  True,  True],
            [False,  True,  True]], dtype=bool)
     """
-    cpdef mutate(self, int64_t[:, :] data):
+    cpdef mutate(self, int64_t[:, :] data, Py_ssize_t row_offset=0):
         cdef Py_ssize_t row, col
         cdef int64_t value = self.value
 
         # last_col + 1 because last_col should also be affected.
         for col in range(self.first_col, self.last_col + 1):
             # last_row + 1 because last_row should also be affected.
-            for row in range(self.first_row, self.last_row + 1):
-                data[row, col] = value
+            for row in range(max(self.first_row, row_offset),
+                             self.last_row + 1):
+                data[row - row_offset, col] = value
 
 
 cdef class _ObjectAdjustment(Adjustment):
@@ -784,11 +799,14 @@ cdef class _ObjectAdjustment(Adjustment):
 
 cdef class ObjectOverwrite(_ObjectAdjustment):
 
-    cpdef mutate(self, object data):
+    cpdef mutate(self, object data, Py_ssize_t row_offset=0):
         # data is an object here because this is intended to be used with a
         # `zipline.lib.LabelArray`.
 
         # We don't do this in a loop because we only want to look up the label
         # code in the array's categories once.
-        data[self.first_row:self.last_row + 1,
+        cdef Py_ssize_t first_row = max(self.first_row, row_offset)
+        if first_row > self.last_row:
+            return
+        data[first_row - row_offset:self.last_row + 1 - row_offset,
              self.first_col:self.last_col + 1] = self.value
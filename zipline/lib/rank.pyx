@@ -6,6 +6,7 @@ from cpython cimport bool
 from numpy cimport (
     float64_t,
     import_array,
+    int64_t,
     intp_t,
     ndarray,
     NPY_DOUBLE,
@@ -14,7 +15,17 @@ from numpy cimport (
     PyArray_DIMS,
     PyArray_EMPTY,
 )
-from numpy import apply_along_axis, float64, isnan, nan
+from numpy import (
+    apply_along_axis,
+    arange,
+    empty,
+    float64,
+    int64,
+    isnan,
+    lexsort,
+    nan,
+    repeat,
+)
 from scipy.stats import rankdata
 
 from zipline.utils.numpy_utils import (
@@ -108,3 +119,123 @@ cpdef rankdata_2d_ordinal(ndarray[float64_t, ndim=2] array):
             out[i, sort_idxs[i, j]] = j + 1.0
 
     return out
+
+
+# Codes for the tie-breaking methods supported by grouped_rankdata_2d.
+cdef enum:
+    ORDINAL, MIN, MAX, DENSE, AVERAGE
+
+_GROUPED_RANK_METHODS = {
+    'ordinal': ORDINAL,
+    'min': MIN,
+    'max': MAX,
+    'dense': DENSE,
+    'average': AVERAGE,
+}
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.embedsignature(True)
+def grouped_rankdata_2d(ndarray data,
+                        ndarray group_labels,
+                        str method,
+                        bool ascending=True,
+                        ndarray out=None):
+    """
+    Rank the values of each row of ``data`` within the groups defined by
+    ``group_labels``.
+
+    Equivalent to::
+
+        naive_grouped_rowwise_apply(
+            data,
+            group_labels,
+            rankdata if ascending else rankdata_1d_descending,
+            (method,),
+        )
+
+    but ranks every group of every row with a single sort.  As with
+    ``scipy.stats.rankdata``, NaNs are ranked after all other values and are
+    never considered tied with one another.
+
+    Parameters
+    ----------
+    data : np.ndarray[float64, ndim=2]
+        The values to rank.
+    group_labels : np.ndarray[int, ndim=2]
+        Labels with the same shape as ``data``.  Values in the same row with
+        the same label are ranked against one another.
+    method : {'ordinal', 'min', 'max', 'dense', 'average'}
+        The method used to assign ranks to tied elements.
+    ascending : bool, optional
+        Whether to rank values in ascending order.  Default is True.
+    out : np.ndarray[float64, ndim=2], optional
+        Array into which to write the ranks.  If not supplied, a new array is
+        allocated and returned.
+    """
+    try:
+        code = _GROUPED_RANK_METHODS[method]
+    except KeyError:
+        raise ValueError('unknown method "{0}"'.format(method))
+
+    cdef:
+        Py_ssize_t nrows = data.shape[0]
+        Py_ssize_t ncols = data.shape[1]
+        Py_ssize_t n = nrows * ncols
+        Py_ssize_t i, j, k, first, group_start = 0, dense = 0
+        int tie_method = code
+        float64_t tie_rank = 0
+        ndarray[float64_t] values
+        ndarray[int64_t] labels
+        ndarray[intp_t] order
+        ndarray[float64_t] ranks
+
+    values = data.astype(float64).ravel()
+    if not ascending:
+        values = -values
+    labels = group_labels.astype(int64).ravel()
+
+    # Sort by row, then by label, then by value.  lexsort is stable, so tied
+    # values within a group stay in column order, as required for 'ordinal'.
+    order = lexsort((values, labels, repeat(arange(nrows), ncols)))
+    ranks = empty(n, dtype=float64)
+
+    i = 0
+    while i < n:
+        first = order[i]
+        if (i == 0 or
+                first // ncols != order[group_start] // ncols or
+                labels[first] != labels[order[group_start]]):
+            group_start = i
+            dense = 0
+
+        # Find the end of the run of values tied with ``first``.
+        j = i + 1
+        while (j < n and
+               order[j] // ncols == first // ncols and
+               labels[order[j]] == labels[first] and
+               values[order[j]] == values[first]):
+            j += 1
+        dense += 1
+
+        if tie_method == MIN:
+            tie_rank = i - group_start + 1
+        elif tie_method == MAX:
+            tie_rank = j - group_start
+        elif tie_method == DENSE:
+            tie_rank = dense
+        elif tie_method == AVERAGE:
+            tie_rank = (i + j + 1) / 2.0 - group_start
+
+        for k in range(i, j):
+            if tie_method == ORDINAL:
+                ranks[order[k]] = k - group_start + 1
+            else:
+                ranks[order[k]] = tie_rank
+        i = j
+
+    if out is None:
+        return ranks.reshape(nrows, ncols)
+    out[:] = ranks.reshape(nrows, ncols)
+    return out
@@ -0,0 +1,574 @@
+"""
+On-disk cache for computed Pipeline terms.
+"""
+from hashlib import sha1
+import os
+from types import BuiltinFunctionType, CodeType, FunctionType, ModuleType
+
+from numpy import (
+    array_equal,
+    asarray,
+    dtype as dtype_class,
+    generic,
+    load,
+    ndarray,
+    save,
+    searchsorted,
+    ufunc,
+)
+from six import binary_type, integer_types, iteritems, string_types
+
+from zipline.utils.cache import working_file
+from zipline.utils.paths import ensure_directory
+
+from .term import ComputableTerm, Term
+
+
+class UncacheableTerm(Exception):
+    """
+    Raised when we can't build a process-independent key for a term.
+    """
+
+
+def _qualified_name(obj):
+    return '%s.%s' % (obj.__module__, obj.__name__)
+
+
+def _value_key(obj, module, seen):
+    """
+    Build a string that uniquely identifies ``obj``, which is a constant,
+    global, closure cell or default argument of a function defined in
+    ``module``.
+
+    Functions and classes defined in ``module`` are keyed by their code, so
+    that editing a helper invalidates the functions that call it. Functions,
+    classes and modules defined elsewhere are keyed by name.
+    """
+    if obj is None or isinstance(
+            obj,
+            (bool, float, complex, generic) + integer_types,
+    ):
+        return '%s:%r' % (type(obj).__name__, obj)
+
+    if isinstance(obj, (string_types, binary_type)):
+        return repr(obj)
+
+    if isinstance(obj, (tuple, list)):
+        return '%s(%s)' % (
+            type(obj).__name__,
+            ','.join(_value_key(elem, module, seen) for elem in obj),
+        )
+
+    if isinstance(obj, (frozenset, set)):
+        # Set iteration order depends on the hash seed of the process.
+        return '%s(%s)' % (
+            type(obj).__name__,
+            ','.join(sorted(_value_key(elem, module, seen) for elem in obj)),
+        )
+
+    if isinstance(obj, dict):
+        return 'dict(%s)' % ','.join(sorted(
+            '%s=%s' % (
+                _value_key(k, module, seen),
+                _value_key(v, module, seen),
+            )
+            for k, v in iteritems(obj)
+        ))
+
+    if isinstance(obj, ndarray):
+        if obj.dtype.kind == 'O':
+            raise UncacheableTerm(obj)
+        return 'ndarray:%s:%s:%s' % (
+            obj.dtype.str,
+            obj.shape,
+            sha1(obj.tobytes()).hexdigest(),
+        )
+
+    if isinstance(obj, dtype_class):
+        return 'dtype:' + obj.str
+
+    if isinstance(obj, CodeType):
+        return _code_key(obj, {}, module, seen)
+
+    if isinstance(obj, ModuleType):
+        return 'module:' + obj.__name__
+
+    if isinstance(obj, (staticmethod, classmethod)):
+        return _value_key(obj.__func__, module, seen)
+
+    if isinstance(obj, FunctionType):
+        if obj.__module__ == module:
+            return _function_key(obj, seen)
+        return _qualified_name(obj)
+
+    if isinstance(obj, type):
+        if obj.__module__ == module:
+            return _class_key(obj, seen)
+        return _qualified_name(obj)
+
+    if isinstance(obj, (BuiltinFunctionType, ufunc)):
+        return repr(obj)
+
+    # We can't tell whether the repr of an arbitrary object captures all of
+    # its state, so we refuse to cache anything that depends on one.
+    raise UncacheableTerm(obj)
+
+
+def _code_key(code, globals_, module, seen):
+    """
+    Build a string that identifies a code object, along with the values of
+    the globals it reads.
+
+    Bytecode refers to constants and names by index, so we mix in the
+    constants, names and the values bound to those names as well.
+    """
+    parts = [sha1(code.co_code).hexdigest(), repr(code.co_names)]
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            # Nested functions, lambdas and comprehensions.
+            parts.append(_code_key(const, globals_, module, seen))
+        else:
+            parts.append(_value_key(const, module, seen))
+
+    for name in code.co_names:
+        # ``co_names`` also holds attribute names, which will usually not
+        # appear in the globals.
+        if name in globals_:
+            parts.append(
+                '%s=%s' % (name, _value_key(globals_[name], module, seen)),
+            )
+    return '(%s)' % ','.join(parts)
+
+
+def _function_key(func, seen):
+    """
+    Build a string that identifies a function by its code, its defaults and
+    the contents of its closure.
+    """
+    try:
+        return seen[func]
+    except KeyError:
+        pass
+    # Guard against recursive functions.
+    seen[func] = 'function:' + _qualified_name(func)
+
+    module = func.__module__
+    parts = [_code_key(func.__code__, func.__globals__, module, seen)]
+    parts.append(_value_key(func.__defaults__, module, seen))
+    for cell in func.__closure__ or ():
+        try:
+            contents = cell.cell_contents
+        except ValueError:
+            # The cell hasn't been filled yet.
+            parts.append('<empty>')
+        else:
+            if (isinstance(contents, FunctionType) and
+                    contents.__code__.co_filename ==
+                    func.__code__.co_filename):
+                # Functions defined alongside ``func`` are part of its code,
+                # wherever they claim to come from.
+                parts.append(_function_key(contents, seen))
+            else:
+                parts.append(_value_key(contents, module, seen))
+
+    result = seen[func] = sha1(
+        ''.join(parts).encode('utf-8'),
+    ).hexdigest()
+    return result
+
+
+def _referenced_names(code):
+    """
+    Iterate over the global and attribute names read by ``code``, including
+    the names read by any nested code objects.
+    """
+    for name in code.co_names:
+        yield name
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            for name in _referenced_names(const):
+                yield name
+
+
+def _lookup_method(cls, name):
+    """
+    Find the function bound to ``name`` on ``cls`` without invoking any
+    descriptors, or None if ``name`` isn't a method of ``cls``.
+    """
+    for klass in cls.__mro__:
+        try:
+            attr = vars(klass)[name]
+        except KeyError:
+            continue
+        attr = getattr(attr, '__func__', attr)
+        if isinstance(attr, FunctionType):
+            return attr
+        return None
+    return None
+
+
+def _class_key(cls, seen=None):
+    """
+    Build a string that identifies a class.
+
+    Classes with user-supplied ``compute`` functions (CustomFactor and
+    friends) are often defined in scripts or notebooks, where the name alone
+    says very little about what is being computed, so we mix in the code of
+    ``compute``, of any methods it reads through ``self``, and of everything
+    that code reads.
+
+    Raises
+    ------
+    UncacheableTerm
+        Raised if the class's code depends on an object that can't be keyed.
+    """
+    if seen is None:
+        seen = {}
+    try:
+        return seen[cls]
+    except KeyError:
+        pass
+    key = seen[cls] = _qualified_name(cls)
+
+    compute = _lookup_method(cls, 'compute')
+    if compute is None:
+        return key
+
+    parts = []
+    methods = [compute]
+    visited = {compute}
+    while methods:
+        method = methods.pop()
+        parts.append(_function_key(method, seen))
+        for name in sorted(set(_referenced_names(method.__code__))):
+            helper = _lookup_method(cls, name)
+            if helper is not None and helper not in visited:
+                visited.add(helper)
+                methods.append(helper)
+
+    key = seen[cls] = key + ':' + sha1(
+        ''.join(parts).encode('utf-8'),
+    ).hexdigest()
+    return key
+
+
+def _key_for(obj, memo):
+    """
+    Build a string that uniquely identifies ``obj``, which is an element of a
+    Term's static identity.
+    """
+    if isinstance(obj, Term):
+        try:
+            return memo[obj]
+        except KeyError:
+            pass
+        try:
+            identity = obj._identity
+        except AttributeError:
+            raise UncacheableTerm(obj)
+        result = memo[obj] = sha1(
+            _key_for(identity, memo).encode('utf-8'),
+        ).hexdigest()
+        return result
+
+    if isinstance(obj, tuple):
+        return '(%s)' % ','.join(_key_for(elem, memo) for elem in obj)
+
+    if isinstance(obj, type):
+        return _class_key(obj)
+
+    if isinstance(obj, (FunctionType, BuiltinFunctionType)):
+        return '%s.%s' % (obj.__module__, obj.__name__)
+
+    if isinstance(obj, string_types):
+        return repr(obj)
+
+    result = repr(obj)
+    if ' at 0x' in result:
+        # The default object repr includes the id of the object, which is
+        # meaningless in another process.
+        raise UncacheableTerm(obj)
+    return type(obj).__name__ + ':' + result
+
+
+def term_key(term):
+    """
+    Compute a hex digest identifying ``term``.
+
+    The digest is derived from the term's static identity (the same value used
+    to memoize Term construction), so two terms have the same key if and only
+    if constructing them in the same process would produce the same object.
+
+    Parameters
+    ----------
+    term : zipline.pipeline.term.Term
+        The term to identify.
+
+    Returns
+    -------
+    key : str
+        Hex digest for ``term``.
+
+    Raises
+    ------
+    UncacheableTerm
+        Raised if ``term`` depends on an object without a stable
+        representation.
+    """
+    return _key_for(term, {})
+
+
+class TermCache(object):
+    """
+    Disk-backed store of computed pipeline terms.
+
+    Each entry holds the full (dates x assets) result of a single term as an
+    ``.npy`` file, which is memory-mapped when read back.  Entries are keyed
+    by the term's identity, the asset universe it was computed over, and
+    ``data_version``; the date range covered by an entry is encoded in its
+    filename, which serves as the index for range lookups.
+
+    Parameters
+    ----------
+    path : str
+        The directory in which to store cached terms.
+    data_version : str, optional
+        An identifier for the underlying data, for example the ingestion
+        timestamp of the bundle being used.  Entries written under a different
+        ``data_version`` are never read.
+    max_size : int, optional
+        The maximum number of bytes to keep on disk.  Once a write takes the
+        cache over this size, the least recently used entries are removed
+        until it fits again.  Results larger than ``max_size`` are never
+        written.  By default, the cache grows without bound.
+
+    Notes
+    -----
+    Only computed (i.e. non-loadable) two-dimensional terms with fixed-width
+    dtypes are cached.  Results for categorical terms are never written.
+
+    See Also
+    --------
+    :class:`zipline.pipeline.engine.SimplePipelineEngine`
+    """
+    _dates_suffix = '.dates.npy'
+    _values_suffix = '.npy'
+
+    def __init__(self, path, data_version='', max_size=None):
+        self.path = path
+        self.data_version = data_version
+        self.max_size = max_size
+        ensure_directory(path)
+
+    def _entry_dir(self, term, assets):
+        """
+        Directory holding all entries for ``term`` computed over ``assets``.
+        """
+        hasher = sha1(term_key(term).encode('utf-8'))
+        hasher.update(asarray(assets, dtype='int64').tobytes())
+        hasher.update(str(self.data_version).encode('utf-8'))
+        return os.path.join(self.path, hasher.hexdigest())
+
+    def _entries(self, dirname):
+        """
+        Iterate over (start, end, basename) for each entry in ``dirname``.
+        """
+        try:
+            names = os.listdir(dirname)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(self._dates_suffix):
+                continue
+            if not name.endswith(self._values_suffix):
+                continue
+            basename = name[:-len(self._values_suffix)]
+            try:
+                start, end = map(int, basename.split('_'))
+            except ValueError:
+                continue
+            yield start, end, os.path.join(dirname, basename)
+
+    @staticmethod
+    def _is_cacheable(term):
+        return isinstance(term, ComputableTerm) and term.ndim == 2
+
+    def load(self, term, dates, assets):
+        """
+        Look up a cached result for ``term``.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.term.Term
+            The term to look up.
+        dates : pd.DatetimeIndex
+            The dates for which values are required.
+        assets : pd.Int64Index
+            The assets for which values are required.
+
+        Returns
+        -------
+        values : np.ndarray or None
+            A (len(dates), len(assets)) copy-on-write memory map of the
+            cached values, or None if no entry covers ``dates``.
+        """
+        if not self._is_cacheable(term):
+            return None
+        try:
+            dirname = self._entry_dir(term, assets)
+        except UncacheableTerm:
+            return None
+
+        dates = asarray(dates.values, dtype='datetime64[ns]')
+        first, last = dates[[0, -1]].view('int64')
+        for start, end, basename in self._entries(dirname):
+            if start > first or end < last:
+                continue
+
+            cached_dates = load(basename + self._dates_suffix)
+            start_row = searchsorted(cached_dates, dates[0])
+            stop_row = start_row + len(dates)
+            if not array_equal(cached_dates[start_row:stop_row], dates):
+                # The entry was computed against a different calendar.
+                continue
+
+            values_path = basename + self._values_suffix
+            values = load(values_path, mmap_mode='c')
+            try:
+                # Mark the entry as recently used for eviction.
+                os.utime(values_path, None)
+            except OSError:
+                pass
+            return values[start_row:stop_row]
+        return None
+
+    def store(self, term, dates, assets, values):
+        """
+        Write the computed ``values`` of ``term`` to the cache.
+
+        This is a no-op for terms that can't be cached.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.term.Term
+            The term that was computed.
+        dates : pd.DatetimeIndex
+            Row labels for ``values``.
+        assets : pd.Int64Index
+            Column labels for ``values``.
+        values : np.ndarray
+            The computed result for ``term``.
+        """
+        if not self._is_cacheable(term):
+            return
+        if type(values) is not ndarray or values.dtype.kind == 'O':
+            return
+        max_size = self.max_size
+        if max_size is not None and values.nbytes > max_size:
+            return
+        try:
+            dirname = self._entry_dir(term, assets)
+        except UncacheableTerm:
+            return
+
+        ensure_directory(dirname)
+        dates = asarray(dates.values, dtype='datetime64[ns]')
+        first, last = dates[[0, -1]].view('int64')
+        basename = os.path.join(dirname, '%d_%d' % (first, last))
+
+        # Write the dates first: an entry only becomes visible once its
+        # values file has been moved into place.
+        for suffix, data in ((self._dates_suffix, dates),
+                             (self._values_suffix, values)):
+            with working_file(basename + suffix,
+                              suffix=suffix,
+                              dir=dirname) as f:
+                save(f.path, data, allow_pickle=False)
+
+        if max_size is not None:
+            self.evict(max_size)
+
+    def evict(self, max_size):
+        """
+        Remove the least recently used entries until the cache takes up at
+        most ``max_size`` bytes.
+
+        Parameters
+        ----------
+        max_size : int
+            The number of bytes to keep on disk.
+        """
+        entries = []
+        total = 0
+        for name in os.listdir(self.path):
+            dirname = os.path.join(self.path, name)
+            for _, _, basename in self._entries(dirname):
+                try:
+                    values_stat = os.stat(basename + self._values_suffix)
+                    size = (
+                        values_stat.st_size +
+                        os.path.getsize(basename + self._dates_suffix)
+                    )
+                except OSError:
+                    # Removed by another process.
+                    continue
+                entries.append((values_stat.st_mtime, basename, size))
+                total += size
+
+        for _, basename, size in sorted(entries):
+            if total <= max_size:
+                break
+            # Remove the values first so that the entry stops being visible
+            # before its dates are gone.
+            for suffix in (self._values_suffix, self._dates_suffix):
+                try:
+                    os.remove(basename + suffix)
+                except OSError:
+                    pass
+            total -= size
+            try:
+                os.rmdir(os.path.dirname(basename))
+            except OSError:
+                # The directory still holds other entries.
+                pass
+
+    def populate_initial_workspace(self,
+                                   initial_workspace,
+                                   root_mask_term,
+                                   execution_plan,
+                                   dates,
+                                   assets):
+        """
+        Load cached results for terms in ``execution_plan``.
+
+        This has the same signature as
+        :func:`zipline.pipeline.engine.default_populate_initial_workspace`.
+        Terms are visited in reverse topological order, so once a term has
+        been loaded none of the terms it depends on are read from disk unless
+        some other term still needs them.
+
+        Returns
+        -------
+        populated_initial_workspace : dict[term, array-like]
+            A copy of ``initial_workspace`` updated with cached values.
+        """
+        workspace = initial_workspace.copy()
+        refcounts = execution_plan.initial_refcounts(workspace)
+        extra_rows = execution_plan.extra_rows
+        root_extra_rows = extra_rows[root_mask_term]
+
+        for term in reversed(list(execution_plan.ordered())):
+            if refcounts[term] <= 0 or term in workspace:
+                continue
+
+            term_dates = dates[root_extra_rows - extra_rows[term]:]
+            cached = self.load(term, term_dates, assets)
+            if cached is None:
+                continue
+
+            workspace[term] = cached
+            # Anything that's only needed to produce ``term`` no longer has
+            # to be computed, or loaded from the cache.
+            execution_plan._decref_depencies_recursive(term, refcounts, set())
+
+        return workspace
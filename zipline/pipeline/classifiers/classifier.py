@@ -346,6 +346,7 @@ class Everything(Classifier):
     """
     A trivial classifier that classifies everything the same.
     """
+    asset_independent = True
     dtype = int64_dtype
     window_length = 0
     inputs = ()
@@ -423,7 +424,7 @@ class Latest(LatestMixin, CustomClassifier):
     zipline.pipeline.factors.factor.Latest
     zipline.pipeline.filters.filter.Latest
     """
-    pass
+    asset_independent = True
 
 
 class InvalidClassifierComparison(TypeError):
@@ -11,23 +11,205 @@ from six import (
     iteritems,
     with_metaclass,
 )
-from numpy import array
-from pandas import DataFrame, MultiIndex
+from numpy import array, bincount, cumsum, empty, ndarray
+from pandas import DataFrame, DatetimeIndex, MultiIndex
 from toolz import groupby, juxt
 from toolz.curried.operator import getitem
 
-from zipline.lib.adjusted_array import ensure_adjusted_array, ensure_ndarray
-from zipline.errors import NoFurtherDataError
-from zipline.utils.numpy_utils import (
-    as_column,
-    repeat_first_axis,
-    repeat_last_axis,
+from zipline.lib.adjusted_array import (
+    AdjustedArray,
+    ensure_adjusted_array,
+    ensure_ndarray,
 )
+from zipline.lib.labelarray import LabelArray
+from zipline.errors import NoFurtherDataError
+from zipline.utils.memoize import lazyval
+from zipline.utils.numpy_utils import as_column
 from zipline.utils.pandas_utils import explode
 
+from .downsample_helpers import select_sampling_indices
+from .graph import ExecutionPlan
+from .mixins import DownsampledMixin
 from .term import AssetExists, InputDates, LoadableTerm
 
 
+def _trailing_windows(workspace, bases, term, window_length, offset):
+    """
+    Generate read-only windows over ``workspace[term]``, looking up the
+    underlying buffer each time a window is requested.
+
+    ``bases[term]`` is the row of ``term`` held at the start of its buffer.
+    """
+    start = offset
+    while True:
+        first = start - bases[term]
+        window = workspace[term][first:first + window_length]
+        window.setflags(write=False)
+        yield window
+        start += 1
+
+
+def _declares_asset_independence(term):
+    """
+    Check whether the class that sets ``term``'s ``asset_independent`` flag
+    also provides the methods that compute ``term``.
+
+    The flag is inherited like any other class attribute, so a subclass that
+    overrides ``compute`` with cross-sectional logic would otherwise claim to
+    be asset-independent.  Such subclasses have to restate the flag.
+    """
+    mro = type(term).__mro__
+    declarer = next(cls for cls in mro if 'asset_independent' in vars(cls))
+    for name in ('compute', '_compute'):
+        definer = next((cls for cls in mro if name in vars(cls)), None)
+        if definer is not None and definer not in declarer.__mro__:
+            return False
+    return True
+
+
+def _restrict(term, value, first_row, columns):
+    """
+    Restrict the computed or loaded ``value`` of ``term`` to the rows
+    starting at ``first_row`` and to ``columns``, or return None if we can't.
+    """
+    if isinstance(value, AdjustedArray):
+        return value.subset(columns, first_row)
+    if isinstance(value, LabelArray) or type(value) is ndarray:
+        if term.ndim == 1:
+            # There's no column per asset to select.
+            return value[first_row:]
+        return value[first_row:, columns]
+    return None
+
+
+def _compress_labels(level, codes):
+    """
+    Drop the entries of ``level`` that aren't referenced by ``codes``.
+
+    Returns
+    -------
+    (level, codes) : (pd.Index, np.ndarray[intp])
+        The used entries of ``level`` and ``codes`` renumbered to index into
+        them.
+    """
+    used = bincount(codes, minlength=len(level)).astype(bool)
+    return level[used], (cumsum(used) - 1)[codes]
+
+
+class RawPipelineResult(object):
+    """
+    The result of running a pipeline, stored as flat arrays.
+
+    Each row of the result corresponds to a single (date, asset) pair.  Rows
+    are stored as integer labels into ``date_level`` and ``sid_level``, so
+    building a result doesn't allocate any object arrays.
+
+    Parameters
+    ----------
+    columns : dict[str -> array-like]
+        1-D array of values for each column.  Categorical columns are stored
+        as ``pd.Categorical``.
+    date_level : pd.DatetimeIndex
+        The distinct dates in the result.
+    date_codes : np.ndarray[intp]
+        Index into ``date_level`` for each row.
+    sid_level : pd.Int64Index
+        The distinct sids in the result.
+    sid_codes : np.ndarray[intp]
+        Index into ``sid_level`` for each row.
+    asset_finder : zipline.assets.AssetFinder
+        Used to look up Asset objects when they're requested.
+    """
+    def __init__(self,
+                 columns,
+                 date_level,
+                 date_codes,
+                 sid_level,
+                 sid_codes,
+                 asset_finder):
+        self.columns = columns
+        self.date_level = date_level
+        self.date_codes = date_codes
+        self.sid_level = sid_level
+        self.sid_codes = sid_codes
+        self._finder = asset_finder
+
+    def __len__(self):
+        return len(self.date_codes)
+
+    @lazyval
+    def dates(self):
+        """
+        The date of each row, as an array of datetime64[ns].
+        """
+        return self.date_level.values[self.date_codes]
+
+    @lazyval
+    def sids(self):
+        """
+        The sid of each row, as an array of int64.
+        """
+        return self.sid_level.values[self.sid_codes]
+
+    @lazyval
+    def asset_level(self):
+        """
+        Asset objects for each entry of ``sid_level``.
+        """
+        return self._finder.retrieve_all(self.sid_level)
+
+    @lazyval
+    def assets(self):
+        """
+        The Asset of each row.
+        """
+        return array(self.asset_level, dtype=object)[self.sid_codes]
+
+    def to_frame(self, resolve_assets=True):
+        """
+        Convert to a DataFrame indexed by (date, asset).
+
+        Parameters
+        ----------
+        resolve_assets : bool, optional
+            Whether to label rows with Asset objects or with integer sids.
+            Default is True.
+
+        Returns
+        -------
+        frame : pd.DataFrame
+            A frame in the format described in
+            :meth:`zipline.pipeline.engine.PipelineEngine.run_pipeline`.
+        """
+        if not len(self):
+            # Manually handle the empty DataFrame case. This is a workaround
+            # to pandas failing to tz_localize an empty dataframe with a
+            # MultiIndex.
+            return DataFrame(
+                data=self.columns,
+                index=MultiIndex.from_arrays([
+                    self.date_level[:0],
+                    array([], dtype=object if resolve_assets else 'int64'),
+                ]),
+            )
+
+        if resolve_assets:
+            sid_level = self.asset_level
+        else:
+            sid_level = self.sid_level
+        return DataFrame(
+            data=self.columns,
+            index=MultiIndex(
+                levels=[
+                    DatetimeIndex(self.date_level.values).tz_localize('UTC'),
+                    sid_level,
+                ],
+                labels=[self.date_codes, self.sid_codes],
+                verify_integrity=False,
+            ),
+        )
+
+
 class PipelineEngine(with_metaclass(ABCMeta)):
 
     @abstractmethod
@@ -62,6 +244,34 @@ class PipelineEngine(with_metaclass(ABCMeta)):
         """
         raise NotImplementedError("run_pipeline")
 
+    def run_pipelines(self, pipelines, start_date, end_date):
+        """
+        Compute values for several pipelines between `start_date` and
+        `end_date`.
+
+        The default implementation runs each pipeline independently.  Engines
+        that can share work between pipelines should override this.
+
+        Parameters
+        ----------
+        pipelines : dict[str -> zipline.pipeline.Pipeline]
+            The pipelines to run, keyed by name.
+        start_date : pd.Timestamp
+            Start date of the computed matrices.
+        end_date : pd.Timestamp
+            End date of the computed matrices.
+
+        Returns
+        -------
+        results : dict[str -> pd.DataFrame]
+            Map from pipeline name to the result of running that pipeline, as
+            described in :meth:`run_pipeline`.
+        """
+        return {
+            name: self.run_pipeline(pipeline, start_date, end_date)
+            for name, pipeline in iteritems(pipelines)
+        }
+
 
 class NoEngineRegistered(Exception):
     """
@@ -80,6 +290,18 @@ class ExplodingPipelineEngine(PipelineEngine):
             "resources were registered."
         )
 
+    def run_pipelines(self, pipelines, start_date, end_date):
+        raise NoEngineRegistered(
+            "Attempted to run a pipeline but no pipeline "
+            "resources were registered."
+        )
+
+    def run_pipeline_incrementally(self, pipeline, start_date, end_date):
+        raise NoEngineRegistered(
+            "Attempted to run a pipeline but no pipeline "
+            "resources were registered."
+        )
+
 
 def default_populate_initial_workspace(initial_workspace,
                                        root_mask_term,
@@ -134,10 +356,28 @@ class SimplePipelineEngine(object):
         computing a pipeline. See
         :func:`zipline.pipeline.engine.default_populate_initial_workspace`
         for more info.
+    term_cache : zipline.pipeline.cache.TermCache, optional
+        A cache of previously-computed terms.  Cached results that cover the
+        requested dates are added to the initial workspace, which lets us skip
+        computing their dependencies entirely, and newly-computed terms are
+        written back to the cache.
+    screen_first : bool, optional
+        If True, pipelines with a screen are computed in two passes.  The
+        screen is computed first, over every asset, and then columns that
+        depend only on per-asset data (see ``Term.asset_independent``) are
+        computed over just the assets that passed the screen on at least one
+        day.  Columns that compare assets with one another, such as ranks,
+        are always computed over every asset.  Default is False.
+    fuse_expressions : bool, optional
+        If True, chains of elementwise terms are folded into single numexpr
+        evaluations before a pipeline is run, so that intermediate results
+        are never allocated.  The number of terms folded away is available as
+        ``ExecutionPlan.fused_count``.  Default is False.
 
     See Also
     --------
     :func:`zipline.pipeline.engine.default_populate_initial_workspace`
+    :class:`zipline.pipeline.cache.TermCache`
     """
     __slots__ = (
         '_get_loader',
@@ -146,6 +386,9 @@ class SimplePipelineEngine(object):
         '_root_mask_term',
         '_root_mask_dates_term',
         '_populate_initial_workspace',
+        '_term_cache',
+        '_screen_first',
+        '_fuse_expressions',
         '__weakref__',
     )
 
@@ -153,7 +396,10 @@ class SimplePipelineEngine(object):
                  get_loader,
                  calendar,
                  asset_finder,
-                 populate_initial_workspace=None):
+                 populate_initial_workspace=None,
+                 term_cache=None,
+                 screen_first=False,
+                 fuse_expressions=False):
         self._get_loader = get_loader
         self._calendar = calendar
         self._finder = asset_finder
@@ -164,6 +410,9 @@ class SimplePipelineEngine(object):
         self._populate_initial_workspace = (
             populate_initial_workspace or default_populate_initial_workspace
         )
+        self._term_cache = term_cache
+        self._screen_first = screen_first
+        self._fuse_expressions = fuse_expressions
 
     def run_pipeline(self, pipeline, start_date, end_date):
         """
@@ -206,17 +455,47 @@ class SimplePipelineEngine(object):
         Step 0 is performed by ``Pipeline.to_graph``.
         Step 1 is performed in ``SimplePipelineEngine._compute_root_mask``.
         Step 2 is performed in ``SimplePipelineEngine.compute_chunk``.
-        Steps 3, 4, and 5 are performed in ``SimplePiplineEngine._to_narrow``.
+        Steps 3 and 4 are performed in ``SimplePipelineEngine._to_raw``.
+        Step 5 is performed in ``RawPipelineResult.to_frame``.
 
         See Also
         --------
         PipelineEngine.run_pipeline
+        SimplePipelineEngine.run_pipeline_raw
         """
-        if end_date < start_date:
-            raise ValueError(
-                "start_date must be before or equal to end_date \n"
-                "start_date=%s, end_date=%s" % (start_date, end_date)
-            )
+        return self.run_pipeline_raw(pipeline, start_date, end_date).to_frame()
+
+    def run_pipeline_raw(self, pipeline, start_date, end_date):
+        """
+        Compute a pipeline, returning its results as flat arrays.
+
+        This is cheaper than :meth:`run_pipeline` for large outputs because
+        it doesn't build a MultiIndex or look up Asset objects.  Both can be
+        built later with :meth:`RawPipelineResult.to_frame`.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            Start date of the computed matrix.
+        end_date : pd.Timestamp
+            End date of the computed matrix.
+
+        Returns
+        -------
+        result : RawPipelineResult
+            The ``dates``, ``sids`` and ``columns`` of each (date, asset) pair
+            that passed ``pipeline.screen``.
+
+        See Also
+        --------
+        SimplePipelineEngine.run_pipeline
+        """
+        self._validate_dates(start_date, end_date)
+
+        if self._screen_first and pipeline.screen is not None:
+            return self._run_screened_pipeline(pipeline, start_date, end_date)
 
         screen_name = uuid4().hex
         graph = pipeline.to_execution_plan(
@@ -225,36 +504,409 @@ class SimplePipelineEngine(object):
             self._calendar,
             start_date,
             end_date,
+            fuse_expressions=self._fuse_expressions,
+        )
+        results, dates, assets = self._run_execution_plan(
+            graph,
+            start_date,
+            end_date,
         )
-        extra_rows = graph.extra_rows[self._root_mask_term]
-        root_mask = self._compute_root_mask(start_date, end_date, extra_rows)
-        dates, assets, root_mask_values = explode(root_mask)
 
-        initial_workspace = self._populate_initial_workspace(
-            {
-                self._root_mask_term: root_mask_values,
-                self._root_mask_dates_term: as_column(dates.values)
-            },
+        return self._to_raw(
+            graph.outputs,
+            results,
+            results.pop(screen_name),
+            dates,
+            assets,
+        )
+
+    def _run_screened_pipeline(self, pipeline, start_date, end_date):
+        """
+        Compute a pipeline by computing its screen first, and then computing
+        asset-independent columns only for assets that pass the screen.
+
+        See Also
+        --------
+        SimplePipelineEngine.run_pipeline
+        """
+        screen_name = uuid4().hex
+        terms = pipeline._prepare_graph_terms(
+            screen_name,
             self._root_mask_term,
+        )
+
+        # Columns whose values for one asset depend on other assets, or which
+        # are already being computed as the screen, stay in the first pass.
+        screen = terms.pop(screen_name)
+        wide_terms = {screen_name: screen}
+        narrow_terms = {}
+        independent = {}
+        for name, term in iteritems(terms):
+            if (term is not screen and
+                    self._is_asset_independent(term, independent)):
+                narrow_terms[name] = term
+            else:
+                wide_terms[name] = term
+
+        graph = ExecutionPlan(
+            wide_terms,
+            self._calendar,
+            start_date,
+            end_date,
+            fuse_expressions=self._fuse_expressions,
+        )
+        if narrow_terms:
+            narrow_graph = ExecutionPlan(
+                narrow_terms,
+                self._calendar,
+                start_date,
+                end_date,
+                fuse_expressions=self._fuse_expressions,
+            )
+            # Keep whatever the second pass can reuse from the first, rather
+            # than loading and computing it again.
+            shared = self._choose_seeds(
+                narrow_graph,
+                self._initial_terms(),
+                self._reusable_terms(graph, narrow_graph),
+            )
+        else:
+            shared = ()
+
+        initial_workspace, dates, assets = self._initial_workspace(
+            graph,
+            start_date,
+            end_date,
+        )
+        workspace = self._compute_workspace(
             graph,
             dates,
             assets,
+            initial_workspace,
+            keep=shared,
+        )
+        results = self._graph_outputs(graph, workspace)
+        dates = dates[graph.extra_rows[self._root_mask_term]:]
+        passed_screen = results.pop(screen_name)
+
+        # Every row of our output belongs to an asset that passed the screen
+        # on some day, so those are the only assets we need to compute.
+        survivors = passed_screen.any(axis=0).nonzero()[0]
+        for name, values in iteritems(results):
+            results[name] = values[:, survivors]
+
+        if len(survivors) and narrow_terms:
+            initial_workspace, narrow_dates, narrow_assets = \
+                self._initial_workspace(
+                    narrow_graph,
+                    start_date,
+                    end_date,
+                    assets[survivors],
+                )
+            extra_rows = graph.extra_rows
+            narrow_extra_rows = narrow_graph.extra_rows
+            for term in self._choose_seeds(narrow_graph,
+                                           initial_workspace,
+                                           shared):
+                if term not in workspace:
+                    # The first pass never needed to compute it.
+                    continue
+                value = _restrict(
+                    term,
+                    workspace[term],
+                    extra_rows[term] - narrow_extra_rows[term],
+                    survivors,
+                )
+                if value is not None:
+                    initial_workspace[term] = value
+            del workspace
+
+            results.update(self.compute_chunk(
+                narrow_graph,
+                narrow_dates,
+                narrow_assets,
+                initial_workspace,
+            ))
+        else:
+            for name, term in iteritems(narrow_terms):
+                results[name] = empty((len(dates), 0), dtype=term.dtype)
+
+        return self._to_raw(
+            pipeline.columns,
+            results,
+            passed_screen[:, survivors],
+            dates,
+            assets[survivors],
+        )
+
+    @classmethod
+    def _is_asset_independent(cls, term, memo):
+        """
+        Check whether ``term`` and everything it depends on can be computed
+        over a subset of assets without changing the result.
+        """
+        try:
+            return memo[term]
+        except KeyError:
+            pass
+        result = memo[term] = (
+            term.asset_independent and
+            _declares_asset_independence(term) and
+            all(
+                cls._is_asset_independent(dep, memo)
+                for dep in term.dependencies
+            )
         )
+        return result
+
+    def _initial_terms(self):
+        """
+        The terms that are in every initial workspace.
+        """
+        return {self._root_mask_term, self._root_mask_dates_term}
+
+    def _reusable_terms(self, graph, narrow_graph):
+        """
+        The terms of ``narrow_graph`` whose values can be cut out of the
+        results of ``graph``.
+
+        A term can be reused if ``graph`` computes at least as many rows
+        before the start date for it as ``narrow_graph`` needs.
+        """
+        initial_terms = self._initial_terms()
+        extra_rows = graph.extra_rows
+        narrow_extra_rows = narrow_graph.extra_rows
+        return {
+            term for term in narrow_graph.graph
+            if term in extra_rows and
+            term not in initial_terms and
+            extra_rows[term] >= narrow_extra_rows[term]
+        }
+
+    @staticmethod
+    def _choose_seeds(graph, workspace, candidates):
+        """
+        Choose which of ``candidates`` to add to ``workspace`` before
+        computing ``graph``.
+
+        Terms are visited in reverse topological order, so a term is skipped
+        if everything that needs it has already been chosen.
+
+        Returns
+        -------
+        seeds : list[Term]
+            The terms to add to ``workspace``.
+        """
+        refcounts = graph.initial_refcounts(workspace)
+        seeds = []
+        for term in reversed(list(graph.ordered())):
+            if (refcounts[term] <= 0 or
+                    term in workspace or
+                    term not in candidates):
+                continue
+            seeds.append(term)
+            graph._decref_depencies_recursive(term, refcounts, set())
+        return seeds
+
+    def run_pipelines(self, pipelines, start_date, end_date):
+        """
+        Compute several pipelines at once.
+
+        All of the pipelines are merged into a single execution plan, so terms
+        shared between pipelines are loaded and computed only once.  The
+        results are then split back out by pipeline name.
+
+        Parameters
+        ----------
+        pipelines : dict[str -> zipline.pipeline.Pipeline]
+            The pipelines to run, keyed by name.
+        start_date : pd.Timestamp
+            Start date of the computed matrices.
+        end_date : pd.Timestamp
+            End date of the computed matrices.
 
+        Returns
+        -------
+        results : dict[str -> pd.DataFrame]
+            Map from pipeline name to the result of running that pipeline, as
+            described in :meth:`run_pipeline`.
+
+        See Also
+        --------
+        PipelineEngine.run_pipelines
+        """
+        self._validate_dates(start_date, end_date)
+
+        screen_name = uuid4().hex
+        terms = {}
+        for name, pipeline in iteritems(pipelines):
+            prepared = pipeline._prepare_graph_terms(
+                screen_name,
+                self._root_mask_term,
+            )
+            for column_name, term in iteritems(prepared):
+                terms[name, column_name] = term
+
+        graph = ExecutionPlan(
+            terms,
+            self._calendar,
+            start_date,
+            end_date,
+            fuse_expressions=self._fuse_expressions,
+        )
+        results, dates, assets = self._run_execution_plan(
+            graph,
+            start_date,
+            end_date,
+        )
+
+        out = {}
+        for name, pipeline in iteritems(pipelines):
+            columns = pipeline.columns
+            out[name] = self._to_narrow(
+                columns,
+                {column_name: results[name, column_name]
+                 for column_name in columns},
+                results[name, screen_name],
+                dates,
+                assets,
+            )
+        return out
+
+    def run_pipeline_incrementally(self, pipeline, start_date, end_date):
+        """
+        Compute a pipeline one session at a time.
+
+        Raw data for the whole range is loaded up front, but terms are only
+        computed for a session when the results for that session are
+        requested.  Rolling-window terms advance their windows by one row per
+        session rather than recomputing a fresh chunk, so the cost of each
+        session is roughly constant.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            Start date of the computed matrix.
+        end_date : pd.Timestamp
+            End date of the computed matrix.
+
+        Yields
+        ------
+        (date, result) : (pd.Timestamp, pd.DataFrame)
+            The results for each session between ``start_date`` and
+            ``end_date``, in the format described in :meth:`run_pipeline`.
+
+        See Also
+        --------
+        SimplePipelineEngine.run_pipeline
+        SimplePipelineEngine.compute_rows
+        """
+        self._validate_dates(start_date, end_date)
+
+        screen_name = uuid4().hex
+        graph = pipeline.to_execution_plan(
+            screen_name,
+            self._root_mask_term,
+            self._calendar,
+            start_date,
+            end_date,
+            fuse_expressions=self._fuse_expressions,
+        )
+        initial_workspace, dates, assets = self._initial_workspace(
+            graph,
+            start_date,
+            end_date,
+        )
+        extra_rows = graph.extra_rows[self._root_mask_term]
+
+        rows = self.compute_rows(graph, dates, assets, initial_workspace)
+        for date_idx, results in enumerate(rows, extra_rows):
+            row_dates = dates[date_idx:date_idx + 1]
+            yield row_dates[0], self._to_narrow(
+                graph.outputs,
+                results,
+                results.pop(screen_name),
+                row_dates,
+                assets,
+            )
+
+    @staticmethod
+    def _validate_dates(start_date, end_date):
+        if end_date < start_date:
+            raise ValueError(
+                "start_date must be before or equal to end_date \n"
+                "start_date=%s, end_date=%s" % (start_date, end_date)
+            )
+
+    def _run_execution_plan(self, graph, start_date, end_date, sids=None):
+        """
+        Compute the root mask for ``graph`` and then compute its outputs.
+
+        If ``sids`` is given, only those assets are computed.
+
+        Returns
+        -------
+        (results, dates, assets) : (dict, pd.DatetimeIndex, pd.Int64Index)
+            ``results`` maps the names of ``graph.outputs`` to their computed
+            values, which have been truncated to start at ``start_date``.
+            ``dates`` and ``assets`` are the row and column labels for each
+            entry of ``results``.
+        """
+        initial_workspace, dates, assets = self._initial_workspace(
+            graph,
+            start_date,
+            end_date,
+            sids,
+        )
         results = self.compute_chunk(
             graph,
             dates,
             assets,
             initial_workspace,
         )
+        extra_rows = graph.extra_rows[self._root_mask_term]
+        return results, dates[extra_rows:], assets
 
-        return self._to_narrow(
-            graph.outputs,
-            results,
-            results.pop(screen_name),
-            dates[extra_rows:],
+    def _initial_workspace(self, graph, start_date, end_date, sids=None):
+        """
+        Compute the root mask for ``graph`` and build the workspace from which
+        to begin computing its terms.
+
+        If ``sids`` is given, the root mask is restricted to those assets.
+
+        Returns
+        -------
+        (workspace, dates, assets) : (dict, pd.DatetimeIndex, pd.Int64Index)
+            ``dates`` and ``assets`` are the row and column labels of the root
+            mask, including any extra rows needed before ``start_date``.
+        """
+        extra_rows = graph.extra_rows[self._root_mask_term]
+        root_mask = self._compute_root_mask(start_date, end_date, extra_rows)
+        if sids is not None:
+            root_mask = root_mask.loc[:, sids]
+        dates, assets, root_mask_values = explode(root_mask)
+
+        initial_workspace = self._populate_initial_workspace(
+            {
+                self._root_mask_term: root_mask_values,
+                self._root_mask_dates_term: as_column(dates.values)
+            },
+            self._root_mask_term,
+            graph,
+            dates,
             assets,
         )
+        if self._term_cache is not None:
+            initial_workspace = self._term_cache.populate_initial_workspace(
+                initial_workspace,
+                self._root_mask_term,
+                graph,
+                dates,
+                assets,
+            )
+        return initial_workspace, dates, assets
 
     def _compute_root_mask(self, start_date, end_date, extra_rows):
         """
@@ -324,11 +976,14 @@ class SimplePipelineEngine(object):
         that input.
         """
         offsets = graph.offset
+        # If ``term`` has been fused with some of its inputs, we read the
+        # inputs of the fused expression instead.
+        inputs = graph.fused.get(term, term).inputs
         out = []
         if term.windowed:
             # If term is windowed, then all input data should be instances of
             # AdjustedArray.
-            for input_ in term.inputs:
+            for input_ in inputs:
                 adjusted_array = ensure_adjusted_array(
                     workspace[input_], input_.missing_value,
                 )
@@ -341,7 +996,7 @@ class SimplePipelineEngine(object):
         else:
             # If term is not windowed, input_data may be an AdjustedArray or
             # np.ndarray.  Coerce the former to the latter.
-            for input_ in term.inputs:
+            for input_ in inputs:
                 input_data = ensure_ndarray(workspace[input_])
                 offset = offsets[term, input_]
                 # OPTIMIZATION: Don't make a copy by doing input_data[0:] if
@@ -377,8 +1032,31 @@ class SimplePipelineEngine(object):
         results : dict
             Dictionary mapping requested results to outputs.
         """
+        return self._graph_outputs(
+            graph,
+            self._compute_workspace(graph, dates, assets, initial_workspace),
+        )
+
+    def _compute_workspace(self,
+                           graph,
+                           dates,
+                           assets,
+                           initial_workspace,
+                           keep=()):
+        """
+        Compute the terms of ``graph``, as in :meth:`compute_chunk`.
+
+        Returns
+        -------
+        workspace : dict
+            Map from term to its value, including the extra rows needed
+            before the start date.  This holds the outputs of ``graph`` and
+            the terms in ``keep``.  Every other term is released as soon as
+            nothing depends on it.
+        """
         self._validate_compute_chunk_params(dates, assets, initial_workspace)
         get_loader = self.get_loader
+        term_cache = self._term_cache
 
         # Copy the supplied initial workspace so we don't mutate it in place.
         workspace = initial_workspace.copy()
@@ -389,6 +1067,11 @@ class SimplePipelineEngine(object):
         loader_groups = groupby(loader_group_key, graph.loadable_terms)
 
         refcounts = graph.initial_refcounts(workspace)
+        for term in keep:
+            # Terms that don't need to be computed, for example because
+            # everything that depends on them was supplied, aren't kept.
+            if refcounts[term] > 0:
+                refcounts[term] += 1
 
         for term in graph.execution_order(refcounts):
             # `term` may have been supplied in `initial_workspace`, and in the
@@ -418,7 +1101,7 @@ class SimplePipelineEngine(object):
                 )
                 workspace.update(loaded)
             else:
-                workspace[term] = term._compute(
+                workspace[term] = graph.fused.get(term, term)._compute(
                     self._inputs_for_term(term, workspace, graph),
                     mask_dates,
                     assets,
@@ -429,11 +1112,21 @@ class SimplePipelineEngine(object):
                 else:
                     assert workspace[term].shape == (mask.shape[0], 1)
 
+                if term_cache is not None:
+                    term_cache.store(term, mask_dates, assets, workspace[term])
+
                 # Decref dependencies of ``term``, and clear any terms whose
                 # refcounts hit 0.
                 for garbage_term in graph.decref_dependencies(term, refcounts):
                     del workspace[garbage_term]
 
+        return workspace
+
+    @staticmethod
+    def _graph_outputs(graph, workspace):
+        """
+        Get the outputs of ``graph`` from a computed workspace.
+        """
         out = {}
         graph_extra_rows = graph.extra_rows
         for name, term in iteritems(graph.outputs):
@@ -441,6 +1134,244 @@ class SimplePipelineEngine(object):
             out[name] = workspace[term][graph_extra_rows[term]:]
         return out
 
+    def compute_rows(self, graph, dates, assets, initial_workspace):
+        """
+        Compute the Pipeline terms in the graph one row at a time.
+
+        This takes the same parameters as :meth:`compute_chunk`, but rather
+        than computing each term for every date before moving on to the next
+        term, we compute every term for a single date before moving on to the
+        next date.  Windowed terms hold on to the same window iterators from
+        one date to the next, so each step only needs to slide those windows
+        forward by a row.  Computed terms only keep as many trailing rows as
+        the terms that depend on them read, so memory use doesn't grow with
+        the number of dates.
+
+        Yields
+        ------
+        results : dict
+            For each date in ``dates`` after the extra rows required by the
+            root mask, a dictionary mapping requested results to single-row
+            outputs for that date.
+
+        See Also
+        --------
+        SimplePipelineEngine.compute_chunk
+        """
+        self._validate_compute_chunk_params(dates, assets, initial_workspace)
+        get_loader = self.get_loader
+        root_mask_term = self._root_mask_term
+
+        workspace = initial_workspace.copy()
+        refcounts = graph.initial_refcounts(workspace)
+        execution_order = list(graph.execution_order(refcounts))
+        extra_rows = graph.extra_rows
+        offsets = graph.offset
+        root_extra_rows = extra_rows[root_mask_term]
+
+        # Load all of our raw data before computing anything.  Loaders are
+        # designed to read contiguous blocks of dates, so there's nothing to
+        # be gained by loading a row at a time.
+        loader_group_key = juxt(get_loader, getitem(graph.extra_rows))
+        loader_groups = groupby(loader_group_key, graph.loadable_terms)
+        for term in execution_order:
+            if term in workspace or not isinstance(term, LoadableTerm):
+                continue
+            mask, mask_dates = graph.mask_and_dates_for_term(
+                term,
+                root_mask_term,
+                workspace,
+                dates,
+            )
+            to_load = sorted(
+                loader_groups[loader_group_key(term)],
+                key=lambda t: t.dataset
+            )
+            workspace.update(
+                get_loader(term).load_adjusted_array(
+                    to_load, mask_dates, assets, mask,
+                )
+            )
+
+        to_compute = [t for t in execution_order if t not in workspace]
+        fused = graph.fused
+
+        # Computed terms only keep the trailing rows that their dependents
+        # still read, rather than a row for every date.  ``bases`` holds the
+        # row of each computed term at the start of its buffer.
+        depths = self._row_depths(graph, to_compute)
+        bases = {}
+
+        # The first row of ``dates`` for which we compute each term.
+        first_rows = {
+            term: root_extra_rows - extra_rows[term]
+            for term in execution_order
+        }
+        mask_offsets = {
+            term: extra_rows[term.mask] - extra_rows[term]
+            for term in to_compute
+        }
+        windows = {
+            term: [
+                self._incremental_window(
+                    workspace,
+                    bases,
+                    input_,
+                    term.window_length,
+                    offsets[term, input_],
+                )
+                for input_ in term.inputs
+            ]
+            for term in to_compute if term.windowed
+        }
+        # Downsampled terms only call their wrapped term on sample dates and
+        # forward-fill the results in between.
+        sample_rows = {
+            term: frozenset(select_sampling_indices(
+                dates[first_rows[term]:],
+                term._frequency,
+            ))
+            for term in to_compute if isinstance(term, DownsampledMixin)
+        }
+
+        for date_idx in range(len(dates)):
+            for term in to_compute:
+                row = date_idx - first_rows[term]
+                if row < 0:
+                    continue
+
+                if term.windowed:
+                    inputs = windows[term]
+                else:
+                    inputs = []
+                    for input_ in fused.get(term, term).inputs:
+                        input_row = (
+                            offsets[term, input_] + row - bases.get(input_, 0)
+                        )
+                        inputs.append(
+                            ensure_ndarray(workspace[input_])[
+                                input_row:input_row + 1
+                            ]
+                        )
+
+                if term in sample_rows and row not in sample_rows[term]:
+                    for window in inputs if term.windowed else ():
+                        next(window)
+                    buf = workspace[term]
+                    idx = self._buffer_row(buf, bases, depths[term], term, row)
+                    buf[idx] = buf[idx - 1]
+                    continue
+
+                mask_row = mask_offsets[term] + row - bases.get(term.mask, 0)
+                result = fused.get(term, term)._compute(
+                    inputs,
+                    dates[date_idx:date_idx + 1],
+                    assets,
+                    workspace[term.mask][mask_row:mask_row + 1],
+                )
+                if term.ndim == 2:
+                    assert result.shape == (1, len(assets))
+                else:
+                    assert result.shape == (1, 1)
+
+                if row == 0:
+                    workspace[term] = self._allocate_rows(
+                        result,
+                        min(len(dates) - first_rows[term], 2 * depths[term]),
+                    )
+                    bases[term] = 0
+                buf = workspace[term]
+                buf[self._buffer_row(buf, bases, depths[term], term, row)] = (
+                    result[0]
+                )
+
+            if date_idx >= root_extra_rows:
+                out = {}
+                for name, term in iteritems(graph.outputs):
+                    row = date_idx - first_rows[term] - bases.get(term, 0)
+                    # Copy the row, since the buffer it lives in is reused.
+                    out[name] = workspace[term][row:row + 1].copy()
+                yield out
+
+    @staticmethod
+    def _row_depths(graph, to_compute):
+        """
+        Find how many trailing rows of each term in ``to_compute`` have to be
+        kept while computing rows of ``graph``.
+
+        A dependent reading the rows of a term from ``offset`` on needs every
+        row of the term since the dependent's first extra row.  Downsampled
+        terms also need their own previous row to forward-fill it.
+        """
+        extra_rows = graph.extra_rows
+        offsets = graph.offset
+        fused = graph.fused
+        depths = {
+            term: 2 if isinstance(term, DownsampledMixin) else 1
+            for term in to_compute
+        }
+        for term in to_compute:
+            for input_ in fused.get(term, term).inputs:
+                if input_ in depths:
+                    depths[input_] = max(
+                        depths[input_],
+                        extra_rows[input_] - extra_rows[term]
+                        - offsets[term, input_] + 1,
+                    )
+        return depths
+
+    @staticmethod
+    def _buffer_row(buf, bases, depth, term, row):
+        """
+        Get the index in ``buf`` at which to write ``row`` of ``term``.
+
+        When ``buf`` is full, its last ``depth - 1`` rows are moved to the
+        front to make room, so the rows of ``term`` can be computed into a
+        buffer of bounded size.
+        """
+        idx = row - bases[term]
+        if idx == len(buf):
+            keep = depth - 1
+            buf[:keep] = buf[idx - keep:idx]
+            bases[term] += idx - keep
+            idx = keep
+        return idx
+
+    @staticmethod
+    def _incremental_window(workspace, bases, term, window_length, offset):
+        """
+        Get an iterator of trailing windows over the values of ``term``.
+
+        If ``term`` has already been loaded or computed, this is just a
+        traversal of its AdjustedArray.  Otherwise, the values of ``term``
+        are still being computed, so we yield views of its output buffer,
+        which is only read when the next window is requested.
+        """
+        try:
+            data = workspace[term]
+        except KeyError:
+            return _trailing_windows(
+                workspace,
+                bases,
+                term,
+                window_length,
+                offset,
+            )
+        return ensure_adjusted_array(data, term.missing_value).traverse(
+            window_length=window_length,
+            offset=offset,
+        )
+
+    @staticmethod
+    def _allocate_rows(first_row, nrows):
+        """
+        Allocate a buffer with ``nrows`` rows for values like ``first_row``.
+        """
+        shape = (nrows,) + first_row.shape[1:]
+        if isinstance(first_row, LabelArray):
+            return first_row.empty_like(shape)
+        return empty(shape, dtype=first_row.dtype).view(type(first_row))
+
     def _to_narrow(self, terms, data, mask, dates, assets):
         """
         Convert raw computed pipeline results into a DataFrame for public APIs.
@@ -472,40 +1403,50 @@ class SimplePipelineEngine(object):
         If mask[date, asset] is True, then result.loc[(date, asset), colname]
         will contain the value of data[colname][date, asset].
         """
-        if not mask.any():
-            # Manually handle the empty DataFrame case. This is a workaround
-            # to pandas failing to tz_localize an empty dataframe with a
-            # MultiIndex. It also saves us the work of applying a known-empty
-            # mask to each array.
-            #
-            # Slicing `dates` here to preserve pandas metadata.
-            empty_dates = dates[:0]
-            empty_assets = array([], dtype=object)
-            return DataFrame(
-                data={
-                    name: array([], dtype=arr.dtype)
-                    for name, arr in iteritems(data)
-                },
-                index=MultiIndex.from_arrays([empty_dates, empty_assets]),
-            )
+        return self._to_raw(terms, data, mask, dates, assets).to_frame()
+
+    def _to_raw(self, terms, data, mask, dates, assets):
+        """
+        Convert raw computed pipeline results into a RawPipelineResult.
 
-        resolved_assets = array(self._finder.retrieve_all(assets))
-        dates_kept = repeat_last_axis(dates.values, len(assets))[mask]
-        assets_kept = repeat_first_axis(resolved_assets, len(dates))[mask]
+        This takes the same parameters as :meth:`_to_narrow`.
 
-        final_columns = {}
-        for name in data:
+        Returns
+        -------
+        results : RawPipelineResult
+            Flat arrays of the values in ``data`` for which ``mask`` is True.
+        """
+        # ``nonzero`` returns indices in the same (row-major) order that
+        # boolean indexing visits the entries of ``mask``.
+        date_codes, sid_codes = mask.nonzero()
+        date_level, date_codes = _compress_labels(dates, date_codes)
+        sid_level, sid_codes = _compress_labels(assets, sid_codes)
+
+        if len(date_codes):
             # Each term that computed an output has its postprocess method
             # called on the filtered result.
             #
             # As of Mon May 2 15:38:47 2016, we only use this to convert
             # LabelArrays into categoricals.
-            final_columns[name] = terms[name].postprocess(data[name][mask])
-
-        return DataFrame(
-            data=final_columns,
-            index=MultiIndex.from_arrays([dates_kept, assets_kept]),
-        ).tz_localize('UTC', level=0)
+            columns = {
+                name: terms[name].postprocess(data[name][mask])
+                for name in data
+            }
+        else:
+            # Saves us the work of applying a known-empty mask to each array.
+            columns = {
+                name: array([], dtype=arr.dtype)
+                for name, arr in iteritems(data)
+            }
+
+        return RawPipelineResult(
+            columns,
+            date_level,
+            date_codes,
+            sid_level,
+            sid_codes,
+            self._finder,
+        )
 
     def _validate_compute_chunk_params(self, dates, assets, initial_workspace):
         """
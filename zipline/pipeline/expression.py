@@ -179,6 +179,7 @@ class NumericalExpression(ComputableTerm):
     dtype : np.dtype
         The dtype for the expression.
     """
+    asset_independent = True
     window_length = 0
 
     def __new__(cls, expr, binds, dtype):
@@ -1,7 +1,7 @@
 """
 factor.py
 """
-from functools import wraps
+from functools import partial, wraps
 from operator import attrgetter
 from numbers import Number
 from math import ceil
@@ -10,8 +10,16 @@ from numpy import empty_like, inf, nan, where
 from scipy.stats import rankdata
 
 from zipline.errors import BadPercentileBounds, UnknownRankMethod
-from zipline.lib.normalize import naive_grouped_rowwise_apply
-from zipline.lib.rank import masked_rankdata_2d, rankdata_1d_descending
+from zipline.lib.normalize import (
+    grouped_rowwise_apply,
+    grouped_rowwise_demean,
+    grouped_rowwise_zscore,
+)
+from zipline.lib.rank import (
+    grouped_rankdata_2d,
+    masked_rankdata_2d,
+    rankdata_1d_descending,
+)
 from zipline.pipeline.api_utils import restrict_to_dtype
 from zipline.pipeline.classifiers import Classifier, Everything, Quantiles
 from zipline.pipeline.expression import (
@@ -28,6 +36,7 @@ from zipline.pipeline.expression import (
 from zipline.pipeline.filters import (
     Filter,
     NumExprFilter,
+    PartialSortFilter,
     PercentileFilter,
     NotNullFilter,
     NullFilter,
@@ -1053,6 +1062,8 @@ class Factor(RestrictedDTypeMixin, ComputableTerm):
         -------
         filter : zipline.pipeline.filters.Filter
         """
+        if groupby is NotSpecified and self.dtype == float64_dtype:
+            return PartialSortFilter(self, N, ascending=False, mask=mask)
         return self.rank(ascending=False, mask=mask, groupby=groupby) <= N
 
     def bottom(self, N, mask=NotSpecified, groupby=NotSpecified):
@@ -1077,6 +1088,8 @@ class Factor(RestrictedDTypeMixin, ComputableTerm):
         -------
         filter : zipline.pipeline.Filter
         """
+        if groupby is NotSpecified and self.dtype == float64_dtype:
+            return PartialSortFilter(self, N, ascending=True, mask=mask)
         return self.rank(ascending=True, mask=mask, groupby=groupby) <= N
 
     def percentile_between(self,
@@ -1302,17 +1315,20 @@ class GroupedRowTransform(Factor):
 
         # Make a copy with the null code written to masked locations.
         group_labels = where(mask, group_labels, null_label)
-        return where(
-            group_labels != null_label,
-            naive_grouped_rowwise_apply(
+        out = empty_like(data, dtype=self.dtype)
+
+        vectorized = _VECTORIZED_GROUPED_TRANSFORMS.get(self._transform)
+        if vectorized is not None and data.dtype == float64_dtype:
+            vectorized(data, group_labels, *self._transform_args, out=out)
+        else:
+            grouped_rowwise_apply(
                 data=data,
                 group_labels=group_labels,
                 func=self._transform,
                 func_args=self._transform_args,
-                out=empty_like(data, dtype=self.dtype),
-            ),
-            self.missing_value,
-        )
+                out=out,
+            )
+        return where(group_labels != null_label, out, self.missing_value)
 
     @property
     def transform_name(self):
@@ -1582,6 +1598,8 @@ class RecarrayField(SingleInputMixin, Factor):
     """
     A single field from a multi-output factor.
     """
+    asset_independent = True
+
     def __new__(cls, factor, attribute):
         return super(RecarrayField, cls).__new__(
             cls,
@@ -1615,6 +1633,7 @@ class Latest(LatestMixin, CustomFactor):
     The `.latest` attribute of DataSet columns returns an instance of this
     Factor.
     """
+    asset_independent = True
     window_length = 1
 
     def compute(self, today, assets, out, data):
@@ -1631,6 +1650,17 @@ def zscore(row):
     return (row - nanmean(row)) / nanstd(row)
 
 
+# Implementations of row-wise transforms that process every group of every row
+# at once.  GroupedRowTransform uses these for float64 data in place of calling
+# the row-wise function on each group.
+_VECTORIZED_GROUPED_TRANSFORMS = {
+    demean: grouped_rowwise_demean,
+    zscore: grouped_rowwise_zscore,
+    rankdata: partial(grouped_rankdata_2d, ascending=True),
+    rankdata_1d_descending: partial(grouped_rankdata_2d, ascending=False),
+}
+
+
 def winsorize(row, min_percentile, max_percentile):
     """
     This implementation is based on scipy.stats.mstats.winsorize
@@ -1,10 +1,18 @@
 
-from numpy import broadcast_arrays
-from scipy.stats import (
-    linregress,
-    pearsonr,
-    spearmanr,
+from numpy import (
+    arange,
+    clip,
+    empty,
+    errstate,
+    float64,
+    isnan,
+    nan,
+    maximum,
+    minimum,
+    sqrt,
+    where,
 )
+from scipy.stats import t as t_dist
 
 from zipline.errors import IncompatibleTerms
 from zipline.pipeline.factors import CustomFactor
@@ -20,6 +28,150 @@ from .technical import Returns
 
 ALLOWED_DTYPES = (float64_dtype, int64_dtype)
 
+# Constant used by scipy.stats.linregress to avoid dividing by zero when
+# computing t-statistics for perfectly-correlated samples.
+TINY = 1.0e-20
+
+
+def _demean(data):
+    return data - data.mean(axis=0, keepdims=True)
+
+
+def vectorized_pearson_r(a, b):
+    """
+    Compute Pearson's r between each column of ``a`` and the corresponding
+    column of ``b``.
+
+    This is equivalent to calling :func:`scipy.stats.pearsonr` on each pair of
+    columns, but computes all of the coefficients at once.
+
+    Parameters
+    ----------
+    a : np.ndarray[ndim=2]
+        Array of samples, with one set of observations per column.
+    b : np.ndarray[ndim=2]
+        Array of samples.  ``b`` must either have the same shape as ``a`` or
+        have a single column, in which case it is compared against every
+        column of ``a``.
+
+    Returns
+    -------
+    r : np.ndarray[float64, ndim=1]
+        Correlation coefficient for each column.  Columns containing NaNs,
+        or with no variance, produce NaN.
+    """
+    a_demeaned = _demean(a.astype(float64))
+    b_demeaned = _demean(b.astype(float64))
+    with errstate(invalid='ignore', divide='ignore'):
+        r = (a_demeaned * b_demeaned).sum(axis=0) / sqrt(
+            (a_demeaned ** 2).sum(axis=0) * (b_demeaned ** 2).sum(axis=0)
+        )
+    return clip(r, -1.0, 1.0)
+
+
+def _average_ranks(data):
+    """
+    Rank each column of ``data``, assigning tied values the average of the
+    ranks they span.
+
+    This is equivalent to applying ``scipy.stats.rankdata`` to each column.
+    NaNs are sorted to the end of their column.
+    """
+    nrows, ncols = data.shape
+    columns = arange(ncols)
+    order = data.argsort(axis=0, kind='mergesort')
+    sorted_data = data[order, columns]
+
+    # For each position in sorted order, find the first and last positions
+    # holding the same value.
+    positions = arange(nrows).reshape(nrows, 1).repeat(ncols, axis=1)
+    starts = empty(data.shape, dtype=bool)
+    starts[0] = True
+    starts[1:] = sorted_data[1:] != sorted_data[:-1]
+    ends = empty(data.shape, dtype=bool)
+    ends[-1] = True
+    ends[:-1] = starts[1:]
+    first = maximum.accumulate(where(starts, positions, 0), axis=0)
+    last = minimum.accumulate(
+        where(ends, positions, nrows)[::-1],
+        axis=0,
+    )[::-1]
+
+    ranks = empty(data.shape, dtype=float64)
+    ranks[order, columns] = (first + last) / 2.0 + 1
+    return ranks
+
+
+def vectorized_spearman_r(a, b):
+    """
+    Compute Spearman's rank correlation coefficient between each column of
+    ``a`` and the corresponding column of ``b``.
+
+    This is equivalent to calling :func:`scipy.stats.spearmanr` on each pair
+    of columns, but computes all of the coefficients at once.  Parameters are
+    the same as for :func:`vectorized_pearson_r`.
+
+    Returns
+    -------
+    r : np.ndarray[float64, ndim=1]
+        Rank correlation coefficient for each column.  Columns containing
+        NaNs produce NaN.
+    """
+    a = a.astype(float64)
+    b = b.astype(float64)
+    r = vectorized_pearson_r(_average_ranks(a), _average_ranks(b))
+    r[isnan(a).any(axis=0) | isnan(b).any(axis=0)] = nan
+    return r
+
+
+def vectorized_linear_regression(y, x):
+    """
+    Compute an ordinary least-squares regression of each column of ``y`` on
+    the corresponding column of ``x``.
+
+    This is equivalent to calling :func:`scipy.stats.linregress` on each pair
+    of columns, but computes all of the regressions at once.
+
+    Parameters
+    ----------
+    y : np.ndarray[ndim=2]
+        Dependent variable, with one set of observations per column.
+    x : np.ndarray[ndim=2]
+        Independent variable.  ``x`` must either have the same shape as ``y``
+        or have a single column, in which case every column of ``y`` is
+        regressed against it.
+
+    Returns
+    -------
+    (alpha, beta, r_value, p_value, stderr) : tuple[np.ndarray[float64]]
+        Intercept, slope, correlation coefficient, two-sided p-value for a
+        hypothesis test whose null hypothesis is that the slope is zero, and
+        standard error of the slope estimate for each column.
+    """
+    nobs = len(y)
+    y = y.astype(float64)
+    x = x.astype(float64)
+    x_mean = x.mean(axis=0)
+    y_mean = y.mean(axis=0)
+    x_demeaned = x - x_mean
+    y_demeaned = y - y_mean
+
+    ssxm = (x_demeaned ** 2).mean(axis=0)
+    ssym = (y_demeaned ** 2).mean(axis=0)
+    ssxym = (x_demeaned * y_demeaned).mean(axis=0)
+
+    df = nobs - 2
+    with errstate(invalid='ignore', divide='ignore'):
+        r_den = sqrt(ssxm * ssym)
+        r = clip(where(r_den == 0.0, 0.0, ssxym / r_den), -1.0, 1.0)
+        t = r * sqrt(df / ((1.0 - r + TINY) * (1.0 + r + TINY)))
+        p_value = 2 * t_dist.sf(abs(t), df)
+        beta = ssxym / ssxm
+        alpha = y_mean - beta * x_mean
+        stderr = sqrt((1 - r ** 2) * ssym / ssxm / df)
+
+    return alpha, beta, r, p_value, stderr
+
 
 class _RollingCorrelation(CustomFactor, SingleInputMixin):
 
@@ -78,13 +230,9 @@ class RollingPearson(_RollingCorrelation):
     window_safe = True
 
     def compute(self, today, assets, out, base_data, target_data):
-        # If `target_data` is a Slice or single column of data, broadcast it
-        # out to the same shape as `base_data`, then compute column-wise. This
-        # is efficient because each column of the broadcasted array only refers
-        # to a single memory location.
-        target_data = broadcast_arrays(target_data, base_data)[0]
-        for i in range(len(out)):
-            out[i] = pearsonr(base_data[:, i], target_data[:, i])[0]
+        # If `target_data` is a Slice or single column of data, it's
+        # broadcast against every column of `base_data`.
+        out[:] = vectorized_pearson_r(base_data, target_data)
 
 
 class RollingSpearman(_RollingCorrelation):
@@ -124,13 +272,9 @@ class RollingSpearman(_RollingCorrelation):
     window_safe = True
 
     def compute(self, today, assets, out, base_data, target_data):
-        # If `target_data` is a Slice or single column of data, broadcast it
-        # out to the same shape as `base_data`, then compute column-wise. This
-        # is efficient because each column of the broadcasted array only refers
-        # to a single memory location.
-        target_data = broadcast_arrays(target_data, base_data)[0]
-        for i in range(len(out)):
-            out[i] = spearmanr(base_data[:, i], target_data[:, i])[0]
+        # If `target_data` is a Slice or single column of data, it's
+        # broadcast against every column of `base_data`.
+        out[:] = vectorized_spearman_r(base_data, target_data)
 
 
 class RollingLinearRegression(CustomFactor, SingleInputMixin):
@@ -190,29 +334,17 @@ class RollingLinearRegression(CustomFactor, SingleInputMixin):
         )
 
     def compute(self, today, assets, out, dependent, independent):
-        alpha = out.alpha
-        beta = out.beta
-        r_value = out.r_value
-        p_value = out.p_value
-        stderr = out.stderr
-
-        def regress(y, x):
-            regr_results = linregress(y=y, x=x)
-            # `linregress` returns its results in the following order:
-            # slope, intercept, r-value, p-value, stderr
-            alpha[i] = regr_results[1]
-            beta[i] = regr_results[0]
-            r_value[i] = regr_results[2]
-            p_value[i] = regr_results[3]
-            stderr[i] = regr_results[4]
-
-        # If `independent` is a Slice or single column of data, broadcast it
-        # out to the same shape as `dependent`, then compute column-wise. This
-        # is efficient because each column of the broadcasted array only refers
-        # to a single memory location.
-        independent = broadcast_arrays(independent, dependent)[0]
-        for i in range(len(out)):
-            regress(y=dependent[:, i], x=independent[:, i])
+        # If `independent` is a Slice or single column of data, every column
+        # of `dependent` is regressed against it.
+        alpha, beta, r_value, p_value, stderr = vectorized_linear_regression(
+            y=dependent,
+            x=independent,
+        )
+        out.alpha[:] = alpha
+        out.beta[:] = beta
+        out.r_value[:] = r_value
+        out.p_value[:] = p_value
+        out.stderr[:] = stderr
 
 
 class RollingPearsonOfReturns(RollingPearson):
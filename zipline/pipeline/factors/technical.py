@@ -10,19 +10,26 @@ from numpy import (
     arange,
     average,
     clip,
+    cumsum,
     diff,
     dstack,
+    errstate,
     exp,
     fmax,
     full,
     inf,
+    isinf,
     isnan,
     log,
+    nan,
     NINF,
     sqrt,
     sum as np_sum,
+    where,
+    zeros,
 )
 from numexpr import evaluate
+from scipy.signal import lfilter
 
 from zipline.pipeline.data import USEquityPricing
 from zipline.pipeline.mixins import SingleInputMixin
@@ -39,6 +46,7 @@ from zipline.utils.math_utils import (
 from zipline.utils.numpy_utils import (
     float64_dtype,
     ignore_nanwarnings,
+    int64_dtype,
     rolling_window,
 )
 from .factor import CustomFactor
@@ -50,6 +58,7 @@ class Returns(CustomFactor):
 
     **Default Inputs**: [USEquityPricing.close]
     """
+    asset_independent = True
     inputs = [USEquityPricing.close]
     window_safe = True
 
@@ -74,6 +83,7 @@ class RSI(CustomFactor, SingleInputMixin):
 
     **Default Window Length**: 15
     """
+    asset_independent = True
     window_length = 15
     inputs = (USEquityPricing.close,)
 
@@ -89,6 +99,64 @@ class RSI(CustomFactor, SingleInputMixin):
         )
 
 
+def _rolling_nansums(data, window_length, shift=None):
+    """
+    Compute the sum and the number of non-NaN values in every trailing window
+    of ``window_length`` rows in ``data``.
+
+    Parameters
+    ----------
+    data : np.ndarray[float64, ndim=2]
+        Input data.  Must not contain infinite values.
+    window_length : int
+        Number of rows in each window.
+    shift : np.ndarray[float64, ndim=1], optional
+        Value to subtract from each column before summing.  Centering the data
+        reduces the error introduced by differencing cumulative sums.
+
+    Returns
+    -------
+    sums, counts : np.ndarray[ndim=2]
+        Arrays of ``len(data) - window_length + 1`` rows.
+    """
+    present = ~isnan(data)
+    if shift is not None:
+        data = data - shift
+    sums = zeros((len(data) + 1, data.shape[1]))
+    cumsum(where(present, data, 0.0), axis=0, out=sums[1:])
+    counts = zeros(sums.shape, dtype=int64_dtype)
+    cumsum(present, axis=0, out=counts[1:])
+    return (
+        sums[window_length:] - sums[:-window_length],
+        counts[window_length:] - counts[:-window_length],
+    )
+
+
+def _column_shift(data):
+    """
+    Per-column mean of ``data``, or 0 for columns without any values.
+    """
+    shift = nanmean(data, axis=0)
+    shift[isnan(shift)] = 0.0
+    return shift
+
+
+def _compute_by_window(term, dates, assets, out, *arrays, **params):
+    """
+    Fallback for ``compute_range`` implementations that calls ``compute`` once
+    per row.
+    """
+    window_length = term.window_length
+    for i, date in enumerate(dates):
+        term.compute(
+            date,
+            assets,
+            out[i],
+            *(array[i:i + window_length] for array in arrays),
+            **params
+        )
+
+
 class SimpleMovingAverage(CustomFactor, SingleInputMixin):
     """
     Average Value of an arbitrary column
@@ -97,6 +165,7 @@ class SimpleMovingAverage(CustomFactor, SingleInputMixin):
 
     **Default Window Length**: None
     """
+    asset_independent = True
     # numpy's nan functions throw warnings when passed an array containing only
     # nans, but they still returns the desired value (nan), so we ignore the
     # warning.
@@ -105,6 +174,14 @@ class SimpleMovingAverage(CustomFactor, SingleInputMixin):
     def compute(self, today, assets, out, data):
         out[:] = nanmean(data, axis=0)
 
+    def compute_range(self, dates, assets, out, data):
+        if isinf(data).any():
+            return _compute_by_window(self, dates, assets, out, data)
+        shift = _column_shift(data)
+        sums, counts = _rolling_nansums(data, self.window_length, shift)
+        with errstate(invalid='ignore'):
+            out[:] = shift + sums / counts
+
 
 class WeightedAverageValue(CustomFactor):
     """
@@ -114,9 +191,22 @@ class WeightedAverageValue(CustomFactor):
 
     **Default Window Length:** None
     """
+    asset_independent = True
+
     def compute(self, today, assets, out, base, weight):
         out[:] = nansum(base * weight, axis=0) / nansum(weight, axis=0)
 
+    def compute_range(self, dates, assets, out, base, weight):
+        product = base * weight
+        if isinf(product).any() or isinf(weight).any():
+            return _compute_by_window(self, dates, assets, out, base, weight)
+        window_length = self.window_length
+        with errstate(invalid='ignore', divide='ignore'):
+            out[:] = (
+                _rolling_nansums(product, window_length)[0] /
+                _rolling_nansums(weight, window_length)[0]
+            )
+
 
 class VWAP(WeightedAverageValue):
     """
@@ -137,17 +227,18 @@ class MaxDrawdown(CustomFactor, SingleInputMixin):
 
     **Default Window Length:** None
     """
+    asset_independent = True
     ctx = ignore_nanwarnings()
 
     def compute(self, today, assets, out, data):
-        drawdowns = fmax.accumulate(data, axis=0) - data
+        peaks = fmax.accumulate(data, axis=0)
+        drawdowns = peaks - data
         drawdowns[isnan(drawdowns)] = NINF
         drawdown_ends = nanargmax(drawdowns, axis=0)
 
-        # TODO: Accelerate this loop in Cython or Numba.
-        for i, end in enumerate(drawdown_ends):
-            peak = nanmax(data[:end + 1, i])
-            out[i] = (peak - data[end, i]) / data[end, i]
+        columns = arange(data.shape[1])
+        ends = data[drawdown_ends, columns]
+        out[:] = (peaks[drawdown_ends, columns] - ends) / ends
 
 
 class AverageDollarVolume(CustomFactor):
@@ -158,11 +249,20 @@ class AverageDollarVolume(CustomFactor):
 
     **Default Window Length:** None
     """
+    asset_independent = True
     inputs = [USEquityPricing.close, USEquityPricing.volume]
 
     def compute(self, today, assets, out, close, volume):
         out[:] = nansum(close * volume, axis=0) / len(close)
 
+    def compute_range(self, dates, assets, out, close, volume):
+        dollar_volume = close * volume
+        if isinf(dollar_volume).any():
+            return _compute_by_window(self, dates, assets, out, close, volume)
+        window_length = self.window_length
+        out[:] = _rolling_nansums(dollar_volume, window_length)[0]
+        out /= window_length
+
 
 def exponential_weights(length, decay_rate):
     """
@@ -215,6 +315,7 @@ class _ExponentialWeightedFactor(SingleInputMixin, CustomFactor):
     from_halflife
     from_center_of_mass
     """
+    asset_independent = True
     params = ('decay_rate',)
 
     @classmethod
@@ -389,6 +490,32 @@ class ExponentialWeightedMovingAverage(_ExponentialWeightedFactor):
             weights=exponential_weights(len(data), decay_rate),
         )
 
+    def compute_range(self, dates, assets, out, data, decay_rate):
+        if isinf(data).any():
+            return _compute_by_window(
+                self, dates, assets, out, data, decay_rate=decay_rate,
+            )
+        window_length = self.window_length
+        nans = isnan(data)
+
+        # Each output is a ratio of two windowed sums of decaying terms, which
+        # can be updated in constant time per row:
+        #
+        #     y[t] = decay_rate * y[t - 1] + x[t] - decay_rate ** L * x[t - L]
+        numerator = zeros(window_length + 1)
+        numerator[0] = 1.0
+        numerator[-1] = -decay_rate ** window_length
+        sums = lfilter(
+            numerator,
+            [1.0, -decay_rate],
+            where(nans, 0.0, data),
+            axis=0,
+        )[window_length - 1:]
+        out[:] = sums / (decay_rate ** arange(window_length)).sum()
+
+        # Like ``average``, produce NaN for any window containing a NaN.
+        out[_rolling_nansums(nans, window_length)[0] > 0] = nan
+
 
 class LinearWeightedMovingAverage(CustomFactor, SingleInputMixin):
     """
@@ -398,6 +525,7 @@ class LinearWeightedMovingAverage(CustomFactor, SingleInputMixin):
 
     **Default Window Length**: None
     """
+    asset_independent = True
     # numpy's nan functions throw warnings when passed an array containing only
     # nans, but they still returns the desired value (nan), so we ignore the
     # warning.
@@ -481,6 +609,7 @@ class BollingerBands(CustomFactor):
         The number of standard deviations to add or subtract to create the
         upper and lower bands.
     """
+    asset_independent = True
     params = ('k',)
     inputs = (USEquityPricing.close,)
     outputs = 'lower', 'middle', 'upper'
@@ -505,7 +634,7 @@ class Aroon(CustomFactor):
         Length of the lookback window over which to compute the Aroon
         indicator.
     """
-
+    asset_independent = True
     inputs = (USEquityPricing.low, USEquityPricing.high)
     outputs = ('down', 'up')
 
@@ -550,6 +679,7 @@ class FastStochasticOscillator(CustomFactor):
     -------
     out: %K oscillator
     """
+    asset_independent = True
     inputs = (USEquityPricing.close, USEquityPricing.low, USEquityPricing.high)
     window_safe = True
     window_length = 14
@@ -592,7 +722,7 @@ class IchimokuKinkoHyo(CustomFactor):
     chikou_span_length : int >= 0, <= window_length
         The lag for the chikou span.
     """
-
+    asset_independent = True
     params = {
         'tenkan_sen_length': 9,
         'kijun_sen_length': 26,
@@ -652,6 +782,8 @@ class RateOfChangePercentage(CustomFactor):
     price - the current price
     prevPrice - the price n days ago, equals window length
     """
+    asset_independent = True
+
     def compute(self, today, assets, out, close):
         today_close = close[-1]
         prev_close = close[0]
@@ -677,6 +809,7 @@ class TrueRange(CustomFactor):
                         :data:`zipline.pipeline.data.USEquityPricing.close`
     **Default Window Length:** 2
     """
+    asset_independent = True
     inputs = (
         USEquityPricing.high,
         USEquityPricing.low,
@@ -725,6 +858,7 @@ class MovingAverageConvergenceDivergenceSignal(CustomFactor):
     ``window_length`` parameter. ``window_length`` is inferred from
     ``slow_period`` and ``signal_period``.
     """
+    asset_independent = True
     inputs = (USEquityPricing.close,)
     # We don't use the default form of `params` here because we want to
     # dynamically calculate `window_length` from the period lengths in our
@@ -798,6 +932,7 @@ class AnnualizedVolatility(CustomFactor):
         The number of time units per year. Defaults is 252, the number of NYSE
         trading days in a normal year.
     """
+    asset_independent = True
     inputs = [Returns(window_length=2)]
     params = {'annualization_factor': 252.0}
     window_length = 252
@@ -805,6 +940,35 @@ class AnnualizedVolatility(CustomFactor):
     def compute(self, today, assets, out, returns, annualization_factor):
         out[:] = nanstd(returns, axis=0) * (annualization_factor ** .5)
 
+    def compute_range(self,
+                      dates,
+                      assets,
+                      out,
+                      returns,
+                      annualization_factor):
+        if isinf(returns).any():
+            return _compute_by_window(
+                self,
+                dates,
+                assets,
+                out,
+                returns,
+                annualization_factor=annualization_factor,
+            )
+        window_length = self.window_length
+        shift = _column_shift(returns)
+        sums, counts = _rolling_nansums(returns, window_length, shift)
+        squares, _ = _rolling_nansums(
+            (returns - shift) ** 2, window_length,
+        )
+        with errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+            variances = clip(squares / counts - means ** 2, 0.0, inf)
+        # Don't let rounding error produce a nonzero deviation for windows
+        # containing a single observation.
+        variances[counts == 1] = 0.0
+        out[:] = sqrt(variances) * (annualization_factor ** .5)
+
 # Convenience aliases.
 EWMA = ExponentialWeightedMovingAverage
 EWMSTD = ExponentialWeightedMovingStdDev
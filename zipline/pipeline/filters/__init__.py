@@ -6,6 +6,7 @@ from .filter import (
     NotNullFilter,
     NullFilter,
     NumExprFilter,
+    PartialSortFilter,
     PercentileFilter,
     SingleAsset,
     StaticAssets,
@@ -24,6 +25,7 @@ __all__ = [
     'NotNullFilter',
     'NullFilter',
     'NumExprFilter',
+    'PartialSortFilter',
     'PercentileFilter',
     'SingleAsset',
     'StaticAssets',
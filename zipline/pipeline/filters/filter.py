@@ -6,8 +6,13 @@ from operator import attrgetter
 
 from numpy import (
     float64,
+    inf,
+    isnan,
     nan,
     nanpercentile,
+    partition,
+    where,
+    zeros,
 )
 
 from zipline.errors import (
@@ -250,6 +255,7 @@ class NullFilter(SingleInputMixin, Filter):
     factor : zipline.pipeline.Term
         The factor to compare against its missing_value.
     """
+    asset_independent = True
     window_length = 0
 
     def __new__(cls, term):
@@ -274,6 +280,7 @@ class NotNullFilter(SingleInputMixin, Filter):
     factor : zipline.pipeline.Term
         The factor to compare against its missing_value.
     """
+    asset_independent = True
     window_length = 0
 
     def __new__(cls, term):
@@ -367,6 +374,82 @@ class PercentileFilter(SingleInputMixin, Filter):
         return (lower_bounds <= data) & (data <= upper_bounds)
 
 
+class PartialSortFilter(SingleInputMixin, Filter):
+    """
+    A Filter matching the N lowest or highest values of a Factor on each day.
+
+    This is equivalent to ``factor.rank(ascending=ascending, mask=mask) <= N``,
+    but only partially sorts each row with :func:`numpy.partition`, rather
+    than ranking every asset.  As with ``method='ordinal'``, ties are broken
+    in favor of the asset appearing first in the row.
+
+    Parameters
+    ----------
+    factor : zipline.pipeline.factor.Factor
+        The float64 factor whose values should be selected.
+    N : int
+        Number of assets passing the filter each day.
+    ascending : bool
+        If True, select the N lowest values; otherwise select the N highest.
+    """
+    window_length = 0
+
+    def __new__(cls, factor, N, ascending, mask):
+        return super(PartialSortFilter, cls).__new__(
+            cls,
+            inputs=(factor,),
+            mask=mask,
+            N=N,
+            ascending=ascending,
+        )
+
+    def _init(self, N, ascending, *args, **kwargs):
+        self._N = N
+        self._ascending = ascending
+        return super(PartialSortFilter, self)._init(*args, **kwargs)
+
+    @classmethod
+    def _static_identity(cls, N, ascending, *args, **kwargs):
+        return (
+            super(PartialSortFilter, cls)._static_identity(*args, **kwargs),
+            N,
+            ascending,
+        )
+
+    def _compute(self, arrays, dates, assets, mask):
+        N = self._N
+        data = arrays[0]
+        if N <= 0 or not data.shape[1]:
+            return zeros(data.shape, dtype=bool_dtype)
+
+        values = data if self._ascending else -data
+        eligible = mask & ~is_missing(data, self.inputs[0].missing_value)
+        nans = eligible & isnan(data)
+        numbers = eligible & ~nans
+
+        # Find the Nth lowest eligible value in each row...
+        kth = min(N, data.shape[1]) - 1
+        threshold = partition(
+            where(numbers, values, inf),
+            kth,
+            axis=1,
+        )[:, kth:kth + 1]
+
+        # ...select everything strictly below it, then fill the remaining
+        # slots with values equal to it, taking the leftmost ones first.
+        below = numbers & (values < threshold)
+        ties = numbers & (values == threshold)
+        remaining = N - below.sum(axis=1, keepdims=True)
+        out = below | (ties & (ties.cumsum(axis=1) <= remaining))
+
+        # Ranking sorts NaNs after every other value, in column order along
+        # with the entries excluded by the mask, so a NaN only passes if
+        # there are fewer than N other eligible values.
+        remaining = N - numbers.sum(axis=1, keepdims=True)
+        out |= nans & ((~numbers).cumsum(axis=1) <= remaining)
+        return out
+
+
 class CustomFilter(PositiveWindowLengthMixin, CustomTermMixin, Filter):
     """
     Base class for user-defined Filters.
@@ -432,6 +515,7 @@ class ArrayPredicate(SingleInputMixin, Filter):
     opargs : tuple[hashable]
         Additional argument to apply to ``op``.
     """
+    asset_independent = True
     window_length = 0
 
     @expect_types(term=Term, opargs=tuple)
@@ -467,7 +551,7 @@ class Latest(LatestMixin, CustomFilter):
     """
     Filter producing the most recently-known value of `inputs[0]` on each day.
     """
-    pass
+    asset_independent = True
 
 
 class SingleAsset(Filter):
@@ -515,6 +599,7 @@ class StaticSids(Filter):
     sids : iterable[int]
         An iterable of sids for which to filter.
     """
+    asset_independent = True
     inputs = ()
     window_length = 0
     params = ('sids',)
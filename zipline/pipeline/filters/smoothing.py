@@ -16,6 +16,7 @@ class All(CustomFilter):
 
     **Default Window Length:** None
     """
+    asset_independent = True
 
     def compute(self, today, assets, out, arg):
         out[:] = (arg.sum(axis=0) == self.window_length)
@@ -30,6 +31,7 @@ class Any(CustomFilter):
 
     **Default Window Length:** None
     """
+    asset_independent = True
 
     def compute(self, today, assets, out, arg):
         out[:] = (arg.sum(axis=0) > 0)
@@ -44,7 +46,7 @@ class AtLeastN(CustomFilter):
 
     **Default Window Length:** None
     """
-
+    asset_independent = True
     params = ('N',)
 
     def compute(self, today, assets, out, arg, N):
@@ -1,17 +1,34 @@
 """
 Dependency-Graph representation of Pipeline API terms.
 """
+import re
+
 from networkx import (
     DiGraph,
     topological_sort,
 )
+from numpy import isnan
 from six import iteritems, itervalues
 from zipline.utils.memoize import lazyval
+from zipline.utils.numpy_utils import bool_dtype, float64_dtype, int64_dtype
 from zipline.pipeline.visualize import display_graph
 
+from .expression import NumericalExpression
+from .filters import NotNullFilter, NullFilter
+from .mixins import AliasedMixin
 from .term import LoadableTerm
 
 
+_VARIABLE_RE = re.compile(r'\bx_([0-9]+)\b')
+
+# numexpr can't evaluate expressions with more operands than numpy's
+# iterators support.
+_MAX_FUSED_INPUTS = 32
+
+# Terms that can be rewritten as numexpr expressions of their inputs.
+_FUSIBLE_TYPES = (NumericalExpression, AliasedMixin, NullFilter, NotNullFilter)
+
+
 class CyclicDependency(Exception):
     pass
 
@@ -218,12 +235,20 @@ class ExecutionPlan(TermGraph):
         The first date for which output is requested for ``terms``.
     end_date : pd.Timestamp
         The last date for which output is requested for ``terms``.
+    min_extra_rows : int, optional
+        The minimum number of extra rows to compute for each output term.
+    fuse_expressions : bool, optional
+        If True, chains of elementwise terms feeding a NumericalExpression are
+        folded into a single numexpr evaluation.  See
+        :meth:`_fuse_expressions`.  Default is False.
 
     Attributes
     ----------
     outputs
     offset
     extra_rows
+    fused
+    fused_count
 
     Methods
     -------
@@ -235,7 +260,8 @@ class ExecutionPlan(TermGraph):
                  all_dates,
                  start_date,
                  end_date,
-                 min_extra_rows=0):
+                 min_extra_rows=0,
+                 fuse_expressions=False):
         super(ExecutionPlan, self).__init__(terms)
 
         for term in terms.values():
@@ -247,6 +273,15 @@ class ExecutionPlan(TermGraph):
                 min_extra_rows=min_extra_rows,
             )
 
+        #: Map from terms in the graph to the NumericalExpression that should
+        #: be computed in their place.
+        self.fused = {}
+        #: The number of terms that were folded into another term's
+        #: expression, and which will therefore never be materialized.
+        self.fused_count = 0
+        if fuse_expressions:
+            self._fuse_expressions()
+
     def set_extra_rows(self,
                        term,
                        all_dates,
@@ -349,13 +384,16 @@ class ExecutionPlan(TermGraph):
         zipline.pipeline.engine.SimplePipelineEngine._mask_and_dates_for_term
         """
         extra = self.extra_rows
+        fused = self.fused
         return {
             # Another way of thinking about this is:
             # How much bigger is the array for ``dep`` compared to ``term``?
             # How much of that difference did I ask for.
             (term, dep): (extra[dep] - extra[term]) - requested_extra_rows
             for term in self.graph
-            for dep, requested_extra_rows in term.dependencies.items()
+            for dep, requested_extra_rows in (
+                fused.get(term, term).dependencies.items()
+            )
         }
 
     @lazyval
@@ -404,6 +442,136 @@ class ExecutionPlan(TermGraph):
         attrs = self.graph.node[term]
         attrs['extra_rows'] = max(N, attrs.get('extra_rows', 0))
 
+    def _fuse_expressions(self):
+        """
+        Fold elementwise inputs of NumericalExpressions into the expressions
+        that consume them.
+
+        Operators between factors and filters are already merged into a
+        single NumericalExpression when a pipeline is built, but chains are
+        broken up by terms that aren't themselves NumericalExpressions
+        (``isnull()``, ``notnull()``, aliases), and by expressions that are
+        reused under a name.  Each link in such a chain allocates a full
+        (dates x assets) array.  This pass walks the graph from outputs to
+        inputs and inlines every input which:
+
+        - is a NumericalExpression, a null check, or an alias,
+        - is consumed only by the expression into which it's inlined,
+        - is not itself an output, and
+        - has the same mask and extra rows as its consumer.
+
+        Absorbed terms are removed from the graph and their inputs are wired
+        directly to the consumer.  The consumer stays in the graph, so
+        results and refcounts are still keyed by the original terms; the
+        expression computed in its place is stored in ``self.fused``.
+
+        Cross-sectional terms such as ranks, z-scores and percentile filters
+        can't be expressed in numexpr, so they still end a chain.
+        """
+        graph = self.graph
+        outputs = set(itervalues(self.outputs))
+
+        for term in reversed(list(topological_sort(graph))):
+            if term not in graph or not isinstance(term, NumericalExpression):
+                continue
+
+            expr, inputs = term._expr, list(term.inputs)
+            absorbed = []
+            idx = 0
+            while idx < len(inputs):
+                input_ = inputs[idx]
+                inlined = None
+                if (isinstance(input_, _FUSIBLE_TYPES) and
+                        input_ not in outputs and
+                        graph.out_degree(input_) == 1 and
+                        input_.mask is term.mask and
+                        graph.node[input_]['extra_rows'] ==
+                        graph.node[term]['extra_rows']):
+                    inlined = self._inline_expression(
+                        expr, inputs, idx, input_, term,
+                    )
+                if inlined is None:
+                    idx += 1
+                    continue
+                # Inputs of the absorbed term may themselves be fusible, so
+                # start over from the first input.
+                expr, inputs = inlined
+                absorbed.append(input_)
+                idx = 0
+
+            if not absorbed:
+                continue
+
+            for input_ in absorbed:
+                graph.remove_node(input_)
+            for input_ in inputs:
+                graph.add_edge(input_, term)
+            self.fused[term] = type(term)(
+                expr=expr,
+                binds=tuple(inputs),
+                dtype=term.dtype,
+            )
+            self.fused_count += len(absorbed)
+
+    @staticmethod
+    def _inline_expression(expr, inputs, idx, input_, consumer):
+        """
+        Substitute the computation of ``inputs[idx]`` into ``expr``.
+
+        Returns
+        -------
+        inlined : (str, list[Term]) or None
+            The rewritten expression and its inputs, or None if ``input_``
+            can't be expressed in numexpr.
+        """
+        if isinstance(input_, NumericalExpression):
+            uses = sum(
+                int(m.group(1)) == idx for m in _VARIABLE_RE.finditer(expr)
+            )
+            if uses > 1:
+                # Inlining would evaluate ``input_`` once per use.
+                return None
+            if input_.dtype == bool_dtype:
+                # NumExprFilters re-apply their mask, which is only safe to
+                # defer if the consumer is also a filter.
+                if consumer.dtype != bool_dtype:
+                    return None
+            elif input_.dtype != float64_dtype or any(
+                    t.dtype != float64_dtype for t in input_.inputs):
+                return None
+            sub_expr = input_._expr
+        elif isinstance(input_, AliasedMixin):
+            sub_expr = 'x_0'
+        else:
+            data = input_.inputs[0]
+            op = '==' if isinstance(input_, NullFilter) else '!='
+            if data.dtype == float64_dtype and isnan(data.missing_value):
+                # NaN is the only value not equal to itself.
+                sub_expr = 'x_0 %s x_0' % ('!=' if op == '==' else '==')
+            elif data.dtype == int64_dtype:
+                sub_expr = 'x_0 %s %d' % (op, data.missing_value)
+            else:
+                return None
+
+        new_inputs = [t for t in inputs if t is not input_]
+        new_inputs.extend(t for t in input_.inputs if t not in new_inputs)
+        if len(new_inputs) > _MAX_FUSED_INPUTS:
+            return None
+
+        sub_inputs = input_.inputs
+        sub_expr = _VARIABLE_RE.sub(
+            lambda m: 'x_%d' % new_inputs.index(sub_inputs[int(m.group(1))]),
+            sub_expr,
+        )
+
+        def rebind(match):
+            i = int(match.group(1))
+            if i == idx:
+                return '(%s)' % sub_expr
+            return 'x_%d' % new_inputs.index(inputs[i])
+
+        return _VARIABLE_RE.sub(rebind, expr), new_inputs
+
     def mask_and_dates_for_term(self,
                                 term,
                                 root_mask_term,
@@ -1,3 +1,4 @@
+from .cache import QueryCache
 from .core import (
     BlazeLoader,
     NoMetaDataWarning,
@@ -10,4 +11,5 @@ __all__ = (
     'from_blaze',
     'global_loader',
     'NoMetaDataWarning',
+    'QueryCache',
 )
@@ -0,0 +1,194 @@
+"""
+A local cache for the results of blaze queries.
+"""
+from itertools import count
+import os
+from tempfile import mkdtemp
+from threading import Lock
+
+import numpy as np
+from odo import odo
+import pandas as pd
+
+from zipline.pipeline.common import TS_FIELD_NAME
+from zipline.utils.paths import ensure_directory
+
+
+def _as_datetime64(dt):
+    """
+    Convert a possibly tz-aware timestamp into a naive UTC datetime64[ns].
+    """
+    dt = pd.Timestamp(dt)
+    if dt.tz is not None:
+        dt = dt.tz_convert('UTC').tz_localize(None)
+    return dt.to_datetime64()
+
+
+class QueryCache(object):
+    """
+    A read-through cache of blaze expressions, materialized as memory-mapped
+    columns on local disk.
+
+    The first time an expression is queried, all of its rows are computed
+    with ``odo`` and written to ``path``, sorted by timestamp, with one
+    ``.npy`` file per field.  Every later query against the expression, for
+    any range of timestamps, is answered with a binary search on the cached
+    timestamps instead of going back to the expression's backend.
+
+    Parameters
+    ----------
+    path : str, optional
+        The directory in which to store materialized expressions.  Defaults to
+        a new temporary directory.
+
+    Notes
+    -----
+    Expressions are identified by their hash and are assumed not to change
+    while they are cached.  Use a new cache to pick up new data.
+
+    Fields with an object dtype can't be memory-mapped, so they are kept in
+    memory instead.
+    """
+    def __init__(self, path=None):
+        self.path = path if path is not None else mkdtemp()
+        # Map from (hash(expr), ts_field) to a list of (expr, columns) pairs.
+        self._entries = {}
+        self._names = count()
+        self._lock = Lock()
+
+    def __repr__(self):
+        return '<%s: %s>' % (type(self).__name__, self.path)
+
+    def _columns(self, expr, odo_kwargs, ts_field):
+        """
+        Get the cached columns of ``expr``, materializing it if this is the
+        first time that it has been queried.
+        """
+        key = hash(expr), ts_field
+        with self._lock:
+            # Blaze expressions overload ``==``, so we can't use them as
+            # dictionary keys directly.
+            for cached_expr, columns in self._entries.get(key, ()):
+                if cached_expr.isidentical(expr):
+                    return columns
+
+            columns = self._materialize(expr, odo_kwargs, ts_field)
+            self._entries.setdefault(key, []).append((expr, columns))
+            return columns
+
+    def _materialize(self, expr, odo_kwargs, ts_field):
+        frame = odo(expr, pd.DataFrame, **odo_kwargs)
+        frame[ts_field] = frame[ts_field].astype('datetime64[ns]')
+        # A stable sort keeps rows with the same timestamp in the order in
+        # which the backend returned them.
+        frame = frame.sort_values(ts_field, kind='mergesort')
+
+        path = os.path.join(self.path, str(next(self._names)))
+        ensure_directory(path)
+        columns = {}
+        for i, name in enumerate(frame.columns):
+            values = np.asarray(frame[name])
+            if values.dtype == object:
+                columns[name] = values
+                continue
+
+            # Field names aren't necessarily valid file names.
+            filename = os.path.join(path, '%d.npy' % i)
+            np.save(filename, values)
+            columns[name] = np.load(filename, mmap_mode='r')
+        return columns
+
+    @staticmethod
+    def _frame(columns, colnames, start, stop):
+        # Copy the rows out of the memory-mapped files: callers are free to
+        # modify the frames that we return.
+        return pd.DataFrame(
+            {name: np.array(columns[name][start:stop]) for name in colnames},
+            columns=list(colnames),
+        )
+
+    def query(self,
+              expr,
+              colnames,
+              lower,
+              upper,
+              odo_kwargs=None,
+              ts_field=TS_FIELD_NAME):
+        """
+        Get the rows of ``expr`` with timestamps in ``[lower, upper]``.
+
+        Parameters
+        ----------
+        expr : Expr
+            The bound blaze expression to query.
+        colnames : iterable[str]
+            The fields of ``expr`` to return.
+        lower : datetime or None
+            The lower bound on timestamps, or None for no lower bound.
+        upper : datetime
+            The upper bound on timestamps.
+        odo_kwargs : dict, optional
+            The extra keyword arguments to pass to ``odo`` when materializing
+            ``expr``.
+        ts_field : str, optional
+            The name of the timestamp field of ``expr``.
+
+        Returns
+        -------
+        rows : pd.DataFrame
+            The requested rows, sorted by timestamp.
+        """
+        columns = self._columns(expr, odo_kwargs or {}, ts_field)
+        ts = columns[ts_field]
+        start = (
+            0
+            if lower is None else
+            ts.searchsorted(_as_datetime64(lower), side='left')
+        )
+        stop = ts.searchsorted(_as_datetime64(upper), side='right')
+        return self._frame(columns, colnames, start, stop)
+
+    def checkpoint(self,
+                   expr,
+                   colnames,
+                   upper,
+                   odo_kwargs=None,
+                   ts_field=TS_FIELD_NAME):
+        """
+        Get the rows of ``expr`` with the latest timestamp that is on or before
+        ``upper``.
+
+        Parameters
+        ----------
+        expr : Expr
+            The bound blaze expression holding checkpoints.
+        colnames : iterable[str]
+            The fields of ``expr`` to return.
+        upper : datetime
+            The upper bound on timestamps.
+        odo_kwargs : dict, optional
+            The extra keyword arguments to pass to ``odo`` when materializing
+            ``expr``.
+        ts_field : str, optional
+            The name of the timestamp field of ``expr``.
+
+        Returns
+        -------
+        checkpoint_ts : pd.Timestamp or None
+            The latest timestamp on or before ``upper``, or None if there are
+            no such timestamps.
+        rows : pd.DataFrame
+            The rows with timestamp ``checkpoint_ts``.
+        """
+        columns = self._columns(expr, odo_kwargs or {}, ts_field)
+        ts = columns[ts_field]
+        stop = ts.searchsorted(_as_datetime64(upper), side='right')
+        if not stop:
+            return None, pd.DataFrame(columns=colnames)
+
+        checkpoint_ts = ts[stop - 1]
+        start = ts.searchsorted(checkpoint_ts, side='left')
+        return (
+            pd.Timestamp(checkpoint_ts),
+            self._frame(columns, colnames, start, stop),
+        )
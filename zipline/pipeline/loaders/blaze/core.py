@@ -945,6 +945,10 @@ class BlazeLoader(dict):
     pool : Pool, optional
         The pool to use to run blaze queries concurrently. This object must
         support ``imap_unordered``, ``apply`` and ``apply_async`` methods.
+    cache : QueryCache, optional
+        A cache to serve blaze queries from. When provided, each expression is
+        materialized locally the first time it is queried, and every later
+        query is answered from the local copy.
 
     Attributes
     ----------
@@ -959,17 +963,20 @@ class BlazeLoader(dict):
     --------
     :class:`zipline.utils.pool.SequentialPool`
     :class:`multiprocessing.Pool`
+    :class:`zipline.pipeline.loaders.blaze.cache.QueryCache`
     """
     @preprocess(data_query_tz=optionally(ensure_timezone))
     def __init__(self,
                  dsmap=None,
                  data_query_time=None,
                  data_query_tz=None,
-                 pool=SequentialPool()):
+                 pool=SequentialPool(),
+                 cache=None):
         self.update(dsmap or {})
         check_data_query_args(data_query_time, data_query_tz)
         self._data_query_time = data_query_time
         self._data_query_tz = data_query_tz
+        self._cache = cache
 
         # explicitly public
         self.pool = pool
@@ -1021,6 +1028,7 @@ class BlazeLoader(dict):
 
         data_query_time = self._data_query_time
         data_query_tz = self._data_query_tz
+        cache = self._cache
         lower_dt, upper_dt = normalize_data_query_bounds(
             dates[0],
             dates[-1],
@@ -1048,6 +1056,9 @@ class BlazeLoader(dict):
             This can return more data than needed. The in memory reindex will
             handle this.
             """
+            if cache is not None:
+                return cache.query(e, colnames, lower, upper_dt, odo_kwargs)
+
             predicate = e[TS_FIELD_NAME] <= upper_dt
             if lower is not None:
                 predicate &= e[TS_FIELD_NAME] >= lower
@@ -1055,7 +1066,7 @@ class BlazeLoader(dict):
             return odo(e[predicate][colnames], pd.DataFrame, **odo_kwargs)
 
         lower, materialized_checkpoints = get_materialized_checkpoints(
-            checkpoints, colnames, lower_dt, odo_kwargs
+            checkpoints, colnames, lower_dt, odo_kwargs, cache
         )
 
         materialized_expr = self.pool.apply_async(collect_expr, (expr, lower))
@@ -1195,7 +1206,12 @@ def bind_expression_to_resources(expr, resources):
     })
 
 
-def get_materialized_checkpoints(checkpoints, colnames, lower_dt, odo_kwargs):
+def get_materialized_checkpoints(checkpoints,
+                                 colnames,
+                                 lower_dt,
+                                 odo_kwargs,
+                                 cache=None,
+                                 ts_field=TS_FIELD_NAME):
     """
     Computes a lower bound and a DataFrame checkpoints.
 
@@ -1211,9 +1227,21 @@ def get_materialized_checkpoints(checkpoints, colnames, lower_dt, odo_kwargs):
         checkpoints.
     odo_kwargs : dict, optional
         The extra keyword arguments to pass to ``odo``.
+    cache : QueryCache, optional
+        A cache to serve the checkpoints query from.
+    ts_field : str, optional
+        The name of the timestamp field in the checkpoints expression.
     """
-    if checkpoints is not None:
-        ts = checkpoints[TS_FIELD_NAME]
+    if checkpoints is not None and cache is not None:
+        lower, materialized_checkpoints = cache.checkpoint(
+            checkpoints,
+            colnames,
+            lower_dt,
+            odo_kwargs,
+            ts_field,
+        )
+    elif checkpoints is not None:
+        ts = checkpoints[ts_field]
         checkpoints_ts = odo(
             ts[ts <= lower_dt].max(),
             pd.Timestamp,
@@ -1242,7 +1270,8 @@ def ffill_query_in_range(expr,
                          upper,
                          checkpoints=None,
                          odo_kwargs=None,
-                         ts_field=TS_FIELD_NAME):
+                         ts_field=TS_FIELD_NAME,
+                         cache=None):
     """Query a blaze expression in a given time range properly forward filling
     from values that fall before the lower date.
 
@@ -1261,6 +1290,8 @@ def ffill_query_in_range(expr,
         The extra keyword arguments to pass to ``odo``.
     ts_field : str, optional
         The name of the timestamp field in the given blaze expression.
+    cache : QueryCache, optional
+        A cache to serve the queries from.
 
     Returns
     -------
@@ -1274,23 +1305,30 @@ def ffill_query_in_range(expr,
         expr.fields,
         lower,
         odo_kwargs,
+        cache,
+        ts_field,
     )
 
-    pred = expr[ts_field] <= upper
+    if cache is not None:
+        materialized_expr = cache.query(
+            expr,
+            expr.fields,
+            computed_lower,
+            upper,
+            odo_kwargs,
+            ts_field,
+        )
+    else:
+        pred = expr[ts_field] <= upper
+
+        if computed_lower is not None:
+            # only constrain the lower date if we computed a new lower date
+            pred &= expr[ts_field] >= computed_lower
 
-    if computed_lower is not None:
-        # only constrain the lower date if we computed a new lower date
-        pred &= expr[ts_field] >= computed_lower
+        materialized_expr = odo(expr[pred], pd.DataFrame, **odo_kwargs)
 
     raw = pd.concat(
-        (
-            materialized_checkpoints,
-            odo(
-                expr[pred],
-                pd.DataFrame,
-                **odo_kwargs
-            ),
-        ),
+        (materialized_checkpoints, materialized_expr),
         ignore_index=True,
     )
     raw.loc[:, ts_field] = raw.loc[:, ts_field].astype('datetime64[ns]')
@@ -47,6 +47,8 @@ class BlazeEstimatesLoader(PipelineLoader):
     checkpoints : Expr, optional
         The expression representing checkpointed data to be used for faster
         forward-filling of data from `expr`.
+    cache : QueryCache, optional
+        A cache to serve queries against `expr` and `checkpoints` from.
 
     Notes
     -----
@@ -83,7 +85,8 @@ class BlazeEstimatesLoader(PipelineLoader):
                  odo_kwargs=None,
                  data_query_time=None,
                  data_query_tz=None,
-                 checkpoints=None):
+                 checkpoints=None,
+                 cache=None):
 
         dshape = expr.dshape
         if not istabular(dshape):
@@ -104,6 +107,7 @@ class BlazeEstimatesLoader(PipelineLoader):
         self._data_query_time = data_query_time
         self._data_query_tz = data_query_tz
         self._checkpoints = checkpoints
+        self._cache = cache
 
     def load_adjusted_array(self, columns, dates, assets, mask):
         # Only load requested columns.
@@ -118,6 +122,7 @@ class BlazeEstimatesLoader(PipelineLoader):
             self._expr[sorted(metadata_columns.union(requested_column_names))],
             self._odo_kwargs,
             checkpoints=self._checkpoints,
+            cache=self._cache,
         )
 
         return self.loader(
@@ -175,6 +180,7 @@ class BlazeSplitAdjustedEstimatesLoader(BlazeEstimatesLoader):
             self._expr[sorted(metadata_columns.union(requested_column_names))],
             self._odo_kwargs,
             checkpoints=self._checkpoints,
+            cache=self._cache,
         )
 
         return self.loader(
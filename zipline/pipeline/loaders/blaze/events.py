@@ -38,6 +38,8 @@ class BlazeEventsLoader(PipelineLoader):
         The time to use for the data query cutoff.
     data_query_tz : tzinfo or str
         The timezone to use for the data query cutoff.
+    cache : QueryCache, optional
+        A cache to serve queries against the expression from.
 
     Notes
     -----
@@ -69,7 +71,8 @@ class BlazeEventsLoader(PipelineLoader):
                  resources=None,
                  odo_kwargs=None,
                  data_query_time=None,
-                 data_query_tz=None):
+                 data_query_tz=None,
+                 cache=None):
 
         dshape = expr.dshape
         if not istabular(dshape):
@@ -90,6 +93,7 @@ class BlazeEventsLoader(PipelineLoader):
         check_data_query_args(data_query_time, data_query_tz)
         self._data_query_time = data_query_time
         self._data_query_tz = data_query_tz
+        self._cache = cache
 
     def load_adjusted_array(self, columns, dates, assets, mask):
         raw = load_raw_data(assets,
@@ -97,7 +101,8 @@ class BlazeEventsLoader(PipelineLoader):
                             self._data_query_time,
                             self._data_query_tz,
                             self._expr,
-                            self._odo_kwargs)
+                            self._odo_kwargs,
+                            cache=self._cache)
 
         return EventsLoader(
             events=raw,
@@ -12,7 +12,8 @@ def load_raw_data(assets,
                   data_query_tz,
                   expr,
                   odo_kwargs,
-                  checkpoints=None):
+                  checkpoints=None,
+                  cache=None):
     """
     Given an expression representing data to load, perform normalization and
     forward-filling and return the data, materialized. Only accepts data with a
@@ -35,6 +36,8 @@ def load_raw_data(assets,
         extra keyword arguments to pass to odo when executing the expression.
     checkpoints : expr, optional
         the expression representing the checkpointed data for `expr`.
+    cache : QueryCache, optional
+        the cache to serve queries against `expr` and `checkpoints` from.
 
     Returns
     -------
@@ -54,6 +57,7 @@ def load_raw_data(assets,
         upper_dt,
         checkpoints=checkpoints,
         odo_kwargs=odo_kwargs,
+        cache=cache,
     )
     sids = raw[SID_FIELD_NAME]
     raw.drop(
@@ -152,6 +152,19 @@ class EarningsEstimatesLoader(PipelineLoader):
             self.estimates[FISCAL_QUARTER_FIELD_NAME],
         )
 
+        # Partition the estimates by sid once, so that each load only has to
+        # look at the rows for the requested assets, and so that the estimates
+        # for a single sid can be found without scanning every row.  The sort
+        # is stable, so each sid's estimates stay in their original order,
+        # which decides which estimate is the latest when several are learned
+        # about on the same day.
+        sids = self.estimates[SID_FIELD_NAME].values
+        self._sid_order = np.argsort(sids, kind='mergesort')
+        self._sorted_sids = sids[self._sid_order]
+        self._estimate_days = self.estimates[
+            TS_FIELD_NAME
+        ].values.astype('datetime64[D]')
+
         self.array_overwrites_dict = {
             datetime64ns_dtype: Datetime641DArrayOverwrite,
             float64_dtype: Float641DArrayOverwrite,
@@ -163,6 +176,59 @@ class EarningsEstimatesLoader(PipelineLoader):
 
         self.name_map = name_map
 
+    def positions_for_sids(self, sids):
+        """
+        Get the positions in ``self.estimates`` of the rows for ``sids``.
+
+        Parameters
+        ----------
+        sids : np.array[int64]
+            The sids whose estimates should be found.
+
+        Returns
+        -------
+        positions : np.array[intp]
+            The positions of the rows for ``sids``, in their original order.
+        """
+        sorted_sids = self._sorted_sids
+        starts = sorted_sids.searchsorted(sids, side='left')
+        lengths = sorted_sids.searchsorted(sids, side='right') - starts
+        # Concatenate the ranges of rows for each sid.
+        offsets = np.repeat(starts - lengths.cumsum() + lengths, lengths)
+        positions = offsets + np.arange(lengths.sum())
+        return np.sort(self._sid_order[positions])
+
+    def estimates_for_sid(self, sid):
+        """
+        Get all of the estimates for ``sid``.
+        """
+        return self.estimates.iloc[self.positions_for_sids([sid])]
+
+    def estimates_for_dates(self, sids, dates):
+        """
+        Get the estimates for ``sids`` that are known by the last of ``dates``.
+        Estimates learned about after ``dates`` can't affect any of the values
+        loaded for ``dates``.
+
+        Parameters
+        ----------
+        sids : np.array[int64]
+            The sids whose estimates should be found.
+        dates : pd.DatetimeIndex
+            The calendar dates for which estimates data is requested.
+
+        Returns
+        -------
+        estimates : pd.DataFrame
+            The rows of ``self.estimates`` for ``sids`` with timestamps on or
+            before the last of ``dates``, in their original order.
+        """
+        positions = self.positions_for_sids(sids)
+        known = dates.searchsorted(
+            self._estimate_days[positions],
+        ) < len(dates)
+        return self.estimates.iloc[positions[known]]
+
     @abstractmethod
     def get_zeroth_quarter_idx(self, stacked_last_per_qtr):
         raise NotImplementedError('get_zeroth_quarter_idx')
@@ -599,12 +665,35 @@ class EarningsEstimatesLoader(PipelineLoader):
             )
         out = {}
         # To optimize performance, only work below on assets that are
-        # actually in the raw data.
-        assets_with_data = set(assets) & set(self.estimates[SID_FIELD_NAME])
+        # actually in the raw data, and on the estimates known by the end of
+        # `dates`.
+        sids_with_data = np.intersect1d(
+            np.asarray(assets),
+            self._sorted_sids,
+        )
+        estimates = self.estimates_for_dates(sids_with_data, dates)
+        if not len(estimates):
+            # We don't know about any estimates yet, so every value is
+            # missing.
+            for col in columns:
+                out[col] = AdjustedArray(
+                    np.full(
+                        (len(dates), len(assets)),
+                        col.missing_value,
+                        dtype=col.dtype,
+                    ),
+                    mask,
+                    {},
+                    col.missing_value,
+                )
+            return out
+
+        assets_with_data = set(sids_with_data)
         last_per_qtr, stacked_last_per_qtr = self.get_last_data_per_qtr(
             assets_with_data,
             columns,
-            dates
+            dates,
+            estimates,
         )
         # Determine which quarter is immediately next/previous for each
         # date.
@@ -664,7 +753,11 @@ class EarningsEstimatesLoader(PipelineLoader):
                 )
         return out
 
-    def get_last_data_per_qtr(self, assets_with_data, columns, dates):
+    def get_last_data_per_qtr(self,
+                              assets_with_data,
+                              columns,
+                              dates,
+                              estimates=None):
         """
         Determine the last piece of information we know for each column on each
         date in the index for each sid and quarter.
@@ -678,6 +771,9 @@ class EarningsEstimatesLoader(PipelineLoader):
             The columns that need to be loaded from the raw data.
         dates : pd.DatetimeIndex
             The calendar of dates for which data should be loaded.
+        estimates : pd.DataFrame, optional
+            The rows of the raw data to use.  Every timestamp must be on or
+            before the last of ``dates``.  Defaults to all of the raw data.
 
         Returns
         -------
@@ -692,8 +788,10 @@ class EarningsEstimatesLoader(PipelineLoader):
         # Get a DataFrame indexed by date with a MultiIndex of columns of [
         # self.estimates.columns, normalized_quarters, sid], where each cell
         # contains the latest data for that day.
+        if estimates is None:
+            estimates = self.estimates
         last_per_qtr = last_in_date_group(
-            self.estimates,
+            estimates,
             dates,
             assets_with_data,
             reindex=True,
@@ -933,9 +1031,7 @@ class SplitAdjustedEstimatesLoader(EarningsEstimatesLoader):
          post_adjustments) = self.retrieve_split_adjustment_data_for_sid(
             dates, sid, split_adjusted_asof_idx
         )
-        sid_estimates = self.estimates[
-            self.estimates[SID_FIELD_NAME] == sid
-            ]
+        sid_estimates = self.estimates_for_sid(sid)
         # We might not have any overwrites but still have
         # adjustments, and we will need to manually add columns if
         # that is the case.
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from numpy import (
+    float32,
     iinfo,
     uint32,
 )
@@ -23,6 +24,7 @@ from zipline.data.us_equity_pricing import (
 from zipline.lib.adjusted_array import AdjustedArray
 from zipline.errors import NoFurtherDataError
 from zipline.utils.calendars import get_calendar
+from zipline.utils.numpy_utils import float64_dtype
 
 from .base import PipelineLoader
 
@@ -34,11 +36,39 @@ class USEquityPricingLoader(PipelineLoader):
     PipelineLoader for US Equity Pricing data
 
     Delegates loading of baselines and adjustments.
+
+    Parameters
+    ----------
+    raw_price_loader : zipline.data.session_bars.SessionBarReader
+        Reader providing raw prices.
+    adjustments_loader : zipline.data.us_equity_pricing.SQLiteAdjustmentReader
+        Reader providing price/volume adjustments.
+    float32 : bool, optional
+        If True, float64 columns are loaded into float32 AdjustedArrays, so
+        factors receive float32 windows.  See Notes.  Default is False.
+
+    Notes
+    -----
+    Large pipelines spend much of their time moving loaded data through
+    memory, and float32 mode halves the size of every loaded array and of
+    every window taken over one.  Factors still produce float64 outputs, so
+    results are upcast once they're computed.
+
+    The cost is precision.  Each loaded value carries a relative error on the
+    order of 1e-7 (float32 has a 24 bit significand), and adjustments are
+    applied in double precision before being rounded back to float32.
+    Volumes are integers, and are exact below 2 ** 24 (16,777,216) shares.
+    Factors which average or sum their inputs agree with float64 mode to
+    within a relative tolerance of about 1e-6.  Factors built from
+    differences of nearby values, such as returns or volatility, inherit an
+    absolute error of about 1e-7 per unit of price ratio instead, which can
+    be large relative to a small return.
     """
 
-    def __init__(self, raw_price_loader, adjustments_loader):
+    def __init__(self, raw_price_loader, adjustments_loader, float32=False):
         self.raw_price_loader = raw_price_loader
         self.adjustments_loader = adjustments_loader
+        self._float32 = float32
 
         cal = self.raw_price_loader.trading_calendar or \
             get_calendar("NYSE")
@@ -46,7 +76,7 @@ class USEquityPricingLoader(PipelineLoader):
         self._all_sessions = cal.all_sessions
 
     @classmethod
-    def from_files(cls, pricing_path, adjustments_path):
+    def from_files(cls, pricing_path, adjustments_path, float32=False):
         """
         Create a loader from a bcolz equity pricing dir and a SQLite
         adjustments path.
@@ -57,10 +87,14 @@ class USEquityPricingLoader(PipelineLoader):
             Path to a bcolz directory written by a BcolzDailyBarWriter.
         adjusments_path : str
             Path to an adjusments db written by a SQLiteAdjustmentWriter.
+        float32 : bool, optional
+            Whether to load prices and volumes as float32.  Prices are read
+            from disk directly into float32 arrays.
         """
         return cls(
-            BcolzDailyBarReader(pricing_path),
-            SQLiteAdjustmentReader(adjustments_path)
+            BcolzDailyBarReader(pricing_path, float32_prices=float32),
+            SQLiteAdjustmentReader(adjustments_path),
+            float32=float32,
         )
 
     def load_adjusted_array(self, columns, dates, assets, mask):
@@ -87,11 +121,18 @@ class USEquityPricingLoader(PipelineLoader):
 
         out = {}
         for c, c_raw, c_adjs in zip(columns, raw_arrays, adjustments):
+            if self._float32 and c.dtype == float64_dtype:
+                # AdjustedArray makes its own copy, so there's no need for
+                # another one here.
+                c_raw = c_raw.astype(float32, copy=False)
+            else:
+                c_raw = c_raw.astype(c.dtype)
             out[c] = AdjustedArray(
-                c_raw.astype(c.dtype),
+                c_raw,
                 mask,
                 c_adjs,
                 c.missing_value,
+                float32=self._float32,
             )
         return out
 
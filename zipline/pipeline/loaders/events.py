@@ -11,10 +11,7 @@ from zipline.pipeline.common import (
     TS_FIELD_NAME,
 )
 from zipline.pipeline.loaders.frame import DataFrameLoader
-from zipline.pipeline.loaders.utils import (
-    next_event_indexer,
-    previous_event_indexer,
-)
+from zipline.pipeline.loaders.utils import EventIndex
 
 
 def required_event_fields(next_value_columns, previous_value_columns):
@@ -109,6 +106,14 @@ class EventsLoader(PipelineLoader):
             )
         }
 
+        # Events partitioned by sid, shared by every query for next and
+        # previous event indexers.
+        self._event_index = EventIndex(
+            self.events[EVENT_DATE_FIELD_NAME],
+            self.events[TS_FIELD_NAME],
+            self.events[SID_FIELD_NAME],
+        )
+
         # Columns to load with self.load_next_events.
         self.next_value_columns = next_value_columns
 
@@ -145,22 +150,10 @@ class EventsLoader(PipelineLoader):
         return groups.get('next', ()), groups.get('previous', ())
 
     def next_event_indexer(self, dates, sids):
-        return next_event_indexer(
-            dates,
-            sids,
-            self.events[EVENT_DATE_FIELD_NAME],
-            self.events[TS_FIELD_NAME],
-            self.events[SID_FIELD_NAME],
-        )
+        return self._event_index.next_event_indexer(dates, sids)
 
     def previous_event_indexer(self, dates, sids):
-        return previous_event_indexer(
-            dates,
-            sids,
-            self.events[EVENT_DATE_FIELD_NAME],
-            self.events[TS_FIELD_NAME],
-            self.events[SID_FIELD_NAME],
-        )
+        return self._event_index.previous_event_indexer(dates, sids)
 
     def load_next_events(self, columns, dates, sids, mask):
         if not columns:
@@ -194,6 +187,7 @@ class EventsLoader(PipelineLoader):
 
         assert indexer.shape == (len(dates), len(sids))
 
+        missing = indexer < 0
         out = {}
         for c in columns:
             # Array holding the value for column `c` for every event we have.
@@ -216,7 +210,7 @@ class EventsLoader(PipelineLoader):
 
                 # indexer will be -1 for locations where we don't have a known
                 # value. Overwrite those locations with c.missing_value.
-                raw[indexer < 0] = c.missing_value
+                raw[missing] = c.missing_value
 
             # Delegate the actual array formatting logic to a DataFrameLoader.
             loader = DataFrameLoader(c, to_frame(raw), adjustments=None)
@@ -24,6 +24,218 @@ def validate_event_metadata(event_dates,
         )
 
 
+class EventIndex(object):
+    """
+    An index over a collection of events, partitioned by sid and sorted by
+    event date within each sid.
+
+    The index is built once and can then produce next and previous event
+    indexers for any block of dates and sids.  Each query is answered with a
+    few calls to ``searchsorted`` over the whole block rather than a Python
+    loop over events.
+
+    Parameters
+    ----------
+    event_dates : ndarray[datetime64[ns], ndim=1]
+        Dates on which each input events occurred/will occur.  ``event_dates``
+        must be in sorted order, and may not contain any NaT values.
+    event_timestamps : ndarray[datetime64[ns], ndim=1]
+        Dates on which we learned about each input event.
+    event_sids : ndarray[int, ndim=1]
+        Sids assocated with each input event.
+
+    Notes
+    -----
+    Indexers produced by this object index into the arrays passed to the
+    constructor, not into the index's sorted copies of them.
+    """
+    def __init__(self, event_dates, event_timestamps, event_sids):
+        validate_event_metadata(event_dates, event_timestamps, event_sids)
+
+        # A stable sort by sid leaves each sid's events sorted by event date.
+        order = np.argsort(event_sids, kind='mergesort')
+        self._positions = order
+        self._sids = np.asarray(event_sids)[order]
+        self._event_dates = np.asarray(event_dates)[order]
+        self._event_timestamps = np.asarray(event_timestamps)[order]
+
+    def __len__(self):
+        return len(self._positions)
+
+    def _columns(self, all_sids):
+        """
+        Find the column of ``all_sids`` associated with each of our events.
+
+        Returns
+        -------
+        keep : ndarray[bool]
+            Mask of the events whose sids appear in ``all_sids``.
+        columns : ndarray[int]
+            The column of ``all_sids`` for each event selected by ``keep``.
+        """
+        all_sids = np.asarray(all_sids)
+        columns = all_sids.searchsorted(self._sids)
+        keep = columns < len(all_sids)
+        keep[keep] = all_sids[columns[keep]] == self._sids[keep]
+        return keep, columns[keep]
+
+    @staticmethod
+    def _cell_keys(ndates, nsids):
+        """
+        Compute sort keys for every cell of a (ndates x nsids) block, laid out
+        in column-major order so that the keys are sorted.
+
+        Events are keyed as ``column * (ndates + 1) + row`` for some row in
+        ``[0, ndates]``, so searching for a cell's key only finds events for
+        the cell's sid.
+        """
+        stride = ndates + 1
+        return (
+            np.arange(nsids)[:, np.newaxis] * stride +
+            np.arange(ndates)
+        ).ravel()
+
+    def next_event_indexer(self, all_dates, all_sids):
+        """
+        Construct an index array that, when applied to an array of values,
+        produces a 2D array containing the values associated with the next
+        event for each sid at each moment in time.
+
+        Locations where no next event was known will be filled with -1.
+
+        Parameters
+        ----------
+        all_dates : ndarray[datetime64[ns], ndim=1]
+            Row labels for the target output.
+        all_sids : ndarray[int, ndim=1]
+            Column labels for the target output.  Events for sids that don't
+            appear in ``all_sids`` are ignored.
+
+        Returns
+        -------
+        indexer : ndarray[int, ndim=2]
+            An array of shape (len(all_dates), len(all_sids)) of indices into
+            the event arrays used to construct this index.
+        """
+        ndates, nsids = len(all_dates), len(all_sids)
+        # Work with the transpose of the result, so that cells for the same
+        # sid are adjacent.
+        out = np.full((nsids, ndates), -1, dtype=np.int64)
+        keep, columns = self._columns(all_sids)
+        if not len(columns):
+            return out.T
+
+        positions = self._positions[keep]
+        # side='right' here ensures that we include the event date itself
+        # if it's in all_dates.
+        dt_ixs = all_dates.searchsorted(self._event_dates[keep], side='right')
+        ts_ixs = all_dates.searchsorted(self._event_timestamps[keep])
+
+        # Within each sid, dt_ixs is sorted because event dates are, so these
+        # keys are sorted.
+        stride = ndates + 1
+        keys = columns * stride + dt_ixs
+        segment_ends = keys.searchsorted(np.arange(1, nsids + 1) * stride)
+        # The earliest timestamp of each event or any later event for the
+        # same sid.  Keys for later sids are larger, so the running minimum
+        # never carries a timestamp from one sid back into the previous one.
+        first_known = np.minimum.accumulate(
+            (columns * stride + ts_ixs)[::-1],
+        )[::-1] - columns * stride
+
+        # For each cell, the first event for its sid that happens on or after
+        # the cell's date.
+        candidates = keys.searchsorted(
+            self._cell_keys(ndates, nsids),
+            side='right',
+        )
+        pending = np.flatnonzero(
+            candidates < segment_ends.repeat(ndates),
+        )
+        pending = pending[
+            first_known[candidates[pending]] <= pending % ndates
+        ]
+
+        # An event is only eligible once we know about it.  When we don't yet
+        # know about a cell's candidate, try the sid's next event instead.
+        # This depends for correctness on the fact that events are sorted by
+        # event date within each sid, because we want the earliest eligible
+        # event.  Every pending cell has an eligible event at or after its
+        # candidate, so this never runs past the end of a sid's events.
+        result = out.ravel()
+        while len(pending):
+            event_ixs = candidates[pending]
+            known = ts_ixs[event_ixs] <= pending % ndates
+            result[pending[known]] = positions[event_ixs[known]]
+
+            pending = pending[~known]
+            candidates[pending] += 1
+
+        return out.T
+
+    def previous_event_indexer(self, all_dates, all_sids):
+        """
+        Construct an index array that, when applied to an array of values,
+        produces a 2D array containing the values associated with the previous
+        event for each sid at each moment in time.
+
+        Locations where no previous event was known will be filled with -1.
+
+        Parameters
+        ----------
+        all_dates : ndarray[datetime64[ns], ndim=1]
+            Row labels for the target output.
+        all_sids : ndarray[int, ndim=1]
+            Column labels for the target output.  Events for sids that don't
+            appear in ``all_sids`` are ignored.
+
+        Returns
+        -------
+        indexer : ndarray[int, ndim=2]
+            An array of shape (len(all_dates), len(all_sids)) of indices into
+            the event arrays used to construct this index.
+        """
+        ndates, nsids = len(all_dates), len(all_sids)
+        # Work with the transpose of the result, so that cells for the same
+        # sid are adjacent.
+        out = np.full((nsids, ndates), -1, dtype=np.int64)
+        keep, columns = self._columns(all_sids)
+        if not len(columns):
+            return out.T
+
+        positions = self._positions[keep]
+        # An event becomes a possible value once we're past both its
+        # event_date and its timestamp.
+        eff_ixs = all_dates.searchsorted(
+            np.maximum(
+                self._event_dates[keep],
+                self._event_timestamps[keep],
+            ),
+        )
+
+        # Sort each sid's events by the date on which they become eligible,
+        # then pair each one with the latest (by event date) of the events
+        # for that sid that are eligible no later than it is.  Events are
+        # sorted by sid, so the running maximum never carries an event from
+        # one sid over into the next.
+        by_eligibility = np.lexsort((eff_ixs, columns))
+        latest = np.maximum.accumulate(by_eligibility)
+
+        stride = ndates + 1
+        keys = (columns * stride + eff_ixs)[by_eligibility]
+        cell_keys = self._cell_keys(ndates, nsids)
+        found = keys.searchsorted(cell_keys, side='right') - 1
+
+        # The last eligible key may belong to an earlier sid, in which case
+        # nothing is known for the cell.
+        valid = found >= 0
+        valid[valid] = (
+            keys[found[valid]] >= cell_keys[valid] - cell_keys[valid] % stride
+        )
+        out.ravel()[valid] = positions[latest[found[valid]]]
+        return out.T
+
+
 def next_event_indexer(all_dates,
                        all_sids,
                        event_dates,
@@ -55,27 +267,16 @@ def next_event_indexer(all_dates,
     indexer : ndarray[int, ndim=2]
         An array of shape (len(all_dates), len(all_sids)) of indices into
         ``event_{dates,timestamps,sids}``.
-    """
-    validate_event_metadata(event_dates, event_timestamps, event_sids)
-    out = np.full((len(all_dates), len(all_sids)), -1, dtype=np.int64)
-
-    sid_ixs = all_sids.searchsorted(event_sids)
-    # side='right' here ensures that we include the event date itself
-    # if it's in all_dates.
-    dt_ixs = all_dates.searchsorted(event_dates, side='right')
-    ts_ixs = all_dates.searchsorted(event_timestamps)
 
-    # Walk backward through the events, writing the index of the event into
-    # slots ranging from the event's timestamp to its asof.  This depends for
-    # correctness on the fact that event_dates is sorted in ascending order,
-    # because we need to overwrite later events with earlier ones if their
-    # eligible windows overlap.
-    for i in range(len(event_sids) - 1, -1, -1):
-        start_ix = ts_ixs[i]
-        end_ix = dt_ixs[i]
-        out[start_ix:end_ix, sid_ixs[i]] = i
-
-    return out
+    See Also
+    --------
+    EventIndex.next_event_indexer
+    """
+    return EventIndex(
+        event_dates,
+        event_timestamps,
+        event_sids,
+    ).next_event_indexer(all_dates, all_sids)
 
 
 def previous_event_indexer(all_dates,
@@ -109,26 +310,16 @@ def previous_event_indexer(all_dates,
     indexer : ndarray[int, ndim=2]
         An array of shape (len(all_dates), len(all_sids)) of indices into
         ``event_{dates,timestamps,sids}``.
+
+    See Also
+    --------
+    EventIndex.previous_event_indexer
     """
-    validate_event_metadata(event_dates, event_timestamps, event_sids)
-    out = np.full((len(all_dates), len(all_sids)), -1, dtype=np.int64)
-
-    eff_dts = np.maximum(event_dates, event_timestamps)
-    sid_ixs = all_sids.searchsorted(event_sids)
-    dt_ixs = all_dates.searchsorted(eff_dts)
-
-    # Walk backwards through the events, writing the index of the event into
-    # slots ranging from max(event_date, event_timestamp) to the start of the
-    # previously-written event.  This depends for correctness on the fact that
-    # event_dates is sorted in ascending order, because we need to have written
-    # later events so we know where to stop forward-filling earlier events.
-    last_written = {}
-    for i in range(len(event_dates) - 1, -1, -1):
-        sid_ix = sid_ixs[i]
-        dt_ix = dt_ixs[i]
-        out[dt_ix:last_written.get(sid_ix, None), sid_ix] = i
-        last_written[sid_ix] = dt_ix
-    return out
+    return EventIndex(
+        event_dates,
+        event_timestamps,
+        event_sids,
+    ).previous_event_indexer(all_dates, all_sids)
 
 
 def normalize_data_query_time(dt, time, tz):
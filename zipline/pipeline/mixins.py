@@ -16,6 +16,7 @@ from zipline.errors import (
     UnsupportedDataType,
     NoFurtherDataError,
 )
+from zipline.lib.adjusted_array import WINDOW_TYPES, window_blocks
 from zipline.utils.control_flow import nullctx
 from zipline.utils.input_validation import expect_types
 from zipline.utils.sharedoc import (
@@ -108,6 +109,19 @@ class CustomTermMixin(object):
     """
     ctx = nullctx()
 
+    #: Optional whole-range counterpart to ``compute``.  Subclasses may set
+    #: this to a method with the signature
+    #: ``compute_range(self, dates, assets, out, *arrays, **params)``, which
+    #: receives one array per input holding ``len(dates) + window_length - 1``
+    #: rows and must write ``len(dates)`` rows into ``out``, where row ``i``
+    #: is the value ``compute`` would produce for the trailing window ending
+    #: at row ``i + window_length - 1`` of the inputs.  It is only used for
+    #: two-dimensional terms whose inputs are AdjustedArray windows, and may
+    #: be called more than once per chunk, since each call only sees rows
+    #: between two adjustment dates.  It is ignored for subclasses that
+    #: override ``compute`` without also overriding ``compute_range``.
+    compute_range = None
+
     def __new__(cls,
                 inputs=NotSpecified,
                 outputs=NotSpecified,
@@ -186,11 +200,50 @@ class CustomTermMixin(object):
                 inputs.append(window[:, column_mask])
         return inputs
 
+    def _can_compute_range(self, windows):
+        # A subclass that overrides ``compute`` still inherits
+        # ``compute_range``, which would then compute something else.
+        mro = type(self).__mro__
+        definers = {
+            name: next(cls for cls in mro if name in vars(cls))
+            for name in ('compute', 'compute_range')
+        }
+        return (
+            self.compute_range is not None and
+            definers['compute'] in definers['compute_range'].__mro__ and
+            self.ndim != 1 and
+            all(isinstance(w, WINDOW_TYPES) for w in windows)
+        )
+
+    def _compute_range(self, windows, dates, assets, mask):
+        """
+        Call `compute_range` over each block of rows sharing the same
+        adjustments, then mask the result.
+        """
+        compute_range = self.compute_range
+        params = self.params
+        out = self._allocate_output(windows, mask.shape)
+
+        with self.ctx:
+            for start, stop, arrays in window_blocks(windows, len(dates)):
+                compute_range(
+                    dates[start:stop],
+                    assets,
+                    out[start:stop],
+                    *arrays,
+                    **params
+                )
+        out[~mask] = self.missing_value
+        return out
+
     def _compute(self, windows, dates, assets, mask):
         """
         Call the user's `compute` function on each window with a pre-built
         output array.
         """
+        if self._can_compute_range(windows):
+            return self._compute_range(windows, dates, assets, mask)
+
         format_inputs = self._format_inputs
         compute = self.compute
         params = self.params
@@ -223,6 +276,7 @@ class LatestMixin(SingleInputMixin):
     """
     Mixin for behavior shared by Custom{Factor,Filter,Classifier}.
     """
+    asset_independent = True
     window_length = 1
 
     def compute(self, today, assets, out, data):
@@ -245,6 +299,8 @@ class AliasedMixin(SingleInputMixin):
     """
     Mixin for aliased terms.
     """
+    asset_independent = True
+
     def __new__(cls, term, name):
         return super(AliasedMixin, cls).__new__(
             cls,
@@ -157,7 +157,8 @@ class Pipeline(object):
                           default_screen,
                           all_dates,
                           start_date,
-                          end_date):
+                          end_date,
+                          fuse_expressions=False):
         """
         Compile into an ExecutionPlan.
 
@@ -174,12 +175,16 @@ class Pipeline(object):
             The first date of requested output.
         end_date : pd.Timestamp
             The last date of requested output.
+        fuse_expressions : bool, optional
+            Whether to fold chains of elementwise terms into single numexpr
+            evaluations.  See :class:`zipline.pipeline.graph.ExecutionPlan`.
         """
         return ExecutionPlan(
             self._prepare_graph_terms(screen_name, default_screen),
             all_dates,
             start_date,
             end_date,
+            fuse_expressions=fuse_expressions,
         )
 
     def to_simple_graph(self, screen_name, default_screen):
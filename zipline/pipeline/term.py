@@ -63,6 +63,11 @@ class Term(with_metaclass(ABCMeta, object)):
     # Determines if a term is safe to be used as a windowed input.
     window_safe = False
 
+    # Determines if the values a term produces for an asset depend only on
+    # the values of its inputs for that same asset.  Such terms can be
+    # computed over any subset of assets without changing their results.
+    asset_independent = False
+
     # The dimensions of the term's output (1D or 2D).
     ndim = 2
 
@@ -130,6 +135,10 @@ class Term(with_metaclass(ABCMeta, object)):
                     params=params,
                     *args, **kwargs
                 )
+            # Keep the identity around so that consumers like
+            # ``zipline.pipeline.cache.TermCache`` can derive a key for this
+            # term that is stable across processes.
+            new_instance._identity = identity
             return new_instance
 
     @classmethod
@@ -372,6 +381,7 @@ class AssetExists(Term):
     dependencies = {}
     mask = None
     windowed = False
+    asset_independent = True
 
     def __repr__(self):
         return "AssetExists()"
@@ -398,6 +408,7 @@ class InputDates(Term):
     mask = None
     windowed = False
     window_safe = True
+    asset_independent = True
 
     def __repr__(self):
         return "InputDates()"
@@ -417,6 +428,7 @@ class LoadableTerm(Term):
     """
     windowed = False
     inputs = ()
+    asset_independent = True
 
     @lazyval
     def dependencies(self):
@@ -709,9 +709,14 @@ class FakeDataPortal(DataPortal):
 
     def get_spot_value(self, asset, field, dt, data_frequency):
         if field == "volume":
-            return 100
+            value = 100
         else:
-            return 1.0
+            value = 1.0
+
+        # Like DataPortal, accept a list of assets as well as a single asset.
+        if isinstance(asset, list):
+            return [value] * len(asset)
+        return value
 
     def get_history_window(self, assets, end_dt, bar_count, frequency, field,
                            ffill=True):
@@ -741,6 +746,13 @@ class FetcherDataPortal(DataPortal):
                                                 first_trading_day)
 
     def get_spot_value(self, asset, field, dt, data_frequency):
+        # Like DataPortal, accept a list of assets as well as a single asset.
+        if isinstance(asset, list):
+            return [
+                self.get_spot_value(a, field, dt, data_frequency)
+                for a in asset
+            ]
+
         # if this is a fetcher field, exercise the regular code path
         if self._is_extra_source(asset, field, self._augmented_sources_map):
             return super(FetcherDataPortal, self).get_spot_value(
@@ -1,7 +1,7 @@
 from functools import reduce
 from pprint import pformat
 
-from six import viewkeys
+from six import get_unbound_function, viewkeys
 from six.moves import map, zip
 from toolz import curry, flip
 
@@ -390,3 +390,30 @@ def foldr(f, seq, default=_no_default):
         reversed(seq),
         *(default,) if default is not _no_default else ()
     )
+
+
+def overrides(obj, cls, name):
+    """
+    Whether the class of ``obj`` overrides the method ``name`` of ``cls``.
+
+    This is used to fall back to a generic implementation when a subclass
+    customizes a method that a faster specialized implementation relies on.
+
+    Parameters
+    ----------
+    obj : cls
+        The instance to check.
+    cls : type
+        The class that defines the method.
+    name : str
+        The name of the method.
+
+    Returns
+    -------
+    overridden : bool
+        Whether ``type(obj).name`` is not ``cls.name``.
+    """
+    return (
+        get_unbound_function(getattr(type(obj), name)) is not
+        get_unbound_function(getattr(cls, name))
+    )